@@ -0,0 +1,359 @@
+# BenchmarkGenerators.py
+#
+# This is a Python script that measures how the scripts that generate Vensim command scripts
+# (CreateCombinationsScript.py, CreateContributionTestScript.py, and CreateCarbonCapToTaxScript.py)
+# perform as the number of policies, settings, groups, or prices grows.  It does not run Vensim: it
+# only times the Python scripts as they write their command scripts.  For each test case, it reports:
+#
+# 1. The time taken to generate the command script (the shortest of several attempts).
+# 2. The peak memory used by the Python process that generated it.
+# 3. The size of the command script, in bytes and lines, in total and per run.
+#
+# The results are written to a JSON file (the BenchmarkFile).  Keep a copy of that file from before
+# a change to one of the generators, and compare the results from after the change against it, by
+# giving it on the command line with "--compare" (or in the BaselineFile setting).  Any test case
+# that has become slower or uses more memory than the tolerances below allow is listed as a
+# regression, and the script ends with an error status, so it may be used in automated checks.
+#
+# The test cases use a made-up ("synthetic") model file, policy catalog, and output variable list,
+# written to a temporary folder, so the benchmark does not depend on the size of the EPS model or
+# the contents of PolicyCatalog.py, and its results can be compared from one version to the next.
+# Each synthetic policy is a separate model variable ("Benchmark Policy 1", "Benchmark Policy 2",
+# and so on), and each pair of policies forms a group.
+#
+# Usage: python BenchmarkGenerators.py [--compare Baseline.json] [--quick]
+# With "--quick", only the smallest test cases of each type are run.
+
+
+# File Names
+# ----------
+BenchmarkFile = "GeneratorBenchmark.json" # The file to which the results are written
+BaselineFile = "" # A results file from an earlier version to compare against (may also be given with "--compare")
+
+# Test Cases
+# ----------
+# In the combinations test cases, every combination of a number of enabled policies and a number of
+# settings per policy is tested.  If testing every setting of every policy would require more than
+# MaxCombinationRuns runs, only as many policies as fit within that limit are given several settings,
+# and the others are given a single (non-zero) setting, so every enabled policy still has a SETVAL
+# instruction in every run.
+CombinationPolicyCounts = [2, 5, 10, 20, 30] # Numbers of enabled policies
+CombinationSettingCounts = [2, 3, 5] # Numbers of settings per policy
+MaxCombinationRuns = 10000 # The largest number of runs in a combinations test case
+ContributionGroupCounts = [10, 50, 100, 500] # Numbers of policy groups in the contribution test cases
+ContributionModes = ["Disable", "Enable", "Shapley"] # Modes of CreateContributionTestScript.py to test
+CarbonCapPriceCounts = [10, 100, 1000] # Numbers of prices tested in the carbon cap-to-tax test cases
+NumOutputVariables = 50 # The number of variables in the synthetic output variable list
+
+# Other Settings
+# --------------
+Repeats = 3 # The number of times each test case is run.  The shortest time is reported.
+TimeTolerance = 0.25 # A test case is a regression if it takes more than this fraction longer than in the baseline...
+MinTimeDifference = 0.05 # ...and at least this many seconds longer (so very short test cases are not flagged by chance)
+MemoryTolerance = 0.25 # A test case is a regression if its peak memory is more than this fraction larger than in the baseline
+
+
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Synthetic Model Files
+# ---------------------
+# The synthetic model file defines each synthetic policy, the policy implementation schedule selector,
+# the carbon tax rate for each sector (used by CreateCarbonCapToTaxScript.py), and the output variables.
+# The synthetic policy catalog is a copy of PolicyCatalog.py with its catalog replaced by the synthetic
+# policies, so the generators select policies exactly as they do from the real catalog.
+Sectors = ["transportation sector", "electricity sector", "residential buildings sector", "commercial buildings sector", "industry sector"]
+PoliciesPerGroup = 2
+
+def PolicyName(PolicyNumber):
+	return "Benchmark Policy " + str(PolicyNumber)
+
+def GroupName(GroupNumber):
+	return "Benchmark Group " + str(GroupNumber)
+
+def OutputVariableName(VariableNumber):
+	return "Benchmark Output " + str(VariableNumber)
+
+def ModelEntry(Name, Value, Units="Dmnl"):
+	return Name + "=\n\t" + str(Value) + "\n\t~\t" + Units + "\n\t~\t\t|\n\n"
+
+def WriteSyntheticModel(Folder, NumPolicies):
+	with open(os.path.join(Folder, "Benchmark.mdl"), 'w') as Model:
+		Model.write("{UTF-8}\n")
+		Model.write("Benchmark Sector:\n\t" + ", ".join(Sectors) + "\n\t~\t\n\t~\t\t|\n\n")
+		Model.write(ModelEntry("Additional Carbon Tax Rate[Benchmark Sector]", 0))
+		Model.write(ModelEntry("Policy Implementation Schedule Selector", 1, "Dmnl [1,9,1]"))
+		for PolicyNumber in range(1, NumPolicies + 1):
+			Model.write(ModelEntry(PolicyName(PolicyNumber), 0))
+		for VariableNumber in range(1, NumOutputVariables + 1):
+			Model.write(ModelEntry(OutputVariableName(VariableNumber), 0))
+		Model.write("\\\\\\---/// Sketch information - do not modify anything except names\n")
+	with open(os.path.join(Folder, "Benchmark.lst"), 'w') as VarsFile:
+		for VariableNumber in range(1, NumOutputVariables + 1):
+			VarsFile.write(OutputVariableName(VariableNumber) + "\n")
+
+def WriteSyntheticCatalog(Folder, NumPolicies):
+	with open("PolicyCatalog.py", 'r') as CatalogFile:
+		Source = CatalogFile.read()
+	Entries = []
+	for PolicyNumber in range(1, NumPolicies + 1):
+		GroupNumber = (PolicyNumber - 1) // PoliciesPerGroup + 1
+		Entries.append("\t\t(" + repr(PolicyName(PolicyNumber)) + ", " + repr(PolicyName(PolicyNumber)) + ", [0, 1], " + repr(GroupName(GroupNumber)) + "),\n")
+	Catalog = "CatalogSections = (\n\t(\"Benchmark\", (\n" + "".join(Entries) + "\t)),\n)\n\n\n"
+	Source, NumReplaced = re.subn(r"^CatalogSections = \(.*?(?=^# Building the Indexes)", lambda Match: Catalog, Source, flags=re.M | re.S)
+	if NumReplaced != 1:
+		raise ValueError("The catalog could not be found in PolicyCatalog.py.")
+	with open(os.path.join(Folder, "PolicyCatalog.py"), 'w') as CatalogFile:
+		CatalogFile.write(Source)
+
+
+# Building the Test Cases
+# -----------------------
+# Each test case is a copy of one of the generators with some of its settings changed.  Settings are
+# changed by replacing the line on which they are assigned, and the multi-line PolicySelections list
+# is replaced as a whole.
+def ChangeSettings(Source, Settings):
+	for Name, Value in Settings.items():
+		if Name == "PolicySelections":
+			Pattern = r"^PolicySelections = \[.*?^\]"
+			Text = "PolicySelections = [\n" + "".join("\t" + repr(Selection) + ",\n" for Selection in Value) + "]"
+		else:
+			Pattern = r"^" + Name + r" = [^\n]*"
+			Text = Name + " = " + repr(Value)
+		Source, NumReplaced = re.subn(Pattern, lambda Match: Text, Source, count=1, flags=re.M | re.S)
+		if NumReplaced != 1:
+			raise ValueError("The setting " + Name + " could not be found.")
+	return Source
+
+CommonSettings = {"ModelFile": "Benchmark.mdl", "OutputVarsFile": "Benchmark.lst", "NumShards": 1, "UseRunCache": False, "Resume": False}
+
+def CombinationCases():
+	Cases = []
+	for NumPolicies in CombinationPolicyCounts:
+		for NumSettings in CombinationSettingCounts:
+			NumVaried = 0
+			while NumVaried < NumPolicies and NumSettings ** (NumVaried + 1) <= MaxCombinationRuns:
+				NumVaried += 1
+			Selections = []
+			for PolicyNumber in range(1, NumPolicies + 1):
+				Settings = list(range(NumSettings)) if PolicyNumber <= NumVaried else [1]
+				Selections.append(("Policy", PolicyName(PolicyNumber), Settings))
+			Settings = dict(CommonSettings, PolicySelections=Selections)
+			Cases.append({
+				"Name": "Combinations-P" + str(NumPolicies) + "-S" + str(NumSettings),
+				"Generator": "CreateCombinationsScript.py",
+				"Parameters": {"NumPolicies": NumPolicies, "NumSettings": NumSettings, "NumVariedPolicies": NumVaried},
+				"Settings": Settings,
+				"OutputScript": "GeneratedCombinationsScript.cmd",
+			})
+	return Cases
+
+def ContributionCases():
+	Cases = []
+	for NumGroups in ContributionGroupCounts:
+		for Mode in ContributionModes:
+			Selections = [("Group", GroupName(GroupNumber)) for GroupNumber in range(1, NumGroups + 1)]
+			Settings = dict(CommonSettings, PolicySelections=Selections, EnableOrDisableGroups=Mode)
+			Cases.append({
+				"Name": "Contribution-" + Mode + "-G" + str(NumGroups),
+				"Generator": "CreateContributionTestScript.py",
+				"Parameters": {"NumGroups": NumGroups, "NumPolicies": NumGroups * PoliciesPerGroup, "Mode": Mode},
+				"Settings": Settings,
+				"OutputScript": "GeneratedContributionTestScript.cmd",
+			})
+	return Cases
+
+def CarbonCapCases():
+	Cases = []
+	for NumPrices in CarbonCapPriceCounts:
+		Settings = {"ModelFile": "Benchmark.mdl", "OutputVarsFile": "Benchmark.lst", "ComplementaryPoliciesFile": "", "PriceFloor": 1, "PriceCeiling": NumPrices, "SearchMode": "Sweep", "Resume": False}
+		Cases.append({
+			"Name": "CarbonCapToTax-N" + str(NumPrices),
+			"Generator": "CreateCarbonCapToTaxScript.py",
+			"Parameters": {"NumPrices": NumPrices},
+			"Settings": Settings,
+			"OutputScript": "GeneratedCarbonCapToTaxScript.cmd",
+		})
+	return Cases
+
+# In "--quick" mode, only the first (smallest) test case of each generator is kept.
+def BuildCases(Quick):
+	Cases = []
+	for CaseList in (CombinationCases(), ContributionCases(), CarbonCapCases()):
+		Cases.extend(CaseList[:1] if Quick else CaseList)
+	return Cases
+
+
+# Measuring a Test Case
+# ---------------------
+# Each attempt runs the generator in a new Python process (started with "--measure"), so that its
+# peak memory is measured on its own.  The process adds the folder holding the synthetic files to the
+# start of the module search path (so the synthetic policy catalog is used), runs the generator, and
+# prints the time taken and its peak memory on its last line of output.  Peak memory is the largest
+# resident set size of the process, which includes the memory used by Python itself.  Where this is
+# not available (on Windows), the peak memory allocated by Python objects is measured instead, which
+# slows the generator down somewhat.
+def MeasureScript(ScriptFile):
+	import runpy
+
+	sys.path.insert(0, os.path.dirname(os.path.abspath(ScriptFile)))
+	sys.argv = [ScriptFile]
+	try:
+		import resource
+	except ImportError:
+		resource = None
+		import tracemalloc
+		tracemalloc.start()
+	Start = time.perf_counter()
+	runpy.run_path(ScriptFile, run_name="__main__")
+	Seconds = time.perf_counter() - Start
+	if resource is not None:
+		PeakBytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+		MemoryKind = "Resident"
+	else:
+		PeakBytes = tracemalloc.get_traced_memory()[1]
+		MemoryKind = "PythonObjects"
+	print(json.dumps({"Seconds": Seconds, "PeakBytes": PeakBytes, "MemoryKind": MemoryKind}))
+
+def RunCase(Case, Folder):
+	with open(Case["Generator"], 'r') as GeneratorFile:
+		Source = ChangeSettings(GeneratorFile.read(), Case["Settings"])
+	ScriptFile = os.path.join(Folder, "Benchmark" + Case["Generator"])
+	with open(ScriptFile, 'w') as GeneratorFile:
+		GeneratorFile.write(Source)
+
+	Attempts = []
+	for Attempt in range(Repeats):
+		Process = subprocess.run([sys.executable, os.path.abspath(__file__), "--measure", ScriptFile], cwd=Folder, capture_output=True, text=True)
+		if Process.returncode != 0:
+			raise RuntimeError(Case["Name"] + " failed:\n" + Process.stdout + Process.stderr)
+		Attempts.append(json.loads(Process.stdout.strip().splitlines()[-1]))
+
+	OutputScript = os.path.join(Folder, Case["OutputScript"])
+	ScriptBytes = os.path.getsize(OutputScript)
+	ScriptLines = 0
+	NumRuns = 0
+	with open(OutputScript, 'r') as Script:
+		for Line in Script:
+			ScriptLines += 1
+			if Line.startswith("MENU>RUN|"):
+				NumRuns += 1
+
+	Fastest = min(Attempts, key=lambda Attempt: Attempt["Seconds"])
+	return {
+		"Name": Case["Name"],
+		"Generator": Case["Generator"],
+		"Parameters": Case["Parameters"],
+		"NumRuns": NumRuns,
+		"Seconds": Fastest["Seconds"],
+		"AllSeconds": [Attempt["Seconds"] for Attempt in Attempts],
+		"MicrosecondsPerRun": Fastest["Seconds"] / max(1, NumRuns) * 1000000,
+		"PeakMemoryMB": min(Attempt["PeakBytes"] for Attempt in Attempts) / 1000000,
+		"MemoryKind": Fastest["MemoryKind"],
+		"ScriptBytes": ScriptBytes,
+		"ScriptLines": ScriptLines,
+		"BytesPerRun": ScriptBytes / max(1, NumRuns),
+		"LinesPerRun": ScriptLines / max(1, NumRuns),
+	}
+
+
+# Comparing Against a Baseline
+# ----------------------------
+# Test cases are matched by name.  Besides regressions, any change in the size of a command script
+# is reported, because it means the generator's output has changed, which may or may not be intended.
+def CompareResults(Baseline, Results):
+	BaselineCases = dict((Case["Name"], Case) for Case in Baseline["Cases"])
+	Regressions = []
+	print("")
+	print("Comparison with the baseline from " + Baseline.get("Date", "an unknown date") + ":")
+	for Case in Results["Cases"]:
+		Before = BaselineCases.get(Case["Name"])
+		if Before is None:
+			print("  " + Case["Name"] + ": not in the baseline")
+			continue
+		TimeRatio = Case["Seconds"] / Before["Seconds"] if Before["Seconds"] > 0 else 1.0
+		MemoryRatio = Case["PeakMemoryMB"] / Before["PeakMemoryMB"] if Before["PeakMemoryMB"] > 0 else 1.0
+		Problems = []
+		if TimeRatio > 1 + TimeTolerance and Case["Seconds"] - Before["Seconds"] >= MinTimeDifference:
+			Problems.append("slower")
+		if MemoryRatio > 1 + MemoryTolerance and Case.get("MemoryKind") == Before.get("MemoryKind"):
+			Problems.append("more memory")
+		if Problems:
+			Regressions.append(Case["Name"])
+		Notes = ("  REGRESSION (" + ", ".join(Problems) + ")") if Problems else ""
+		if Case["ScriptBytes"] != Before["ScriptBytes"]:
+			Notes += "  (command script size changed from " + str(Before["ScriptBytes"]) + " to " + str(Case["ScriptBytes"]) + " bytes)"
+		print("  " + Case["Name"] + ": " + format(Before["Seconds"], ".3f") + " s -> " + format(Case["Seconds"], ".3f") + " s (x" + format(TimeRatio, ".2f") + "), " + format(Before["PeakMemoryMB"], ".1f") + " MB -> " + format(Case["PeakMemoryMB"], ".1f") + " MB (x" + format(MemoryRatio, ".2f") + ")" + Notes)
+	return Regressions
+
+
+if __name__ == "__main__":
+
+	Arguments = sys.argv[1:]
+	if len(Arguments) == 2 and Arguments[0] == "--measure":
+		MeasureScript(Arguments[1])
+		sys.exit(0)
+	for ArgumentIndex in range(len(Arguments)):
+		if Arguments[ArgumentIndex] == "--compare" and ArgumentIndex + 1 < len(Arguments):
+			BaselineFile = Arguments[ArgumentIndex + 1]
+	Quick = "--quick" in Arguments
+
+	# Writing the results over the baseline file would lose the baseline, so a copy must be compared instead.
+	Baseline = None
+	if BaselineFile != "":
+		if os.path.abspath(BaselineFile) == os.path.abspath(BenchmarkFile):
+			sys.exit("Error: The baseline file " + BaselineFile + " is the BenchmarkFile, to which the results are written.  Compare against a copy of it instead.")
+		try:
+			with open(BaselineFile, 'r') as File:
+				Baseline = json.load(File)
+		except (OSError, ValueError) as Error:
+			sys.exit("Error: The baseline file " + BaselineFile + " could not be read (" + str(Error) + ").")
+
+	Cases = BuildCases(Quick)
+	NumPolicies = max([max(CombinationPolicyCounts, default=0)] + [NumGroups * PoliciesPerGroup for NumGroups in ContributionGroupCounts])
+	Results = {
+		"Date": time.strftime("%Y-%m-%d %H:%M:%S"),
+		"Python": platform.python_version(),
+		"Platform": platform.platform(),
+		"Repeats": Repeats,
+		"Cases": [],
+	}
+	with tempfile.TemporaryDirectory() as Folder:
+		WriteSyntheticModel(Folder, NumPolicies)
+		WriteSyntheticCatalog(Folder, NumPolicies)
+
+		# The model file is read once before any test case is timed, so the index of its names is
+		# cached (see ModelSymbols.py) and every attempt loads it the same way.
+		# The cache is named after the model file as the generators give it, so it is made from the
+		# same folder in which they run.
+		from ModelSymbols import LoadModelSymbols
+		WorkingDirectory = os.getcwd()
+		os.chdir(Folder)
+		try:
+			LoadModelSymbols("Benchmark.mdl")
+		finally:
+			os.chdir(WorkingDirectory)
+
+		for Case in Cases:
+			try:
+				Result = RunCase(Case, Folder)
+			except RuntimeError as Error:
+				sys.exit("Error: " + str(Error))
+			Results["Cases"].append(Result)
+			print(Result["Name"] + ": " + str(Result["NumRuns"]) + " runs in " + format(Result["Seconds"], ".3f") + " s (" + format(Result["MicrosecondsPerRun"], ".1f") + " us per run), peak memory " + format(Result["PeakMemoryMB"], ".1f") + " MB, " + str(Result["ScriptBytes"]) + " bytes (" + format(Result["LinesPerRun"], ".1f") + " lines per run)")
+
+	with open(BenchmarkFile, 'w') as File:
+		json.dump(Results, File, indent="\t")
+	print("Wrote the results to " + BenchmarkFile + ".")
+
+	if Baseline is not None:
+		Regressions = CompareResults(Baseline, Results)
+		if len(Regressions) > 0:
+			sys.exit("Error: " + str(len(Regressions)) + " test cases regressed: " + ", ".join(Regressions))
@@ -0,0 +1,210 @@
+# BuildWedgesAndCostCurve.py
+#
+# This is a Python script that builds the data for a wedge diagram and a cost curve from the
+# results of a command script generated by CreateContributionTestScript.py in "Enable" or
+# "Disable" mode.  It carries out the procedure described in "Producing a Wedge Diagram" in
+# docs/testing-policy-contributions.md, so the wedges no longer need to be built by hand in a
+# spreadsheet:
+#
+# 1. The abatement caused by each policy group in each year is found by comparing the run that
+#    tests the group to the reference run (the BAU run in "Enable" mode, or the full policy
+#    package run in "Disable" mode).  Emissions are the sum of the variables in WedgeVarsFile.
+# 2. Groups that increase emissions in a year are given no wedge in that year.
+# 3. The remaining groups are scaled so that their wedges add up to the abatement of the full
+#    policy package in each year.
+#
+# For the cost curve, each group's abatement is the change in cumulative CO2e emissions over the
+# years in the results file, and its cost is the change in the net present value of capital and
+# operating expenditures, both measured the same way as the group's wedge (against BAU or against
+# the full package).  A group's box on the cost curve is as wide as its average annual abatement
+# and as tall as its cost per ton of CO2e abated (negative for savings).  The cost curve variables
+# must be included in the OutputVarsFile used by CreateContributionTestScript.py (by default,
+# OutputVarsForWedgeDiagram.lst includes them).  If they are not in the results file, only the
+# wedges are written.
+#
+# This script requires the NumPy package.
+
+
+# File Names
+# ----------
+RunResultsFile = "ContributionTestResults.tsv" # The results file produced by the Vensim command script
+WedgeVarsFile = "OutputVarsForWedgeDiagram.lst" # The file listing the emissions variables that add up to total emissions
+WedgeDiagramFile = "WedgeDiagram.csv" # The file to which the wedges will be written
+CostCurveFile = "CostCurve.json" # The file to which the cost curve will be written
+
+# Other Settings
+# --------------
+CumulativeEmissionsVariable = "Output Cumulative Total CO2e Emissions" # Used for cost curve abatement (in million metric tons)
+CostVariable = "Output First Year NPV of CapEx and OpEx through This Year" # Used for cost curve costs
+TonsPerEmissionsUnit = 1000000 # The number of metric tons in the unit of the emissions variables (million metric tons)
+PolicySchedule = None # If the results file holds runs under several policy implementation schedules (see PolicySchedules
+					  # in CreateContributionTestScript.py), the number of the schedule whose runs should be used
+FirstYear = "2019" # Only used if the results file does not begin with a "Time" row
+FinalYear = "2050" # Only used if the results file does not begin with a "Time" row
+
+
+import json
+import sys
+
+import numpy
+
+from RunResultsTools import IterateRuns, MatchesSchedule, ParseMetadata, ParseValues, ReadYears
+
+
+# Layouts of the Results File
+# ---------------------------
+# In "Enable" mode, each run is identified by an "EnabledPolicyGroup" column, and in "Disable"
+# mode, by a "DisabledPolicyGroup" column.  In both modes, the value "None" or "All" marks the
+# BAU run or the full policy package run.  The table below lists, for each layout, the run that
+# groups are compared against, and the sign that turns "group run minus reference run" into
+# abatement (a reduction in emissions).
+Layouts = {
+	# Column name: (BAU run, full package run, reference run, sign)
+	"EnabledPolicyGroup": ("None", "All", "None", -1.0),
+	"DisabledPolicyGroup": ("All", "None", "None", 1.0),
+}
+
+
+# Reading the Results
+# -------------------
+# We read the results one run at a time.  For each run, we keep only the total of the emissions
+# variables in each year and the final-year values of the cost curve variables, so memory use
+# does not depend on the number of variables in the results file.
+def ReadWedgeVariables(WedgeVarsFile, CumulativeEmissionsVariable, CostVariable):
+	with open(WedgeVarsFile, 'r') as VarsFile:
+		Variables = [Line.strip() for Line in VarsFile if Line.strip() != ""]
+	return [Variable for Variable in Variables if Variable not in (CumulativeEmissionsVariable, CostVariable)]
+
+def ReadGroupRuns(RunResultsFile, Years, WedgeVariables, CumulativeEmissionsVariable, CostVariable, Schedule=None):
+	WedgeVariables = set(WedgeVariables)
+	SchedulesFound = set()
+	LayoutColumn = None
+	RunNames = []
+	Emissions = []
+	CostCurveValues = []
+	FoundVariables = set()
+	for Metadata, Rows in IterateRuns(RunResultsFile, len(Years)):
+		Parsed = ParseMetadata(Metadata)
+		if not MatchesSchedule(Parsed, Schedule, SchedulesFound):
+			continue
+		for Column in Layouts:
+			if Column in Parsed:
+				if LayoutColumn is not None and Column != LayoutColumn:
+					raise ValueError("The results file mixes runs from \"Enable\" and \"Disable\" modes.")
+				LayoutColumn = Column
+				break
+		else:
+			continue
+
+		RunEmissions = numpy.zeros(len(Years))
+		RunCostCurveValues = [numpy.nan, numpy.nan]
+		for Name, Values in Rows:
+			if Name in WedgeVariables:
+				RunEmissions += ParseValues(Values)
+				FoundVariables.add(Name)
+			elif Name == CumulativeEmissionsVariable:
+				RunCostCurveValues[0] = ParseValues(Values)[-1]
+			elif Name == CostVariable:
+				RunCostCurveValues[1] = ParseValues(Values)[-1]
+		RunNames.append(Parsed[LayoutColumn])
+		Emissions.append(RunEmissions)
+		CostCurveValues.append(RunCostCurveValues)
+
+	if LayoutColumn is None:
+		raise ValueError("The results file " + RunResultsFile + " has no runs from CreateContributionTestScript.py in \"Enable\" or \"Disable\" mode.")
+	if len(FoundVariables) == 0:
+		raise ValueError("None of the variables in the wedge variables file were found in the results file.")
+	for RequiredRun in Layouts[LayoutColumn][:2]:
+		if RequiredRun not in RunNames:
+			raise ValueError("The results file is missing the run with " + LayoutColumn + "=" + RequiredRun + ".")
+	return LayoutColumn, RunNames, numpy.array(Emissions), numpy.array(CostCurveValues)
+
+
+# Computing the Wedges
+# --------------------
+# The runs are stacked into arrays (one row per run), so each step of the procedure is a single
+# array operation over all groups and years at once.
+def ComputeWedges(LayoutColumn, RunNames, Emissions):
+	BAURun, FullRun, ReferenceRun, Sign = Layouts[LayoutColumn]
+	Reference = RunNames.index(ReferenceRun)
+	GroupRuns = [Index for Index, Name in enumerate(RunNames) if Name not in (BAURun, FullRun)]
+
+	TotalAbatement = Emissions[RunNames.index(BAURun)] - Emissions[RunNames.index(FullRun)]
+	GroupAbatement = Sign * (Emissions[GroupRuns] - Emissions[Reference])
+
+	# Groups that increase emissions in a year get no wedge in that year, and the others are
+	# scaled to add up to the abatement of the full package.  If no group reduces emissions in a
+	# year, all wedges in that year are zero.
+	PositiveAbatement = numpy.clip(GroupAbatement, 0.0, None)
+	PositiveTotals = PositiveAbatement.sum(axis=0)
+	Scale = numpy.divide(TotalAbatement, PositiveTotals, out=numpy.zeros_like(TotalAbatement), where=PositiveTotals > 0)
+	Wedges = PositiveAbatement * Scale
+	RemainingEmissions = Emissions[RunNames.index(FullRun)]
+	return [RunNames[Index] for Index in GroupRuns], GroupAbatement, Wedges, RemainingEmissions, TotalAbatement
+
+
+# Computing the Cost Curve
+# ------------------------
+# Groups are sorted from the lowest to the highest cost per ton, and each box begins where the
+# previous box ends.  Groups that do not reduce cumulative emissions cannot be placed on a cost
+# curve, so they are listed separately.
+def ComputeCostCurve(LayoutColumn, RunNames, CostCurveValues, NumYears, TonsPerEmissionsUnit):
+	BAURun, FullRun, ReferenceRun, Sign = Layouts[LayoutColumn]
+	Reference = RunNames.index(ReferenceRun)
+	GroupRuns = [Index for Index, Name in enumerate(RunNames) if Name not in (BAURun, FullRun)]
+
+	Changes = Sign * (CostCurveValues[GroupRuns] - CostCurveValues[Reference])
+	Abatement = Changes[:, 0]
+	Costs = -Changes[:, 1]
+	with numpy.errstate(divide='ignore', invalid='ignore'):
+		CostPerTon = Costs / (Abatement * TonsPerEmissionsUnit)
+
+	Boxes = []
+	Excluded = []
+	for Position in numpy.argsort(CostPerTon, kind='stable'):
+		Entry = {
+			"Group": RunNames[GroupRuns[Position]],
+			"CumulativeAbatement": float(Abatement[Position]),
+			"Cost": float(Costs[Position]),
+		}
+		if Abatement[Position] > 0:
+			Boxes.append(Entry)
+		else:
+			Excluded.append(Entry)
+
+	Start = 0.0
+	for Box in Boxes:
+		Box["CostPerTon"] = Box["Cost"] / (Box["CumulativeAbatement"] * TonsPerEmissionsUnit)
+		Box["Width"] = Box["CumulativeAbatement"] / NumYears
+		Box["Start"] = Start
+		Start += Box["Width"]
+	return Boxes, Excluded
+
+
+if __name__ == "__main__":
+
+	Years = ReadYears(RunResultsFile, FirstYear, FinalYear)
+	WedgeVariables = ReadWedgeVariables(WedgeVarsFile, CumulativeEmissionsVariable, CostVariable)
+	try:
+		LayoutColumn, RunNames, Emissions, CostCurveValues = ReadGroupRuns(RunResultsFile, Years, WedgeVariables, CumulativeEmissionsVariable, CostVariable, PolicySchedule)
+	except ValueError as Error:
+		sys.exit("Error: " + str(Error))
+	Groups, GroupAbatement, Wedges, RemainingEmissions, TotalAbatement = ComputeWedges(LayoutColumn, RunNames, Emissions)
+
+	# We write one row per series, with the remaining emissions first, so the rows can be graphed
+	# directly as a stacked area chart (with the remaining emissions series made transparent).
+	with open(WedgeDiagramFile, 'w') as f:
+		f.write("Series," + ",".join(str(Year) for Year in Years) + "\n")
+		f.write("Remaining Emissions," + ",".join(format(Value, ".7g") for Value in RemainingEmissions) + "\n")
+		for GroupName, GroupWedges in zip(Groups, Wedges):
+			f.write('"' + GroupName.replace('"', '""') + '",' + ",".join(format(Value, ".7g") for Value in GroupWedges) + "\n")
+		f.write("Total Package Abatement," + ",".join(format(Value, ".7g") for Value in TotalAbatement) + "\n")
+	print("Wrote wedges for " + str(len(Groups)) + " policy groups (" + LayoutColumn + " layout) to " + WedgeDiagramFile + ".")
+
+	if numpy.isnan(CostCurveValues).all(axis=0).any():
+		print("The cost curve variables are not in the results file, so no cost curve was written.")
+	else:
+		Boxes, Excluded = ComputeCostCurve(LayoutColumn, RunNames, CostCurveValues, len(Years), TonsPerEmissionsUnit)
+		with open(CostCurveFile, 'w') as f:
+			json.dump({"FirstYear": Years[0], "FinalYear": Years[-1], "Layout": LayoutColumn, "Boxes": Boxes, "Excluded": Excluded}, f, separators=(",", ":"))
+		print("Wrote a cost curve with " + str(len(Boxes)) + " policy groups to " + CostCurveFile + ".")
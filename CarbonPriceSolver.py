@@ -0,0 +1,99 @@
+# CarbonPriceSolver.py
+#
+# This is a Python module used by CreateCarbonCapToTaxScript.py (in its "Solve" mode) to find
+# the carbon tax lever setting at which emissions from the sectors covered by a carbon cap equal
+# the cap, using as few model runs as possible.
+#
+# Rather than testing every price between the floor and the ceiling, we search for the price.
+# Emissions fall as the carbon price rises, so once we have one price whose emissions are above
+# the cap and one price whose emissions are below it, the answer lies in between.  Each new run
+# is placed where a straight line between those two points crosses the cap (a "secant" or "false
+# position" step), which usually lands very close to the answer.  If that step would barely
+# shrink the search range, we test the midpoint instead (a "bisection" step), which halves the
+# range every run.  Either way, the search reaches a precise answer in about ten runs.
+#
+# The solver does not know how to run the model.  Instead, it is given a function (called
+# "Simulate" below) that performs a run at a given price and returns the covered-sector
+# emissions in each year.  This allows the same solver to be used with Vensim, with the stand-in
+# simulator in SimulatorStandIn.py, or with any other way of producing results.
+
+
+# If a secant step would land within this fraction of the search range from either end of the
+# range, we take a bisection step instead.
+MinStepFraction = 0.1
+
+
+# Finding the Price for Each Year
+# -------------------------------
+# Simulate: a function that takes a price and returns a dictionary of covered-sector emissions by year
+# CapsByYear: a dictionary of the emissions cap in each year of interest
+# PriceFloor, PriceCeiling: the lowest and highest prices to consider
+# Tolerance: the search ends when emissions are within this amount of the cap
+# PriceTolerance: the search also ends when the range of possible prices is narrower than this
+# MaxRuns: the search is abandoned if it needs more runs than this, in total across all years
+#
+# Every run provides emissions in every year, so the runs performed while searching for one year's
+# price are reused when searching for the next year's price.  The function returns a dictionary
+# with an entry for each year, containing the price, the emissions at that price, and a status:
+# "Solved" (emissions within Tolerance of the cap), "Converged" (the price range shrank below
+# PriceTolerance), "Floor" (emissions are below the cap even at the price floor), or "Ceiling"
+# (emissions are above the cap even at the price ceiling).  It also returns the emissions from
+# every run, by price.
+def SolveCarbonPrices(Simulate, CapsByYear, PriceFloor, PriceCeiling, Tolerance, PriceTolerance, MaxRuns):
+
+	Evaluations = {}
+
+	def Evaluate(Price):
+		if Price not in Evaluations:
+			if len(Evaluations) >= MaxRuns:
+				raise RuntimeError("The carbon price search needed more than " + str(MaxRuns) + " runs.  Increase MaxSolverRuns or Tolerance.")
+			Evaluations[Price] = Simulate(Price)
+		return Evaluations[Price]
+
+	Solutions = {}
+	for Year in sorted(CapsByYear):
+		Cap = CapsByYear[Year]
+
+		def Excess(Price):
+			return Evaluate(Price)[Year] - Cap
+
+		# We first check the floor and the ceiling.  If the cap is met at the floor price, or not
+		# met even at the ceiling price, the permit price is the floor or ceiling, respectively.
+		if Excess(PriceFloor) <= Tolerance:
+			Solutions[Year] = (PriceFloor, Evaluations[PriceFloor][Year], "Solved" if Excess(PriceFloor) >= -Tolerance else "Floor")
+			continue
+		if Excess(PriceCeiling) >= -Tolerance:
+			Solutions[Year] = (PriceCeiling, Evaluations[PriceCeiling][Year], "Solved" if Excess(PriceCeiling) <= Tolerance else "Ceiling")
+			continue
+
+		# Next, we narrow the range using any runs already performed (for earlier years), so that
+		# the low end of the range has emissions above the cap and the high end has emissions below it.
+		Low, High = PriceFloor, PriceCeiling
+		for Price in Evaluations:
+			if Low < Price < High:
+				if Excess(Price) > 0:
+					Low = Price
+				else:
+					High = Price
+		ExcessLow, ExcessHigh = Excess(Low), Excess(High)
+
+		Solution = None
+		while Solution is None:
+			if abs(ExcessHigh) <= Tolerance:
+				Solution = (High, "Solved")
+			elif abs(ExcessLow) <= Tolerance:
+				Solution = (Low, "Solved")
+			elif High - Low <= PriceTolerance:
+				Solution = (High if abs(ExcessHigh) < abs(ExcessLow) else Low, "Converged")
+			else:
+				Width = High - Low
+				Price = Low + ExcessLow * Width / (ExcessLow - ExcessHigh)
+				if not (Low + MinStepFraction * Width < Price < High - MinStepFraction * Width):
+					Price = Low + Width / 2
+				if Excess(Price) > 0:
+					Low, ExcessLow = Price, Excess(Price)
+				else:
+					High, ExcessHigh = Price, Excess(Price)
+		Solutions[Year] = (Solution[0], Evaluations[Solution[0]][Year], Solution[1])
+
+	return Solutions, Evaluations
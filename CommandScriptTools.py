@@ -0,0 +1,203 @@
+# CommandScriptTools.py
+#
+# This is a Python module containing functions shared by the Python scripts that generate
+# Vensim command scripts (such as CreateCombinationsScript.py, CreateContributionTestScript.py,
+# CreateCarbonCapToTaxScript.py, and CreateDataLoggingScript.py).  It is not meant to be run on its own.
+
+import sys
+
+
+# Shards
+# ------
+# A batch of runs may be split into several independent Vensim command scripts, called "shards,"
+# so that several copies of Vensim (for example, one per processor core) can work on the batch at
+# the same time.  Each shard has its own command script, its own run name (and therefore its own
+# .vdfx file), and its own results file, so shards never interfere with one another.  When all of
+# the shards are done, MergeShardResults.py stitches the shard results files back together into
+# a single results file.
+#
+# Shards are numbered starting from 1.  When there is only one shard, all file names and run
+# names are left unchanged, so the generated command script is the same as it would be without
+# sharding.
+
+# The number of shards is normally set in the "Other Settings" section of each script, but it may
+# also be given on the command line (for example, "python CreateCombinationsScript.py --shards 8"),
+# in which case the command line value takes precedence.
+def ReadNumShards(NumShards):
+	Arguments = sys.argv[1:]
+	for ArgumentIndex in range(len(Arguments)):
+		if Arguments[ArgumentIndex] == "--shards" and ArgumentIndex + 1 < len(Arguments):
+			NumShards = Arguments[ArgumentIndex + 1]
+		elif Arguments[ArgumentIndex].startswith("--shards="):
+			NumShards = Arguments[ArgumentIndex][len("--shards="):]
+	try:
+		NumShards = int(NumShards)
+	except ValueError:
+		NumShards = 0
+	if NumShards < 1:
+		raise ValueError("The number of shards must be a whole number of at least 1.")
+	return NumShards
+
+# We add the shard number to a file name (or run name) just before its extension, so that
+# "RunResults.tsv" becomes "RunResults_Shard3.tsv" and "MostRecentRun" becomes "MostRecentRun_Shard3".
+def ShardFileName(FileName, ShardNumber, NumShards):
+	if NumShards <= 1:
+		return FileName
+	DotPosition = FileName.rfind(".")
+	if DotPosition <= 0:
+		return FileName + "_Shard" + str(ShardNumber)
+	return FileName[:DotPosition] + "_Shard" + str(ShardNumber) + FileName[DotPosition:]
+
+# Each shard performs a contiguous block of runs, and the blocks differ in size by at most one run.
+# This function returns the index of the first run in the shard and the index one past its last run
+# (run indices count from zero).  If there are more shards than runs, some shards will be empty,
+# so scripts should use no more shards than they have runs.
+def ShardRunRange(ShardNumber, NumShards, NumRuns):
+	FirstRunIndex = (ShardNumber - 1) * NumRuns // NumShards
+	LastRunIndex = ShardNumber * NumRuns // NumShards
+	return FirstRunIndex, LastRunIndex
+
+
+# Save Lists
+# ----------
+# Vensim normally saves every variable in the model to the .vdfx file after each run, even though
+# only the variables in the OutputVarsFile are exported to the results file.  A SAVELIST limits the
+# .vdfx file to the listed variables, which makes each .vdfx file much smaller and faster to write
+# and to export.  Vensim still calculates every variable in the model during a run (the savelist
+# only controls what is written to disk), so the savelist only needs to hold the variables that
+# will be exported, not the variables they are calculated from.
+#
+# This function writes a savelist containing every entry in the given output variable files, once
+# each.  Entries with "*" subscripts are expanded (see ModelSymbols.py), and entries for single
+# elements of a variable are left out if the whole variable is also listed.  The savelist file is
+# named after the command script, so each script has its own.
+def SaveListFileName(OutputScript):
+	DotPosition = OutputScript.rfind(".")
+	if DotPosition <= 0:
+		return OutputScript + "SaveList.lst"
+	return OutputScript[:DotPosition] + "SaveList.lst"
+
+def WriteSaveList(ModelFile, OutputVarsFiles, SaveListFile):
+	import os
+	from ModelSymbols import LoadModelSymbols, NameKey, ReadOutputVarsFile, SplitName
+
+	Symbols = None
+	if ModelFile.lower().endswith(".mdl") and os.path.isfile(ModelFile):
+		Symbols = LoadModelSymbols(ModelFile)
+
+	Entries = []
+	for OutputVarsFile in OutputVarsFiles:
+		for LineNumber, Entry in ReadOutputVarsFile(OutputVarsFile):
+			Entries.extend(Symbols.ExpandName(Entry) if Symbols is not None else [Entry])
+
+	WholeVariables = set(NameKey(Entry) for Entry in Entries if SplitName(Entry)[1] is None)
+	SavedKeys = set()
+	with open(SaveListFile, 'w') as SaveList:
+		for Entry in Entries:
+			VariableName, Subscripts = SplitName(Entry)
+			Key = NameKey(VariableName) + ("" if Subscripts is None else "[" + ",".join(NameKey(Subscript) for Subscript in Subscripts) + "]")
+			if Key in SavedKeys or (Subscripts is not None and NameKey(VariableName) in WholeVariables):
+				continue
+			SavedKeys.add(Key)
+			SaveList.write(Entry + "\n")
+
+
+# Policy Implementation Schedules
+# -------------------------------
+# The model reads the fraction of each policy implemented in each year from one of nine schedule files
+# (FoPITY-1.csv to FoPITY-9.csv in InputData/plcy-schd/FoPITY), chosen with the "Policy Implementation
+# Schedule Selector".  A script may perform the same runs under several schedules, listed in its
+# PolicySchedules setting, so that they do not need to be generated and performed as separate batches.
+# Each run records its schedule in a "PolicySchedule=" column, which always holds a whole number, so
+# tools that read the results (such as ResultsStore.py) treat it as a number.  Every run is performed
+# under every listed schedule, even a run with no policies enabled (such as the BAU run), because the
+# schedule also scales settings whose default values are not zero, such as the GRA revenue allocation
+# settings.
+ScheduleSelector = "Policy Implementation Schedule Selector"
+
+def ReadPolicySchedules(PolicySchedules):
+	if isinstance(PolicySchedules, int):
+		PolicySchedules = [PolicySchedules]
+	Schedules = []
+	for Schedule in PolicySchedules:
+		if isinstance(Schedule, bool) or not isinstance(Schedule, int) or Schedule < 1 or Schedule > 9:
+			raise ValueError("Policy implementation schedules must be whole numbers from 1 to 9, but PolicySchedules lists " + repr(Schedule) + ".")
+		if Schedule not in Schedules:
+			Schedules.append(Schedule)
+	if len(Schedules) < 1:
+		raise ValueError("At least one policy implementation schedule must be listed in PolicySchedules.")
+	return Schedules
+
+def ScheduleSetvalText(Schedule):
+	return "SIMULATE>SETVAL|" + ScheduleSelector + "=" + str(Schedule) + "\n"
+
+def ScheduleColumnText(Schedule):
+	return "\tPolicySchedule=" + str(Schedule)
+
+
+# Resuming a Batch
+# ----------------
+# Vensim sometimes stops part-way through a long batch of runs (for example, if sync software locks a
+# .vdfx file).  Rather than performing the whole batch again, a script may be run in "resume" mode,
+# either by changing its Resume setting or by adding "--resume" on the command line.  In resume mode,
+# the script reads the results file left by the interrupted batch, finds the runs that were completed,
+# and writes a command script that performs only the remaining runs, appending their results to the
+# same results file.
+def ReadResume(Resume):
+	return bool(Resume) or "--resume" in sys.argv[1:]
+
+# This function returns the values of the IdentifyingColumn (such as "CurrentRunNumber") of the runs
+# that were completed in a results file.  If a run is only identified by several columns together
+# (such as "CurrentPrice" and "PolicySchedule"), IdentifyingColumn may be a tuple of column names, and
+# each run is returned as a tuple of its values in those columns (None for a column the run does not
+# have).  Vensim writes all of the rows of one run before beginning the next, so a run is complete if
+# another run follows it.  The last run in the file is only counted as complete if the file does not
+# end part-way through a line, every one of its rows has a value in every year column, and (if there
+# is a run before it) it has as many rows as that run.  Incomplete runs are removed from the results
+# file, so that they are not listed twice once they have been performed again.  If the file does not
+# exist, no runs were completed.
+def FindCompletedRuns(ResultsFile, FirstYear, FinalYear, IdentifyingColumn):
+	import os
+	from RunResultsTools import IsTimeRow, ParseMetadata, SplitResultsLine
+
+	if not os.path.isfile(ResultsFile):
+		return set()
+	NumYears = int(FinalYear) - int(FirstYear) + 1
+
+	Runs = []
+	RowCounts = {}
+	MissingValues = set()
+	Truncated = False
+	with open(ResultsFile, 'r', newline='') as Results:
+		for Line in Results:
+			if not Line.endswith("\n"):
+				Truncated = True
+				break
+			if IsTimeRow(Line) or Line.strip() == "":
+				continue
+			Name, Metadata, Values = SplitResultsLine(Line, NumYears)
+			# A row with fewer columns than the rows before it is missing some of its year columns (so
+			# its metadata columns cannot be found), and it belongs to the run before it.
+			Short = len(Values) < NumYears or (len(Runs) > 0 and len(Metadata) < len(Runs[-1]))
+			if Short and len(Runs) > 0:
+				Metadata = Runs[-1]
+			if len(Runs) == 0 or Runs[-1] != Metadata:
+				Runs.append(Metadata)
+			RowCounts[Metadata] = RowCounts.get(Metadata, 0) + 1
+			if Short or any(Value.strip() == "" for Value in Values):
+				MissingValues.add(Metadata)
+
+	CompleteRuns = set(Runs[:-1])
+	if len(Runs) >= 1 and not Truncated and Runs[-1] not in MissingValues and (len(Runs) == 1 or RowCounts[Runs[-1]] == RowCounts[Runs[-2]]):
+		CompleteRuns.add(Runs[-1])
+
+	if Truncated or len(CompleteRuns) < len(Runs):
+		with open(ResultsFile, 'r', newline='') as Results, open(ResultsFile + ".tmp", 'w', newline='') as Kept:
+			for Line in Results:
+				if IsTimeRow(Line) or (Line.endswith("\n") and SplitResultsLine(Line, NumYears)[1] in CompleteRuns):
+					Kept.write(Line)
+		os.replace(ResultsFile + ".tmp", ResultsFile)
+
+	if isinstance(IdentifyingColumn, tuple):
+		return set(tuple(ParseMetadata(Metadata).get(Column) for Column in IdentifyingColumn) for Metadata in CompleteRuns)
+	return set(ParseMetadata(Metadata).get(IdentifyingColumn) for Metadata in CompleteRuns)
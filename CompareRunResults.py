@@ -0,0 +1,250 @@
+# CompareRunResults.py
+#
+# This is a Python script that compares the results of the same runs performed with two versions of
+# the model (for example, before and after changing EPS.mdl or the InputData folder during
+# calibration), and lists the variables whose results differ the most.  Each results file written by
+# the other Python scripts' command scripts (such as Scenario_NDC.tsv from CreateDataLoggingScript.py,
+# or RunResults.tsv from CreateCombinationsScript.py) is compared with the file of the same name
+# written by the other version.  This script requires the NumPy package.
+#
+# Usage:
+#   python CompareRunResults.py                                        # compare the files in OldResults and NewResults
+#   python CompareRunResults.py PreviousResults/Scenario_NDC.tsv Scenario_NDC.tsv  # compare two files
+#   python CompareRunResults.py PreviousResults .                      # compare every .tsv file in PreviousResults
+#                                                                      # with the file of the same name in "."
+#
+# Matching Runs and Variables
+# ---------------------------
+# Runs are matched by their metadata columns (see RunResultsTools.py), leaving out IgnoredColumns
+# (such as the run cache key, which depends on the model file), and variables are matched by name
+# within each run.  Both files are read at the same time, one run at a time, so memory use does not
+# depend on the size of the files, as long as the runs are in the same order in both files (as they
+# are when both files were written by the same command script).  A run that is not yet matched is
+# held until the matching run is found in the other file.  Only the years found in both files are
+# compared.
+#
+# Tolerances and Ranking
+# ----------------------
+# The value of a variable in a year differs if the absolute difference between the new and old values
+# is greater than the absolute tolerance plus the relative tolerance times the absolute old value (the
+# same test as NumPy's isclose function), or if the value is missing (":NA:") in one file but not the
+# other.  The tolerances of a variable are taken from VariableTolerances if it is listed there, either
+# with its subscripts (to set the tolerances of one element) or without them (for every element), and
+# from AbsoluteTolerance and RelativeTolerance otherwise.  Each run's variable that differs in any year
+# is ranked by its largest relative difference (the absolute difference divided by the absolute old
+# value) in a year in which it differs, and the NumDivergencesToReport variables with the largest
+# relative differences are written to the ReportFile, with the year of the largest difference.  An old
+# value of zero gives an infinite relative difference, so such variables are ranked first (by their
+# absolute differences).
+
+
+# File Names
+# ----------
+OldResults = "PreviousResults" # The results file (or folder of results files) written by the old version of the model
+NewResults = "." # The results file (or folder of results files) written by the new version of the model
+ReportFile = "RunResultsComparison.tsv" # The file to which the largest differences are written
+
+# Other Settings
+# --------------
+AbsoluteTolerance = 0.0 # The largest absolute difference that is not reported (see above)
+RelativeTolerance = 1e-6 # The largest difference relative to the old value that is not reported (see above)
+VariableTolerances = {} # The tolerances of particular variables, each as a pair (absolute tolerance, relative tolerance),
+						# for example {"Total CO2e Emissions": (0.0, 1e-3), "Electricity Generation[hard coal es]": (1e6, 0.0)}
+IgnoredColumns = ["RunCacheKey"] # Metadata columns that are not used to match runs
+NumDivergencesToReport = 100 # The number of differing variables written to the ReportFile (in order of their largest difference)
+NumDivergencesToShow = 20 # The number of differing variables printed when the comparison is done
+FirstYear = "2019" # Only used if a results file does not begin with a "Time" row
+FinalYear = "2050" # Only used if a results file does not begin with a "Time" row
+
+
+import collections
+import heapq
+import itertools
+import os
+import sys
+
+import numpy
+
+from ModelSymbols import NameKey, SplitName, VariableKey
+from RunResultsTools import IterateRuns, ParseMetadata, ParseValues, ReadYears
+
+
+# Matching Runs
+# -------------
+def RunKey(Metadata, IgnoredColumns):
+	return tuple(sorted((Key, Value) for Key, Value in ParseMetadata(Metadata).items() if Key not in IgnoredColumns))
+
+def RunLabel(Key):
+	return ", ".join(Value if Column == "RunName" else Column + "=" + Value for Column, Value in Key) or "(no metadata)"
+
+# This generator reads two results files at the same time, and yields the key and the rows of each
+# pair of matching runs.  Runs found in only one of the files are added to the lists UnmatchedOld and
+# UnmatchedNew once both files have been read.
+def MatchRuns(OldFile, OldNumYears, NewFile, NewNumYears, IgnoredColumns, UnmatchedOld, UnmatchedNew):
+	Pending = (collections.defaultdict(collections.deque), collections.defaultdict(collections.deque))
+	OldRuns = IterateRuns(OldFile, OldNumYears)
+	NewRuns = IterateRuns(NewFile, NewNumYears)
+	for OldRun, NewRun in itertools.zip_longest(OldRuns, NewRuns):
+		for Side, Run in ((0, OldRun), (1, NewRun)):
+			if Run is None:
+				continue
+			Key = RunKey(Run[0], IgnoredColumns)
+			Other = Pending[1 - Side]
+			if Key in Other:
+				OtherRows = Other[Key].popleft()
+				if len(Other[Key]) == 0:
+					del Other[Key]
+				yield (Key, OtherRows, Run[1]) if Side == 1 else (Key, Run[1], OtherRows)
+			else:
+				Pending[Side][Key].append(Run[1])
+	UnmatchedOld.extend(Key for Key, Runs in Pending[0].items() for Run in Runs)
+	UnmatchedNew.extend(Key for Key, Runs in Pending[1].items() for Run in Runs)
+
+
+# Comparing Values
+# ----------------
+# The values of a run are converted to numbers all at once, unless some of them are not numbers (such
+# as ":NA:"), in which case they are converted one at a time (see ParseValues in RunResultsTools.py).
+def ValueArray(Rows, YearIndices):
+	try:
+		Values = numpy.array([Values for Name, Values in Rows], dtype=numpy.float64)
+	except ValueError:
+		Values = numpy.array([ParseValues(Values) for Name, Values in Rows], dtype=numpy.float64)
+	return Values.reshape(len(Rows), -1)[:, YearIndices]
+
+def VariableTolerance(Name, VariableTolerances, Default):
+	Key = VariableKey(Name)
+	if Key in VariableTolerances:
+		return VariableTolerances[Key]
+	return VariableTolerances.get(NameKey(SplitName(Name)[0]), Default)
+
+class Comparison:
+
+	def __init__(self, VariableTolerances, AbsoluteTolerance, RelativeTolerance, NumDivergencesToReport):
+		self.Tolerances = {VariableKey(Name): (float(Tolerance[0]), float(Tolerance[1])) for Name, Tolerance in VariableTolerances.items()}
+		self.DefaultTolerance = (float(AbsoluteTolerance), float(RelativeTolerance))
+		self.NameTolerances = {}
+		self.NumDivergencesToReport = NumDivergencesToReport
+		self.Divergences = []
+		self.NumRuns = 0
+		self.NumRows = 0
+		self.NumDivergentRows = 0
+		self.OnlyInOld = set()
+		self.OnlyInNew = set()
+
+	def Tolerance(self, Name):
+		if Name not in self.NameTolerances:
+			self.NameTolerances[Name] = VariableTolerance(Name, self.Tolerances, self.DefaultTolerance)
+		return self.NameTolerances[Name]
+
+	# The largest divergences are kept in a heap, so only NumDivergencesToReport of them are held at once.
+	def CompareRun(self, ResultsFile, Key, OldRows, NewRows, Years, OldYearIndices, NewYearIndices):
+		NewRowIndex = {Name: Index for Index, (Name, Values) in enumerate(NewRows)}
+		OldNames = set(Name for Name, Values in OldRows)
+		Matched = [(Name, Values) for Name, Values in OldRows if Name in NewRowIndex]
+		self.OnlyInOld.update(Name for Name, Values in OldRows if Name not in NewRowIndex)
+		self.OnlyInNew.update(Name for Name, Values in NewRows if Name not in OldNames)
+		self.NumRuns += 1
+		if len(Matched) == 0:
+			return
+
+		Old = ValueArray(Matched, OldYearIndices)
+		New = ValueArray([NewRows[NewRowIndex[Name]] for Name, Values in Matched], NewYearIndices)
+		Tolerances = numpy.array([self.Tolerance(Name) for Name, Values in Matched]).reshape(-1, 2)
+		with numpy.errstate(invalid='ignore', divide='ignore'):
+			Difference = numpy.abs(New - Old)
+			Relative = Difference / numpy.abs(Old)
+			Relative[Difference == 0] = 0
+			Differs = Difference > Tolerances[:, :1] + Tolerances[:, 1:] * numpy.abs(Old)
+		OneMissing = numpy.isnan(Old) != numpy.isnan(New)
+		Differs |= OneMissing
+		Difference[OneMissing] = Relative[OneMissing] = numpy.inf
+
+		DivergentRows = numpy.flatnonzero(Differs.any(axis=1))
+		self.NumRows += len(Matched)
+		self.NumDivergentRows += len(DivergentRows)
+		for Row in DivergentRows:
+			Scores = numpy.where(Differs[Row], Relative[Row], -numpy.inf)
+			Largest = numpy.flatnonzero(Scores == Scores.max())
+			Column = Largest[numpy.argmax(numpy.where(Differs[Row, Largest], Difference[Row, Largest], -numpy.inf))]
+			Score = (float(Relative[Row, Column]), float(Difference[Row, Column]))
+			Entry = (Score, ResultsFile, RunLabel(Key), Matched[Row][0], Years[Column], float(Old[Row, Column]), float(New[Row, Column]))
+			if len(self.Divergences) < self.NumDivergencesToReport:
+				heapq.heappush(self.Divergences, Entry)
+			elif Entry > self.Divergences[0]:
+				heapq.heapreplace(self.Divergences, Entry)
+
+	def Ranked(self):
+		return sorted(self.Divergences, reverse=True)
+
+
+# Comparing Results Files
+# -----------------------
+# Old and New may each be a results file, or a folder of results files, in which case every .tsv file
+# in the Old folder is compared with the file of the same name in the New folder.
+def ResultsFilePairs(Old, New):
+	if not os.path.isdir(Old):
+		return [(Old, New)]
+	Pairs = []
+	for FileName in sorted(os.listdir(Old)):
+		if FileName.lower().endswith(".tsv") and os.path.isfile(os.path.join(New, FileName)):
+			Pairs.append((os.path.join(Old, FileName), os.path.join(New, FileName)))
+	return Pairs
+
+def CompareResultsFiles(OldFile, NewFile, Results, IgnoredColumns, FirstYear, FinalYear):
+	OldYears = ReadYears(OldFile, FirstYear, FinalYear)
+	NewYears = ReadYears(NewFile, FirstYear, FinalYear)
+	Years = sorted(set(OldYears) & set(NewYears))
+	if len(Years) == 0:
+		raise ValueError(OldFile + " and " + NewFile + " have no years in common.")
+	OldYearIndices = [OldYears.index(Year) for Year in Years]
+	NewYearIndices = [NewYears.index(Year) for Year in Years]
+	UnmatchedOld, UnmatchedNew = [], []
+	for Key, OldRows, NewRows in MatchRuns(OldFile, len(OldYears), NewFile, len(NewYears), IgnoredColumns, UnmatchedOld, UnmatchedNew):
+		Results.CompareRun(os.path.basename(NewFile), Key, OldRows, NewRows, Years, OldYearIndices, NewYearIndices)
+	return Years, UnmatchedOld, UnmatchedNew
+
+
+if __name__ == "__main__":
+
+	if len(sys.argv) == 3:
+		OldResults, NewResults = sys.argv[1], sys.argv[2]
+	elif len(sys.argv) != 1:
+		sys.exit("Usage: python CompareRunResults.py [OldResults NewResults]")
+	if not os.path.exists(OldResults):
+		sys.exit("Error: " + OldResults + " does not exist.")
+	if os.path.isdir(OldResults) != os.path.isdir(NewResults):
+		sys.exit("Error: " + OldResults + " and " + NewResults + " must both be results files, or both be folders.")
+	Pairs = ResultsFilePairs(OldResults, NewResults)
+	if len(Pairs) == 0:
+		sys.exit("Error: No .tsv files in " + OldResults + " have a file of the same name in " + NewResults + ".")
+
+	Results = Comparison(VariableTolerances, AbsoluteTolerance, RelativeTolerance, NumDivergencesToReport)
+	for OldFile, NewFile in Pairs:
+		try:
+			Years, UnmatchedOld, UnmatchedNew = CompareResultsFiles(OldFile, NewFile, Results, IgnoredColumns, FirstYear, FinalYear)
+		except (OSError, ValueError) as Error:
+			sys.exit("Error: " + str(Error))
+		print("Compared " + OldFile + " with " + NewFile + " (" + str(Years[0]) + "-" + str(Years[-1]) + ").")
+		for Key in UnmatchedOld:
+			print("  Only in " + OldFile + ": " + RunLabel(Key))
+		for Key in UnmatchedNew:
+			print("  Only in " + NewFile + ": " + RunLabel(Key))
+
+	Ranked = Results.Ranked()
+	with open(ReportFile, 'w') as Report:
+		Report.write("\t".join(["File", "Run", "Variable", "Year", "Old", "New", "Difference", "RelativeDifference"]) + "\n")
+		for Score, ResultsFile, Run, Name, Year, Old, New in Ranked:
+			Report.write("\t".join([ResultsFile, Run, Name, str(Year), repr(Old), repr(New), repr(New - Old), repr(Score[0])]) + "\n")
+
+	print("")
+	print(str(Results.NumDivergentRows) + " of " + str(Results.NumRows) + " variables in " + str(Results.NumRuns) + " runs differ by more than their tolerances.")
+	for Label, Names in (("old", Results.OnlyInOld), ("new", Results.OnlyInNew)):
+		if len(Names) > 0:
+			print(str(len(Names)) + " variables are only in the " + Label + " results, such as: " + ", ".join(sorted(Names)[:5]))
+	for Score, ResultsFile, Run, Name, Year, Old, New in Ranked[:NumDivergencesToShow]:
+		Change = "missing in one file" if numpy.isnan(Old) or numpy.isnan(New) else "from zero" if Old == 0 else format(100 * (New - Old) / abs(Old), "+.3g") + "%"
+		print("  " + Name + " (" + Run + ", " + str(Year) + "): " + format(Old, ".6g") + " -> " + format(New, ".6g") + " (" + Change + ")")
+	if len(Ranked) > 0:
+		print("The " + str(len(Ranked)) + " largest differences were written to " + ReportFile + ".")
+	sys.exit(1 if Results.NumDivergentRows > 0 else 0)
@@ -0,0 +1,211 @@
+# CompileImplementationSchedules.py
+#
+# This is a Python script that writes policy implementation schedule files (the FoPITY-N.csv files in
+# InputData/plcy-schd/FoPITY, read by the model as "FoPITY Fraction of Policy Implemented This Year")
+# from "keypoint" files that give each schedule as a few (year, fraction implemented) points, such as
+# the FoPITY-N-WebApp.csv files distributed with the EPS.  Normally, a schedule file is exported by
+# hand from a "Frac of Pol Impl This Yr" Excel workbook (see adjusting-plcy-impl-schd.md).  With this
+# script, many variations of a schedule can be written in a few seconds, without Excel.
+#
+# Usage: python CompileImplementationSchedules.py [KeypointFile.csv ...]
+#
+# Each keypoint file is written to a schedule file with the same name, without "-WebApp" (so
+# FoPITY-4-WebApp.csv is written to FoPITY-4.csv).  Names without "-WebApp" have "-Compiled" added
+# instead.  A schedule file is only written if every schedule in its keypoint file passes the checks
+# described below, so a mistake never replaces a working schedule file.
+#
+# Keypoint Files
+# --------------
+# The first four columns of each row name a policy element, as in FoPITY-policy-elements.csv (the
+# policy and up to three subscripts).  Every policy element must have a row, in the same order as in
+# FoPITY-policy-elements.csv, because the model reads the schedules by position.  The remaining
+# columns are pairs of a year and the fraction of the policy implemented in that year.  Between
+# keypoints, each schedule follows one of these shapes, given in an optional "Shape" column after the
+# four name columns (linear is used if there is no Shape column, or it is blank):
+#   linear: a straight line from one keypoint to the next
+#   step: the fraction of each keypoint holds until the year of the next keypoint (for policies
+#     implemented at full strength at once, or that expire)
+#   sigmoid: an S-shaped curve from one keypoint to the next, which starts and ends slowly, like the
+#     default R&D schedules (its steepness is set with SigmoidSteepness)
+#
+# Checks
+# ------
+# As described in adjusting-plcy-impl-schd.md, every schedule must:
+#   have keypoints from the model's initial time to its final time, in increasing order of year
+#   have no fraction below 0 or above 1 in any year
+#   reach full implementation (a fraction of 1) in at least one year.  Because a sigmoid curve only
+#     approaches its end points, a fraction of 1 - FullImplementationTolerance or more counts as 1.
+
+
+# File Names
+# ----------
+KeypointFiles = [ # The keypoint files to compile (may also be given on the command line).  FoPITY-2-WebApp.csv is not
+				  # listed, because some of its industrial CCS schedules end in 2034 without reaching full implementation,
+				  # so it fails the checks below (FoPITY-2.csv is still exported from its Excel workbook).
+	"InputData/plcy-schd/FoPITY/FoPITY-1-WebApp.csv",
+	"InputData/plcy-schd/FoPITY/FoPITY-3-WebApp.csv"]
+PolicyElementsFile = "InputData/plcy-schd/FoPITY/FoPITY-policy-elements.csv" # The list of policy elements read by the model
+InitialTimeFile = "InputData/plcy-schd/IT/IT.csv" # The file giving the first year of the model run
+FinalTimeFile = "InputData/plcy-schd/FT/FT.csv" # The file giving the last year of the model run
+
+# Other Settings
+# --------------
+SigmoidSteepness = 10 # How sharply sigmoid segments rise in their middle years (larger values are steeper)
+FullImplementationTolerance = 0.01 # How far below 1 the largest fraction in a schedule may be and still count as full implementation
+
+
+import csv
+import os
+import sys
+
+import numpy
+
+
+# Reading the Files
+# -----------------
+def ReadYear(TimeFile):
+	with open(TimeFile, 'r', encoding='utf-8-sig', newline='') as File:
+		return int(float(list(csv.reader(File))[1][1]))
+
+def ReadPolicyElements(ElementsFile):
+	with open(ElementsFile, 'r', encoding='utf-8-sig', newline='') as File:
+		return [Row[0].strip() for Row in list(csv.reader(File))[1:] if len(Row) > 0 and Row[0].strip() != ""]
+
+# Policy elements join the policy and its subscripts with " X ".  A policy without subscripts is
+# followed by " X" (as in "trans LDVs feebate X"), so that its name differs from the policy's.
+def ElementName(Row):
+	Parts = [Cell.strip() for Cell in Row[:4] if Cell.strip() != ""]
+	return " X ".join(Parts) + (" X" if len(Parts) == 1 else "")
+
+# The keypoints of all rows are returned as arrays with one row per schedule, padded on the right with
+# an infinitely late year (so each schedule has at least one more keypoint than it needs).
+Shapes = ["linear", "step", "sigmoid"]
+
+def ReadKeypointFile(KeypointFile, Errors):
+	with open(KeypointFile, 'r', encoding='utf-8-sig', newline='') as File:
+		Rows = list(csv.reader(File))
+	HasShape = len(Rows[0]) > 4 and Rows[0][4].strip().lower() == "shape"
+	Names, ShapeNumbers, Keypoints = [], [], []
+	for LineNumber, Row in enumerate(Rows[1:], 2):
+		if all(Cell.strip() == "" for Cell in Row):
+			continue
+		Names.append(Row[:4] + [""] * (4 - len(Row[:4])))
+		Shape = Row[4].strip().lower() if HasShape and len(Row) > 4 else ""
+		if Shape not in Shapes + [""]:
+			Errors.append(KeypointFile + ", line " + str(LineNumber) + ": \"" + Row[4] + "\" is not a shape (use " + ", ".join(Shapes) + ").")
+		ShapeNumbers.append(Shapes.index(Shape) if Shape in Shapes else 0)
+		Cells = [Cell.strip() for Cell in Row[5 if HasShape else 4:]]
+		Points = []
+		for Position in range(0, len(Cells) - 1, 2):
+			if Cells[Position] == "" and Cells[Position + 1] == "":
+				continue
+			try:
+				Points.append((float(Cells[Position]), float(Cells[Position + 1])))
+			except ValueError:
+				Errors.append(KeypointFile + ", line " + str(LineNumber) + ": \"" + Cells[Position] + "\", \"" + Cells[Position + 1] + "\" is not a year and a fraction.")
+		Keypoints.append(Points)
+
+	NumPoints = max([len(Points) for Points in Keypoints] + [0]) + 1
+	KeyYears = numpy.full((len(Keypoints), NumPoints), numpy.inf)
+	KeyValues = numpy.zeros((len(Keypoints), NumPoints))
+	NumKeypoints = numpy.array([len(Points) for Points in Keypoints], dtype=int)
+	for RowNumber, Points in enumerate(Keypoints):
+		if len(Points) > 0:
+			KeyYears[RowNumber, :len(Points)] = [Year for Year, Value in Points]
+			KeyValues[RowNumber, :len(Points)] = [Value for Year, Value in Points]
+			KeyValues[RowNumber, len(Points):] = Points[-1][1]
+	return Names, numpy.array(ShapeNumbers, dtype=int), KeyYears, KeyValues, NumKeypoints
+
+
+# Compiling the Schedules
+# -----------------------
+# Every schedule is compiled at once.  For each schedule and year, we find the keypoints before and
+# after the year, and how far the year is between them (from 0 to 1), and then apply the schedule's
+# shape.  The sigmoid is a logistic curve rescaled to pass exactly through both keypoints.
+def Sigmoid(Progress):
+	Logistic = lambda X: 1.0 / (1.0 + numpy.exp(-SigmoidSteepness * (X - 0.5)))
+	return (Logistic(Progress) - Logistic(0.0)) / (Logistic(1.0) - Logistic(0.0))
+
+def CompileSchedules(ShapeNumbers, KeyYears, KeyValues, Years):
+	Rows = numpy.arange(KeyYears.shape[0])[:, None]
+	Before = numpy.clip((KeyYears[:, :, None] <= Years[None, None, :]).sum(axis=1) - 1, 0, KeyYears.shape[1] - 2)
+	Year0, Year1 = KeyYears[Rows, Before], KeyYears[Rows, Before + 1]
+	Value0, Value1 = KeyValues[Rows, Before], KeyValues[Rows, Before + 1]
+	with numpy.errstate(invalid='ignore'):
+		Progress = numpy.nan_to_num(numpy.clip((Years[None, :] - Year0) / (Year1 - Year0), 0.0, 1.0))
+	Shape = ShapeNumbers[:, None]
+	Fraction = numpy.where(Shape == Shapes.index("step"), numpy.floor(Progress), numpy.where(Shape == Shapes.index("sigmoid"), Sigmoid(Progress), Progress))
+	return Value0 + (Value1 - Value0) * Fraction
+
+def CheckSchedules(KeypointFile, Names, Elements, KeyYears, NumKeypoints, Schedules, Years, Errors):
+	RowNames = [ElementName(Name) for Name in Names]
+	if RowNames != Elements:
+		Missing = [Element for Element in Elements if Element not in RowNames]
+		Extra = [RowName for RowName in RowNames if RowName not in Elements]
+		if len(Missing) > 0 or len(Extra) > 0:
+			Errors.append(KeypointFile + ": The rows do not match " + PolicyElementsFile + " (missing: " + (", ".join(Missing) or "none") + "; not policy elements: " + (", ".join(Extra) or "none") + ").")
+		else:
+			Errors.append(KeypointFile + ": The rows are not in the same order as in " + PolicyElementsFile + ".")
+
+	FirstYears = KeyYears[:, 0]
+	LastYears = KeyYears[numpy.arange(len(KeyYears)), numpy.maximum(NumKeypoints - 1, 0)]
+	with numpy.errstate(invalid='ignore'):
+		Increasing = numpy.all((numpy.diff(KeyYears, axis=1) > 0) | ~numpy.isfinite(KeyYears[:, 1:]), axis=1)
+	Problems = [
+		((NumKeypoints == 0) | (FirstYears > Years[0]) | (LastYears < Years[-1]), "The keypoints do not cover every year from " + str(Years[0]) + " to " + str(Years[-1]) + "."),
+		(~Increasing, "The years of the keypoints are not in increasing order."),
+		((Schedules < 0).any(axis=1) | (Schedules > 1).any(axis=1), "The schedule has a fraction below 0 or above 1."),
+		(Schedules.max(axis=1, initial=0.0) < 1 - FullImplementationTolerance, "The schedule never reaches full implementation (a fraction of 1).")]
+	for Failed, Message in Problems:
+		for RowNumber in numpy.flatnonzero(Failed):
+			Errors.append(KeypointFile + ", line " + str(RowNumber + 2) + " (" + RowNames[RowNumber] + "): " + Message)
+
+
+# Writing the Schedule Files
+# --------------------------
+# Fractions are written with up to six decimal places, as in the schedule files exported from Excel.
+def FormatFraction(Value):
+	return ("%.6f" % Value).rstrip("0").rstrip(".")
+
+def ScheduleFileName(KeypointFile):
+	Base, Extension = os.path.splitext(KeypointFile)
+	if Base.endswith("-WebApp"):
+		return Base[:-len("-WebApp")] + Extension
+	return Base + "-Compiled" + Extension
+
+def WriteScheduleFile(ScheduleFile, Names, Schedules, Years):
+	with open(ScheduleFile, 'w', newline='') as File:
+		File.write(",".join(["Policy", "Subscript 1", "Subscript 2", "Subscript 3"] + [str(Year) for Year in Years]) + "\n")
+		for Name, Schedule in zip(Names, Schedules):
+			File.write(",".join(Name + [FormatFraction(Value) for Value in Schedule]) + "\n")
+
+
+if __name__ == "__main__":
+
+	if len(sys.argv) > 1:
+		KeypointFiles = sys.argv[1:]
+	try:
+		Years = numpy.arange(ReadYear(InitialTimeFile), ReadYear(FinalTimeFile) + 1)
+		Elements = ReadPolicyElements(PolicyElementsFile)
+	except (OSError, ValueError, IndexError) as Error:
+		sys.exit("Error: The initial time, final time, or policy elements could not be read (" + str(Error) + ").")
+
+	Errors = []
+	for KeypointFile in KeypointFiles:
+		FileErrors = []
+		try:
+			Names, ShapeNumbers, KeyYears, KeyValues, NumKeypoints = ReadKeypointFile(KeypointFile, FileErrors)
+		except (OSError, IndexError) as Error:
+			Errors.append(KeypointFile + ": The file could not be read (" + str(Error) + ").")
+			continue
+		Schedules = CompileSchedules(ShapeNumbers, KeyYears, KeyValues, Years)
+		CheckSchedules(KeypointFile, Names, Elements, KeyYears, NumKeypoints, Schedules, Years, FileErrors)
+		if len(FileErrors) > 0:
+			Errors.extend(FileErrors)
+			continue
+		WriteScheduleFile(ScheduleFileName(KeypointFile), Names, Schedules, Years)
+		print("Wrote " + ScheduleFileName(KeypointFile) + " (" + str(len(Names)) + " schedules).")
+
+	for Error in Errors:
+		print(Error, file=sys.stderr)
+	sys.exit(1 if len(Errors) > 0 else 0)
@@ -23,8 +23,8 @@ OutputScript = "GeneratedCarbonCapToTaxScript.cmd" # The desired filename of the
 RunResultsFile = "RunResults.tsv" # The desired filename for TSV file containing model run results
 OutputVarsFile = "OutputVarsForCarbonCapToTaxScript.lst"	# The name of the file containing a list of variables
 															# to be included in the RunResultsFile
-															# May optionally also be used as a SAVELIST
-															# for Vensim (see below)
+															# Also used to build a SAVELIST for Vensim
+															# (see UseSaveList below)
 
 
 # Complementary Policies
@@ -39,11 +39,14 @@ OutputVarsFile = "OutputVarsForCarbonCapToTaxScript.lst"	# The name of the file
 ComplementaryPoliciesFile = "Scenario_NDC.cin"
 
 
-# Policy Schedule
-# ---------------
-# Specify the number of the policy implementation schedule file to use (in InputData/plcy-schd/FoPITY).
+# Policy Schedules
+# ----------------
+# Specify the numbers of the policy implementation schedule files to use (in InputData/plcy-schd/FoPITY),
+# such as [1] or [1, 2, 3].  Every price is tested under each schedule in turn (and in "Solve" mode, the
+# permit price is found separately for each schedule).  Each run records its schedule in a
+# "PolicySchedule=" column of the RunResultsFile.
 # This overrides any policy schedule setting that may exist in the ComplementaryPoliciesFile.
-PolicySchedule = 1
+PolicySchedules = [1]
 
 
 # Carbon Cap Floor and Ceiling
@@ -94,9 +97,60 @@ Sectors = {
 }
 
 
+# Search Mode
+# -----------
+# In "Sweep" mode, this script writes a Vensim command script that tests every whole-number price
+# from PriceFloor to PriceCeiling, and you find the permit price by comparing the results to the cap
+# yourself (see the documentation linked above).  This requires one model run per currency unit in
+# the price range.
+#
+# In "Solve" mode, this script runs the model itself, one run at a time, reading the emissions from
+# the covered sectors after each run and choosing the next price to test, until it finds the price
+# at which emissions in each year listed in EmissionsCaps meet that year's cap.  This usually takes
+# about ten runs per year of interest.  Solve mode requires a SimulatorCommand (see below), because
+# Python must be able to start Vensim.  The prices tested are still logged to the RunResultsFile,
+# and the permit price found for each year is written to the SolverResultsFile.
+SearchMode = "Sweep"
+
+# The emissions cap in each year of interest, in the same units as the emissions output variables,
+# summed across the covered sectors.  Add one entry per year, separated by commas, for example:
+# EmissionsCaps = {2030: 2500, 2035: 2000}
+EmissionsCaps = {2030: 2500}
+
+Tolerance = 1 # The search for each year ends when covered emissions are within this amount of that year's cap
+PriceTolerance = 0.01 # The search for each year also ends when the range of possible prices is narrower than this
+MaxSolverRuns = 60 # The search is abandoned if it needs more than this many runs (for each policy implementation schedule)
+SolverResultsFile = "CarbonCapToTaxSolution.tsv" # The file to which the permit price for each year is written
+
+# The command used to start Vensim DSS and have it carry out a command script.  The text {CommandScript}
+# is replaced with the name of the command script for each run.  Each command script ends with a
+# MENU>EXIT instruction, so Vensim closes when the run is done.  For example:
+# SimulatorCommand = ["C:\\Program Files\\Vensim\\vendss64.exe", "{CommandScript}"]
+# To try out Solve mode without Vensim, you may use the stand-in simulator distributed with the EPS
+# (which produces made-up results):
+# SimulatorCommand = ["python", "SimulatorStandIn.py", "{CommandScript}"]
+SimulatorCommand = []
+SimulatorTimeout = 3600 # The longest time (in seconds) to wait for a single run before giving up
+
+# The output variable containing emissions from each sector, which must be included in the OutputVarsFile
+SectorEmissionsVariables = {
+	"transportation sector": "Output Total CO2e Emissions by Sector[transportation sector]",
+	"electricity sector": "Output Total CO2e Emissions by Sector[electricity sector]",
+	"residential buildings sector": "Output Total CO2e Emissions by Sector[residential buildings sector]",
+	"commercial buildings sector": "Output Total CO2e Emissions by Sector[commercial buildings sector]",
+	"industry sector": "Output Industry Sector Excluding Ag and Waste CO2e Emissions"
+}
+
+
 # Other Settings
 # --------------
 RunName = "MostRecentRun" # The desired name for all runs performed.  Used as the filename for the .vdfx files that Vensim creates.
+UseSaveList = True # If True, the command script tells Vensim to save only the variables in the OutputVarsFile to the .vdfx
+				   # file after each run (using a SAVELIST generated from the OutputVarsFile), which makes each .vdfx file
+				   # much smaller and faster to export.  Set to False to save every variable in the model.
+Resume = False # In "Sweep" mode, if True, the script reads the RunResultsFile left by a batch that Vensim did not finish,
+			   # and writes a command script that tests only the prices that are missing from it, appending them to the
+			   # same RunResultsFile.  May also be set on the command line with "--resume".
 
 
 
@@ -128,86 +182,300 @@ if PriceCeiling <= PriceFloor:
 	import sys
 	sys.exit(ErrorMessage)
 
+# Give error and exit if the policy schedules are not valid
+from CommandScriptTools import ReadPolicySchedules
 
-# Generate Vensim Command Script
-# ------------------------------
-# We begin by creating a new file to serve as the Vensim command script (overwriting
-# any older version at that filename).  We then tell Vensim to load
-# the model file, and we give it a RUNNAME that will be used for all runs.  (It is
-# overwritten each run, and the Vensim command file generated by this script
-# always contains multiple runs.)
-f = open(OutputScript, 'w')
-f.write('SPECIAL>LOADMODEL|"' + ModelFile + '"\n')
-f.write("SIMULATE>RUNNAME|" + RunName + "\n")
+try:
+	Schedules = ReadPolicySchedules(PolicySchedules)
+except ValueError as Error:
+	f = open(OutputScript, 'w')
+	ErrorMessage = "Error: " + str(Error.args[0])
+	f.write(ErrorMessage)
+	f.close()
+	import sys
+	sys.exit(ErrorMessage)
 
-# The following options may be useful in certain cases, but they may slow Vensim down
-# or increase the odds that Vensim crashes during execution of a batch of runs (though
-# it is hard to tell for sure).  These lines are usually best left commented out.
-# f.write("SPECIAL>NOINTERACTION\n")
-# f.write("SIMULATE>SAVELIST|" + OutputVarsFile + "\n")
-f.write("\n")
+# Give error and exit if Solve mode cannot start Vensim
+if SearchMode == "Solve" and len(SimulatorCommand) < 1:
+	f = open(OutputScript, 'w')
+	ErrorMessage = "Error: SearchMode is \"Solve\", but no SimulatorCommand was specified.  Specify a SimulatorCommand, or use \"Sweep\" mode."
+	f.write(ErrorMessage)
+	f.close()
+	import sys
+	sys.exit(ErrorMessage)
 
+# Give error and exit if Solve mode has no emissions caps, or a cap is for a year that is not in the output
+if SearchMode == "Solve":
+	OutsideYears = [Year for Year in sorted(EmissionsCaps) if not int(FirstYear) <= Year <= int(FinalYear)]
+	if len(EmissionsCaps) < 1 or len(OutsideYears) > 0:
+		f = open(OutputScript, 'w')
+		if len(EmissionsCaps) < 1:
+			ErrorMessage = "Error: SearchMode is \"Solve\", but no EmissionsCaps were specified."
+		else:
+			ErrorMessage = "Error: EmissionsCaps includes years outside the output years (" + FirstYear + " to " + FinalYear + "): " + ", ".join(str(Year) for Year in OutsideYears)
+		f.write(ErrorMessage)
+		f.close()
+		import sys
+		sys.exit(ErrorMessage)
 
-# Only for the first entry in the TSV file, we wish to include the "Time" row and
-# overwrite any existing TSV file of that name.  Other entries append to the TSV file.
-FirstEntryDone = False
 
+# Checking Names
+# --------------
+# Before writing anything, we check the carbon tax variables, the entries in the OutputVarsFile, and
+# the settings in the ComplementaryPoliciesFile against the model file.
+# A misspelled name would otherwise not be noticed until Vensim reached it (or, in a .lst file,
+# would be silently skipped), possibly hours into a batch of runs.  See ModelSymbols.py for details.
 
-# We start the price at the price floor, and we will increment by one
-# currency unit with each model run.
-CurrentPrice = PriceFloor
+from CommandScriptTools import ScheduleSelector
+from ModelSymbols import CheckCommandScriptNames
 
-while CurrentPrice <= PriceCeiling:
+NameErrors = CheckCommandScriptNames(ModelFile, ["Additional Carbon Tax Rate[" + Sector + "]" for Sector in Sectors] + [ScheduleSelector], [OutputVarsFile], [ComplementaryPoliciesFile] if ComplementaryPoliciesFile.strip() != "" else [])
+if len(NameErrors) > 0:
+	f = open(OutputScript, 'w')
+	ErrorMessage = "Error: The following problems were found when checking names against the model file " + ModelFile + ":\n" + "\n".join(NameErrors)
+	f.write(ErrorMessage)
+	f.close()
+	import sys
+	sys.exit(ErrorMessage)
 
-	# We have to read in the .cin file for every simulation.
-	# Therefore, we have to override its policy implementation schedule setting
-	# and carbon tax policy settings for every simulation.
-	f.write("SIMULATE>READCIN|" + ComplementaryPoliciesFile + "\n")
-	f.write("SIMULATE>SETVAL|Policy Implementation Schedule Selector=" + str(PolicySchedule) + "\n")
 
-	# We check each sector.  If it is enabled, we write a SETVAL command to specify the current price.
-	# If it is not enabled, we write a SETVAL command to set it to zero.
+# Instructions for a Single Run
+# -----------------------------
+# If UseSaveList is enabled, we write a savelist listing the variables in the OutputVarsFile, and
+# every command script tells Vensim to save only those variables.
+from CommandScriptTools import SaveListFileName, ScheduleColumnText, ScheduleSetvalText, WriteSaveList
+
+SaveListFile = SaveListFileName(OutputScript)
+if UseSaveList:
+	WriteSaveList(ModelFile, [OutputVarsFile], SaveListFile)
+
+# Both search modes use the same instructions to prepare each run.
+# We have to read in the .cin file (if any) for every simulation.
+# Therefore, we have to override its policy implementation schedule setting
+# and carbon tax policy settings for every simulation.
+# We check each sector.  If it is enabled, we write a SETVAL command to specify the current price.
+# If it is not enabled, we write a SETVAL command to set it to zero.
+def PriceRunText(Price, Schedule):
+	RunText = ""
+	if ComplementaryPoliciesFile.strip() != "":
+		RunText += "SIMULATE>READCIN|" + ComplementaryPoliciesFile + "\n"
+	RunText += ScheduleSetvalText(Schedule)
 	for Sector in Sectors:
 		if Sectors[Sector]:
-			f.write("SIMULATE>SETVAL|Additional Carbon Tax Rate[" + Sector + "]=" + str(CurrentPrice) + "\n")
+			RunText += "SIMULATE>SETVAL|Additional Carbon Tax Rate[" + Sector + "]=" + str(Price) + "\n"
 		else:
-			f.write("SIMULATE>SETVAL|Additional Carbon Tax Rate[" + Sector + "]=0\n")
-
-	# We add a RUN instruction now that we've added all the SETVAL instructions.
-	f.write("MENU>RUN|O\n")
-	
-	# Lastly, we copy the results from the .vdfx file generated by Vensim to a TSV file.
-	# The complexity of this section is partly due to Vensim's required syntax for the
-	# VDF2TAB function.  Please see the page on that function in the Vensim reference
-	# manual for details.  But the general idea is that at the end (after the series of
-	# vertical bars), we can add columns for arbitrary text, and we use this functionality
-	# to add entries to the spreadsheet showing the current price and which sectors were
-	# enabled for this run.
-	if FirstEntryDone:
-		f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + RunResultsFile + "|" + OutputVarsFile + "|+!||" + FirstYear + "|" + FinalYear + "|:")
-	else:
-		f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + RunResultsFile + "|" + OutputVarsFile + "|||" + FirstYear + "|" + FinalYear + "|:")
-		FirstEntryDone = True
-
-	# Include a column for CurrentPrice in the output file, then increment CurrentPrice
-	f.write("CurrentPrice=\t" + str(CurrentPrice))
-	CurrentPrice += 1
-
-	# Adding a column specifying which sectors were enabled for this run
-	NumSectorsRemaining = len(CoveredSectors)
-	f.write("\tCovered sectors=")
-	for Sector in CoveredSectors:
-		f.write(Sector)
-		NumSectorsRemaining -= 1
-		if NumSectorsRemaining > 0:
-			f.write(", ")
+			RunText += "SIMULATE>SETVAL|Additional Carbon Tax Rate[" + Sector + "]=0\n"
+	return RunText
+
+# This is the text of the column specifying which sectors were enabled for each run
+CoveredSectorsText = "\tCovered sectors=" + ", ".join(CoveredSectors)
+
+
+if SearchMode == "Solve":
+
+	# Solve Mode
+	# ----------
+	# For each run, we write a short command script containing a single run, have Vensim carry it out,
+	# and read the results.  The results of each run are written to a scratch results file (with its
+	# own "Time" row), then copied to the RunResultsFile, so the RunResultsFile ends up with the same
+	# layout as in Sweep mode, listing only the prices that were tested.
+
+	import math
+	import os
+	import subprocess
+	import sys
+	from CarbonPriceSolver import SolveCarbonPrices
+	from RunResultsTools import IterateRuns, ParseValues, ReadYears
+
+	IterationScript = "CarbonCapToTaxIteration.cmd"
+	IterationResultsFile = "CarbonCapToTaxIteration.tsv"
+
+	# Every covered sector's emissions variable must be exported, or we could not measure emissions.
+	with open(OutputVarsFile, 'r') as VarsFile:
+		OutputVars = [Line.strip() for Line in VarsFile if Line.strip() != ""]
+	MissingVars = [SectorEmissionsVariables[Sector] for Sector in CoveredSectors if SectorEmissionsVariables[Sector] not in OutputVars]
+	if len(MissingVars) > 0:
+		f = open(OutputScript, 'w')
+		ErrorMessage = "Error: The following variables must be added to " + OutputVarsFile + " to use Solve mode: " + ", ".join(MissingVars)
+		f.write(ErrorMessage)
+		f.close()
+		sys.exit(ErrorMessage)
+
+	RunCount = 0
+
+	def SimulateAtPrice(Price, Schedule):
+		global RunCount
+		RunCount += 1
+
+		with open(IterationScript, 'w') as f:
+			f.write('SPECIAL>LOADMODEL|"' + ModelFile + '"\n')
+			f.write("SIMULATE>RUNNAME|" + RunName + "\n")
+			if UseSaveList:
+				f.write("SIMULATE>SAVELIST|" + SaveListFile + "\n")
+			f.write("\n")
+			f.write(PriceRunText(Price, Schedule))
+			f.write("MENU>RUN|O\n")
+			f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + IterationResultsFile + "|" + OutputVarsFile + "|||" + FirstYear + "|" + FinalYear + "|:")
+			f.write("CurrentPrice=\t" + str(Price) + ScheduleColumnText(Schedule) + CoveredSectorsText + "\n")
+			f.write("FILE>DELETE|" + RunName + ".vdfx\n\n")
+			if UseSaveList:
+				f.write("SIMULATE>SAVELIST|\n")
+			f.write("MENU>EXIT\n")
+
+		if os.path.exists(IterationResultsFile):
+			os.remove(IterationResultsFile)
+		Command = [Argument.replace("{CommandScript}", IterationScript) for Argument in SimulatorCommand]
+		Process = subprocess.run(Command, timeout=SimulatorTimeout)
+		if Process.returncode != 0:
+			raise RuntimeError("The simulator ended with status " + str(Process.returncode) + " for the run at price " + str(Price) + ".")
+		if not os.path.exists(IterationResultsFile):
+			raise RuntimeError("The simulator did not produce " + IterationResultsFile + " for the run at price " + str(Price) + ".")
+
+		# We copy the results to the RunResultsFile, keeping the "Time" row only for the first run.
+		with open(IterationResultsFile, 'r') as IterationResults, open(RunResultsFile, 'w' if RunCount == 1 else 'a') as RunResults:
+			for Line in IterationResults:
+				if RunCount == 1 or not Line.startswith("Time\t"):
+					RunResults.write(Line)
+
+		# We add up the emissions of the covered sectors in each year.
+		Years = ReadYears(IterationResultsFile)
+		CoveredVars = set(SectorEmissionsVariables[Sector] for Sector in CoveredSectors)
+		EmissionsByYear = dict((Year, 0.0) for Year in Years)
+		for Metadata, Rows in IterateRuns(IterationResultsFile, len(Years)):
+			for Name, Values in Rows:
+				if Name in CoveredVars:
+					for Year, Value in zip(Years, ParseValues(Values)):
+						EmissionsByYear[Year] += Value
+
+		# A run that failed part of the way through leaves NaN (or no) emissions, which the search must not use.
+		FailedYears = [Year for Year in sorted(EmissionsCaps) if Year not in EmissionsByYear or math.isnan(EmissionsByYear[Year])]
+		if len(FailedYears) > 0:
+			raise RuntimeError("The run at price " + str(Price) + " produced no covered emissions for " + ", ".join(str(Year) for Year in FailedYears) + ".")
+		print("Run " + str(RunCount) + ": schedule " + str(Schedule) + ", price " + str(Price) + ", covered emissions " + ", ".join(str(Year) + ": " + format(EmissionsByYear[Year], ".6g") for Year in sorted(EmissionsCaps)))
+		return EmissionsByYear
+
+	# The permit prices are found separately for each policy implementation schedule (with up to
+	# MaxSolverRuns runs for each schedule), because the schedule changes how much of the carbon tax
+	# is in effect in each year.  If the simulator cannot be started, takes longer than SimulatorTimeout,
+	# or fails, or the search needs more than MaxSolverRuns runs, we produce an error and exit.  Either
+	# way, the scratch files of the last run are removed.
+	SolutionsBySchedule = {}
+	try:
+		for Schedule in Schedules:
+			Solutions, Evaluations = SolveCarbonPrices(lambda Price: SimulateAtPrice(Price, Schedule), EmissionsCaps, PriceFloor, PriceCeiling, Tolerance, PriceTolerance, MaxSolverRuns)
+			SolutionsBySchedule[Schedule] = Solutions
+	except (RuntimeError, subprocess.TimeoutExpired, OSError) as Error:
+		f = open(OutputScript, 'w')
+		ErrorMessage = "Error: The search for the carbon tax lever settings stopped after " + str(RunCount) + " runs.  " + str(Error)
+		f.write(ErrorMessage)
+		f.close()
+		sys.exit(ErrorMessage)
+	finally:
+		for FileName in (IterationScript, IterationResultsFile):
+			if os.path.exists(FileName):
+				os.remove(FileName)
+
+	# We write the permit price found for each schedule and year to the SolverResultsFile.
+	with open(SolverResultsFile, 'w') as f:
+		f.write("Policy Schedule\tYear\tEmissions Cap\tCarbon Tax Lever Setting\tCovered Emissions\tStatus\n")
+		for Schedule in Schedules:
+			Solutions = SolutionsBySchedule[Schedule]
+			for Year in sorted(Solutions):
+				Price, Emissions, Status = Solutions[Year]
+				f.write(str(Schedule) + "\t" + str(Year) + "\t" + str(EmissionsCaps[Year]) + "\t" + str(Price) + "\t" + format(Emissions, ".7g") + "\t" + Status + "\n")
+	print("Found carbon tax lever settings for " + str(len(EmissionsCaps)) + " years under " + str(len(Schedules)) + " policy schedules in " + str(RunCount) + " runs.  See " + SolverResultsFile + ".")
+
+else:
+
+	# Generate Vensim Command Script
+	# ------------------------------
+	# We begin by creating a new file to serve as the Vensim command script (overwriting
+	# any older version at that filename).  We then tell Vensim to load
+	# the model file, and we give it a RUNNAME that will be used for all runs.  (It is
+	# overwritten each run, and the Vensim command file generated by this script
+	# always contains multiple runs.)
+	f = open(OutputScript, 'w')
+	f.write('SPECIAL>LOADMODEL|"' + ModelFile + '"\n')
+	f.write("SIMULATE>RUNNAME|" + RunName + "\n")
+
+	# The following option may be useful in certain cases, but it may slow Vensim down
+	# or increase the odds that Vensim crashes during execution of a batch of runs (though
+	# it is hard to tell for sure).  This line is usually best left commented out.
+	# f.write("SPECIAL>NOINTERACTION\n")
+
+	# We tell Vensim to save only the variables we will export (see UseSaveList above).
+	if UseSaveList:
+		f.write("SIMULATE>SAVELIST|" + SaveListFile + "\n")
 	f.write("\n")
 
-	# We instruct Vensim to delete the .vdfx file, to prevent it from getting picked up by
-	# sync software, such as DropBox or Google Drive.  If sync software locks the file,
-	# Vensim won't be able to overwrite it on the next model run, ruining the batch.
-	f.write("FILE>DELETE|" + RunName + ".vdfx")
-	f.write("\n\n")
 
-# We are done writing the Vensim command script and therefore close the file.
-f.close()
+	# Only for the first entry in the TSV file, we wish to include the "Time" row and
+	# overwrite any existing TSV file of that name.  Other entries append to the TSV file.
+	FirstEntryDone = False
+
+	# In resume mode, we find the prices that were already tested under each policy implementation
+	# schedule (listed in the "CurrentPrice=" and "PolicySchedule=" columns of the RunResultsFile), and
+	# we append the results for the other prices to the RunResultsFile.
+	from CommandScriptTools import FindCompletedRuns, ReadResume
+
+	CompletedPrices = set()
+	if ReadResume(Resume):
+		CompletedPrices = FindCompletedRuns(RunResultsFile, FirstYear, FinalYear, ("CurrentPrice", "PolicySchedule"))
+		FirstEntryDone = len(CompletedPrices) > 0
+		print(str(len(CompletedPrices)) + " runs were already completed.  The command script tests the remaining prices under each schedule.")
+
+
+	# We test every price under each policy implementation schedule in turn.  For each schedule, we
+	# start the price at the price floor, and we will increment by one currency unit with each model run.
+	for Schedule in Schedules:
+
+		CurrentPrice = PriceFloor
+
+		while CurrentPrice <= PriceCeiling:
+
+			# In resume mode, we skip the prices that were already tested.
+			if (str(CurrentPrice), str(Schedule)) in CompletedPrices:
+				CurrentPrice += 1
+				continue
+
+			# We write the READCIN and SETVAL instructions for this price (see PriceRunText() above).
+			f.write(PriceRunText(CurrentPrice, Schedule))
+
+			# We add a RUN instruction now that we've added all the SETVAL instructions.
+			f.write("MENU>RUN|O\n")
+		
+			# Lastly, we copy the results from the .vdfx file generated by Vensim to a TSV file.
+			# The complexity of this section is partly due to Vensim's required syntax for the
+			# VDF2TAB function.  Please see the page on that function in the Vensim reference
+			# manual for details.  But the general idea is that at the end (after the series of
+			# vertical bars), we can add columns for arbitrary text, and we use this functionality
+			# to add entries to the spreadsheet showing the current price and which sectors were
+			# enabled for this run.
+			if FirstEntryDone:
+				f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + RunResultsFile + "|" + OutputVarsFile + "|+!||" + FirstYear + "|" + FinalYear + "|:")
+			else:
+				f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + RunResultsFile + "|" + OutputVarsFile + "|||" + FirstYear + "|" + FinalYear + "|:")
+				FirstEntryDone = True
+
+			# Include columns for CurrentPrice and the policy implementation schedule in the output file,
+			# then increment CurrentPrice
+			f.write("CurrentPrice=\t" + str(CurrentPrice) + ScheduleColumnText(Schedule))
+			CurrentPrice += 1
+
+			# Adding a column specifying which sectors were enabled for this run
+			f.write(CoveredSectorsText)
+			f.write("\n")
+
+			# We instruct Vensim to delete the .vdfx file, to prevent it from getting picked up by
+			# sync software, such as DropBox or Google Drive.  If sync software locks the file,
+			# Vensim won't be able to overwrite it on the next model run, ruining the batch.
+			f.write("FILE>DELETE|" + RunName + ".vdfx")
+			f.write("\n\n")
+
+	# Since Vensim fails to clear the savelist entry in the program after script execution, we need to do it here
+	# before the script exits.
+	if UseSaveList:
+		f.write("SIMULATE>SAVELIST|\n")
+
+	# We are done writing the Vensim command script and therefore close the file.
+	f.close()
@@ -20,7 +20,7 @@ FinalYear = "2050" # The last year you wish to include in the output file (canno
 OutputScript = "GeneratedCombinationsScript.cmd" # The desired filename of the Vensim command script to be generated
 RunResultsFile = "RunResults.tsv" # The desired filename for TSV file containing model run results
 OutputVarsFile = "OutputVarsToExport.lst" # The name of the file containing a list of variables to be included in the RunResultsFile
-                                          # May optionally also be used as a SAVELIST for Vensim (see below)
+                                          # Also used to build a SAVELIST for Vensim (see UseSaveList below)
 
 # Other Settings
 # --------------
@@ -30,579 +30,536 @@ MinPolicyCols = 0 # At least this many columns for policy settings will be added
 				  # fewer policies than this, the extra columns will be blank.  The purpose of this setting is to make it
 				  # easier to append various RunResultsFiles together, when they use different numbers of enabled policies,
 				  # and still have the columns line up correctly.
-PolicySchedule = 1 # The number of the policy implementation schedule file to be used (in InputData/plcy-schd/FoPITY)
-
-
-# Index definitions
-# -----------------
-# Each policy is a Python list.  The numbers below are a key to the meaning of the four entries
-# that compose each policy, so we can refer to them by meaningful names in the code.
-# Note that the fourth entry in each policy, Settings, is itself a list that contains various
-# setting values.  Do not change any names or numbers in this section.
-Enabled = 0
-LongName = 1
-ShortName = 2
-Settings = 3
-Group = 4 # Groups are not used in this script, but they exist here so the policy
-		  # list has the same format as the one in CreateContributionTestScript.py
-		  # It would be difficult to support groups here because policies can have
-		  # an arbitrary number of settings, so different policies within a group may
-		  # have different numbers of settings, and it's not clear how to test a group
-		  # as a single entity under all possible user-defined setting combinations.
+PolicySchedules = [1] # The numbers of the policy implementation schedule files to be used (in InputData/plcy-schd/FoPITY),
+					  # such as [1, 2, 3].  Every combination of policy settings is run under each schedule in turn.
+NumShards = 1 # The number of separate command scripts ("shards") to split the runs among, so that several copies of
+			  # Vensim can perform the runs at the same time.  Each shard has its own run name and results file (with
+			  # "_Shard" and the shard number added to the name).  Use MergeShardResults.py to combine the results
+			  # files when all shards are done.  May also be set on the command line with "--shards N".
+RunOrder = "Standard" # The order in which combinations are run.  "Standard" changes the last enabled policy fastest.
+					  # "GrayCode" orders the runs so that each run differs from the run before it in the setting
+					  # of exactly one policy, so the difference between consecutive runs shows the effect of
+					  # changing that one setting.
+CombineGroups = False # If True, the enabled policies in each group (see PolicyCatalog.py, or the group name given in
+					  # PolicySelections) are tested as a single unit: they move together along a shared strength, and
+					  # only the combinations of the groups' strengths are run, rather than every combination of the
+					  # policies' own settings.  For example, eight policies in one group with two settings each need
+					  # 2 runs rather than 2^8.  Each strength selects the matching setting of every member (see
+					  # GroupStrengthSettings() in PolicyCatalog.py).  Only used in "Grid" mode.
+SamplingDesign = "Grid" # "Grid" tests every combination of the listed settings of the enabled policies.  "Morris" and
+						# "Sobol" perform a global sensitivity analysis instead: the lowest and highest listed settings of
+						# each enabled policy are the ends of a range, and runs are sampled within the ranges, so that
+						# the effects of dozens of policies can be ranked with a few thousand runs (see SensitivityDesigns.py).
+						# "Morris" is the cheaper screening method.  "Sobol" also measures how much of each policy's effect
+						# comes from interactions with other policies.  RunOrder is not used in these modes.  Use
+						# EstimateSensitivityIndices.py to compute the results.
+NumMorrisTrajectories = 20 # In "Morris" mode, the number of trajectories.  Each needs one run more than the number of enabled policies.
+NumMorrisLevels = 4 # In "Morris" mode, the number of evenly spaced values each policy may take within its range (an even number)
+NumSobolBaseSamples = 64 # In "Sobol" mode, the number of base samples.  The design needs this many runs for each enabled
+						 # policy, plus twice this many.
+SensitivitySeed = 1 # In "Morris" and "Sobol" modes, the seed for the random samples.  The same seed always gives the same runs.
+SensitivityDesignFile = "SensitivityDesign.json" # In "Morris" and "Sobol" modes, the file in which the samples are recorded
+												 # (needed by EstimateSensitivityIndices.py)
+UseSaveList = True # If True, the command script tells Vensim to save only the variables in the OutputVarsFile to the .vdfx
+				   # file after each run (using a SAVELIST generated from the OutputVarsFile), which makes each .vdfx file
+				   # much smaller and faster to export.  Set to False to save every variable in the model.
+OmitDefaultSetvals = False # If True, no SETVAL instruction is written for a policy whose setting in a run is the same as
+						   # its default value (read from InputData or the model file with InputDataArrays.py, which
+						   # requires the NumPy package).  Vensim resets all SETVAL changes after every run, so these
+						   # instructions can be left out, making the command script smaller and faster for Vensim to
+						   # read.  (For this reason, SETVAL instructions cannot be limited to the policies that changed
+						   # since the previous run, even in "GrayCode" order.)
+UseRunCache = False # If True, runs whose results are already in the run cache (see RunCache.py) are left out of the command
+					# script, and the other runs are added to the cache.  After Vensim has carried out the command script,
+					# run SpliceRunResults.py to write the RunResultsFile (including the runs taken from the cache).
+RunCacheDirectory = "RunCache" # The folder holding the run cache, which may be shared by all scripts and batches
+MaxRunCacheSizeMB = 2000 # When the run cache grows larger than this, the runs that have gone unused longest are removed
+Resume = False # If True, the script reads the RunResultsFile left by a batch that Vensim did not finish, and writes a command
+			   # script that performs only the runs that are missing from it, appending them to the same RunResultsFile.
+			   # All other settings must be the same as when the batch was first generated.  May also be set on the
+			   # command line with "--resume".
 
 
 # Policy Options
 # --------------
 # This section specifies which policies should be included in the Vensim command script
 # (called here "enabled" policies) and what setting values for those policies should
-# be included.  Unless you have enabled "IndividualPoliciesOnly" mode, all non-repeating
-# combinations of the settings for enabled policies will
+# be included.  All non-repeating combinations of the settings for enabled policies will
 # be included in the Vensim command script, so do not enable too many policies at once, or
 # Vensim will be unable to complete the necessary runs in a reasonable amount of time.
-# Each policy is on a single line.  You may change the first entry of each policy to
-# "True" to enable the policy or "False" to disable it.
-# The fourth entry in each policy is a list of setting values enclosed with square brackets.
-# You may change these values, add more values (separated by commas), and delete values.
-# Any enabled policy must have a minimum of one setting value.  A policy that is disabled
-# and a policy with a setting of zero produce identical results.
-
-PotentialPolicies = (
-
-	# Transportation Sector Policies
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,VOC]","Conventional Pollutant Standards - LDVs VOCs",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,CO]","Conventional Pollutant Standards - LDVs CO",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,NOx]","Conventional Pollutant Standards - LDVs NOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,PM10]","Conventional Pollutant Standards - LDVs PM10",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,PM25]","Conventional Pollutant Standards - LDVs PM2.5",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,SOx]","Conventional Pollutant Standards - LDVs SOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,BC]","Conventional Pollutant Standards - LDVs BC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,OC]","Conventional Pollutant Standards - LDVs OC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,VOC]","Conventional Pollutant Standards - HDVs VOCs",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,CO]","Conventional Pollutant Standards - HDVs CO",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,NOx]","Conventional Pollutant Standards - HDVs NOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,PM10]","Conventional Pollutant Standards - HDVs PM10",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,PM25]","Conventional Pollutant Standards - HDVs PM2.5",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,SOx]","Conventional Pollutant Standards - HDVs SOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,BC]","Conventional Pollutant Standards - HDVs BC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,OC]","Conventional Pollutant Standards - HDVs OC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[aircraft,VOC]","Conventional Pollutant Standards - aircraft VOCs",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[aircraft,NOx]","Conventional Pollutant Standards - aircraft NOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[rail,VOC]","Conventional Pollutant Standards - rail VOCs",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[rail,CO]","Conventional Pollutant Standards - rail CO",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[rail,NOx]","Conventional Pollutant Standards - rail NOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[rail,PM10]","Conventional Pollutant Standards - rail PM10",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[rail,PM25]","Conventional Pollutant Standards - rail PM2.5",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[rail,BC]","Conventional Pollutant Standards - rail BC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[rail,OC]","Conventional Pollutant Standards - rail OC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[ships,VOC]","Conventional Pollutant Standards - ships VOCs",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[ships,CO]","Conventional Pollutant Standards - ships CO",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[ships,NOx]","Conventional Pollutant Standards - ships NOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[ships,PM10]","Conventional Pollutant Standards - ships PM10",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[ships,PM25]","Conventional Pollutant Standards - ships PM2.5",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[ships,BC]","Conventional Pollutant Standards - ships BC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[ships,OC]","Conventional Pollutant Standards - ships OC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,VOC]","Conventional Pollutant Standards - motorbikes VOCs",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,CO]","Conventional Pollutant Standards - motorbikes CO",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,NOx]","Conventional Pollutant Standards - motorbikes NOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,PM10]","Conventional Pollutant Standards - motorbikes PM10",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,PM25]","Conventional Pollutant Standards - motorbikes PM2.5",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,SOx]","Conventional Pollutant Standards - motorbikes SOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,BC]","Conventional Pollutant Standards - motorbikes BC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,OC]","Conventional Pollutant Standards - motorbikes OC",[0,1],"Conventional Pollutant Standard"),
-	(False,"EV Charger Deployment","Electric Vehicle Charger Deployment",[0,300],"EV Charger Deployment"),
-	(False,"Reduce EV Range Anxiety and Charging Time","Electric Vehicle Range n Charging Time",[0,1],"EV Range n Charging Time"),
-	(False,"Additional Minimum Required EV Sales Percentage[passenger,LDVs]","Electric Vehicle Sales Mandate - Passenger LDVs",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[freight,LDVs]","Electric Vehicle Sales Mandate - Freight LDVs",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[passenger,HDVs]","Electric Vehicle Sales Mandate - Passenger HDVs",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[freight,HDVs]","Electric Vehicle Sales Mandate - Freight HDVs",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[passenger,aircraft]","Electric Vehicle Sales Mandate - Passenger Aircraft",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[freight,aircraft]","Electric Vehicle Sales Mandate - Freight Aircraft",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[passenger,rail]","Electric Vehicle Sales Mandate - Passenger Rail",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[freight,rail]","Electric Vehicle Sales Mandate - Freight Rail",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[passenger,ships]","Electric Vehicle Sales Mandate - Passenger Ships",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[freight,ships]","Electric Vehicle Sales Mandate - Freight Ships",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[passenger,motorbikes]","Electric Vehicle Sales Mandate - Passenger Motorbikes",[0,1],"EV Sales Mandate"),
-	(False,"Additional EV Subsidy Percentage[passenger,LDVs]","Electric Vehicle Subsidy - Passenger LDVs",[0,0.5],"EV Subsidy"),
-	(False,"LDVs Feebate Rate","Feebate",[0,1],"Feebate"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[passenger,LDVs]","Fuel Economy Standard - Passenger LDVs",[0,1],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[freight,LDVs]","Fuel Economy Standard - Freight LDVs",[0,1],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[passenger,HDVs]","Fuel Economy Standard - Passenger HDVs",[0,0.66],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[freight,HDVs]","Fuel Economy Standard - Freight HDVs",[0,0.66],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[passenger,aircraft]","Fuel Economy Standard - Passenger Aircraft",[0,0.54],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[freight,aircraft]","Fuel Economy Standard - Freight Aircraft",[0,0.54],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[passenger,rail]","Fuel Economy Standard - Passenger Rail",[0,0.2],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[freight,rail]","Fuel Economy Standard - Freight Rail",[0,0.2],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[passenger,ships]","Fuel Economy Standard - Passenger Ships",[0,0.2],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[freight,ships]","Fuel Economy Standard - Freight Ships",[0,0.2],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[passenger,motorbikes]","Fuel Economy Standard - Passenger Motorbikes",[0,0.74],"Vehicle Fuel Economy Standards"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[passenger,LDVs]","Hydrogen Vehicle Sales Mandate - Passenger LDVs",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[freight,LDVs]","Hydrogen Vehicle Sales Mandate - Freight LDVs",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[passenger,HDVs]","Hydrogen Vehicle Sales Mandate - Passenger HDVs",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[freight,HDVs]","Hydrogen Vehicle Sales Mandate - Freight HDVs",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[passenger,aircraft]","Hydrogen Vehicle Sales Mandate - Passenger Aircraft",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[freight,aircraft]","Hydrogen Vehicle Sales Mandate - Freight Aircraft",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[passenger,rail]","Hydrogen Vehicle Sales Mandate - Passenger Rail",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[freight,rail]","Hydrogen Vehicle Sales Mandate - Freight Rail",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[passenger,ships]","Hydrogen Vehicle Sales Mandate - Passenger Ships",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[freight,ships]","Hydrogen Vehicle Sales Mandate - Freight Ships",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Additional LCFS Percentage","Low Carbon Fuel Standard",[0,0.2],"Low Carbon Fuel Standard"),
-	(False,"Fraction of TDM Package Implemented[passenger]","Transportation Demand Management - Passengers",[0,1],"Transportation Demand Management"),
-	(False,"Fraction of TDM Package Implemented[freight]","Transportation Demand Management - Freight",[0,1],"Transportation Demand Management"),
-
-	# Buildings Sector Policies
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[heating,urban residential]","Building Component Electrification - Urban Residential Heating",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[appliances,urban residential]","Building Component Electrification - Urban Residential Appliances",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[other component,urban residential]","Building Component Electrification - Urban Residential Other Components",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[heating,rural residential]","Building Component Electrification - Rural Residential Heating",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[appliances,rural residential]","Building Component Electrification - Rural Residential Appliances",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[other component,rural residential]","Building Component Electrification - Rural Residential Other Components",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[heating,commercial]","Building Component Electrification - Commercial Heating",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[appliances,commercial]","Building Component Electrification - Commercial Appliances",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[other component,commercial]","Building Component Electrification - Commercial Other Components",[0,1],"Building Component Electrification"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[heating,urban residential]","Building Energy Efficiency Standards - Urban Residential Heating",[0,0.22],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[cooling and ventilation,urban residential]","Building Energy Efficiency Standards - Urban Residential Cooling and Ventilation",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[envelope,urban residential]","Building Energy Efficiency Standards - Urban Residential Envelope",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[lighting,urban residential]","Building Energy Efficiency Standards - Urban Residential Lighting",[0,0.4],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[appliances,urban residential]","Building Energy Efficiency Standards - Urban Residential Appliances",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[other component,urban residential]","Building Energy Efficiency Standards - Urban Residential Other Components",[0,0.11],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[heating,rural residential]","Building Energy Efficiency Standards - Rural Residential Heating",[0,0.22],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[cooling and ventilation,rural residential]","Building Energy Efficiency Standards - Rural Residential Cooling and Ventilation",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[envelope,rural residential]","Building Energy Efficiency Standards - Rural Residential Envelope",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[lighting,rural residential]","Building Energy Efficiency Standards - Rural Residential Lighting",[0,0.4],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[appliances,rural residential]","Building Energy Efficiency Standards - Rural Residential Appliances",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[other component,rural residential]","Building Energy Efficiency Standards - Rural Residential Other Components",[0,0.11],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[heating,commercial]","Building Energy Efficiency Standards - Commercial Heating",[0,0.22],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[cooling and ventilation,commercial]","Building Energy Efficiency Standards - Commercial Cooling and Ventilation",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[envelope,commercial]","Building Energy Efficiency Standards - Commercial Envelope",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[lighting,commercial]","Building Energy Efficiency Standards - Commercial Lighting",[0,0.4],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[appliances,commercial]","Building Energy Efficiency Standards - Commercial Appliances",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[other component,commercial]","Building Energy Efficiency Standards - Commercial Other Components",[0,0.11],"Building Energy Efficiency Standards"),
-	(False,"Boolean Improved Contractor Edu and Training","Contractor Training",[0,1],"Contractor Training"),
-	(False,"Min Fraction of Total Elec Demand to be Met by Distributed Solar PV","Distributed Solar Carve-Out",[0,0.24],"Distributed Solar Promotion"),
-	(False,"Perc Subsidy for Distributed Solar PV Capacity","Distributed Solar Subsidy",[0,0.5],"Distributed Solar Promotion"),
-	(False,"Boolean Improved Device Labeling","Improved Labeling",[0,1],"Improved Labeling"),
-	(False,"Share of Preexisting Buildings Subject to Retrofitting[urban residential]","Retrofit Existing Buildings - Urban Residential",[0,0.5],"Increased Retrofitting"),
-	(False,"Share of Preexisting Buildings Subject to Retrofitting[rural residential]","Retrofit Existing Buildings - Rural Residential",[0,0.5],"Increased Retrofitting"),
-	(False,"Share of Preexisting Buildings Subject to Retrofitting[commercial]","Retrofit Existing Buildings - Commercial",[0,0.5],"Increased Retrofitting"),
-	(False,"Boolean Rebate Program for Efficient Components[heating]","Rebate for Efficient Products - Heating",[0,1],"Rebate for Efficient Products"),
-	(False,"Boolean Rebate Program for Efficient Components[cooling and ventilation]","Rebate for Efficient Products - Cooling and Ventilation",[0,1],"Rebate for Efficient Products"),
-	(False,"Boolean Rebate Program for Efficient Components[appliances]","Rebate for Efficient Products - Appliances",[0,1],"Rebate for Efficient Products"),
-
-	# Electricity Sector Policies
-	(False,"Boolean Ban New Power Plants[hard coal es]","Ban New Power Plants - Hard Coal",[0,1],"Ban New Power Plants"),
-	(False,"Boolean Ban New Power Plants[natural gas nonpeaker es]","Ban New Power Plants - Natural Gas Nonpeaker",[0,1],"Ban New Power Plants"),
-	(False,"Boolean Ban New Power Plants[nuclear es]","Ban New Power Plants - Nuclear",[0,1],"Ban New Power Plants"),
-	(False,"Boolean Ban New Power Plants[hydro es]","Ban New Power Plants - Hydro",[0,1],"Ban New Power Plants"),
-	(False,"Boolean Ban New Power Plants[lignite es]","Ban New Power Plants - Lignite",[0,1],"Ban New Power Plants"),
-	(False,"Renewable Portfolio Std Percentage","Carbon-free Electricity Standard",[0,1],"Carbon-free Electricity Standard"),
-	(False,"Percent Change in Electricity Exports","Change Electricity Exports",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[hard coal es]","Change Electricity Imports - Hard Coal",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[natural gas nonpeaker es]","Change Electricity Imports - Natural Gas Nonpeaker",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[nuclear es]","Change Electricity Imports - Nuclear",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[hydro es]","Change Electricity Imports - Hydro",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[onshore wind es]","Change Electricity Imports - Onshore Wind",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[solar PV es]","Change Electricity Imports - Solar PV",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[biomass es]","Change Electricity Imports - Biomass",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[petroleum es]","Change Electricity Imports - Petroleum",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Fraction of Additional Demand Response Potential Achieved","Demand Response",[0,1],"Demand Response"),
-	(False,"Annual Additional Capacity Retired due to Early Retirement Policy[hard coal es]","Early Retirement of Power Plants - Hard Coal",[0,10000],"Early Retirement of Power Plants"),
-	(False,"Annual Additional Capacity Retired due to Early Retirement Policy[nuclear es]","Early Retirement of Power Plants - Nuclear",[0,10000],"Early Retirement of Power Plants"),
-	(False,"Additional Battery Storage Annual Growth Percentage","Grid-Scale Electricity Storage",[0,0.16],"Grid-Scale Electricity Storage"),
-	(False,"Percentage Increase in Transmission Capacity vs BAU","Increase Transmission",[0,1.13],"Increase Transmission"),
-	(False,"Percentage Reduction in Plant Downtime[natural gas nonpeaker es,preexisting retiring]","Reduce Plant Downtime - Preexisting Natural Gas Nonpeaker",[0,0.6],"Reduce Plant Downtime"),
-	(False,"Percentage Reduction in Plant Downtime[onshore wind es,newly built]","Reduce Plant Downtime - New Onshore Wind",[0,0.25],"Reduce Plant Downtime"),
-	(False,"Percentage Reduction in Plant Downtime[solar PV es,newly built]","Reduce Plant Downtime - New Solar PV",[0,0.3],"Reduce Plant Downtime"),
-	(False,"Percentage Reduction in Plant Downtime[offshore wind es,newly built]","Reduce Plant Downtime - New Offshore Wind",[0,0.25],"Reduce Plant Downtime"),
-	(False,"Percent Reduction in Soft Costs of Capacity Construction[onshore wind es]","Reduce Soft Costs - Onshore Wind",[0,0.9],"Reduce Soft Costs"),
-	(False,"Percent Reduction in Soft Costs of Capacity Construction[solar PV es]","Reduce Soft Costs - Solar PV",[0,0.9],"Reduce Soft Costs"),
-	(False,"Percent Reduction in Soft Costs of Capacity Construction[offshore wind es]","Reduce Soft Costs - Offshore Wind",[0,0.9],"Reduce Soft Costs"),
-	(False,"Percentage TnD Losses Avoided","Reduce Transmission n Distribution Losses",[0,0.4],"Reduce TnD Losses"),
-	(False,"Perc Subsidy for Elec Capacity Construction[nuclear es]","Subsidy for Capacity Construction - Nuclear",[0,1],"Subsidy for Capacity Construction"),
-	(False,"Perc Subsidy for Elec Capacity Construction[onshore wind es]","Subsidy for Capacity Construction - Onshore Wind",[0,1],"Subsidy for Capacity Construction"),
-	(False,"Perc Subsidy for Elec Capacity Construction[solar PV es]","Subsidy for Capacity Construction - Solar PV",[0,1],"Subsidy for Capacity Construction"),
-	(False,"Perc Subsidy for Elec Capacity Construction[solar thermal es]","Subsidy for Capacity Construction - Solar Thermal",[0,1],"Subsidy for Capacity Construction"),
-	(False,"Perc Subsidy for Elec Capacity Construction[biomass es]","Subsidy for Capacity Construction - Biomass",[0,1],"Subsidy for Capacity Construction"),
-	(False,"Perc Subsidy for Elec Capacity Construction[offshore wind es]","Subsidy for Capacity Construction - Offshore Wind",[0,1],"Subsidy for Capacity Construction"),
-	(False,"Subsidy for Elec Production by Fuel[nuclear es]","Subsidy for Electricity Production - Nuclear",[0,60],"Subsidy for Electricity Production"),
-	(False,"Subsidy for Elec Production by Fuel[onshore wind es]","Subsidy for Electricity Production - Onshore Wind",[0,60],"Subsidy for Electricity Production"),
-	(False,"Subsidy for Elec Production by Fuel[solar PV es]","Subsidy for Electricity Production - Solar PV",[0,60],"Subsidy for Electricity Production"),
-	(False,"Subsidy for Elec Production by Fuel[solar thermal es]","Subsidy for Electricity Production - Solar Thermal",[0,60],"Subsidy for Electricity Production"),
-	(False,"Subsidy for Elec Production by Fuel[biomass es]","Subsidy for Electricity Production - Biomass",[0,60],"Subsidy for Electricity Production"),
-	(False,"Subsidy for Elec Production by Fuel[offshore wind es]","Subsidy for Electricity Production - Offshore Wind",[0,60],"Subsidy for Electricity Production"),
-
-	# Industry Sector Policies
-	(False,"Fraction of Cement Measures Achieved","Cement Clinker Substitution",[0,1],"Cement Clinker Substitution"),
-	(False,"Fraction of Potential Cogeneration and Waste Heat Recovery Adopted","Cogeneration and Waste Heat Recovery",[0,1],"Cogeneration and Waste Heat Recovery"),
-	(False,"Fraction of Energy Savings from Early Facility Retirement Achieved","Early Retirement of Industrial Facilities",[0,1],"Early Retirement of Industrial Facilities"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[cement and other carbonates]","Industry Energy Efficiency Standards - Cement Industry",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[natural gas and petroleum systems]","Industry Energy Efficiency Standards - Natural Gas and Petroleum Industry",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[iron and steel]","Industry Energy Efficiency Standards - Iron and Steel Industry",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[chemicals]","Industry Energy Efficiency Standards - Chemicals Industry",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[coal mining]","Industry Energy Efficiency Standards - Coal Mining Industry",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[waste management]","Industry Energy Efficiency Standards - Water n Waste",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[agriculture]","Industry Energy Efficiency Standards - Agriculture",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[other industries]","Industry Energy Efficiency Standards - Other Industries",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Fraction of Installation and System Integration Issues Remedied","Improved System Design",[0,1],"Improved System Design"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[cement and other carbonates,hard coal if]","Electrification + Hydrogen - Cement Industry Coal Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[cement and other carbonates,natural gas if]","Electrification + Hydrogen - Cement Industry Natural Gas Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[cement and other carbonates,biomass if]","Electrification + Hydrogen - Cement Industry Biomass Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[cement and other carbonates,petroleum diesel if]","Electrification + Hydrogen - Cement Industry Petroleum Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[cement and other carbonates,heavy or residual fuel oil if]","Electrification + Hydrogen - Cement Industry Heavy or Residual Fuel Oil Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[cement and other carbonates,LPG propane or butane if]","Electrification + Hydrogen - Cement Industry LPG Propane or Butane Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[natural gas and petroleum systems,hard coal if]","Electrification + Hydrogen - Natural Gas and Petroleum Industry Coal Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[natural gas and petroleum systems,natural gas if]","Electrification + Hydrogen - Natural Gas and Petroleum Industry Natural Gas Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[natural gas and petroleum systems,biomass if]","Electrification + Hydrogen - Natural Gas and Petroleum Industry Biomass Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[natural gas and petroleum systems,crude oil if]","Electrification + Hydrogen - Natural Gas and Petroleum Industry Crude Oil Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[iron and steel,hard coal if]","Electrification + Hydrogen - Iron and Steel Industry Coal Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[iron and steel,natural gas if]","Electrification + Hydrogen - Iron and Steel Industry Natural Gas Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[iron and steel,petroleum diesel if]","Electrification + Hydrogen - Iron and Steel Industry Petroleum Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[iron and steel,heavy or residual fuel oil if]","Electrification + Hydrogen - Iron and Steel Industry Heavy or Residual Fuel Oil Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[iron and steel,LPG propane or butane if]","Electrification + Hydrogen - Iron and Steel Industry LPG Propane or Butane Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[chemicals,hard coal if]","Electrification + Hydrogen - Chemicals Industry Coal Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[chemicals,natural gas if]","Electrification + Hydrogen - Chemicals Industry Natural Gas Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[chemicals,petroleum diesel if]","Electrification + Hydrogen - Chemicals Industry Petroleum Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[chemicals,heavy or residual fuel oil if]","Electrification + Hydrogen - Chemicals Industry Heavy or Residual Fuel Oil Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[chemicals,LPG propane or butane if]","Electrification + Hydrogen - Chemicals Industry LPG Propane or Butane Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[coal mining,hard coal if]","Electrification + Hydrogen - Coal Mining Industry Coal Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[coal mining,natural gas if]","Electrification + Hydrogen - Coal Mining Industry Natural Gas Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[coal mining,petroleum diesel if]","Electrification + Hydrogen - Coal Mining Industry Petroleum Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[coal mining,heavy or residual fuel oil if]","Electrification + Hydrogen - Coal Mining Industry Heavy or Residual Fuel Oil Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[agriculture,natural gas if]","Electrification + Hydrogen - Agriculture Natural Gas Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[agriculture,petroleum diesel if]","Electrification + Hydrogen - Agriculture Petroleum Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[agriculture,heavy or residual fuel oil if]","Electrification + Hydrogen - Agriculture Heavy or Residual Fuel Oil Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[agriculture,LPG propane or butane if]","Electrification + Hydrogen - Agriculture LPG Propane or Butane Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[other industries,hard coal if]","Electrification + Hydrogen - Other Industries Coal Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[other industries,natural gas if]","Electrification + Hydrogen - Other Industries Natural Gas Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[other industries,petroleum diesel if]","Electrification + Hydrogen - Other Industries Petroleum Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[other industries,heavy or residual fuel oil if]","Electrification + Hydrogen - Other Industries Heavy or Residual Fuel Oil Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[other industries,LPG propane or butane if]","Electrification + Hydrogen - Other Industries LPG Propane or Butane Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of F Gas Substitution Achieved","F-Gas Substitution",[0,1],"F-gas Measures"),
-	(False,"Fraction of F Gas Destruction Achieved","F-Gas Destruction",[0,1],"F-gas Measures"),
-	(False,"Fraction of F Gas Recovery Achieved","F-Gas Recovery",[0,1],"F-gas Measures"),
-	(False,"Fraction of F Gas Inspct Maint Retrofit Achieved","F-Gas Eqpt. Maintenance n Retrofits",[0,1],"F-gas Measures"),
-	(False,"Percent Reduction in Nonenergy Nonagriculture Industry Product Demand[cement and other carbonates]","Material Efficiency, Longevity, n Re-Use - Cement Industry",[0,1],"Material Efficiency, Longevity, n Re-Use"),
-	(False,"Percent Reduction in Nonenergy Nonagriculture Industry Product Demand[iron and steel]","Material Efficiency, Longevity, n Re-Use - Iron and Steel Industry",[0,1],"Material Efficiency, Longevity, n Re-Use"),
-	(False,"Percent Reduction in Nonenergy Nonagriculture Industry Product Demand[chemicals]","Material Efficiency, Longevity, n Re-Use - Chemicals Industry",[0,1],"Material Efficiency, Longevity, n Re-Use"),
-	(False,"Percent Reduction in Nonenergy Nonagriculture Industry Product Demand[waste management]","Material Efficiency, Longevity, n Re-Use - Water n Waste",[0,1],"Material Efficiency, Longevity, n Re-Use"),
-	(False,"Percent Reduction in Nonenergy Nonagriculture Industry Product Demand[other industries]","Material Efficiency, Longevity, n Re-Use - Other Industries",[0,1],"Material Efficiency, Longevity, n Re-Use"),
-	(False,"Fraction of Methane Capture Opportunities Achieved[natural gas and petroleum systems]","Methane Capture - Natural Gas and Petroleum Industry",[0,1],"Methane Capture and Destruction"),
-	(False,"Fraction of Methane Capture Opportunities Achieved[coal mining]","Methane Capture - Coal Mining Industry",[0,1],"Methane Capture and Destruction"),
-	(False,"Fraction of Methane Capture Opportunities Achieved[waste management]","Methane Capture - Water n Waste",[0,1],"Methane Capture and Destruction"),
-	(False,"Fraction of Methane Destruction Opportunities Achieved[natural gas and petroleum systems]","Methane Destruction - Natural Gas and Petroleum Industry",[0,1],"Methane Capture and Destruction"),
-	(False,"Fraction of Methane Destruction Opportunities Achieved[coal mining]","Methane Destruction - Coal Mining Industry",[0,1],"Methane Capture and Destruction"),
-	(False,"Fraction of Methane Destruction Opportunities Achieved[waste management]","Methane Destruction - Water n Waste",[0,1],"Methane Capture and Destruction"),
-	(False,"Percent Reduction in Fossil Fuel Exports[hard coal]","Reduce Fossil Fuel Exports - Hard Coal",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-	(False,"Percent Reduction in Fossil Fuel Exports[natural gas]","Reduce Fossil Fuel Exports - Natural Gas",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-	(False,"Percent Reduction in Fossil Fuel Exports[petroleum gasoline]","Reduce Fossil Fuel Exports - Petroleum Gasoline",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-	(False,"Percent Reduction in Fossil Fuel Exports[petroleum diesel]","Reduce Fossil Fuel Exports - Petroleum Diesel",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-	(False,"Percent Reduction in Fossil Fuel Exports[jet fuel or kerosene]","Reduce Fossil Fuel Exports - Jet Fuel/Kerosene",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-	(False,"Percent Reduction in Fossil Fuel Exports[crude oil]","Reduce Fossil Fuel Exports - Crude Oil",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-	(False,"Percent Reduction in Fossil Fuel Exports[heavy or residual fuel oil]","Reduce Fossil Fuel Exports - Heavy/Residual Fuel Oil",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-	(False,"Percent Reduction in Fossil Fuel Exports[LPG propane or butane]","Reduce Fossil Fuel Exports - LPG/Propane/Butane",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-
-	# Agriculture, Land Use, and Forestry Policies
-	(False,"Fraction of Afforestation and Reforestation Achieved","Afforestation and Reforestation",[0,1],"Afforestation and Reforestation"),
-	(False,"Fraction of Forest Set Asides Achieved","Forest Set-Asides",[0,1],"Forest Set-Asides"),
-	(False,"Fraction of Cropland and Rice Measures Achieved","Cropland and Rice Measures",[0,1],"Cropland and Rice Measures"),
-	(False,"Fraction of Improved Forest Management Achieved","Improved Forest Management",[0,1],"Improved Forest Management"),
-	(False,"Fraction of Livestock Measures Achieved","Livestock Measures",[0,1],"Livestock Measures"),
-	(False,"Percent Animal Products Shifted to Nonanimal Products","Shift to Non-Animal Products",[0,1],"Shift to Non-Animal Products"),
-
-	# District Heat and Hydrogen Sector Policies
-	(False,"Fraction of Non CHP Heat Production Converted to CHP","Use CHP for District Heat",[0,1],"District Heat CHP"),
-	(False,"Fraction of District Heat Fuel Use Shifted to Other Fuels","Produce District Heat with Hydrogen",[0,1],"District Heat Fuel Switching"),
-	(False,"Fraction of Hydrogen Production Pathways Shifted","Shift Hydrogen Production to Electrolysis",[0,1],"Hydrogen Electrolysis"),
-
-	# Cross-Sector Policies
-	(False,"Fraction of Potential Additional CCS Achieved[electricity sector]","Carbon Capture and Sequestration - Electricity Sector",[0,0.3],"Carbon Capture and Sequestration"),
-	(False,"Fraction of Potential Additional CCS Achieved[industry sector]","Carbon Capture and Sequestration - Industry Sector",[0,0.3],"Carbon Capture and Sequestration"),
-	(False,"Additional Carbon Tax Rate[transportation sector]","Carbon Tax - Transportation Sector",[0,300],"Carbon Tax"),
-	(False,"Additional Carbon Tax Rate[electricity sector]","Carbon Tax - Electricity Sector",[0,300],"Carbon Tax"),
-	(False,"Additional Carbon Tax Rate[residential buildings sector]","Carbon Tax - Residential Bldg Sector",[0,300],"Carbon Tax"),
-	(False,"Additional Carbon Tax Rate[commercial buildings sector]","Carbon Tax - Commercial Bldg Sector",[0,300],"Carbon Tax"),
-	(False,"Additional Carbon Tax Rate[industry sector]","Carbon Tax - Industry Sector",[0,300],"Carbon Tax"),
-	(False,"Additional Carbon Tax Rate[district heat and hydrogen sector]","Carbon Tax - District Heat n Hydrogen Sector",[0,300],"Carbon Tax"),
-	(False,"Toggle Whether Carbon Tax Affects Process Emissions","Carbon Tax Applies to Process Emissions",[0,1],"Carbon Tax on Process Emissions"),
-	(False,"Percent Reduction in BAU Subsidies[hard coal]","End Existing Subsidies - Hard Coal",[0,1],"End Existing Subsidies"),
-	(False,"Percent Reduction in BAU Subsidies[natural gas]","End Existing Subsidies - Natural Gas",[0,1],"End Existing Subsidies"),
-	(False,"Percent Reduction in BAU Subsidies[nuclear]","End Existing Subsidies - Nuclear",[0,1],"End Existing Subsidies"),
-	(False,"Percent Reduction in BAU Subsidies[solar]","End Existing Subsidies - Solar",[0,1],"End Existing Subsidies"),
-	(False,"Percent Reduction in BAU Subsidies[petroleum gasoline]","End Existing Subsidies - Petroleum Gasoline",[0,1],"End Existing Subsidies"),
-	(False,"Percent Reduction in BAU Subsidies[petroleum diesel]","End Existing Subsidies - Petroleum Diesel",[0,1],"End Existing Subsidies"),
-	(False,"Additional Fuel Tax Rate by Fuel[electricity]","Fuel Taxes - Electricity",[0,0.2],"Fuel Taxes"),
-	(False,"Additional Fuel Tax Rate by Fuel[hard coal]","Fuel Taxes - Hard Coal",[0,0.2],"Fuel Taxes"),
-	(False,"Additional Fuel Tax Rate by Fuel[natural gas]","Fuel Taxes - Natural Gas",[0,0.2],"Fuel Taxes"),
-	(False,"Additional Fuel Tax Rate by Fuel[petroleum gasoline]","Fuel Taxes - Petroleum Gasoline",[0,0.2],"Fuel Taxes"),
-	(False,"Additional Fuel Tax Rate by Fuel[petroleum diesel]","Fuel Taxes - Petroleum Diesel",[0,0.2],"Fuel Taxes"),
-
-	# Research & Development Levers
-	(False,"RnD Building Capital Cost Perc Reduction[heating]","Capital Cost Reduction - Buildings: Heating",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Building Capital Cost Perc Reduction[cooling and ventilation]","Capital Cost Reduction - Buildings: Cooling and Ventilation",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Building Capital Cost Perc Reduction[envelope]","Capital Cost Reduction - Buildings: Envelope",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Building Capital Cost Perc Reduction[lighting]","Capital Cost Reduction - Buildings: Lighting",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Building Capital Cost Perc Reduction[appliances]","Capital Cost Reduction - Buildings: Appliances",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Building Capital Cost Perc Reduction[other component]","Capital Cost Reduction - Buildings: Other Components",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD CCS Capital Cost Perc Reduction","Capital Cost Reduction",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[hard coal es]","Capital Cost Reduction - Electricity: Hard Coal",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[natural gas nonpeaker es]","Capital Cost Reduction - Electricity: Natural Gas Nonpeaker",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[nuclear es]","Capital Cost Reduction - Electricity: Nuclear",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[hydro es]","Capital Cost Reduction - Electricity: Hydro",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[onshore wind es]","Capital Cost Reduction - Electricity: Onshore Wind",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[solar PV es]","Capital Cost Reduction - Electricity: Solar PV",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[solar thermal es]","Capital Cost Reduction - Electricity: Solar Thermal",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[biomass es]","Capital Cost Reduction - Electricity: Biomass",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[natural gas peaker es]","Capital Cost Reduction - Electricity: Natural Gas Peaker",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[lignite es]","Capital Cost Reduction - Electricity: Lignite",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[offshore wind es]","Capital Cost Reduction - Electricity: Offshore Wind",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[cement and other carbonates]","Capital Cost Reduction - Industry: Cement",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[natural gas and petroleum systems]","Capital Cost Reduction - Industry: Natural Gas and Petroleum",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[iron and steel]","Capital Cost Reduction - Industry: Iron and Steel",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[chemicals]","Capital Cost Reduction - Industry: Chemicals",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[coal mining]","Capital Cost Reduction - Industry: Mining",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[waste management]","Capital Cost Reduction - Industry: Water n Waste",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[agriculture]","Capital Cost Reduction - Industry: Agriculture",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[other industries]","Capital Cost Reduction - Industry: Other Industries",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Transportation Capital Cost Perc Reduction[battery electric vehicle]","Capital Cost Reduction - Vehicles: Battery Electric",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Transportation Capital Cost Perc Reduction[natural gas vehicle]","Capital Cost Reduction - Vehicles: Natural Gas",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Transportation Capital Cost Perc Reduction[gasoline vehicle]","Capital Cost Reduction - Vehicles: Gasoline Engine",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Transportation Capital Cost Perc Reduction[diesel vehicle]","Capital Cost Reduction - Vehicles: Diesel Engine",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Transportation Capital Cost Perc Reduction[plugin hybrid vehicle]","Capital Cost Reduction - Vehicles: Plug-in Hybrid",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Transportation Capital Cost Perc Reduction[LPG vehicle]","Capital Cost Reduction - Vehicles: LPG",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Transportation Capital Cost Perc Reduction[hydrogen vehicle]","Capital Cost Reduction - Vehicles: Hydrogen",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"Fraction of Direct Air Capture Potential Achieved","Direct Air Capture",[0,1],"Direct Air Capture"),
-	(False,"RnD Building Fuel Use Perc Reduction[heating]","Fuel Use Reduction - Buildings: Heating",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Building Fuel Use Perc Reduction[cooling and ventilation]","Fuel Use Reduction - Buildings: Cooling and Ventilation",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Building Fuel Use Perc Reduction[lighting]","Fuel Use Reduction - Buildings: Lighting",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Building Fuel Use Perc Reduction[appliances]","Fuel Use Reduction - Buildings: Appliances",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Building Fuel Use Perc Reduction[other component]","Fuel Use Reduction - Buildings: Other Components",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD CCS Fuel Use Perc Reduction","Fuel Use Reduction",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Electricity Fuel Use Perc Reduction[hard coal es]","Fuel Use Reduction - Electricity: Hard Coal",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Electricity Fuel Use Perc Reduction[natural gas nonpeaker es]","Fuel Use Reduction - Electricity: Natural Gas Nonpeaker",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Electricity Fuel Use Perc Reduction[nuclear es]","Fuel Use Reduction - Electricity: Nuclear",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Electricity Fuel Use Perc Reduction[biomass es]","Fuel Use Reduction - Electricity: Biomass",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Electricity Fuel Use Perc Reduction[natural gas peaker es]","Fuel Use Reduction - Electricity: Natural Gas Peaker",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Electricity Fuel Use Perc Reduction[lignite es]","Fuel Use Reduction - Electricity: Lignite",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[cement and other carbonates]","Fuel Use Reduction - Industry: Cement",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[natural gas and petroleum systems]","Fuel Use Reduction - Industry: Natural Gas and Petroleum",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[iron and steel]","Fuel Use Reduction - Industry: Iron and Steel",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[chemicals]","Fuel Use Reduction - Industry: Chemicals",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[coal mining]","Fuel Use Reduction - Industry: Mining",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[waste management]","Fuel Use Reduction - Industry: Water n Waste",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[agriculture]","Fuel Use Reduction - Industry: Agriculture",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[other industries]","Fuel Use Reduction - Industry: Other Industries",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Transportation Fuel Use Perc Reduction[battery electric vehicle]","Fuel Use Reduction - Vehicles: Battery Electric",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Transportation Fuel Use Perc Reduction[natural gas vehicle]","Fuel Use Reduction - Vehicles: Natural Gas",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Transportation Fuel Use Perc Reduction[gasoline vehicle]","Fuel Use Reduction - Vehicles: Gasoline Engine",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Transportation Fuel Use Perc Reduction[diesel vehicle]","Fuel Use Reduction - Vehicles: Diesel Engine",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Transportation Fuel Use Perc Reduction[plugin hybrid vehicle]","Fuel Use Reduction - Vehicles: Plug-in Hybrid",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Transportation Fuel Use Perc Reduction[LPG vehicle]","Fuel Use Reduction - Vehicles: LPG",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Transportation Fuel Use Perc Reduction[hydrogen vehicle]","Fuel Use Reduction - Vehicles: Hydrogen",[0,0.4],"RnD Fuel Use Reductions"),
-
-	# Control Settings
-	(False,"GDPGR Alternative Base Case GDP Growth Rate","COVID-19 Recession",[-0.1,0.02],""),
-	(False,"GRA for Carbon Tax Revenue[regular spending]","Carbon Tax Revenue - Regular Spending",[0,10],""),
-	(False,"GRA for Carbon Tax Revenue[deficit spending]","Carbon Tax Revenue - Deficit Spending",[0,10],""),
-	(False,"GRA for Carbon Tax Revenue[household taxes]","Carbon Tax Revenue - Household Taxes",[0,10],""),
-	(False,"GRA for Carbon Tax Revenue[payroll taxes]","Carbon Tax Revenue - Payroll Taxes",[0,10],""),
-	(False,"GRA for Carbon Tax Revenue[corporate taxes]","Carbon Tax Revenue - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for Fuel Tax Revenue[regular spending]","Fuel Tax Revenue - Regular Spending",[0,10],""),
-	(False,"GRA for Fuel Tax Revenue[deficit spending]","Fuel Tax Revenue - Deficit Spending",[0,10],""),
-	(False,"GRA for Fuel Tax Revenue[household taxes]","Fuel Tax Revenue - Household Taxes",[0,10],""),
-	(False,"GRA for Fuel Tax Revenue[payroll taxes]","Fuel Tax Revenue - Payroll Taxes",[0,10],""),
-	(False,"GRA for Fuel Tax Revenue[corporate taxes]","Fuel Tax Revenue - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for EV Subsidy[regular spending]","EV Subsidy - Regular Spending",[0,10],""),
-	(False,"GRA for EV Subsidy[deficit spending]","EV Subsidy - Deficit Spending",[0,10],""),
-	(False,"GRA for EV Subsidy[household taxes]","EV Subsidy - Household Taxes",[0,10],""),
-	(False,"GRA for EV Subsidy[payroll taxes]","EV Subsidy - Payroll Taxes",[0,10],""),
-	(False,"GRA for EV Subsidy[corporate taxes]","EV Subsidy - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for Electricity Generation Subsidies[regular spending]","Electricity Generation Subsidy - Regular Spending",[0,10],""),
-	(False,"GRA for Electricity Generation Subsidies[deficit spending]","Electricity Generation Subsidy - Deficit Spending",[0,10],""),
-	(False,"GRA for Electricity Generation Subsidies[household taxes]","Electricity Generation Subsidy - Household Taxes",[0,10],""),
-	(False,"GRA for Electricity Generation Subsidies[payroll taxes]","Electricity Generation Subsidy - Payroll Taxes",[0,10],""),
-	(False,"GRA for Electricity Generation Subsidies[corporate taxes]","Electricity Generation Subsidy - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for Electricity Capacity Construction Subsidies[regular spending]","Electricity Capacity Construction Subsidy - Regular Spending",[0,10],""),
-	(False,"GRA for Electricity Capacity Construction Subsidies[deficit spending]","Electricity Capacity Construction Subsidy - Deficit Spending",[0,10],""),
-	(False,"GRA for Electricity Capacity Construction Subsidies[household taxes]","Electricity Capacity Construction Subsidy - Household Taxes",[0,10],""),
-	(False,"GRA for Electricity Capacity Construction Subsidies[payroll taxes]","Electricity Capacity Construction Subsidy - Payroll Taxes",[0,10],""),
-	(False,"GRA for Electricity Capacity Construction Subsidies[corporate taxes]","Electricity Capacity Construction Subsidy - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for Distributed Solar Subsidy[regular spending]","Distributed Solar Subsidy - Regular Spending",[0,10],""),
-	(False,"GRA for Distributed Solar Subsidy[deficit spending]","Distributed Solar Subsidy - Deficit Spending",[0,10],""),
-	(False,"GRA for Distributed Solar Subsidy[household taxes]","Distributed Solar Subsidy - Household Taxes",[0,10],""),
-	(False,"GRA for Distributed Solar Subsidy[payroll taxes]","Distributed Solar Subsidy - Payroll Taxes",[0,10],""),
-	(False,"GRA for Distributed Solar Subsidy[corporate taxes]","Distributed Solar Subsidy - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for Fuel Subsidies[regular spending]","Fuel Subsidy - Regular Spending",[0,10],""),
-	(False,"GRA for Fuel Subsidies[deficit spending]","Fuel Subsidy - Deficit Spending",[0,10],""),
-	(False,"GRA for Fuel Subsidies[household taxes]","Fuel Subsidy - Household Taxes",[0,10],""),
-	(False,"GRA for Fuel Subsidies[payroll taxes]","Fuel Subsidy - Payroll Taxes",[0,10],""),
-	(False,"GRA for Fuel Subsidies[corporate taxes]","Fuel Subsidy - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for National Debt Interest[regular spending]","National Debt Interest - Regular Spending",[0,10],""),
-	(False,"GRA for National Debt Interest[deficit spending]","National Debt Interest - Deficit Spending",[0,10],""),
-	(False,"GRA for National Debt Interest[household taxes]","National Debt Interest - Household Taxes",[0,10],""),
-	(False,"GRA for National Debt Interest[payroll taxes]","National Debt Interest - Payroll Taxes",[0,10],""),
-	(False,"GRA for National Debt Interest[corporate taxes]","National Debt Interest - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for Remaining Government Cash Flow Changes[regular spending]","Remaining Government Cash Flows - Regular Spending",[0,10],""),
-	(False,"GRA for Remaining Government Cash Flow Changes[deficit spending]","Remaining Government Cash Flows - Deficit Spending",[0,10],""),
-	(False,"GRA for Remaining Government Cash Flow Changes[household taxes]","Remaining Government Cash Flows - Household Taxes",[0,10],""),
-	(False,"GRA for Remaining Government Cash Flow Changes[payroll taxes]","Remaining Government Cash Flows - Payroll Taxes",[0,10],""),
-	(False,"GRA for Remaining Government Cash Flow Changes[corporate taxes]","Remaining Government Cash Flows - Corporate Income Taxes",[0,10],"")
-
-)
+#
+# The available policies, with their names, default setting values, groups, and sectors, are
+# listed in PolicyCatalog.py.  Rather than editing that file, list the policies to enable below.
+# Each entry is a selection, in parentheses, with two to four parts:
+  # "Policy", "Group", or "Sector", to select a single policy, every policy in a group, or every
+  # policy in a sector of the catalog
+  # The name of the policy (its long or short name), group, or sector
+  # Optionally, a list of setting values enclosed with square brackets, used for every selected
+  # policy.  If this is left out, the setting values listed in PolicyCatalog.py are used.  Any
+  # enabled policy must have a minimum of one setting value.  A policy that is disabled and a
+  # policy with a setting of zero produce identical results.  In "Morris" and "Sobol" modes (see
+  # SamplingDesign above), only the lowest and highest values are used, as the ends of a range.
+  # Optionally, a group name to use for every selected policy in place of its catalog group (only
+  # used if CombineGroups is enabled, to test policies from different groups together)
+# For example:
+#	("Group", "Carbon Tax", [0, 50, 100]),
+#	("Policy", "Feebate"),
+#	("Policy", "Fuel Economy Standard - Passenger LDVs", [0, 0.5, 1]),
+
+PolicySelections = [
+]
+
+
+# Uncertain Inputs
+# ----------------
+# This section lists model inputs whose values are uncertain, such as fuel prices or technology
+# costs, for a Monte Carlo uncertainty analysis (see UncertainInputs.py).  If any are listed, every
+# run is repeated NumDraws times, each time with the uncertain inputs set to a different set of
+# values ("draw") from their probability distributions, so that the spread of each result across the
+# draws shows how uncertain it is.  The same draws are used for every combination of policy settings.
+# Each entry is a tuple, in parentheses, with three or four parts:
+  # The name of a constant in the model, with subscripts if it has any.  Only constants (including
+  # those read from InputData with GET DIRECT CONSTANTS) can be changed.  To vary a time series, such
+  # as the fuel prices in InputData/fuels, vary a multiplier, such as "Fuel Price Multiplier for
+  # Sensitivity Analysis Runs[natural gas]".
+  # The distribution: "Uniform", "Triangular", "Normal", or "LogNormal"
+  # A list of the distribution's parameters, enclosed with square brackets: [lowest, highest] for
+  # "Uniform", [lowest, most likely, highest] for "Triangular", [mean, standard deviation] for
+  # "Normal", or [median, standard deviation of the logarithm] for "LogNormal"
+  # Optionally, "Relative", to multiply the constant's value in InputData by the drawn value
+  # (which requires the NumPy package)
+# For example:
+#	("Fuel Price Multiplier for Sensitivity Analysis Runs[natural gas]", "Triangular", [0.7, 1, 1.6]),
+#	("EIaE Imported Electricity Price", "Normal", [1, 0.1], "Relative"),
+
+UncertainInputs = [
+]
+NumDraws = 100 # The number of draws of values of the uncertain inputs
+UncertaintySampler = "LatinHypercube" # How the draws are chosen: "Random", "LatinHypercube" (which spreads the draws evenly
+									  # across each input's distribution), or "Halton" (a quasi-random sequence, which spreads
+									  # them evenly across every combination of inputs).  See SensitivityDesigns.py.
+UncertaintySeed = 1 # The seed for the random draws.  The same seed always gives the same draws.
+UncertaintySampleFile = "UncertaintySamples.tsv" # The file in which the value of each uncertain input in each draw is recorded
+
 
 # Building the Policy List
 # ------------------------
-# Every policy, whether enabled or not, appears in a tuple called "PotentialPolicies" that was constructed above.
-# Now we construct the actual list of policies to be included (named "Policies") by
-# checking which of the policies have been enabled.
-
-Policies = []
-for PotentialPolicy in PotentialPolicies:
-	if PotentialPolicy[Enabled]:
-		Policies.append(PotentialPolicy)
-
-		
-# Next, we define two functions that build lists of policy settings.  One builds a list of all combinations
-# of settings.  The other builds a list of each setting of each enabled policy tested individually (plus
-# the BAU case).  Which function will be called is determined by the user's setting for the
-# "IndividualPoliciesOnly" variable above.
-
-def BuildPolicyCombinationsSettingsList():
-
-	# We need to use unusual syntax to generate our list of non-repeating policy setting combinations
-	# (see below).  To make a statement whose syntax works for an arbitrary number of policies, I
-	# found it clearest and easiest to build the required statement as a string (so that I can
-	# append to it using for loops), then execute the string as code at the end.  This next segment
-	# constructs the string we plan to execute.  An example of what it should look like when it's
-	# done appears in a comment below.
-	
-	ExpressionToBuildList = "PolicySettingCombinations = [ ("
-	for Policy in Policies:
-		ExpressionToBuildList += ("P" + str(Policies.index(Policy)) + ", ")
-	ExpressionToBuildList = ExpressionToBuildList[:-2]
-	ExpressionToBuildList += ") "
-	for Policy in Policies:
-		ExpressionToBuildList += ("for P" + str(Policies.index(Policy)) + " in range(len(Policies[" + str(Policies.index(Policy)) + "][Settings])) ")
-	ExpressionToBuildList += "]"
-	
-	# At this point, ExpressionToBuildList contains a command similar to the following example (which assumes
-	# only three policies are enabled):
-	# PolicySettingCombinations = [ (P0, P1, P2) for P0 in range(len(Policies[0][Settings])) for P1 in range(len(Policies[1][Settings])) for P2 in range(len(Policies[2][Settings])) ]
-
-
-	# Now we execute the expression, which generates a list containing non-repeating combinations of
-	# our policy settings for each enabled policy.  Since we are inside a function, we need to give the
-	# resulting variable global scope, so we pass globals() as the second argument to exec().  See the
-	# Python 3 documentation for more details.
-	exec(ExpressionToBuildList, globals())
-
-	# Now we have created a list called "PolicySettingCombinations" which contains values such as
-	# (if three policies, which each have three possible settings, are enabled):
-	# [(0, 0, 0), (0, 0, 1), (0, 0, 2), (0, 1, 0), (0, 1, 1), (0, 1, 2), (0, 2, 0)... (2, 2, 2)]
-	
-	return PolicySettingCombinations
-
-
-# We invoke the function that builds the list of policy setting combinations.
-# If fewer than two policies were enabled, we instead produce an error
-# and exit.  (We write the error to the text file, because many users won't
-# be using a console and won't see the message produced by sys.exit().
-# Note that the function BuildPolicyCombinationsSettingList() fails if there
-# is only one enabled policy, so we do not invoke it unless there are at
-# least two enabled policies.
+# We look up the selected policies in the policy catalog (see PolicyCatalog.py).  Each policy in
+# the resulting list (named "Policies") is a record with LongName, ShortName, Settings, Group, and
+# Sector fields.  If a selection names a policy, group, or sector that is not in the catalog, we
+# produce an error and exit.  (We write the error to the output file, because many users won't be
+# using a console and won't see the message produced by sys.exit().)
+
+from CommandScriptTools import ReadPolicySchedules
+from PolicyCatalog import SelectPolicies
+from UncertainInputs import ReadUncertainInputs
+
+try:
+	Policies = SelectPolicies(PolicySelections)
+	Schedules = ReadPolicySchedules(PolicySchedules)
+	Inputs = ReadUncertainInputs(UncertainInputs, ModelFile)
+except (KeyError, ValueError) as Error:
+	f = open(OutputScript, 'w')
+	ErrorMessage = "Error: " + str(Error.args[0])
+	f.write(ErrorMessage)
+	f.close()
+	import sys
+	sys.exit(ErrorMessage)
+
+
+# Grouping Policies
+# -----------------
+# Each digit of a combination (see below) selects the settings of one "unit".  Normally, each enabled
+# policy is a unit of its own.  If CombineGroups is enabled, the policies in each group form one unit,
+# and are listed together (in the order in which each group first appears), so their results file
+# columns are next to one another.  Each unit is a list of its member policies, and for each unit, we
+# list its strengths, each of which gives a setting for every member (see GroupStrengthSettings() in
+# PolicyCatalog.py).  A policy on its own has one strength for each of its settings.
+
+from PolicyCatalog import GroupStrengthSettings, PartitionByGroup
+
+if CombineGroups:
+	Groups, PoliciesByGroup = PartitionByGroup(Policies)
+	Units = [PoliciesByGroup[Group] for Group in Groups]
+	Policies = [Policy for Members in Units for Policy in Members]
+else:
+	Units = [[Policy] for Policy in Policies]
+UnitStrengths = [GroupStrengthSettings(Members) for Members in Units]
+
+
+# Next, we prepare to step through every combination of settings of the enabled policies.
+# Building a list of every combination before writing anything would require a great deal
+# of memory (and time) when many policies are enabled.  Instead, we use the functions in
+# PolicyCombinations.py, which number the combinations and compute each one as it is needed
+# (see the comments in that file for details).  The first entry in the "Radices" list is the
+# number of policy implementation schedules, and each other entry is the number of strengths
+# available for one unit (usually the number of settings of one enabled policy).  The policy
+# implementation schedule changes slowest, so the whole set of combinations is run under each
+# schedule in turn.
+#
+# Every combination is run under every schedule, even the one in which every policy is set to
+# zero, because the schedule also scales settings whose default values are not zero (such as
+# the GRA revenue allocation settings), so it may change the results of any run.
+
+from PolicyCombinations import CountCombinations, IterateCombinations, IterateGrayCombinations
+
+Radices = [len(Schedules)] + [len(Strengths) for Strengths in UnitStrengths]
+NumRuns = CountCombinations(Radices)
+
+# The RunOrder setting determines which of the two enumeration functions is used.
+if RunOrder == "GrayCode":
+	IterateRunCombinations = IterateGrayCombinations
+else:
+	IterateRunCombinations = IterateCombinations
+
+# If no policies were enabled, or an enabled policy has no settings, we produce an error and exit.
+# (We write the error to the text file, because many users won't be using a console and won't
+# see the message produced by sys.exit().)
 
 if len(Policies) < 1:
 	f = open(OutputScript, 'w')
-	ErrorMessage = "Error: No policies were enabled in the Python script.  Before running the script, you must enable at least two policies."
+	ErrorMessage = "Error: No policies were enabled in the Python script.  Before running the script, you must add at least one policy to PolicySelections."
 	f.write(ErrorMessage)
 	f.close()
 	import sys
 	sys.exit(ErrorMessage)
-elif len(Policies) == 1:
+elif NumRuns < 1:
 	f = open(OutputScript, 'w')
-	ErrorMessage = "Error: Only one policy was enabled in the Python script.  Before running the script, you must enable at least two policies."
+	ErrorMessage = "Error: At least one enabled policy has no setting values.  Any enabled policy must have a minimum of one setting value."
 	f.write(ErrorMessage)
 	f.close()
 	import sys
 	sys.exit(ErrorMessage)
-else:
-	PolicySettingCombinations = BuildPolicyCombinationsSettingsList()
-
-
-# Generate Vensim Command Script
-# ------------------------------
-# We begin by creating a new file to serve as the Vensim command script (overwriting
-# any older version at that filename).  We then tell Vensim to load
-# the model file, and we give it a RUNNAME that will be used for all runs.  (It is
-# overwritten each run, and the Vensim command file generated by this script
-# always contains multiple runs, unless you only have one enabled policy and one
-# setting value for that policy.)
-f = open(OutputScript, 'w')
-f.write('SPECIAL>LOADMODEL|"' + ModelFile + '"\n')
-f.write("SIMULATE>RUNNAME|" + RunName + "\n")
-
-# The following options may be useful in certain cases, but they may slow Vensim down
-# or increase the odds that Vensim crashes during execution of a batch of runs (though
-# it is hard to tell for sure).  These lines are usually best left commented out.
-# f.write("SPECIAL>NOINTERACTION\n")
-# f.write("SIMULATE>SAVELIST|" + OutputVarsFile + "\n")
-f.write("\n")
-
-# Only for the first entry in the TSV file, we wish to include the "Time" row and
-# overwrite any existing TSV file of that name.  Other entries append to the TSV file.
-FirstEntryDone = False
-
-# We track a run number, so that we can number the runs in the output file (because
-# each run will have multiple rows- one for each output variable).
-CurrentRunNumber = 1
-
-# We need a single run of Vensim for each PolicySettingCombination.  We start by clearing
-# any policy changes from old runs by reading the NoPolicies.cin file.
-# Then, each run must have one SIMULATE>SETVAL instruction for each enabled policy.
-# The most complex details here are the bits that look up the values of the settings
-# for each policy.  We next array references- for example, "Policies[ActivePolicy]"
-# refers to a single policy, which is itself a list.  Therefore, to reference an element
-# of that list, we add another bracketed clause to the right, such as "[LongName]" if
-# we want the long name text string for that policy.
-for PolicySettingCombination in PolicySettingCombinations:
-	
-	for ActivePolicy in range(len(Policies)):	
-		f.write("SIMULATE>SETVAL|" + Policies[ActivePolicy][LongName] + "=" + str(Policies[ActivePolicy][Settings][PolicySettingCombination[ActivePolicy]]) + "\n")
-	
-	# We include a SETVAL instruction to select the correct policy implementation schedule file
-	f.write("SIMULATE>SETVAL|Policy Implementation Schedule Selector=" + str(PolicySchedule) + "\n")
-	
-	# We add a RUN instruction now that we've added all the SETVAL instructions.
-	f.write("MENU>RUN|O\n")
-	
-	# Lastly, we copy the results from the .vdfx file generated by Vensim to a TSV file.
-	# The complexity of this section is partly due to Vensim's required syntax for the
-	# VDF2TAB function.  Please see the page on that function in the Vensim reference
-	# manual for details.  But the general idea is that at the end (after the series of
-	# vertical bars), we can add columns for arbitrary text, and we use this functionality
-	# to add entries to the spreadsheet showing what policy settings were used for this run.
-	# Then we add blank columns if we haven't added enough policy columns to satisfy the
-	# MinPolicyCols setting.
-	if FirstEntryDone:
-		f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + RunResultsFile + "|" + OutputVarsFile + "|+!||" + FirstYear + "|" + FinalYear + "|:")
+
+
+# Sensitivity Analysis Designs
+# ----------------------------
+# In "Morris" and "Sobol" modes, the runs are the samples of a sensitivity analysis design (see
+# SensitivityDesigns.py) rather than every combination of settings.  Each sample gives each policy a
+# value between 0 and 1, which we convert to a setting within the policy's range.  We then replace each
+# policy's list of settings with the distinct settings that the design uses, and each sample with the
+# indices of its settings in those lists, so every run is again a combination of setting indices, and
+# the rest of this script (the SETVAL text, shards, the run cache, and resume mode) works unchanged.
+# The samples are repeated under each policy implementation schedule, as in "Grid" mode.  The design
+# is saved to the SensitivityDesignFile, and each run is identified by its sample number.
+if SamplingDesign != "Grid":
+	import json
+	from SensitivityDesigns import BuildMorrisDesign, BuildSobolDesign
+
+	ErrorMessage = None
+	if SamplingDesign not in ("Morris", "Sobol"):
+		ErrorMessage = "Error: SamplingDesign must be \"Grid\", \"Morris\", or \"Sobol\" (not \"" + str(SamplingDesign) + "\")."
+	elif CombineGroups:
+		ErrorMessage = "Error: CombineGroups can only be used in \"Grid\" mode (see SamplingDesign)."
+	elif any(min(Policy.Settings) == max(Policy.Settings) for Policy in Policies):
+		ErrorMessage = "Error: In \"" + SamplingDesign + "\" mode, each enabled policy must have at least two different setting values (the ends of its range).  These policies do not: " + ", ".join(Policy.ShortName for Policy in Policies if min(Policy.Settings) == max(Policy.Settings))
 	else:
-		f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + RunResultsFile + "|" + OutputVarsFile + "|||" + FirstYear + "|" + FinalYear + "|:")
-		FirstEntryDone = True
-	f.write(RunName)
-	f.write("\tCurrentRunNumber=" + str(CurrentRunNumber))
-	CurrentRunNumber += 1
-	PolicyCols = 0
-	for Policy in Policies:
-		f.write("\t" + Policy[ShortName] + "=" + str(Policy[Settings][PolicySettingCombination[Policies.index(Policy)]]))
-		PolicyCols += 1
-	ExtraCols = max(0, MinPolicyCols - PolicyCols)
-	for Cols in range(0, ExtraCols):
-		f.write("\t-")
+		try:
+			if SamplingDesign == "Morris":
+				UnitSamples = BuildMorrisDesign(len(Policies), NumMorrisTrajectories, NumMorrisLevels, SensitivitySeed)
+			else:
+				UnitSamples = BuildSobolDesign(len(Policies), NumSobolBaseSamples, SensitivitySeed)
+		except ValueError as Error:
+			ErrorMessage = "Error: " + str(Error.args[0])
+	if ErrorMessage is not None:
+		f = open(OutputScript, 'w')
+		f.write(ErrorMessage)
+		f.close()
+		import sys
+		sys.exit(ErrorMessage)
+
+	# Settings are rounded to six significant digits, which keeps the command script readable.
+	LowerBounds = [min(Policy.Settings) for Policy in Policies]
+	UpperBounds = [max(Policy.Settings) for Policy in Policies]
+	SampleSettings = [{} for Policy in Policies]
+	Samples = []
+	for UnitSample in UnitSamples:
+		Sample = []
+		for ActivePolicy, UnitValue in enumerate(UnitSample):
+			Setting = float(format(LowerBounds[ActivePolicy] + UnitValue * (UpperBounds[ActivePolicy] - LowerBounds[ActivePolicy]), ".6g"))
+			Sample.append(SampleSettings[ActivePolicy].setdefault(Setting, len(SampleSettings[ActivePolicy])))
+		Samples.append(tuple(Sample))
+	Policies = [Policy._replace(Settings=tuple(Settings)) for Policy, Settings in zip(Policies, SampleSettings)]
+	Units = [[Policy] for Policy in Policies]
+	UnitStrengths = [GroupStrengthSettings(Members) for Members in Units]
+
+	with open(SensitivityDesignFile, 'w') as DesignFile:
+		json.dump({
+			"Method": SamplingDesign,
+			"Policies": [Policy.ShortName for Policy in Policies],
+			"LowerBounds": LowerBounds,
+			"UpperBounds": UpperBounds,
+			"NumTrajectories": NumMorrisTrajectories if SamplingDesign == "Morris" else None,
+			"NumLevels": NumMorrisLevels if SamplingDesign == "Morris" else None,
+			"NumBaseSamples": NumSobolBaseSamples if SamplingDesign == "Sobol" else None,
+			"Seed": SensitivitySeed,
+			"PolicySchedules": Schedules,
+			"UnitSamples": UnitSamples
+		}, DesignFile)
+
+	# Run indices count the samples under each schedule in turn, like the grid they replace.
+	NumRuns = len(Schedules) * len(Samples)
+
+	def IterateRunCombinations(Radices, FirstRunIndex=0, LastRunIndex=None):
+		for RunIndex in range(FirstRunIndex, NumRuns if LastRunIndex is None else min(LastRunIndex, NumRuns)):
+			ScheduleIndex, SampleIndex = divmod(RunIndex, len(Samples))
+			yield (ScheduleIndex,) + Samples[SampleIndex]
+
+
+# Drawing the Uncertain Inputs
+# ----------------------------
+# If any uncertain inputs are listed, we draw their values (see SensitivityDesigns.py and UncertainInputs.py)
+# and build the SETVAL instructions and results file column for each draw once, here.  The draw becomes
+# one more digit of each run's combination (the last, so it changes fastest), so every combination of
+# policy settings is run with each draw in turn, and run numbers, shards, and resume mode work as before.
+# Values are rounded to six significant digits, and the values written to the command script are
+# recorded in the UncertaintySampleFile, with one line per draw.
+if len(Inputs) > 0:
+	from SensitivityDesigns import BuildUnitSample
+	from UncertainInputs import InputValue
+
+	try:
+		if SamplingDesign != "Grid":
+			raise ValueError("Uncertain inputs can only be used in \"Grid\" mode (see SamplingDesign).")
+		UnitDraws = BuildUnitSample(UncertaintySampler, NumDraws, len(Inputs), UncertaintySeed)
+	except ValueError as Error:
+		f = open(OutputScript, 'w')
+		ErrorMessage = "Error: " + str(Error.args[0])
+		f.write(ErrorMessage)
+		f.close()
+		import sys
+		sys.exit(ErrorMessage)
+
+	DrawSetvalText = []
+	DrawColumns = []
+	with open(UncertaintySampleFile, 'w') as SampleFile:
+		SampleFile.write("UncertaintyDraw\t" + "\t".join(Input.Name for Input in Inputs) + "\n")
+		for DrawIndex, UnitDraw in enumerate(UnitDraws):
+			Values = [format(InputValue(Input, UnitValue), ".6g") for Input, UnitValue in zip(Inputs, UnitDraw)]
+			DrawSetvalText.append("".join("SIMULATE>SETVAL|" + Input.Name + "=" + Value + "\n" for Input, Value in zip(Inputs, Values)))
+			DrawColumns.append("\tUncertaintyDraw=" + str(DrawIndex))
+			SampleFile.write(str(DrawIndex) + "\t" + "\t".join(Values) + "\n")
+
+	Radices.append(NumDraws)
+	NumRuns *= NumDraws
+
+# Checking Names
+# --------------
+# Before writing anything, we check the names of the policies and the entries in the OutputVarsFile
+# against the model file.
+# A misspelled name would otherwise not be noticed until Vensim reached it (or, in a .lst file,
+# would be silently skipped), possibly hours into a batch of runs.  See ModelSymbols.py for details.
+
+from CommandScriptTools import ScheduleSelector
+from ModelSymbols import CheckCommandScriptNames
+
+NameErrors = CheckCommandScriptNames(ModelFile, [Policy.LongName for Policy in Policies] + [ScheduleSelector] + [Input.Name for Input in Inputs], [OutputVarsFile], [])
+if len(NameErrors) > 0:
+	f = open(OutputScript, 'w')
+	ErrorMessage = "Error: The following problems were found when checking names against the model file " + ModelFile + ":\n" + "\n".join(NameErrors)
+	f.write(ErrorMessage)
+	f.close()
+	import sys
+	sys.exit(ErrorMessage)
+
+
+# Rather than rebuilding the same text for every run, we build the SETVAL instructions and the
+# results file columns for each strength of each unit once, here.  In the main loop, each run
+# then only needs to look up the text for its settings and join the pieces together.  If the
+# OmitDefaultSetvals setting is enabled, the SETVAL text for a setting equal to the policy's default
+# value is left empty.
+from CommandScriptTools import ScheduleColumnText, ScheduleSetvalText
+
+DefaultSettings = {}
+if OmitDefaultSetvals:
+	from InputDataArrays import OpenInputData
+	Data = OpenInputData(ModelFile)
+	DefaultSettings = dict((Policy.LongName, Data.DefaultValue(Policy.LongName)) for Policy in Policies)
+
+SetvalText = []
+ColumnText = []
+for Members, Strengths in zip(Units, UnitStrengths):
+	SetvalText.append(["".join("" if Setting == DefaultSettings.get(Policy.LongName) else "SIMULATE>SETVAL|" + Policy.LongName + "=" + str(Setting) + "\n" for Policy, Setting in zip(Members, Settings)) for Settings in Strengths])
+	ColumnText.append(["".join("\t" + Policy.ShortName + "=" + str(Setting) for Policy, Setting in zip(Members, Settings)) for Settings in Strengths])
+ScheduleText = [ScheduleSetvalText(Schedule) for Schedule in Schedules]
+ScheduleColumns = [ScheduleColumnText(Schedule) for Schedule in Schedules]
+ExtraColsText = "\t-" * max(0, MinPolicyCols - len(Policies))
+
+
+# Generate Vensim Command Scripts
+# -------------------------------
+# We write one command script per shard (usually just one command script in total).  Each shard
+# performs a contiguous block of runs, and because the policy setting combination for any run can
+# be computed directly from its run index (in either run order), each shard starts enumerating at
+# its own first run.  Run numbers count up across the whole batch, so they do not need to be changed
+# when the shard results files are merged.
+
+from CommandScriptTools import FindCompletedRuns, ReadNumShards, ReadResume, SaveListFileName, ShardFileName, ShardRunRange, WriteSaveList
+
+NumShards = min(ReadNumShards(NumShards), NumRuns)
+Resume = ReadResume(Resume)
+NumCompletedRuns = 0
+
+# If UseSaveList is enabled, we write the savelist (one for all shards) before the command scripts.
+SaveListFile = SaveListFileName(OutputScript)
+if UseSaveList:
+	WriteSaveList(ModelFile, [OutputVarsFile], SaveListFile)
+
+# If UseRunCache is enabled, every run is listed in the run plan, in order, but only the runs that are
+# not in the run cache are written to the command scripts.  These runs export their results to a
+# separate new runs results file (one per shard), in which each run is identified only by its run key,
+# and SpliceRunResults.py later assembles the RunResultsFile from the cache.  (A run needed more than
+# once in a shard is only performed once.)
+if UseRunCache:
+	from RunCache import NewRunsFileName, RunCache, RunKey, RunPlanFileName, RunPlanWriter
+	Cache = RunCache(RunCacheDirectory)
+	BatchHash = Cache.BatchHash(ModelFile, OutputVarsFile, FirstYear, FinalYear)
+	NewRunsFiles = [ShardFileName(NewRunsFileName(OutputScript), ShardNumber, NumShards) for ShardNumber in range(1, NumShards + 1)]
+	RunPlan = RunPlanWriter(RunPlanFileName(OutputScript), RunCacheDirectory, FirstYear, FinalYear, NewRunsFiles, MaxRunCacheSizeMB)
+	NumCachedRuns = 0
+
+for ShardNumber in range(1, NumShards + 1):
+
+	ShardRunName = ShardFileName(RunName, ShardNumber, NumShards)
+	ShardResultsFile = ShardFileName(RunResultsFile, ShardNumber, NumShards)
+	FirstRunIndex, LastRunIndex = ShardRunRange(ShardNumber, NumShards, NumRuns)
+
+	# We begin by creating a new file to serve as the Vensim command script (overwriting
+	# any older version at that filename).  We then tell Vensim to load
+	# the model file, and we give it a RUNNAME that will be used for all runs in this shard.
+	# (It is overwritten each run, and the Vensim command file generated by this script
+	# always contains multiple runs, unless you only have one enabled policy and one
+	# setting value for that policy.)
+	f = open(ShardFileName(OutputScript, ShardNumber, NumShards), 'w')
+	f.write('SPECIAL>LOADMODEL|"' + ModelFile + '"\n')
+	f.write("SIMULATE>RUNNAME|" + ShardRunName + "\n")
+
+	# The following option may be useful in certain cases, but it may slow Vensim down
+	# or increase the odds that Vensim crashes during execution of a batch of runs (though
+	# it is hard to tell for sure).  This line is usually best left commented out.
+	# f.write("SPECIAL>NOINTERACTION\n")
+
+	# We tell Vensim to save only the variables we will export (see UseSaveList above).
+	if UseSaveList:
+		f.write("SIMULATE>SAVELIST|" + SaveListFile + "\n")
 	f.write("\n")
 
-	# We instruct Vensim to delete the .vdfx file, to prevent it from getting picked up by
-	# sync software, such as DropBox or Google Drive.  If sync software locks the file,
-	# Vensim won't be able to overwrite it on the next model run, ruining the batch.
-	f.write("FILE>DELETE|" + RunName + ".vdfx")
-	f.write("\n\n")
+	# We track a run number, so that we can number the runs in the output file (because
+	# each run will have multiple rows- one for each output variable).
+	CurrentRunNumber = FirstRunIndex + 1
+	if UseRunCache:
+		ShardRunKeys = set()
+
+	# Each shard exports its runs to its own results file (or, if the run cache is in use, to its own new
+	# runs results file).  In resume mode, we find the runs already in that file, identified by their run
+	# numbers (or run keys), and any runs exported later are appended to it.
+	ShardExportFile = NewRunsFiles[ShardNumber - 1] if UseRunCache else ShardResultsFile
+	CompletedRuns = set()
+	if Resume:
+		CompletedRuns = FindCompletedRuns(ShardExportFile, FirstYear, FinalYear, "RunCacheKey" if UseRunCache else "CurrentRunNumber")
+		NumCompletedRuns += len(CompletedRuns)
+	ExportedRuns = len(CompletedRuns)
+
+	# We need a single run of Vensim for each RunCombination.
+	# Each run must have one SIMULATE>SETVAL instruction for each enabled policy.
+	# Each RunCombination is a tuple containing the index of the selected policy implementation
+	# schedule, followed by the index of the selected strength of each unit (usually, the selected setting
+	# of each enabled policy) and, if there are uncertain inputs, by the index of the draw, so
+	# "SetvalText[ActiveUnit][RunCombination[ActiveUnit + 1]]" holds the SETVAL instructions for the
+	# selected strength of that unit.
+	# All of the text for a run is joined into a single string and written at once, and we do not
+	# keep any record of earlier runs, so memory use does not grow with the number of runs.
+	for RunCombination in IterateRunCombinations(Radices, FirstRunIndex, LastRunIndex):
+
+		ScheduleIndex = RunCombination[0]
+		RunNumber = CurrentRunNumber
+		CurrentRunNumber += 1
+
+		RunText = []
+		for ActiveUnit in range(len(Units)):
+			RunText.append(SetvalText[ActiveUnit][RunCombination[ActiveUnit + 1]])
+
+		# We include a SETVAL instruction to select the correct policy implementation schedule file,
+		# and the values of the uncertain inputs (if any) in the run's draw
+		RunText.append(ScheduleText[ScheduleIndex])
+		if len(Inputs) > 0:
+			RunText.append(DrawSetvalText[RunCombination[-1]])
+
+		# The columns that identify the run in the RunResultsFile are its run name, its run number, its
+		# policy implementation schedule, its sample number (in "Morris" and "Sobol" modes), its draw of
+		# the uncertain inputs (if any), and its setting for each policy.  Then we add blank columns if we
+		# haven't added enough policy columns to satisfy the MinPolicyCols setting.  The run name column
+		# always shows RunName (not the shard's run name), so merged results look the same as results
+		# from a single command script.
+		RunColumns = [RunName, "\tCurrentRunNumber=" + str(RunNumber)]
+		RunColumns.append(ScheduleColumns[ScheduleIndex])
+		if SamplingDesign != "Grid":
+			RunColumns.append("\tSensitivitySample=" + str((RunNumber - 1) % len(Samples)))
+		if len(Inputs) > 0:
+			RunColumns.append(DrawColumns[RunCombination[-1]])
+		for ActiveUnit in range(len(Units)):
+			RunColumns.append(ColumnText[ActiveUnit][RunCombination[ActiveUnit + 1]])
+		RunColumns.append(ExtraColsText)
+		RunColumns = "".join(RunColumns)
+		RunIdentifier = str(RunNumber)
+
+		# If the run cache is in use, the run is listed in the run plan, and it is skipped if its results
+		# are already in the cache (or it has already been performed in this shard).  Otherwise, it is
+		# exported to the new runs results file, identified by its run key.
+		if UseRunCache:
+			Key = RunKey(BatchHash, "".join(RunText))
+			RunPlan.Add(Key, RunResultsFile, RunColumns)
+			if Cache.Contains(Key) or Key in ShardRunKeys:
+				NumCachedRuns += 1
+				continue
+			ShardRunKeys.add(Key)
+			RunIdentifier = Key
+			RunColumns = "RunCacheKey=" + Key
+
+		# In resume mode, runs that were completed before the batch was interrupted are skipped.
+		if RunIdentifier in CompletedRuns:
+			continue
+
+		# We add a RUN instruction now that we've added all the SETVAL instructions.
+		RunText.append("MENU>RUN|O\n")
+
+		# Lastly, we copy the results from the .vdfx file generated by Vensim to a TSV file.
+		# The complexity of this section is partly due to Vensim's required syntax for the
+		# VDF2TAB function.  Please see the page on that function in the Vensim reference
+		# manual for details.  But the general idea is that at the end (after the series of
+		# vertical bars), we can add columns for arbitrary text, and we use this functionality
+		# to add entries to the spreadsheet showing what policy settings were used for this run.
+		# Only for the first entry in each shard's TSV file, we wish to include the "Time" row and
+		# overwrite any existing TSV file of that name.  Other entries append to the TSV file.
+		if ExportedRuns > 0:
+			RunText.append("MENU>VDF2TAB|" + ShardRunName + ".vdfx|" + ShardExportFile + "|" + OutputVarsFile + "|+!||" + FirstYear + "|" + FinalYear + "|:")
+		else:
+			RunText.append("MENU>VDF2TAB|" + ShardRunName + ".vdfx|" + ShardExportFile + "|" + OutputVarsFile + "|||" + FirstYear + "|" + FinalYear + "|:")
+		ExportedRuns += 1
+		RunText.append(RunColumns)
+		RunText.append("\n")
+
+		# We instruct Vensim to delete the .vdfx file, to prevent it from getting picked up by
+		# sync software, such as DropBox or Google Drive.  If sync software locks the file,
+		# Vensim won't be able to overwrite it on the next model run, ruining the batch.
+		RunText.append("FILE>DELETE|" + ShardRunName + ".vdfx")
+		RunText.append("\n\n")
+
+		f.write("".join(RunText))
+
+	# Since Vensim fails to clear the savelist entry in the program after script execution, we need to do it here
+	# before the script exits.
+	if UseSaveList:
+		f.write("SIMULATE>SAVELIST|\n")
+
+	# We are done writing this shard's Vensim command script and therefore close the file.
+	f.close()
+
+if Resume:
+	print(str(NumCompletedRuns) + " of " + str(NumRuns) + " runs were already completed.  The command script performs the remaining runs.")
 
-# We are done writing the Vensim command script and therefore close the file.
-f.close()
+# The run plan is complete, and the runs found in the cache have been marked as used.
+if UseRunCache:
+	RunPlan.Close()
+	Cache.Save()
+	print(str(NumCachedRuns) + " of " + str(NumRuns) + " runs were found in the run cache.  After running the command script, run SpliceRunResults.py " + RunPlanFileName(OutputScript) + " to write " + RunResultsFile + ".")
@@ -16,60 +16,144 @@ FirstYear = "2019" # The first year you wish to include in the output file (cann
 FinalYear = "2050" # The last year you wish to include in the output file (cannot be later than last simulated year)
 OutputScript = "GeneratedDataLoggingScript.cmd" # The desired filename of the Vensim command script to be generated
 OutputVarsFile = "OutputVarsToExport.lst" # The name of the file containing a list of variables to be included in the RunResultsFile
-SettingsFiles = ["","Scenario_NDC.cin","Scenario_NetZero.cin"]
+SettingsFiles = ["","Scenario_NDC.cin","Scenario_1point5.cin"]
 	# This is the list of settings files to be tested, with .cin extensions.
 	# Include a blank entry (e.g. "") to include BAU case.
 
+# Other Settings
+# --------------
+NumShards = 1 # The number of separate command scripts ("shards") to split the settings files among, so that several
+			  # copies of Vensim can perform the runs at the same time.  Each run already has its own run name and
+			  # results file, so the results do not need to be merged afterward.  May also be set on the command line
+			  # with "--shards N".
+UseRunCache = False # If True, runs whose results are already in the run cache (see RunCache.py) are left out of the command
+					# script, and the other runs are added to the cache.  After Vensim has carried out the command script,
+					# run SpliceRunResults.py to write the results files (including the runs taken from the cache).
+RunCacheDirectory = "RunCache" # The folder holding the run cache, which may be shared by all scripts and batches
+MaxRunCacheSizeMB = 2000 # When the run cache grows larger than this, the runs that have gone unused longest are removed
+
 	
-# Generate Vensim Command Script
-# ------------------------------
+# Checking Names
+# --------------
+# Before writing anything, we check the entries in the OutputVarsFile and the settings in each
+# settings file against the model file.
+# A misspelled name would otherwise not be noticed until Vensim reached it (or, in a .lst file,
+# would be silently skipped), possibly hours into a batch of runs.  See ModelSymbols.py for details.
+
+from ModelSymbols import CheckCommandScriptNames
+
+NameErrors = CheckCommandScriptNames(ModelFile, [], [OutputVarsFile], [SettingsFile for SettingsFile in SettingsFiles if SettingsFile != ""])
+if len(NameErrors) > 0:
+	f = open(OutputScript, 'w')
+	ErrorMessage = "Error: The following problems were found when checking names against the model file " + ModelFile + ":\n" + "\n".join(NameErrors)
+	f.write(ErrorMessage)
+	f.close()
+	import sys
+	sys.exit(ErrorMessage)
+
+
+# Generate Vensim Command Scripts
+# -------------------------------
+# We write one command script per shard (usually just one command script in total), and each shard
+# runs a contiguous block of the settings files.
 # We use a SAVELIST to reduce the size of the output files, since we are generating one per run.
-f = open(OutputScript, 'w')
-f.write('SPECIAL>LOADMODEL|"' + ModelFile + '"\n\n')
-f.write("SIMULATE>SAVELIST|" + OutputVarsFile + "\n")
-
-for SettingsFile in SettingsFiles:
-
-	# The RunName is the name of the SettingsFile without the .cin extension.  It is used as the filename for the .vdfx file
-	# that Vensim creates (or "NoSettings"), and it is included in a column in the RunResultsFile.
-	SettingsFileNameLen = len(SettingsFile)
-	if SettingsFileNameLen < 5:
-		RunName = "NoSettings"
-	else:
-		RunName = SettingsFile[:SettingsFileNameLen - 4]
-	RunResultsFile = RunName + ".tsv" # The desired filename for the file containing model run results
-	
-	# Generate an empty output file with a time row, to work around bug where Vensim includes multiple Time rows if you
-	# don't suppress all time rows.  We overwrite any output file that may exist at this filename.
-	tsv = open(RunResultsFile, 'w')
-	tsv.write("Time\t" + RunName + "\t")
-	YearToWrite = FirstYear
-	while(YearToWrite <= FinalYear):
-		tsv.write(YearToWrite)
-		if(YearToWrite != FinalYear):
-			tsv.write("\t")
+# The savelist holds each entry of the OutputVarsFile once, with any "*" subscripts expanded.
+
+from CommandScriptTools import ReadNumShards, SaveListFileName, ShardFileName, ShardRunRange, WriteSaveList
+
+SaveListFile = SaveListFileName(OutputScript)
+WriteSaveList(ModelFile, [OutputVarsFile], SaveListFile)
+
+NumShards = max(1, min(ReadNumShards(NumShards), len(SettingsFiles)))
+
+# If UseRunCache is enabled, every run is listed in the run plan, but only the runs that are not in the
+# run cache are written to the command scripts.  These runs export their results to a new runs results
+# file (one per shard), and SpliceRunResults.py later writes each run's results file from the cache.
+if UseRunCache:
+	from RunCache import NewRunsFileName, RunCache, RunKey, RunPlanFileName, RunPlanWriter
+	Cache = RunCache(RunCacheDirectory)
+	BatchHash = Cache.BatchHash(ModelFile, OutputVarsFile, FirstYear, FinalYear)
+	NewRunsFiles = [ShardFileName(NewRunsFileName(OutputScript), ShardNumber, NumShards) for ShardNumber in range(1, NumShards + 1)]
+	RunPlan = RunPlanWriter(RunPlanFileName(OutputScript), RunCacheDirectory, FirstYear, FinalYear, NewRunsFiles, MaxRunCacheSizeMB)
+	NumCachedRuns = 0
+
+for ShardNumber in range(1, NumShards + 1):
+
+	FirstRunIndex, LastRunIndex = ShardRunRange(ShardNumber, NumShards, len(SettingsFiles))
+
+	f = open(ShardFileName(OutputScript, ShardNumber, NumShards), 'w')
+	f.write('SPECIAL>LOADMODEL|"' + ModelFile + '"\n\n')
+	f.write("SIMULATE>SAVELIST|" + SaveListFile + "\n")
+
+	ExportedRuns = 0
+	for SettingsFile in SettingsFiles[FirstRunIndex:LastRunIndex]:
+
+		# The RunName is the name of the SettingsFile without the .cin extension.  It is used as the filename for the .vdfx file
+		# that Vensim creates (or "NoSettings"), and it is included in a column in the RunResultsFile.
+		SettingsFileNameLen = len(SettingsFile)
+		if SettingsFileNameLen < 5:
+			RunName = "NoSettings"
 		else:
-			tsv.write("\n")
-		YearToWrite = str(int(YearToWrite)+1)
-	tsv.close()
-
-	# Write directions to set the run name, read the settings, run the simulation, and append the results to the RunResultsFile.
-	f.write("SIMULATE>RUNNAME|" + RunName + "\n")
-	f.write("SIMULATE>READCIN|" + SettingsFile + "\n")
-	f.write("MENU>RUN|O\n")
-	f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + RunResultsFile + "|" + OutputVarsFile + "|+!||" + FirstYear + "|" + FinalYear + "|:")
-	f.write(RunName)
-	f.write("\n")
-
-	# We instruct Vensim to delete the .vdfx file, to prevent it from getting picked up by
-	# sync software, such as DropBox or Google Drive.  If sync software locks the file,
-	# Vensim won't be able to overwrite it on the next model run, ruining the batch.
-	f.write("FILE>DELETE|" + RunName + ".vdfx")
-	f.write("\n\n")
-
-# Since Vensim fails to clear the savelist entry in the program after script execution, we need to do it here
-# before the script exits.
-f.write("SIMULATE>SAVELIST|\n")
-
-# We are done writing the Vensim command script and therefore close the file.
-f.close()
\ No newline at end of file
+			RunName = SettingsFile[:SettingsFileNameLen - 4]
+		RunResultsFile = RunName + ".tsv" # The desired filename for the file containing model run results
+
+		# If the run cache is in use, the run is listed in the run plan, and it is skipped if its results
+		# are already in the cache.  Otherwise, it is exported to the new runs results file, identified by
+		# its run key.  SpliceRunResults.py writes the RunResultsFile, including its "Time" row.
+		if UseRunCache:
+			Key = RunKey(BatchHash, "", Cache.SettingsHash(SettingsFile))
+			RunPlan.Add(Key, RunResultsFile, RunName)
+			if not Cache.Contains(Key):
+				f.write("SIMULATE>RUNNAME|" + RunName + "\n")
+				f.write("SIMULATE>READCIN|" + SettingsFile + "\n")
+				f.write("MENU>RUN|O\n")
+				f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + NewRunsFiles[ShardNumber - 1] + "|" + OutputVarsFile + "|" + ("+!" if ExportedRuns > 0 else "") + "||" + FirstYear + "|" + FinalYear + "|:")
+				f.write("RunCacheKey=" + Key)
+				f.write("\n")
+				f.write("FILE>DELETE|" + RunName + ".vdfx")
+				f.write("\n\n")
+				ExportedRuns += 1
+			else:
+				NumCachedRuns += 1
+			continue
+
+		# Generate an empty output file with a time row, to work around bug where Vensim includes multiple Time rows if you
+		# don't suppress all time rows.  We overwrite any output file that may exist at this filename.
+		tsv = open(RunResultsFile, 'w')
+		tsv.write("Time\t" + RunName + "\t")
+		YearToWrite = FirstYear
+		while(YearToWrite <= FinalYear):
+			tsv.write(YearToWrite)
+			if(YearToWrite != FinalYear):
+				tsv.write("\t")
+			else:
+				tsv.write("\n")
+			YearToWrite = str(int(YearToWrite)+1)
+		tsv.close()
+
+		# Write directions to set the run name, read the settings, run the simulation, and append the results to the RunResultsFile.
+		f.write("SIMULATE>RUNNAME|" + RunName + "\n")
+		f.write("SIMULATE>READCIN|" + SettingsFile + "\n")
+		f.write("MENU>RUN|O\n")
+		f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + RunResultsFile + "|" + OutputVarsFile + "|+!||" + FirstYear + "|" + FinalYear + "|:")
+		f.write(RunName)
+		f.write("\n")
+
+		# We instruct Vensim to delete the .vdfx file, to prevent it from getting picked up by
+		# sync software, such as DropBox or Google Drive.  If sync software locks the file,
+		# Vensim won't be able to overwrite it on the next model run, ruining the batch.
+		f.write("FILE>DELETE|" + RunName + ".vdfx")
+		f.write("\n\n")
+
+	# Since Vensim fails to clear the savelist entry in the program after script execution, we need to do it here
+	# before the script exits.
+	f.write("SIMULATE>SAVELIST|\n")
+
+	# We are done writing this shard's Vensim command script and therefore close the file.
+	f.close()
+
+# The run plan is complete, and the runs found in the cache have been marked as used.
+if UseRunCache:
+	RunPlan.Close()
+	Cache.Save()
+	print(str(NumCachedRuns) + " of " + str(len(SettingsFiles)) + " runs were found in the run cache.  After running the command script, run SpliceRunResults.py " + RunPlanFileName(OutputScript) + " to write the results files.")
\ No newline at end of file
@@ -0,0 +1,179 @@
+# EstimateSensitivityIndices.py
+#
+# This is a Python script that computes global sensitivity indices for each enabled policy from the
+# results of a command script generated by CreateCombinationsScript.py in "Morris" or "Sobol" mode
+# (see SamplingDesign in that script).  The indices show which policies have the largest effects on
+# each output variable in each year, over the whole range of every policy's settings.
+#
+# For a "Morris" design, each policy's elementary effects (the change in a variable when the policy
+# moves by a fixed step, with every other policy held still) are summarized by three statistics:
+#
+# 1. Mu: the average elementary effect, scaled to a change across the policy's whole range.
+# 2. Mu Star: the average of the absolute values of the elementary effects.  This is the usual
+#    measure for ranking policies, because effects of opposite signs do not cancel out.
+# 3. Sigma: the standard deviation of the elementary effects.  A large Sigma (compared with Mu Star)
+#    means that the policy's effect depends on the settings of other policies, or is not linear.
+#
+# For a "Sobol" design, each policy's share of the variance of each variable is estimated:
+#
+# 1. First-Order Index: the share of the variance caused by the policy on its own.
+# 2. Total-Order Index: the share caused by the policy, including its interactions with other
+#    policies.  A policy with a total-order index near zero can be left out of further analysis.
+#
+# Because the indices are estimated from samples, this script also reports the half-width of a
+# confidence interval around each Sobol index, and around each Morris Mu.  Years in which a variable
+# does not vary at all have no variance to share out, so their Sobol indices are reported as "nan".
+# This script requires the NumPy package.
+
+
+# File Names
+# ----------
+RunResultsFile = "RunResults.tsv" # The results file produced by the Vensim command script
+SensitivityDesignFile = "SensitivityDesign.json" # The design file written by CreateCombinationsScript.py
+OutputFile = "SensitivityIndices.tsv" # The file to which the indices will be written
+
+# Other Settings
+# --------------
+ConfidenceZ = 1.96 # The width of the confidence interval in standard errors (1.96 gives a 95% confidence interval)
+NumRanked = 10 # The number of policies listed, for each variable, in the ranking printed when the script finishes
+FirstYear = "2019" # Only used if the results file does not begin with a "Time" row
+FinalYear = "2050" # Only used if the results file does not begin with a "Time" row
+PolicySchedule = None # If the results file holds runs under several policy implementation schedules (see PolicySchedules
+					  # in CreateCombinationsScript.py), the number of the schedule whose runs should be used
+
+
+import json
+import os
+import sys
+
+import numpy
+
+from RunResultsTools import IterateRuns, MatchesSchedule, ParseMetadata, ParseValues, ReadYears
+
+
+# Reading the Results
+# -------------------
+# We read the results one run at a time and place each run's values in an array with one entry per
+# sample (run), variable, and year.
+def ReadSampleValues(RunResultsFile, NumSamples, Years, Schedule=None):
+	VariableIndex = {}
+	RunValues = {}
+	SchedulesFound = set()
+	for Metadata, Rows in IterateRuns(RunResultsFile, len(Years)):
+		Parsed = ParseMetadata(Metadata)
+		if "SensitivitySample" not in Parsed or not MatchesSchedule(Parsed, Schedule, SchedulesFound):
+			continue
+		Sample = int(Parsed["SensitivitySample"])
+		RunValues[Sample] = {}
+		for Name, Values in Rows:
+			if Name not in VariableIndex:
+				VariableIndex[Name] = len(VariableIndex)
+			RunValues[Sample][Name] = ParseValues(Values)
+
+	Missing = [Sample for Sample in range(NumSamples) if Sample not in RunValues]
+	if len(Missing) > 0:
+		raise ValueError("The results file is missing runs for " + str(len(Missing)) + " of the " + str(NumSamples) + " samples, starting with SensitivitySample " + ", ".join(str(Sample) for Sample in Missing[:10]))
+
+	Values = numpy.full((NumSamples, len(VariableIndex), len(Years)), numpy.nan)
+	for Sample, Rows in RunValues.items():
+		if Sample < NumSamples:
+			for Name, RowValues in Rows.items():
+				Values[Sample, VariableIndex[Name]] = RowValues
+	return Values, sorted(VariableIndex, key=VariableIndex.get)
+
+
+# Morris Indices
+# --------------
+# The samples are listed one trajectory after another, and each step of a trajectory changes one
+# policy, so the differences between consecutive samples in a trajectory give every elementary effect
+# with a single array subtraction.  We find which policy changed at each step (and by how much, in unit
+# terms) from the design, and rearrange the effects so they are listed by policy rather than by step.
+def ComputeMorrisIndices(Values, Design, ConfidenceZ):
+	NumPolicies = len(Design["Policies"])
+	NumTrajectories = Design["NumTrajectories"]
+	UnitSamples = numpy.array(Design["UnitSamples"]).reshape(NumTrajectories, NumPolicies + 1, NumPolicies)
+	Outputs = Values.reshape((NumTrajectories, NumPolicies + 1) + Values.shape[1:])
+
+	UnitSteps = numpy.diff(UnitSamples, axis=1)
+	ChangedPolicies = numpy.abs(UnitSteps).argmax(axis=2)
+	Deltas = numpy.take_along_axis(UnitSteps, ChangedPolicies[:, :, numpy.newaxis], axis=2)[:, :, 0]
+	StepEffects = numpy.diff(Outputs, axis=1) / Deltas[:, :, numpy.newaxis, numpy.newaxis]
+
+	# Effects, with one entry per trajectory, policy, variable, and year
+	StepOfPolicy = ChangedPolicies.argsort(axis=1)
+	Effects = StepEffects[numpy.arange(NumTrajectories)[:, numpy.newaxis], StepOfPolicy]
+
+	Mu = Effects.mean(axis=0)
+	MuStar = numpy.abs(Effects).mean(axis=0)
+	if NumTrajectories > 1:
+		Sigma = Effects.std(axis=0, ddof=1)
+		HalfWidths = ConfidenceZ * Sigma / numpy.sqrt(NumTrajectories)
+	else:
+		Sigma = numpy.full_like(Mu, numpy.nan)
+		HalfWidths = numpy.full_like(Mu, numpy.nan)
+	return [("Mu", Mu), ("Mu Confidence Interval Half-Width", HalfWidths), ("Mu Star", MuStar), ("Sigma", Sigma)], "Mu Star"
+
+
+# Sobol Indices
+# -------------
+# The samples are listed in the order A, B, then the AB sample for each policy (see SensitivityDesigns.py).
+# We use the estimator of Saltelli et al. (2010) for the first-order indices and that of Jansen (1999)
+# for the total-order indices.  Each is an average over the base samples, divided by the variance of
+# the variable, so its confidence interval comes from the standard error of that average.  The values
+# are first centered on their mean (which does not change the indices), because the first-order
+# estimator is otherwise very imprecise for variables whose mean is large compared with their spread.
+def ComputeSobolIndices(Values, Design, ConfidenceZ):
+	NumPolicies = len(Design["Policies"])
+	NumBaseSamples = Design["NumBaseSamples"]
+	Centered = Values - Values[:2 * NumBaseSamples].mean(axis=0)
+	OutputsA = Centered[:NumBaseSamples]
+	OutputsB = Centered[NumBaseSamples:2 * NumBaseSamples]
+	OutputsAB = Centered[2 * NumBaseSamples:].reshape((NumPolicies, NumBaseSamples) + Values.shape[1:])
+
+	Variance = (Centered[:2 * NumBaseSamples] ** 2).mean(axis=0)
+	FirstOrderTerms = OutputsB * (OutputsAB - OutputsA)
+	TotalOrderTerms = (OutputsA - OutputsAB) ** 2 / 2
+
+	Indices = []
+	with numpy.errstate(divide="ignore", invalid="ignore"):
+		for Name, Terms in (("First-Order Index", FirstOrderTerms), ("Total-Order Index", TotalOrderTerms)):
+			Indices.append((Name, Terms.mean(axis=1) / Variance))
+			Indices.append((Name + " Confidence Interval Half-Width", ConfidenceZ * Terms.std(axis=1, ddof=1) / numpy.sqrt(NumBaseSamples) / Variance))
+	return Indices, "Total-Order Index"
+
+
+if __name__ == "__main__":
+
+	if not os.path.isfile(SensitivityDesignFile):
+		sys.exit("Error: The design file " + SensitivityDesignFile + " was not found.  It is written by CreateCombinationsScript.py in \"Morris\" or \"Sobol\" mode, and this script must be run in the same folder.")
+	if not os.path.isfile(RunResultsFile):
+		sys.exit("Error: The results file " + RunResultsFile + " was not found.  Perform the runs in Vensim before running this script.")
+	with open(SensitivityDesignFile, 'r') as DesignFile:
+		Design = json.load(DesignFile)
+	Years = ReadYears(RunResultsFile, FirstYear, FinalYear)
+	try:
+		Values, Variables = ReadSampleValues(RunResultsFile, len(Design["UnitSamples"]), Years, PolicySchedule)
+	except ValueError as Error:
+		sys.exit("Error: " + str(Error))
+	if Design["Method"] == "Morris":
+		Indices, RankingStatistic = ComputeMorrisIndices(Values, Design, ConfidenceZ)
+	else:
+		Indices, RankingStatistic = ComputeSobolIndices(Values, Design, ConfidenceZ)
+
+	# We write one row per variable, policy, and statistic.
+	with open(OutputFile, 'w') as f:
+		f.write("Variable\tPolicy\tStatistic\t" + "\t".join(str(Year) for Year in Years) + "\n")
+		for VariableIndex, Variable in enumerate(Variables):
+			for PolicyNumber, PolicyName in enumerate(Design["Policies"]):
+				for Statistic, StatisticValues in Indices:
+					f.write(Variable + "\t" + PolicyName + "\t" + Statistic + "\t" + "\t".join(format(Value, ".7g") for Value in StatisticValues[PolicyNumber, VariableIndex]) + "\n")
+	print("Wrote " + Design["Method"] + " sensitivity indices of " + str(len(Design["Policies"])) + " policies, estimated from " + str(len(Design["UnitSamples"])) + " runs, to " + OutputFile + ".")
+
+	# For each variable, we list the policies with the largest effects in the last year.
+	RankingValues = dict(Indices)[RankingStatistic][:, :, -1]
+	for VariableIndex, Variable in enumerate(Variables):
+		print("")
+		print(Variable + " (ranked by " + RankingStatistic + " in " + str(Years[-1]) + "):")
+		Ranked = sorted(range(len(Design["Policies"])), key=lambda PolicyNumber: -numpy.nan_to_num(RankingValues[PolicyNumber, VariableIndex], nan=-numpy.inf))
+		for Rank, PolicyNumber in enumerate(Ranked[:NumRanked]):
+			print("  " + str(Rank + 1) + ". " + Design["Policies"][PolicyNumber] + ": " + format(RankingValues[PolicyNumber, VariableIndex], ".4g"))
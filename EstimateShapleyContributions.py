@@ -0,0 +1,135 @@
+# EstimateShapleyContributions.py
+#
+# This is a Python script that computes the contribution of each policy group to a policy package
+# from the results of a command script generated by CreateContributionTestScript.py in "Shapley"
+# mode.  A group's contribution is its Shapley value: the change caused by adding the group to the
+# groups that came before it, averaged over the random orders ("permutations") of groups recorded
+# in the ShapleyDesignFile.  The contributions of all groups add up exactly to the difference
+# between the full policy package and the BAU case, in every year and for every variable.
+#
+# Because only a sample of permutations is tested, each contribution is an estimate, and this
+# script also reports the half-width of a confidence interval around each estimate.  For example,
+# a contribution of 50 with a half-width of 5 means the true Shapley value is likely (with the
+# confidence level below) to be between 45 and 55.  If the ShapleyRunBudget was large enough for
+# every permutation to be tested, the contributions are exact, and the half-widths are zero.
+# This script requires the NumPy package.
+
+
+# File Names
+# ----------
+RunResultsFile = "ContributionTestResults.tsv" # The results file produced by the Vensim command script
+ShapleyDesignFile = "ShapleyDesign.json" # The design file written by CreateContributionTestScript.py
+OutputFile = "ShapleyContributions.tsv" # The file to which the contributions will be written
+
+# Other Settings
+# --------------
+ConfidenceZ = 1.96 # The width of the confidence interval in standard errors (1.96 gives a 95% confidence interval)
+FirstYear = "2019" # Only used if the results file does not begin with a "Time" row
+FinalYear = "2050" # Only used if the results file does not begin with a "Time" row
+PolicySchedule = None # If the results file holds runs under several policy implementation schedules (see PolicySchedules
+					  # in CreateContributionTestScript.py), the number of the schedule whose runs should be used
+
+
+import json
+import os
+import sys
+
+import numpy
+
+from RunResultsTools import IterateRuns, MatchesSchedule, ParseMetadata, ParseValues, ReadYears
+
+
+# Reading the Results
+# -------------------
+# We read the results one run at a time and place each run's values in an array with one entry per
+# coalition (run), variable, and year.
+def ReadCoalitionValues(RunResultsFile, NumCoalitions, Years, Schedule=None):
+	VariableIndex = {}
+	RunValues = {}
+	SchedulesFound = set()
+	for Metadata, Rows in IterateRuns(RunResultsFile, len(Years)):
+		Parsed = ParseMetadata(Metadata)
+		if "ShapleyCoalition" not in Parsed or not MatchesSchedule(Parsed, Schedule, SchedulesFound):
+			continue
+		Coalition = int(Parsed["ShapleyCoalition"])
+		RunValues[Coalition] = {}
+		for Name, Values in Rows:
+			if Name not in VariableIndex:
+				VariableIndex[Name] = len(VariableIndex)
+			RunValues[Coalition][Name] = ParseValues(Values)
+
+	Missing = [Coalition for Coalition in range(NumCoalitions) if Coalition not in RunValues]
+	if len(Missing) > 0:
+		raise ValueError("The results file is missing runs for these ShapleyCoalition numbers: " + ", ".join(str(Coalition) for Coalition in Missing))
+
+	Values = numpy.full((NumCoalitions, len(VariableIndex), len(Years)), numpy.nan)
+	for Coalition, Rows in RunValues.items():
+		if Coalition < NumCoalitions:
+			for Name, RowValues in Rows.items():
+				Values[Coalition, VariableIndex[Name]] = RowValues
+	return Values, sorted(VariableIndex, key=VariableIndex.get)
+
+
+# Computing the Contributions
+# ---------------------------
+# For each permutation and each group, we look up the coalition run before the group is added and
+# the coalition run after it is added, so the contributions of every group in every permutation
+# can be computed with a single array subtraction.  Permutations were generated in pairs (each one
+# followed by its reverse), and the two members of a pair are not independent of one another, so
+# the confidence intervals are computed from the averages of the pairs.
+def ComputeShapleyContributions(Values, Design, ConfidenceZ):
+	CoalitionNumbers = dict((frozenset(Coalition), Number) for Number, Coalition in enumerate(Design["Coalitions"]))
+	Permutations = Design["Permutations"]
+	NumGroups = len(Design["Groups"])
+
+	Before = numpy.zeros((len(Permutations), NumGroups), dtype=int)
+	After = numpy.zeros((len(Permutations), NumGroups), dtype=int)
+	for PermutationIndex, Permutation in enumerate(Permutations):
+		for Step, GroupNumber in enumerate(Permutation):
+			Before[PermutationIndex, GroupNumber] = CoalitionNumbers[frozenset(Permutation[:Step])]
+			After[PermutationIndex, GroupNumber] = CoalitionNumbers[frozenset(Permutation[:Step + 1])]
+
+	# Marginal contributions, with one entry per permutation, group, variable, and year
+	Marginals = Values[After] - Values[Before]
+
+	if Design.get("Exact", False) or len(Permutations) < 2:
+		Contributions = Marginals.mean(axis=0)
+		HalfWidths = numpy.zeros_like(Contributions) if Design.get("Exact", False) else numpy.full_like(Contributions, numpy.nan)
+		return Contributions, HalfWidths
+
+	NumPairs = len(Permutations) // 2
+	PairMeans = (Marginals[0:2 * NumPairs:2] + Marginals[1:2 * NumPairs:2]) / 2
+	Contributions = PairMeans.mean(axis=0)
+	if NumPairs > 1:
+		HalfWidths = ConfidenceZ * PairMeans.std(axis=0, ddof=1) / numpy.sqrt(NumPairs)
+	else:
+		HalfWidths = numpy.full_like(Contributions, numpy.nan)
+	return Contributions, HalfWidths
+
+
+if __name__ == "__main__":
+
+	if not os.path.isfile(ShapleyDesignFile):
+		sys.exit("Error: The design file " + ShapleyDesignFile + " was not found.  It is written by CreateContributionTestScript.py in \"Shapley\" mode, and this script must be run in the same folder.")
+	if not os.path.isfile(RunResultsFile):
+		sys.exit("Error: The results file " + RunResultsFile + " was not found.  Perform the runs in Vensim before running this script.")
+	with open(ShapleyDesignFile, 'r') as DesignFile:
+		Design = json.load(DesignFile)
+	Years = ReadYears(RunResultsFile, FirstYear, FinalYear)
+	try:
+		Values, Variables = ReadCoalitionValues(RunResultsFile, len(Design["Coalitions"]), Years, PolicySchedule)
+	except ValueError as Error:
+		sys.exit("Error: " + str(Error))
+	Contributions, HalfWidths = ComputeShapleyContributions(Values, Design, ConfidenceZ)
+
+	# We write one row per variable, group, and statistic, followed by the total effect of the
+	# package (the full package run minus the BAU run) for each variable, for reference.
+	with open(OutputFile, 'w') as f:
+		f.write("Variable\tPolicy Group\tStatistic\t" + "\t".join(str(Year) for Year in Years) + "\n")
+		for VariableIndex, Variable in enumerate(Variables):
+			for GroupNumber, GroupName in enumerate(Design["Groups"]):
+				f.write(Variable + "\t" + GroupName + "\tContribution\t" + "\t".join(format(Value, ".7g") for Value in Contributions[GroupNumber, VariableIndex]) + "\n")
+				f.write(Variable + "\t" + GroupName + "\tConfidence Interval Half-Width\t" + "\t".join(format(Value, ".7g") for Value in HalfWidths[GroupNumber, VariableIndex]) + "\n")
+			Total = Values[1, VariableIndex] - Values[0, VariableIndex]
+			f.write(Variable + "\tAll\tTotal Package Effect\t" + "\t".join(format(Value, ".7g") for Value in Total) + "\n")
+	print("Wrote contributions of " + str(len(Design["Groups"])) + " policy groups, estimated from " + str(len(Design["Permutations"])) + " permutations, to " + OutputFile + ".")
@@ -0,0 +1,446 @@
+# ExportInputDataCSVs.py
+#
+# This is a Python script that exports the blue tabs of the Excel files in the InputData folder to the
+# .csv files read by the model's GET DIRECT calls, replacing the manual export with "CSV Export Tool.xlsm"
+# (see docs/input-data.md).  A tab is exported if a .csv file with the same name (plus ".csv") is in the
+# same folder as its Excel file, so to export a new tab, first create an empty .csv file with its name.
+# A .csv file that is not up to date with its Excel file silently changes the results of every run that
+# reads it, so this script keeps track of what each Excel file exports, and can check that every .csv
+# file is up to date in a fraction of a second.
+#
+# Usage:
+#   python ExportInputDataCSVs.py                         # export every Excel file that has changed
+#   python ExportInputDataCSVs.py --check                 # only list the .csv files that are out of date
+#   python ExportInputDataCSVs.py InputData/trans/AVLo    # only export (or check) the files in some folders
+#
+# The Manifest
+# ------------
+# The manifest (ManifestFile) records a SHA-256 hash of each Excel file, with its size and modification
+# time, and the names of its tabs and a hash of the .csv text exported from each of them.  It also records
+# a hash of each .csv file, with its size and modification time.  A file whose size and modification time
+# have not changed is not read again, and an Excel file is only opened again if its contents (or the .csv
+# files in its folder) have changed, so when nothing has changed, checking the whole InputData folder
+# only takes the time needed to list its files.  A .csv file is out of date if its hash differs from the
+# hash of the text exported from its tab.  If several Excel files in a folder have a tab with the same
+# name (such as the policy schedule files in InputData/plcy-schd/FoPITY), they must all export the same
+# text.  The changed Excel files are opened by NumProcesses processes at the same time.
+#
+# Writing the .csv Files
+# ----------------------
+# The .csv files are written the way Excel writes them: each cell holds the value shown in Excel (using
+# the cell's number format, such as "0.000E+00" or "0.0%"), every row has a cell for every column up to
+# the last column used in the tab, and lines end with a line feed.  A .csv file is only written if its
+# contents change, so an export that changes nothing leaves the file (and its modification time) alone,
+# and each file is written to a temporary file first, so an interrupted export never leaves a damaged
+# .csv file.  The values are those saved in the Excel file when it was last calculated, so Excel files
+# must be saved by Excel (or another program that saves calculated values), not generated by a script.
+# Number formats that use dates, times, fractions, or conditions are shown as in the "General" format.
+
+
+# File Names
+# ----------
+InputDataFolder = "InputData" # The folder holding the Excel and .csv files
+ManifestFile = "InputDataCache/CSVExportManifest.json" # The file in which the hashes of the Excel and .csv files are kept
+
+# Other Settings
+# --------------
+NumProcesses = 4 # The number of Excel files to export at the same time
+
+
+import concurrent.futures
+import csv
+import decimal
+import hashlib
+import io
+import json
+import math
+import os
+import posixpath
+import re
+import sys
+import time
+import xml.etree.ElementTree as ElementTree
+import zipfile
+
+from ModelSymbols import HashFiles
+
+
+# Reading Excel Files
+# -------------------
+# An .xlsx file is a zip archive of XML files: xl/workbook.xml lists the tabs, xl/_rels/workbook.xml.rels
+# names the file holding each tab, xl/sharedStrings.xml holds the text used in cells, and xl/styles.xml
+# holds the number formats.  Each cell gives its position (such as "B2"), its type ("s" for shared text,
+# "str" for text from a formula, "inlineStr", "b" for TRUE or FALSE, "e" for an error such as #N/A, or
+# none for a number), and the index of its style.
+Namespace = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+RelationshipIdAttribute = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+RelationshipTag = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+CellReferencePattern = re.compile(r"^([A-Z]+)(\d+)$")
+
+# The number formats built into Excel, which are not listed in xl/styles.xml.
+BuiltInFormats = {0: "General", 1: "0", 2: "0.00", 3: "#,##0", 4: "#,##0.00", 9: "0%", 10: "0.00%", 11: "0.00E+00",
+	37: "#,##0 ;(#,##0)", 38: "#,##0 ;(#,##0)", 39: "#,##0.00;(#,##0.00)", 40: "#,##0.00;(#,##0.00)", 48: "##0.0E+0", 49: "@"}
+
+def CellText(Element):
+	return "".join(Text.text or "" for Text in Element.findall(Namespace + "t") + Element.findall(Namespace + "r/" + Namespace + "t"))
+
+def ColumnNumber(Letters):
+	Number = 0
+	for Letter in Letters:
+		Number = Number * 26 + ord(Letter) - ord("A") + 1
+	return Number - 1
+
+def ReadSheetNames(Archive):
+	Workbook = ElementTree.fromstring(Archive.read("xl/workbook.xml"))
+	Relationships = ElementTree.fromstring(Archive.read("xl/_rels/workbook.xml.rels"))
+	Targets = {Relationship.get("Id"): Relationship.get("Target") for Relationship in Relationships.iter(RelationshipTag)}
+	Sheets = {}
+	for Sheet in Workbook.iter(Namespace + "sheet"):
+		Target = Targets[Sheet.get(RelationshipIdAttribute)]
+		Sheets[Sheet.get("name")] = Target.lstrip("/") if Target.startswith("/") else posixpath.normpath(posixpath.join("xl", Target))
+	return Sheets
+
+def ReadStyles(Archive):
+	SharedStrings = []
+	if "xl/sharedStrings.xml" in Archive.namelist():
+		SharedStrings = [CellText(Item) for Item in ElementTree.fromstring(Archive.read("xl/sharedStrings.xml")).iter(Namespace + "si")]
+	Styles = ElementTree.fromstring(Archive.read("xl/styles.xml"))
+	Formats = dict(BuiltInFormats)
+	Formats.update((int(Format.get("numFmtId")), Format.get("formatCode")) for Format in Styles.iter(Namespace + "numFmt"))
+	CellFormats = Styles.find(Namespace + "cellXfs")
+	StyleFormats = [Formats.get(int(Style.get("numFmtId", 0)), "General") for Style in (CellFormats if CellFormats is not None else [])]
+	return SharedStrings, StyleFormats
+
+# This returns the rows of a tab as lists of the text shown in each cell, with a cell for every column up
+# to the last column used in the tab.
+def ReadSheet(Archive, SheetFile, SharedStrings, StyleFormats):
+	Cells = {}
+	NumRows = NumColumns = 0
+	for Cell in ElementTree.fromstring(Archive.read(SheetFile)).iter(Namespace + "c"):
+		Match = CellReferencePattern.match(Cell.get("r", ""))
+		if Match is None:
+			raise ValueError(SheetFile + " has a cell without a valid position.")
+		Row, Column = int(Match.group(2)) - 1, ColumnNumber(Match.group(1))
+		Type = Cell.get("t", "n")
+		Value = Cell.find(Namespace + "v")
+		if Type == "inlineStr":
+			Text = CellText(Cell.find(Namespace + "is"))
+		elif Value is None or Value.text is None:
+			Text = ""
+		elif Type == "s":
+			Text = SharedStrings[int(Value.text)]
+		elif Type == "b":
+			Text = "TRUE" if Value.text == "1" else "FALSE"
+		elif Type == "n":
+			Style = int(Cell.get("s", 0))
+			Text = FormatNumber(float(Value.text), StyleFormats[Style] if Style < len(StyleFormats) else "General")
+		else:
+			Text = Value.text
+		Cells[Row, Column] = Text
+		NumRows, NumColumns = max(NumRows, Row + 1), max(NumColumns, Column + 1)
+	return [[Cells.get((Row, Column), "") for Column in range(NumColumns)] for Row in range(NumRows)]
+
+
+# Number Formats
+# --------------
+# Excel rounds values to 15 significant digits before showing them, and rounds halves away from zero.
+# The "General" format shows as many digits as fit in 11 characters, switching to scientific notation
+# for very large or very small numbers.
+RoundingContext = decimal.Context(prec=40, rounding=decimal.ROUND_HALF_UP)
+
+def RoundedText(Value, Specification):
+	return format(decimal.Decimal(format(Value, ".15g")), Specification)
+
+def TidyGeneral(Text):
+	Mantissa, Separator, Exponent = Text.partition("E")
+	if "." in Mantissa:
+		Mantissa = Mantissa.rstrip("0").rstrip(".")
+	if Separator == "":
+		return Mantissa
+	return Mantissa + "E" + ("-" if Exponent.startswith("-") else "+") + format(abs(int(Exponent)), "02d")
+
+def FormatGeneral(Value):
+	if Value == int(Value) and abs(Value) < 1e11:
+		return str(int(Value))
+	Width = 12 if Value < 0 else 11
+	Exponent = math.floor(math.log10(abs(Value)))
+	with decimal.localcontext(RoundingContext):
+		if -4 <= Exponent <= -1:
+			return TidyGeneral(RoundedText(Value, ".9f"))
+		if abs(Exponent) <= 9:
+			for Places in (12, 9 - Exponent):
+				Text = TidyGeneral(RoundedText(Value, "." + str(max(Places, 0)) + "f"))
+				if len(Text) <= Width:
+					return Text
+		elif Exponent == 10:
+			return RoundedText(Value, ".0f")
+		return TidyGeneral(RoundedText(Value, ".5E"))
+
+# A number format has up to four sections, separated by semicolons: for positive numbers, negative
+# numbers, zero, and text.  In each section, quoted text and characters after a backslash are shown as
+# they are, "_" followed by a character leaves a space, "*" followed by a character (which fills the rest
+# of the cell) is left out, and text in brackets (a color or condition) is left out, except for a currency
+# symbol such as [$€-x-euro].  The digits are shown in place of the first group of "0", "#", "?", ",", and
+# "." characters (and "E+" or "E-" with its digits), and "%" multiplies the number by 100.
+FormatTokenPattern = re.compile(r'"[^"]*"|\\.|_.|\*.|\[[^\]]*\]|[0#?][0#?,.]*(?:[eE][+-][0#?]+)?|\.[0#?][0#?,]*(?:[eE][+-][0#?]+)?|.', re.DOTALL)
+UnsupportedFormatPattern = re.compile(r"[yYmMdDhHsS/]")
+
+def SplitSections(Code):
+	Sections = [""]
+	for Token in FormatTokenPattern.findall(Code):
+		if Token == ";":
+			Sections.append("")
+		else:
+			Sections[-1] += Token
+	return Sections
+
+def FormatDigits(Value, Pattern):
+	Mantissa, Separator, Exponent = re.split(r"([eE][+-])", Pattern) if re.search(r"[eE][+-]", Pattern) else (Pattern, "", "")
+	Scale = len(Mantissa) - len(Mantissa.rstrip(","))
+	IntegerPattern, Point, FractionPattern = Mantissa.rstrip(",").partition(".")
+	FractionPattern = FractionPattern.replace(",", "")
+	Grouping = "," in IntegerPattern
+	IntegerPattern = IntegerPattern.replace(",", "")
+	Places = len(FractionPattern)
+
+	if Separator != "":
+		Text = RoundedText(Value, "." + str(Places) + "E")
+		Digits, Power = Text.split("E")
+		Power = int(Power) if Value != 0 else 0
+		PowerText = format(abs(Power), "0" + str(sum(Character == "0" for Character in Exponent)) + "d")
+		ExponentText = "E" + ("-" if Power < 0 else "+" if Separator[1] == "+" else "") + PowerText
+	else:
+		Digits = RoundedText(Value / 1000 ** Scale, ("," if Grouping else "") + "." + str(Places) + "f")
+		ExponentText = ""
+
+	Integer, _, Fraction = Digits.partition(".")
+	if Integer == "0" and "0" not in IntegerPattern:
+		Integer = ""
+	Integer = Integer.rjust(IntegerPattern.count("0"), "0").rjust(IntegerPattern.count("0") + IntegerPattern.count("?"), " ")
+	Kept = len(FractionPattern.rstrip("#?"))
+	Trimmed = Fraction[Kept:].rstrip("0")
+	Fraction = Fraction[:Kept] + Trimmed + "".join(" " if Character == "?" else "" for Character in FractionPattern[Kept + len(Trimmed):])
+	return Integer + Point + Fraction + ExponentText
+
+def FormatNumber(Value, Code):
+	Sections = SplitSections(Code)
+	Section, Sign = Sections[0], "-" if Value < 0 else ""
+	if len(Sections) >= 3 and Value == 0:
+		Section = Sections[2]
+	elif len(Sections) >= 2 and Value < 0:
+		Section, Sign = Sections[1], ""
+	Tokens = FormatTokenPattern.findall(Section)
+	Plain = "".join(Token for Token in Tokens if Token[0] not in "\"\\_*[")
+	if Plain.strip().lower() in ("general", "@") or UnsupportedFormatPattern.search(Plain):
+		return FormatGeneral(Value if Sign != "" else abs(Value))
+	Value = abs(Value) * 100 ** Plain.count("%")
+
+	Text = ""
+	Digits = None
+	with decimal.localcontext(RoundingContext):
+		for Token in Tokens:
+			if Token[0] == "\"":
+				Text += Token[1:-1]
+			elif Token[0] == "\\":
+				Text += Token[1]
+			elif Token[0] == "_":
+				Text += " "
+			elif Token[0] == "[":
+				if Token.startswith("[$"):
+					Text += Token[2:-1].split("-")[0]
+			elif Token[0] in "0#?" or (Token[0] == "." and len(Token) > 1):
+				if Digits is None:
+					Digits = FormatDigits(Value, Token)
+					Text += Digits
+			elif Token[0] != "*" and Token != "@":
+				Text += Token
+	# A negative number with no section of its own is shown with a minus sign, unless it rounds to zero.
+	if Digits is not None and re.search(r"[1-9]", Digits) is None:
+		Sign = ""
+	return Sign + Text
+
+
+# Exporting an Excel File
+# -----------------------
+# This opens an Excel file and returns the names of its tabs and the text of the .csv file exported from
+# each tab named in CSVNames (the names of the .csv files in its folder, without ".csv").  It runs in a
+# separate process for each Excel file.
+def ExportWorkbook(FileName, CSVNames):
+	with zipfile.ZipFile(FileName) as Archive:
+		Sheets = ReadSheetNames(Archive)
+		Exports = {}
+		Exported = [Name for Name in Sheets if Name in CSVNames]
+		if len(Exported) > 0:
+			SharedStrings, StyleFormats = ReadStyles(Archive)
+		for Name in Exported:
+			Text = io.StringIO()
+			csv.writer(Text, lineterminator="\n").writerows(ReadSheet(Archive, Sheets[Name], SharedStrings, StyleFormats))
+			Exports[Name] = Text.getvalue().encode("utf-8")
+	return list(Sheets), Exports
+
+def WriteIfChanged(FileName, Contents):
+	try:
+		with open(FileName, 'rb') as File:
+			if File.read() == Contents:
+				return False
+	except OSError:
+		pass
+	with open(FileName + ".tmp", 'wb') as File:
+		File.write(Contents)
+	os.replace(FileName + ".tmp", FileName)
+	return True
+
+
+# The Manifest
+# ------------
+ManifestFormat = 1
+
+class ExportManifest:
+
+	def __init__(self, FileName):
+		self.FileName = FileName
+		self.Changed = False
+		try:
+			with open(FileName, 'r') as File:
+				self.Index = json.load(File)
+			if self.Index.get("Format") != ManifestFormat:
+				raise ValueError("The manifest has an unknown format.")
+		except (OSError, ValueError):
+			self.Index = {"Format": ManifestFormat, "FileHashes": {}, "Workbooks": {}}
+
+	# A file is only read again if its size or modification time has changed since it was last hashed.
+	def FileHash(self, FileName, Status):
+		Known = self.Index["FileHashes"].get(FileName)
+		if Known is not None and Known[0] == Status.st_size and Known[1] == Status.st_mtime_ns:
+			return Known[2]
+		Hash = HashFiles([FileName])
+		self.Index["FileHashes"][FileName] = [Status.st_size, Status.st_mtime_ns, Hash]
+		self.Changed = True
+		return Hash
+
+	# Files in the given folders that no longer exist are removed from the manifest.
+	def Forget(self, Folders, FileNames):
+		for FileName in list(self.Index["FileHashes"]):
+			if FileName not in FileNames and any(FileName.startswith(Folder + "/") for Folder in Folders):
+				del self.Index["FileHashes"][FileName]
+				self.Index["Workbooks"].pop(FileName, None)
+				self.Changed = True
+
+	# The manifest is written to a temporary file first, so a crash never leaves a damaged manifest.
+	def Save(self):
+		if not self.Changed:
+			return
+		os.makedirs(os.path.dirname(self.FileName) or ".", exist_ok=True)
+		with open(self.FileName + ".tmp", 'w') as File:
+			json.dump(self.Index, File, separators=(",", ":"), sort_keys=True)
+		os.replace(self.FileName + ".tmp", self.FileName)
+		self.Changed = False
+
+
+# Finding the Files
+# -----------------
+# This returns the Excel files and the .csv files (with their sizes and modification times) in each
+# folder within the given folders.  Excel's lock files (whose names begin with "~$") are skipped.
+def ListInputFiles(Folders):
+	Workbooks, CSVFiles = {}, {}
+	for Folder in Folders:
+		for Directory, Subdirectories, FileNames in os.walk(Folder):
+			Subdirectories.sort()
+			for FileName in sorted(FileNames):
+				Path = os.path.join(Directory, FileName).replace("\\", "/")
+				if FileName.startswith("~$"):
+					continue
+				if FileName.lower().endswith(".xlsx"):
+					Workbooks[Path] = os.stat(Path)
+				elif FileName.lower().endswith(".csv"):
+					CSVFiles[Path] = os.stat(Path)
+	return Workbooks, CSVFiles
+
+# Checking and Exporting
+# ----------------------
+# An Excel file is exported again if its hash has changed, or if the .csv files in its folder have
+# changed which of its tabs are exported.  With Write, an Excel file is also exported again if any of its
+# .csv files is out of date, and the out of date .csv files are written.  This returns a list of the .csv
+# files that are (or were) out of date, a list of the .csv files that were written, and a list of errors.
+def ExportInputData(Folders, Manifest, Write, NumProcesses):
+	Workbooks, CSVFiles = ListInputFiles(Folders)
+	FolderCSVNames = {}
+	for Path in CSVFiles:
+		FolderCSVNames.setdefault(posixpath.dirname(Path), []).append(posixpath.basename(Path)[:-4])
+	CSVNames = {Workbook: FolderCSVNames.get(posixpath.dirname(Workbook), []) for Workbook in Workbooks}
+	Hashes = {FileName: Manifest.FileHash(FileName, Status) for FileName, Status in list(Workbooks.items()) + list(CSVFiles.items())}
+
+	def Outputs(Workbook):
+		return {posixpath.join(posixpath.dirname(Workbook), Name + ".csv"): Hash for Name, Hash in Known[Workbook]["Exports"].items()}
+
+	Known = Manifest.Index["Workbooks"]
+	ToExport = [Workbook for Workbook in Workbooks if Workbook not in Known or Known[Workbook]["Hash"] != Hashes[Workbook]
+		or sorted(Known[Workbook]["Exports"]) != sorted(Name for Name in Known[Workbook]["Sheets"] if Name in CSVNames[Workbook])]
+	if Write:
+		ToExport += [Workbook for Workbook in Workbooks if Workbook not in ToExport and any(Hashes[Path] != Hash for Path, Hash in Outputs(Workbook).items())]
+
+	Errors = []
+	Contents = {}
+	if len(ToExport) > 0:
+		with concurrent.futures.ProcessPoolExecutor(max_workers=min(NumProcesses, len(ToExport))) as Pool:
+			Futures = {Workbook: Pool.submit(ExportWorkbook, Workbook, CSVNames[Workbook]) for Workbook in ToExport}
+			for Workbook, Future in Futures.items():
+				try:
+					Sheets, Exports = Future.result()
+				except (OSError, ValueError, KeyError, IndexError, zipfile.BadZipFile, ElementTree.ParseError) as Error:
+					Errors.append(Workbook + ": This Excel file could not be exported (" + str(Error) + ").")
+					Known.pop(Workbook, None)
+					continue
+				Known[Workbook] = {"Hash": Hashes[Workbook], "Sheets": Sheets, "Exports": {}}
+				for Name, Text in Exports.items():
+					Path = posixpath.join(posixpath.dirname(Workbook), Name + ".csv")
+					Contents.setdefault(Path, {})[Workbook] = Text
+					Known[Workbook]["Exports"][Name] = hashlib.sha256(Text).hexdigest()
+				Manifest.Changed = True
+
+	# Each .csv file is compared with the text exported from every Excel file that has a tab with its name.
+	Expected = {}
+	for Workbook in Workbooks:
+		if Workbook in Known:
+			for Path, Hash in Outputs(Workbook).items():
+				Expected.setdefault(Path, {})[Workbook] = Hash
+	OutOfDate, Written = [], []
+	for Path, Sources in sorted(Expected.items()):
+		if len(set(Sources.values())) > 1:
+			Errors.append(Path + ": The tabs exported to this file from " + " and ".join(sorted(Sources)) + " are different.")
+			continue
+		if Hashes[Path] == next(iter(Sources.values())):
+			continue
+		OutOfDate.append(Path)
+		if Write and Path in Contents:
+			WriteIfChanged(Path, next(iter(Contents[Path].values())))
+			Manifest.FileHash(Path, os.stat(Path))
+			Written.append(Path)
+	Manifest.Forget(Folders, Hashes)
+	return OutOfDate, Written, Errors
+
+
+if __name__ == "__main__":
+
+	Start = time.time()
+	Arguments = [Argument for Argument in sys.argv[1:] if Argument != "--check"]
+	Check = "--check" in sys.argv[1:]
+	Folders = [posixpath.normpath(Argument.replace("\\", "/")) for Argument in Arguments] or [InputDataFolder]
+	for Folder in Folders:
+		if not os.path.isdir(Folder):
+			sys.exit("Error: " + Folder + " is not a folder.")
+	Manifest = ExportManifest(ManifestFile)
+	OutOfDate, Written, Errors = ExportInputData(Folders, Manifest, not Check, NumProcesses)
+	Manifest.Save()
+
+	if Check:
+		for Path in OutOfDate:
+			print(Path + " is out of date.")
+		print(str(len(OutOfDate)) + " .csv files are out of date (checked in " + format(time.time() - Start, ".3f") + " seconds).")
+	else:
+		for Path in Written:
+			print("Exported " + Path)
+		print("Exported " + str(len(Written)) + " .csv files in " + format(time.time() - Start, ".3f") + " seconds.")
+	for Error in Errors:
+		print(Error, file=sys.stderr)
+	sys.exit(1 if len(Errors) > 0 or (Check and len(OutOfDate) > 0) else 0)
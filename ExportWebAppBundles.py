@@ -0,0 +1,316 @@
+# ExportWebAppBundles.py
+#
+# This is a Python script that converts the results of a batch of runs (such as RunResults.tsv,
+# produced by the command script from CreateCombinationsScript.py) into "scenario bundles": a folder
+# of small binary files from which the web application can show any graph for any run in the batch,
+# fetching only the graphs and runs it displays.  Each run is a "scenario", identified by its settings
+# of the "levers" (the policy settings and other metadata columns that differ between runs).  The
+# graphs are those defined in GraphDefinitions.vgd, the Vensim graph definitions that the web
+# application's graphs are based on.  This script requires the NumPy package.
+#
+# Run the script with "--write-vars-list" to write a list of every variable used by the graphs (see
+# GraphVarsFile below), which can be used as the OutputVarsFile of the batch, so that its results file
+# holds every variable the web application needs.  The variables are checked against the ModelFile, and
+# any that are not in the model (such as those of graphs defined for an older version of the model) are
+# left out of the list and reported, because Vensim would skip them anyway.
+#
+# Contents of the Bundle Folder
+# -----------------------------
+# Index.json: the format version, the years, the number of scenarios and of scenarios per chunk, the
+#	levers (each with its name and its list of distinct values), and the graphs (each with its name,
+#	title, folder, number of chunks, and the variable and label of each series)
+# Scenarios.bin: the scenario lookup table (see below)
+# Graphs/<graph name>/<N>.bin: chunk N of a graph, holding the values of every series of the graph in
+#	every year, for scenarios N * ScenariosPerChunk onwards (up to ScenariosPerChunk of them)
+#
+# All numbers are stored as little-endian binary.  Values are 32-bit floating point numbers (the
+# precision with which Vensim exports results), and missing values are NaN.  Within a chunk, the values
+# are ordered by series, then year, then scenario, because neighboring scenarios usually have similar
+# values for the same series and year, and a run of similar numbers compresses far better than a run of
+# different ones.  If ByteShuffle is enabled, the bytes of the values are also rearranged: the first byte
+# of every value is stored first, then the second byte of every value, and so on.  The sign and exponent
+# bytes of similar numbers are usually identical, so this makes the chunks smaller still after gzip or
+# brotli compression (which web servers apply when sending files).  The front end reverses the shuffle
+# after fetching a chunk.  If WriteGzipFiles is enabled, a gzip-compressed copy of each binary file is
+# also written (with ".gz" added to its name), for web servers that send precompressed files.
+#
+# The Scenario Lookup Table
+# -------------------------
+# Scenarios.bin is an array of 32-bit whole numbers with one entry for every combination of lever
+# values, in the same order as the combinations in CreateCombinationsScript.py: the first lever changes
+# slowest, and the levers are ordered as in that script, with the "PolicySchedule" lever first.  The
+# entry for a combination is the number of the scenario with those settings (counting from zero, in the
+# order of the runs in the results file), or -1 if the batch has no such run.  To find a scenario, the
+# front end adds up the position of each lever's setting in its list of values, times the number of
+# combinations of the levers after it.  A run that has no value for a lever (such as a run with "-" in
+# place of its "PolicySchedule" column, as older versions of the scripts wrote for the run with every
+# policy set to zero) is listed under every value of that lever, unless another run has the same
+# settings with a value for that lever.  If two runs have exactly the same lever settings, the script
+# produces an error, because the front end would be unable to tell them apart.
+
+
+# File Names
+# ----------
+RunResultsFile = "RunResults.tsv" # The results file of the batch to be exported
+GraphDefinitionsFile = "GraphDefinitions.vgd" # The file defining the graphs to be exported
+BundleDirectory = "WebAppBundles" # The folder in which the bundles will be written (files already in it will be overwritten)
+GraphVarsFile = "OutputVarsForWebApp.lst" # The list of graph variables written when the script is run with "--write-vars-list"
+ModelFile = "EPS.mdl" # The model file against which the graph variables are checked when the list is written
+
+# Other Settings
+# --------------
+Graphs = [] # The names of the graphs to export (the names after ":GRAPH" in the GraphDefinitionsFile).  If this is
+			# empty, every graph whose variables are all in the results file is exported.
+IgnoredColumns = ["RunName", "CurrentRunNumber", "RunCacheKey"] # Metadata columns that identify a run but are not levers
+ScenariosPerChunk = 64 # The number of scenarios in each chunk.  Smaller chunks mean the front end fetches less data that it
+					   # does not show, but more files.
+ByteShuffle = True # If True, the bytes of the values in each chunk are rearranged so the chunk compresses better (see above)
+WriteGzipFiles = True # If True, a gzip-compressed copy of each binary file is written alongside it
+MaxScenarioTableSize = 2 ** 24 # The largest number of lever value combinations allowed in the scenario lookup table.  A batch
+							   # that is not a grid of lever settings (for example, a "Morris" or "Sobol" batch, in which
+							   # every run has different settings) would need a table far larger than its number of runs.
+FirstYear = "2019" # Only used if the results file does not begin with a "Time" row
+FinalYear = "2050" # Only used if the results file does not begin with a "Time" row
+
+
+import gzip
+import json
+import os
+import sys
+
+import numpy
+
+from ModelSymbols import LoadModelSymbols, VariableKey
+from ResultsStore import IsNumber
+from RunResultsTools import IterateRuns, ParseMetadata, ParseValues, ReadYears
+
+
+IndexFileName = "Index.json"
+ScenariosFileName = "Scenarios.bin"
+GraphsDirectoryName = "Graphs"
+ScheduleLever = "PolicySchedule"
+FormatVersion = 1
+
+
+# Reading the Graph Definitions
+# -----------------------------
+# Each graph in a Vensim graph definitions file begins with a ":GRAPH" line giving its name, and each
+# of its series is a ":VAR" line giving the variable (with subscripts, if any), optionally followed by
+# "|" and the series label.  Lines setting colors, widths, and scales are not needed here.  This function
+# returns a list of graphs, each a dictionary with the graph's name, title, and series.
+def ReadGraphDefinitions(FileName):
+	Definitions = []
+	with open(FileName, 'r') as DefinitionsFile:
+		for Line in DefinitionsFile:
+			Line = Line.strip()
+			if Line.startswith(":GRAPH "):
+				Definitions.append({"Name": Line[len(":GRAPH "):].strip(), "Title": "", "Series": []})
+			elif Line.startswith(":TITLE ") and len(Definitions) > 0:
+				Definitions[-1]["Title"] = Line[len(":TITLE "):].strip()
+			elif Line.startswith(":VAR ") and len(Definitions) > 0:
+				Variable, Separator, Label = Line[len(":VAR "):].partition("|")
+				Definitions[-1]["Series"].append({"Variable": Variable.strip(), "Label": Label.strip() or Variable.strip()})
+	return Definitions
+
+def FileSafeName(Name):
+	return "".join(Character if Character.isalnum() or Character in "_-.()" else "_" for Character in Name)
+
+
+# Writing Binary Files
+# --------------------
+def WriteBinaryFile(FileName, Data, WriteGzip):
+	with open(FileName, 'wb') as BinaryFile:
+		BinaryFile.write(Data)
+	if WriteGzip:
+		with gzip.GzipFile(FileName + ".gz", 'wb', compresslevel=9, mtime=0) as GzipFile:
+			GzipFile.write(Data)
+
+def ChunkBytes(Values, Shuffle):
+	Data = numpy.ascontiguousarray(Values, dtype="<f4")
+	if Shuffle:
+		return Data.view(numpy.uint8).reshape(-1, 4).T.tobytes()
+	return Data.tobytes()
+
+
+# Exporting the Bundles
+# ---------------------
+# The results file is read once, one run at a time.  The graphs to export are chosen from the variables
+# of the first run, and the values of each graph's series are collected for ScenariosPerChunk runs at a
+# time, so each chunk can be written as soon as it is full, and memory use does not depend on the number
+# of runs.  Each run's lever settings are kept, and the scenario lookup table is built once every run
+# has been read.  Variables are matched by their keys (see VariableKey in ModelSymbols.py), so that
+# "Var[LDVs,VOC]" in the graph definitions matches "Var[LDVs, VOC]" in a results file.
+def ExportBundles(RunResultsFile, Definitions, BundleDirectory, Graphs, IgnoredColumns, ScenariosPerChunk, ByteShuffle, WriteGzipFiles, MaxScenarioTableSize, FirstYear, FinalYear):
+	if ScenariosPerChunk < 1:
+		raise ValueError("ScenariosPerChunk must be at least 1.")
+	UnknownGraphs = sorted(set(Graphs) - set(Definition["Name"] for Definition in Definitions))
+	if len(UnknownGraphs) > 0:
+		raise ValueError("These graphs are not in the graph definitions file: " + ", ".join(UnknownGraphs))
+
+	Years = ReadYears(RunResultsFile, FirstYear, FinalYear)
+	ExportedGraphs = None
+	SkippedGraphs = []
+	ChunkValues = None
+	RunSettings = []
+	for Metadata, Rows in IterateRuns(RunResultsFile, len(Years)):
+
+		# The first run decides which graphs are exported, and the row of each of their series.
+		if ExportedGraphs is None:
+			VariableRows = {VariableKey(Name): RowIndex for RowIndex, (Name, Values) in enumerate(Rows)}
+			ExportedGraphs = []
+			for Definition in Definitions:
+				if len(Graphs) > 0 and Definition["Name"] not in Graphs:
+					continue
+				Missing = [Series["Variable"] for Series in Definition["Series"] if VariableKey(Series["Variable"]) not in VariableRows]
+				if len(Missing) > 0 or len(Definition["Series"]) == 0:
+					if len(Graphs) > 0:
+						raise ValueError("The graph " + Definition["Name"] + " cannot be exported, because these variables are not in the results file: " + ", ".join(Missing))
+					SkippedGraphs.append(Definition["Name"])
+					continue
+				ExportedGraphs.append(dict(Definition, Folder=GraphsDirectoryName + "/" + FileSafeName(Definition["Name"]), Keys=[VariableKey(Series["Variable"]) for Series in Definition["Series"]]))
+			if len(ExportedGraphs) == 0:
+				raise ValueError("None of the graphs can be exported, because the results file does not hold all of the variables of any graph.  Run this script with \"--write-vars-list\" to write a list of the variables the graphs need.")
+			for Graph in ExportedGraphs:
+				os.makedirs(os.path.join(BundleDirectory, Graph["Folder"]), exist_ok=True)
+			ChunkValues = [numpy.full((len(Graph["Keys"]), len(Years), ScenariosPerChunk), numpy.nan, dtype=numpy.float32) for Graph in ExportedGraphs]
+
+		Settings = ParseMetadata(Metadata)
+		for Column in IgnoredColumns:
+			Settings.pop(Column, None)
+		RunSettings.append(Settings)
+
+		ScenarioInChunk = (len(RunSettings) - 1) % ScenariosPerChunk
+		RowValues = {VariableKey(Name): Values for Name, Values in Rows}
+		for Graph, Values in zip(ExportedGraphs, ChunkValues):
+			for SeriesIndex, Key in enumerate(Graph["Keys"]):
+				if Key in RowValues:
+					Values[SeriesIndex, :, ScenarioInChunk] = ParseValues(RowValues[Key])
+				else:
+					Values[SeriesIndex, :, ScenarioInChunk] = numpy.nan
+
+		# When a chunk is full (or every run has been read), each graph's chunk is written.
+		if ScenarioInChunk == ScenariosPerChunk - 1:
+			WriteChunks(BundleDirectory, ExportedGraphs, ChunkValues, len(RunSettings) // ScenariosPerChunk - 1, ScenariosPerChunk, ByteShuffle, WriteGzipFiles)
+	if ExportedGraphs is None:
+		raise ValueError("The results file " + RunResultsFile + " holds no runs.")
+	if len(RunSettings) % ScenariosPerChunk > 0:
+		WriteChunks(BundleDirectory, ExportedGraphs, ChunkValues, len(RunSettings) // ScenariosPerChunk, len(RunSettings) % ScenariosPerChunk, ByteShuffle, WriteGzipFiles)
+
+	Levers, ScenarioTable = BuildScenarioTable(RunSettings, MaxScenarioTableSize)
+	WriteBinaryFile(os.path.join(BundleDirectory, ScenariosFileName), ScenarioTable.astype("<i4").tobytes(), WriteGzipFiles)
+
+	NumChunks = (len(RunSettings) + ScenariosPerChunk - 1) // ScenariosPerChunk
+	Index = {
+		"FormatVersion": FormatVersion,
+		"Years": Years,
+		"NumScenarios": len(RunSettings),
+		"ScenariosPerChunk": ScenariosPerChunk,
+		"ByteShuffle": ByteShuffle,
+		"Levers": Levers,
+		"Graphs": [{"Name": Graph["Name"], "Title": Graph["Title"], "Folder": Graph["Folder"], "NumChunks": NumChunks, "Series": Graph["Series"]} for Graph in ExportedGraphs]
+	}
+	with open(os.path.join(BundleDirectory, IndexFileName), 'w') as IndexFile:
+		json.dump(Index, IndexFile)
+	return Index, SkippedGraphs
+
+def WriteChunks(BundleDirectory, ExportedGraphs, ChunkValues, ChunkNumber, NumScenariosInChunk, ByteShuffle, WriteGzipFiles):
+	for Graph, Values in zip(ExportedGraphs, ChunkValues):
+		FileName = os.path.join(BundleDirectory, Graph["Folder"], str(ChunkNumber) + ".bin")
+		WriteBinaryFile(FileName, ChunkBytes(Values[:, :, :NumScenariosInChunk], ByteShuffle), WriteGzipFiles)
+
+
+# Building the Scenario Lookup Table
+# ----------------------------------
+# The levers are the metadata columns found in any run, in the order in which they first appear, except
+# that the "PolicySchedule" lever always comes first, because CreateCombinationsScript.py changes the
+# policy implementation schedule slowest.  That script writes the "PolicySchedule" column right after
+# the "CurrentRunNumber" column, so it is already the first lever there, but other scripts (such as
+# CreateContributionTestScript.py) write it after the policy columns.  The values of a lever are sorted
+# numerically if they are all numbers, and as text otherwise.  Runs with a value for every lever are
+# entered in the table first, so that they take precedence over runs that are listed under every value
+# of a lever they lack (see above).
+def BuildScenarioTable(RunSettings, MaxScenarioTableSize):
+	LeverNames = []
+	for Settings in RunSettings:
+		for Name in Settings:
+			if Name not in LeverNames:
+				LeverNames.append(Name)
+	if ScheduleLever in LeverNames:
+		LeverNames.remove(ScheduleLever)
+		LeverNames.insert(0, ScheduleLever)
+	LeverValues = []
+	for Name in LeverNames:
+		Values = set(Settings[Name] for Settings in RunSettings if Name in Settings)
+		if all(IsNumber(Value) for Value in Values):
+			LeverValues.append(sorted(Values, key=float))
+		else:
+			LeverValues.append(sorted(Values))
+
+	Radices = [len(Values) for Values in LeverValues]
+	TableSize = int(numpy.prod(Radices, dtype=numpy.int64))
+	if TableSize > MaxScenarioTableSize:
+		raise ValueError("The runs' lever settings have " + str(TableSize) + " combinations, more than MaxScenarioTableSize (" + str(MaxScenarioTableSize) + ").  The runs must form a grid of lever settings (see IgnoredColumns).")
+	Strides = [int(numpy.prod(Radices[LeverIndex + 1:], dtype=numpy.int64)) for LeverIndex in range(len(Radices))]
+	Positions = [{Value: Position for Position, Value in enumerate(Values)} for Values in LeverValues]
+
+	ScenarioTable = numpy.full(TableSize, -1, dtype=numpy.int32)
+	Filled = numpy.zeros(TableSize, dtype=bool)
+	Complete = [Scenario for Scenario, Settings in enumerate(RunSettings) if len(Settings) == len(LeverNames)]
+	Partial = [Scenario for Scenario, Settings in enumerate(RunSettings) if len(Settings) < len(LeverNames)]
+	for Scenario in Complete:
+		Entry = sum(Positions[LeverIndex][RunSettings[Scenario][Name]] * Strides[LeverIndex] for LeverIndex, Name in enumerate(LeverNames))
+		if Filled[Entry]:
+			raise ValueError("Scenarios " + str(ScenarioTable[Entry]) + " and " + str(Scenario) + " have the same lever settings, so they cannot be told apart.  If a metadata column tells them apart, remove it from IgnoredColumns.")
+		ScenarioTable[Entry] = Scenario
+		Filled[Entry] = True
+
+	# A run without a value for a lever fills every entry with its other settings that is still empty.
+	for Scenario in Partial:
+		Entries = numpy.zeros(1, dtype=numpy.int64)
+		for LeverIndex, Name in enumerate(LeverNames):
+			if Name in RunSettings[Scenario]:
+				Entries = Entries + Positions[LeverIndex][RunSettings[Scenario][Name]] * Strides[LeverIndex]
+			else:
+				Entries = (Entries[:, numpy.newaxis] + numpy.arange(Radices[LeverIndex]) * Strides[LeverIndex]).ravel()
+		Free = Entries[~Filled[Entries]]
+		if len(Free) == 0:
+			raise ValueError("Scenario " + str(Scenario) + " has the same lever settings as other scenarios, so it cannot be told apart from them.")
+		ScenarioTable[Free] = Scenario
+		Filled[Free] = True
+
+	Levers = [{"Name": Name, "Values": Values} for Name, Values in zip(LeverNames, LeverValues)]
+	return Levers, ScenarioTable
+
+
+if __name__ == "__main__":
+
+	Definitions = ReadGraphDefinitions(GraphDefinitionsFile)
+
+	# With "--write-vars-list", we only write the list of variables used by the graphs.
+	if "--write-vars-list" in sys.argv[1:]:
+		Variables = {}
+		for Definition in Definitions:
+			if len(Graphs) == 0 or Definition["Name"] in Graphs:
+				for Series in Definition["Series"]:
+					Variables.setdefault(VariableKey(Series["Variable"]), Series["Variable"])
+		if ModelFile.lower().endswith(".mdl") and os.path.isfile(ModelFile):
+			Symbols = LoadModelSymbols(ModelFile)
+			NameErrors = dict((Key, Symbols.CheckName(Name)) for Key, Name in Variables.items())
+			for Key in [Key for Key in Variables if NameErrors[Key] is not None]:
+				print("Left out of the list: " + NameErrors[Key])
+				del Variables[Key]
+		with open(GraphVarsFile, 'w') as f:
+			f.write("\n".join(Variables.values()) + "\n")
+		print("Wrote the " + str(len(Variables)) + " variables used by the graphs to " + GraphVarsFile + ".")
+		sys.exit()
+
+	try:
+		Index, SkippedGraphs = ExportBundles(RunResultsFile, Definitions, BundleDirectory, Graphs, IgnoredColumns, ScenariosPerChunk, ByteShuffle, WriteGzipFiles, MaxScenarioTableSize, FirstYear, FinalYear)
+	except ValueError as Error:
+		sys.exit("Error: " + str(Error))
+
+	print("Exported " + str(len(Index["Graphs"])) + " graphs for " + str(Index["NumScenarios"]) + " scenarios to " + BundleDirectory + ".")
+	for Lever in Index["Levers"]:
+		print("  Lever: " + Lever["Name"] + " (" + str(len(Lever["Values"])) + " values)")
+	if len(SkippedGraphs) > 0:
+		print(str(len(SkippedGraphs)) + " graphs were skipped, because the results file does not hold all of their variables.  Run this script with \"--write-vars-list\" to write a list of the variables the graphs need.")
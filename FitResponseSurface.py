@@ -0,0 +1,72 @@
+# FitResponseSurface.py
+#
+# This is a Python script that fits a response surface (an emulator, which estimates the results of a
+# model run in a tiny fraction of the time the run takes) to the results of a batch of runs, such as the
+# batch performed by a command script generated by CreateCombinationsScript.py, and saves it to a file.
+# See ResponseSurfaces.py for a description of the methods and of how to query the saved response
+# surface from Python.  When the script finishes, it prints an estimate of the accuracy of the response
+# surface for each variable in the final year.  This script requires the NumPy package.
+
+
+# File Names
+# ----------
+RunResultsFile = "RunResults.tsv" # The results file of the batch of runs
+EmulatorFile = "ResponseSurface.npz" # The file in which the response surface will be saved
+
+# Other Settings
+# --------------
+Method = "Auto" # "Grid", "Polynomial", "GaussianProcess", or "Auto", which uses "Grid" if the runs tested every
+				# combination of the settings of each lever, "GaussianProcess" if there are no more than
+				# MaxGaussianProcessRuns runs, and "Polynomial" otherwise (see ResponseSurfaces.py)
+Variables = [] # The variables to be emulated.  If this is empty, every variable in the results file is emulated.
+PolynomialDegree = 2 # In "Polynomial" mode, the highest total power of the levers in any term of the polynomial
+MaxGaussianProcessRuns = 2000 # The most runs for which "Auto" uses "GaussianProcess" (fitting takes time proportional
+							  # to the cube of the number of runs)
+PolicySchedule = None # If the results file holds runs under several policy implementation schedules (see PolicySchedules
+					  # in CreateCombinationsScript.py), the number of the schedule whose runs should be used
+NumCheckPoints = 1000 # For "Grid" response surfaces, the number of random points at which the error estimate is averaged
+FirstYear = "2019" # Only used if the results file does not begin with a "Time" row
+FinalYear = "2050" # Only used if the results file does not begin with a "Time" row
+
+
+import sys
+
+import numpy
+
+from ResponseSurfaces import FitEmulator, ReadTrainingRuns
+
+
+try:
+	Levers, Points, VariableNames, Years, Outputs = ReadTrainingRuns(RunResultsFile, Variables or None, Schedule=PolicySchedule, FirstYear=FirstYear, FinalYear=FinalYear)
+	Emulator = FitEmulator(Levers, Points, VariableNames, Years, Outputs, Method, PolynomialDegree, MaxGaussianProcessRuns)
+except (KeyError, ValueError) as Error:
+	sys.exit("Error: " + str(Error.args[0]))
+Emulator.Save(EmulatorFile)
+print("Fitted a \"" + Emulator.Method + "\" response surface of " + str(len(VariableNames)) + " variables to " + str(len(Points)) + " runs, and saved it to " + EmulatorFile + ".")
+for Lever, Lower, Upper in zip(Levers, Emulator.Lower, Emulator.Upper):
+	print("  Lever: " + Lever + " (" + format(Lower, ".6g") + " to " + format(Upper, ".6g") + ")")
+
+# The accuracy of "Polynomial" and "GaussianProcess" response surfaces is measured by leaving out each
+# run in turn, and estimating its results from the others.  For "Grid" response surfaces, which pass
+# through every run, we report the average error estimate at random points within the grid instead.  The
+# error between the settings of a lever with only two settings cannot be estimated (see ResponseSurfaces.py),
+# so such levers are held at one of their settings at each random point.
+# Both are shown as a percentage of the spread (the standard deviation) of each variable across the runs.
+FinalValues = Outputs[:, :, -1]
+Spreads = FinalValues.std(axis=0)
+if Emulator.Method == "Grid":
+	Generator = numpy.random.default_rng(0)
+	CheckPoints = Generator.uniform(Emulator.Lower, Emulator.Upper, (NumCheckPoints, len(Levers)))
+	for LeverIndex, Axis in enumerate(Emulator.Axes):
+		if len(Axis) == 2:
+			CheckPoints[:, LeverIndex] = Generator.choice(Axis, NumCheckPoints)
+	Accuracy = Emulator.Predict(CheckPoints)[1][:, :, -1].mean(axis=0)
+	Description = "average estimated error at random points"
+else:
+	LeaveOneOutResiduals = Emulator.LeaveOneOutResiduals.reshape(Outputs.shape)[:, :, -1]
+	Accuracy = numpy.sqrt(numpy.mean(LeaveOneOutResiduals ** 2, axis=0))
+	Description = "root mean square leave-one-out error"
+print("")
+print("Accuracy in " + str(Years[-1]) + " (" + Description + ", as a percentage of the spread of results across the runs):")
+for Name, Value, Spread in zip(VariableNames, Accuracy, Spreads):
+	print("  " + Name + ": " + format(Value, ".4g") + ("" if Spread == 0 else " (" + format(100 * Value / Spread, ".3g") + "%)"))
@@ -0,0 +1,29 @@
+# IngestRunResults.py
+#
+# This is a Python script that converts a results file written by Vensim (such as RunResults.tsv,
+# produced by the command script from CreateCombinationsScript.py) into a results store: a folder
+# of binary files that can be opened and queried from Python far faster than the results file can
+# be read.  See ResultsStore.py for a description of the results store and how to query it.
+# This script requires the NumPy package.
+
+
+# File Names
+# ----------
+ResultsFile = "RunResults.tsv" # The results file to be converted
+StoreDirectory = "RunResultsStore" # The folder in which the results store will be created (files already in it will be overwritten)
+
+# Other Settings
+# --------------
+# If the results file does not begin with a "Time" row (which happens if every run was appended to
+# it), enter the first and final years included in the results file here.  Otherwise, these settings
+# are ignored, and the years are taken from the "Time" row.
+FirstYear = "2019"
+FinalYear = "2050"
+
+
+from ResultsStore import IngestResultsFile
+
+Index = IngestResultsFile(ResultsFile, StoreDirectory, FirstYear, FinalYear)
+print("Stored " + str(Index["NumRuns"]) + " runs of " + str(len(Index["Variables"])) + " variables over " + str(len(Index["Years"])) + " years in " + StoreDirectory + ".")
+for Dimension in Index["Dimensions"]:
+	print("  Run dimension: " + Dimension["Name"] + " (" + Dimension["Type"] + ")")
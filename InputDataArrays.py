@@ -0,0 +1,409 @@
+# InputDataArrays.py
+#
+# This is a Python module that reads the input data of the EPS into NumPy arrays, for analysis and
+# validation in Python.  The model reads its input data from the CSV files in the InputData folder,
+# with about 700 GET DIRECT DATA, GET DIRECT CONSTANTS, and GET DIRECT LOOKUPS calls in the model
+# file (EPS.mdl).  This module finds these calls in the model file and reads each variable's files
+# the way Vensim does, into a single array with one axis for each of the variable's subscripts
+# (labeled with the subscript elements defined in the model file) and, for data and lookups, a
+# final "Time" axis (labeled with the years, or other values, in the file).
+#
+# Each folder in InputData (such as InputData/trans/AVLo) holds the files of one variable, or of a
+# few closely related variables.  For example:
+#
+#   Data = OpenInputData("EPS.mdl")
+#   Loading = Data.Variable("AVLo Average Vehicle Loading")
+#   Loading.Dimensions                      # ["Vehicle Type", "Cargo Type", "Time"]
+#   Loading.Select("LDVs", "freight", 2030) # The value for LDVs carrying freight in 2030
+#   Data.Folder("InputData/fuels/BFPIaE")   # {variable name: array} for each variable in the folder
+#
+# Elements of a variable that are not read from input data (because they are given by an equation
+# in the model file instead) are NaN, as are empty cells in data files.
+#
+# The Cache
+# ---------
+# Reading and parsing every CSV file takes several seconds, so each array is saved in a cache folder
+# (InputDataCache, next to the model file) as a .npy file, which is opened as a memory map, so only
+# the parts of an array that are used are read from disk.  The cache index records a SHA-256 hash of
+# the model file and of each file read into each array, with the file's size and modification time.
+# A file whose size and modification time have not changed is not read again, and an array is only
+# rebuilt if one of its files (or the model file) has different contents, so opening all of the
+# input data takes milliseconds when nothing has changed.
+#
+# DefaultValue() gives the value that a constant has when no SETVAL instruction changes it, whether
+# it is read from input data or given as numbers in the model file, for example:
+#   Data.DefaultValue("GRA for Carbon Tax Revenue[household taxes]")   # 5.0
+#
+# This module may also be run on its own, to build the cache and check that every input data file
+# can be read, or to describe the arrays in some folders or variables, for example:
+#   python InputDataArrays.py InputData/trans/AVLo "BFPaT BAU Fuel Tax by Sector"
+
+import csv
+import itertools
+import json
+import math
+import os
+import re
+import sys
+import time
+
+import numpy
+
+from ModelSymbols import HashFiles, LoadModelSymbols, NameKey, NamePattern, ReadModelEquations, SplitName, VariableKey
+
+
+# Finding the Input Data Files
+# ----------------------------
+# Each call names the file, the delimiter, and then either the first cell of the values (for
+# constants) or the row or column holding the times and the first cell of the values (for data and
+# lookups).  A "*" after the cell of a constant means the values are read down a column rather than
+# across a row.  File names are given relative to the folder containing the model file.  An empty
+# delimiter means a comma.
+GetDirectPattern = re.compile(r"^GET\s+DIRECT\s+(DATA|CONSTANTS|LOOKUPS)\s*\((.*)\)$", re.IGNORECASE | re.DOTALL)
+ArgumentPattern = re.compile(r"'([^']*)'")
+CellPattern = re.compile(r"^([A-Za-z]*)(\d*)$")
+
+def ReadGetDirectCalls(ModelFile):
+	Calls = {}
+	for Equation in ReadModelEquations(ModelFile):
+		Match = NamePattern.match(Equation)
+		if not Match:
+			continue
+		Call = GetDirectPattern.match(Equation[Match.end():].strip())
+		if not Call:
+			continue
+		Arguments = ArgumentPattern.findall(Call.group(2))
+		Name = Match.group(1).strip().strip('"')
+		Calls.setdefault(NameKey(Name), {"Name": Name, "Calls": []})["Calls"].append({
+			"Subscripts": [Token.strip() for Token in Match.group(2)[1:-1].split(",")] if Match.group(2) else [],
+			"Function": Call.group(1).upper(),
+			"File": Arguments[0],
+			"Arguments": Arguments[1:]
+		})
+	return Calls
+
+# Constants that are not read from input data are given as numbers in the model file: a single number
+# for every element (such as "Var[Sectors]=0"), a separate entry for some elements (such as
+# "Var[electricity sector]=0"), or a table with one row for each element of the first subscript and
+# one column for each element of the second, separated by commas and semicolons.  This function returns
+# a dictionary from the key of each element of each such constant (see VariableKey() in ModelSymbols.py)
+# to its value.  Entries whose numbers do not match their subscripts, and entries that leave out some
+# elements with ":EXCEPT:", are left out.
+NumberPattern = re.compile(r"^[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$")
+
+def ReadModelConstants(ModelFile, Symbols):
+	Constants = {}
+	for Equation in ReadModelEquations(ModelFile):
+		Match = NamePattern.match(Equation)
+		if not Match or Match.group(3) != "=" or ":EXCEPT:" in Equation[:Match.end()]:
+			continue
+		Cells = [Cell.strip() for Row in Equation[Match.end():].strip().rstrip(";").split(";") for Cell in Row.split(",")]
+		if not all(NumberPattern.match(Cell) for Cell in Cells):
+			continue
+		Name = Match.group(1).strip().strip('"')
+		Axes = []
+		for Token in Match.group(2)[1:-1].split(",") if Match.group(2) else []:
+			Token = Token.strip().rstrip("!")
+			Axes.append(Symbols.Ranges[NameKey(Token)]["Elements"] if NameKey(Token) in Symbols.Ranges else [Token])
+		Combinations = list(itertools.product(*Axes))
+		Values = [float(Cell) for Cell in Cells]
+		if len(Values) == 1:
+			Values = Values * len(Combinations)
+		if len(Values) != len(Combinations):
+			continue
+		for Combination, Value in zip(Combinations, Values):
+			Constants[VariableKey(Name + "[" + ",".join(Combination) + "]" if len(Combination) > 0 else Name)] = Value
+	return Constants
+
+# Cells are given as a column letter and a row number, such as "B2".  Positions count from zero.
+def ColumnNumber(Letters):
+	Number = 0
+	for Letter in Letters.upper():
+		Number = Number * 26 + ord(Letter) - ord("A") + 1
+	return Number - 1
+
+def CellPosition(Cell):
+	Letters, Digits = CellPattern.match(Cell.strip().rstrip("*")).groups()
+	return int(Digits) - 1, ColumnNumber(Letters)
+
+
+# Reading a File
+# --------------
+# Values are laid out in the file with one row for each element of the variable's first subscripts
+# and one column for each element of its last subscript (or, for data and lookups, one row for each
+# combination of elements and one column for each time, or the reverse if the times are in a
+# column).  Subscripts that only take one element in a call (such as "freight" in
+# "AVLo Average Vehicle Loading[Vehicle Type,freight]") are not laid out in the file.
+def ReadGrid(FileName, Delimiter):
+	if Delimiter == "":
+		Delimiter = ","
+	with open(FileName, 'r', encoding='utf-8-sig', errors='replace', newline='') as File:
+		return [[Cell.strip() for Cell in Row] for Row in csv.reader(File, delimiter=Delimiter)]
+
+def ReadBlock(Grid, FirstRow, FirstColumn, NumRows, NumColumns):
+	if len(Grid) < FirstRow + NumRows or any(len(Row) < FirstColumn + NumColumns for Row in Grid[FirstRow:FirstRow + NumRows]):
+		raise ValueError("The file has fewer rows or columns than the subscripts of the variable require.")
+	Block = numpy.full((NumRows, NumColumns), numpy.nan)
+	for RowNumber in range(NumRows):
+		for ColumnNumber, Cell in enumerate(Grid[FirstRow + RowNumber][FirstColumn:FirstColumn + NumColumns]):
+			if Cell != "":
+				Block[RowNumber, ColumnNumber] = float(Cell)
+	return Block
+
+def ReadTimes(Cells):
+	Times = []
+	for Cell in Cells:
+		if Cell == "":
+			break
+		Times.append(float(Cell))
+	return Times
+
+# This returns the values read by one call, with one axis for each of the variable's subscripts
+# (including those that only take one element) and, for data and lookups, the times as well.
+def ReadCall(Call, Grid, Sizes):
+	LaidOut = [Size for Size in Sizes if Size > 1]
+	if Call["Function"] == "CONSTANTS":
+		Row, Column = CellPosition(Call["Arguments"][1])
+		Transposed = Call["Arguments"][1].strip().endswith("*")
+		if len(LaidOut) == 0:
+			Block = ReadBlock(Grid, Row, Column, 1, 1)
+		elif len(LaidOut) == 1:
+			Block = ReadBlock(Grid, Row, Column, LaidOut[0], 1) if Transposed else ReadBlock(Grid, Row, Column, 1, LaidOut[0])
+		elif Transposed and len(LaidOut) == 2:
+			Block = ReadBlock(Grid, Row, Column, LaidOut[1], LaidOut[0]).T
+		elif Transposed:
+			raise ValueError("Transposed constants with more than two subscripts are not supported.")
+		else:
+			Block = ReadBlock(Grid, Row, Column, int(numpy.prod(LaidOut[:-1])), LaidOut[-1])
+		return Block.reshape(Sizes), None
+
+	TimeArgument, FirstCell = Call["Arguments"][1].strip(), Call["Arguments"][2]
+	Row, Column = CellPosition(FirstCell)
+	NumSeries = int(numpy.prod(LaidOut))
+	if TimeArgument.isdigit():
+		TimeRow = int(TimeArgument) - 1
+		Times = ReadTimes(Grid[TimeRow][Column:] if TimeRow < len(Grid) else [])
+		Block = ReadBlock(Grid, Row, Column, NumSeries, len(Times))
+	else:
+		TimeColumn = ColumnNumber(TimeArgument)
+		Times = ReadTimes(GridRow[TimeColumn] if TimeColumn < len(GridRow) else "" for GridRow in Grid[Row:])
+		Block = ReadBlock(Grid, Row, Column, len(Times), NumSeries).T
+	if len(Times) == 0:
+		raise ValueError("No times were found in the file.")
+	return Block.reshape(Sizes + [len(Times)]), Times
+
+
+# Building an Array
+# -----------------
+# The axes of a variable are found with the model symbols index (see ModelSymbols.py): each axis has
+# every element used in that position by any of the variable's entries, in the order in which the
+# elements are defined.  Each axis is named after the subscript range with exactly these elements.
+def DimensionName(Symbols, Tokens, Elements, Position):
+	ElementKeys = set(Elements)
+	Candidates = [NameKey(Token) for Token in Tokens] + list(Symbols.Ranges)
+	for RangeKey in Candidates:
+		if RangeKey in Symbols.Ranges and set(NameKey(Element) for Element in Symbols.Ranges[RangeKey]["Elements"]) == ElementKeys:
+			return Symbols.Ranges[RangeKey]["Name"]
+	return "Subscript " + str(Position + 1)
+
+def BuildArray(Symbols, ModelDirectory, Name, Calls):
+	Key = NameKey(Name)
+	Positions = Symbols.AllowedElements(Key) if Key in Symbols.Variables else []
+	Dimensions = [DimensionName(Symbols, Tokens, Allowed, Position) for Position, (Tokens, Allowed) in enumerate(zip(Symbols.Variables[Key]["Subscripts"] or [], Positions))]
+	Labels = [list(Allowed.values()) for Allowed in Positions]
+
+	Parts = []
+	for Call in Calls:
+		if len(Call["Subscripts"]) != len(Positions):
+			raise ValueError("The subscripts of " + Name + " in the model file do not match its call to GET DIRECT " + Call["Function"] + ".")
+		Indexes = []
+		for Token, Allowed in zip(Call["Subscripts"], Positions):
+			Elements = Symbols.Ranges[NameKey(Token)]["Elements"] if NameKey(Token) in Symbols.Ranges else [Token]
+			Order = list(Allowed)
+			Indexes.append([Order.index(NameKey(Element)) for Element in Elements])
+		FileName = os.path.join(ModelDirectory, Call["File"])
+		try:
+			Values, Times = ReadCall(Call, ReadGrid(FileName, Call["Arguments"][0]), [len(Index) for Index in Indexes])
+		except (OSError, ValueError, IndexError) as Error:
+			raise ValueError(Call["File"] + ": " + str(Error))
+		Parts.append((Indexes, Values, Times))
+
+	if Calls[0]["Function"] != "CONSTANTS":
+		AllTimes = sorted(set(itertools.chain.from_iterable(Times for Indexes, Values, Times in Parts)))
+		Dimensions.append("Time")
+		Labels.append(AllTimes)
+	Array = numpy.full([len(Axis) for Axis in Labels], numpy.nan)
+	for Indexes, Values, Times in Parts:
+		if Times is not None:
+			Indexes = Indexes + [[AllTimes.index(Time) for Time in Times]]
+		Array[numpy.ix_(*Indexes)] = Values
+	return Dimensions, Labels, Array
+
+
+# Labeled Arrays
+# --------------
+# Values is a read-only NumPy array (a memory map of the cache file), with one axis for each entry
+# in Dimensions, labeled with the entries in Labels.  Select() finds values by their labels: each
+# argument is a subscript element (or time), or None for every element of that axis.
+class InputArray:
+
+	def __init__(self, Name, Folder, Dimensions, Labels, Values):
+		self.Name = Name
+		self.Folder = Folder
+		self.Dimensions = Dimensions
+		self.Labels = Labels
+		self.Values = Values
+
+	def Index(self, Axis, Label):
+		if self.Dimensions[Axis] == "Time":
+			return self.Labels[Axis].index(float(Label))
+		return [NameKey(Element) for Element in self.Labels[Axis]].index(NameKey(Label))
+
+	def Select(self, *Labels):
+		return self.Values[tuple(slice(None) if Label is None else self.Index(Axis, Label) for Axis, Label in enumerate(Labels))]
+
+
+# The Input Data Cache
+# --------------------
+IndexFileName = "Index.json"
+IndexFormat = 2
+
+class InputData:
+
+	def __init__(self, ModelFile, CacheFolder):
+		self.ModelFile = ModelFile
+		self.CacheFolder = CacheFolder
+		self.Symbols = None
+		self.Changed = False
+		try:
+			with open(os.path.join(CacheFolder, IndexFileName), 'r') as File:
+				self.Index = json.load(File)
+			if self.Index.get("Format") != IndexFormat:
+				raise ValueError("The input data cache index has an unknown format.")
+		except (OSError, ValueError):
+			self.Index = {"Format": IndexFormat, "ModelHash": None, "Variables": {}, "Constants": {}, "FileHashes": {}, "Arrays": {}}
+
+		# The calls to GET DIRECT functions and the constants in the model file are only found again if
+		# the model file has changed.
+		self.ModelHash = self.FileHash(ModelFile)
+		if self.ModelHash != self.Index["ModelHash"]:
+			self.Index["Variables"] = ReadGetDirectCalls(ModelFile)
+			self.Index["Constants"] = ReadModelConstants(ModelFile, LoadModelSymbols(ModelFile))
+			self.Index["ModelHash"] = self.ModelHash
+			self.Changed = True
+
+	# A file is only read again if its size or modification time has changed since it was last hashed.
+	def FileHash(self, FileName):
+		Status = os.stat(FileName)
+		Known = self.Index["FileHashes"].get(FileName)
+		if Known is not None and Known[0] == Status.st_size and Known[1] == Status.st_mtime_ns:
+			return Known[2]
+		Hash = HashFiles([FileName])
+		self.Index["FileHashes"][FileName] = [Status.st_size, Status.st_mtime_ns, Hash]
+		self.Changed = True
+		return Hash
+
+	def VariableNames(self):
+		return sorted(Variable["Name"] for Variable in self.Index["Variables"].values())
+
+	def FolderNames(self):
+		return sorted(set(os.path.dirname(Call["File"]) for Variable in self.Index["Variables"].values() for Call in Variable["Calls"]))
+
+	def LoadArray(self, Key):
+		Variable = self.Index["Variables"][Key]
+		ModelDirectory = os.path.dirname(self.ModelFile)
+		FileHashes = [self.FileHash(os.path.join(ModelDirectory, Call["File"])) for Call in Variable["Calls"]]
+		Entry = self.Index["Arrays"].get(Key)
+		ArrayFile = os.path.join(self.CacheFolder, "Arrays", Key.replace(" ", "_").replace("/", "_") + ".npy")
+		if Entry is None or Entry["ModelHash"] != self.ModelHash or Entry["FileHashes"] != FileHashes or not os.path.isfile(ArrayFile):
+			if self.Symbols is None:
+				self.Symbols = LoadModelSymbols(self.ModelFile)
+			Dimensions, Labels, Array = BuildArray(self.Symbols, ModelDirectory, Variable["Name"], Variable["Calls"])
+			os.makedirs(os.path.dirname(ArrayFile), exist_ok=True)
+			with open(ArrayFile + ".tmp", 'wb') as File:
+				numpy.save(File, Array)
+			os.replace(ArrayFile + ".tmp", ArrayFile)
+			Entry = self.Index["Arrays"][Key] = {"ModelHash": self.ModelHash, "FileHashes": FileHashes, "Dimensions": Dimensions, "Labels": Labels}
+			self.Changed = True
+		return InputArray(Variable["Name"], os.path.dirname(Variable["Calls"][0]["File"]), Entry["Dimensions"], Entry["Labels"], numpy.load(ArrayFile, mmap_mode='r'))
+
+	def Variable(self, Name):
+		Array = self.LoadArray(NameKey(Name))
+		self.Save()
+		return Array
+
+	# The name must give one element for each subscript of the constant.  Elements of a variable read
+	# from input data that are not in its files are looked up among the constants in the model file.
+	# None is returned if the name is not a constant with a known value (such as a variable given by an
+	# equation, or data read with GET DIRECT DATA).
+	def DefaultValue(self, Name):
+		VariableName, Subscripts = SplitName(Name)
+		Variable = self.Index["Variables"].get(NameKey(VariableName))
+		if Variable is not None and all(Call["Function"] == "CONSTANTS" for Call in Variable["Calls"]):
+			try:
+				Value = float(self.Variable(VariableName).Select(*(Subscripts or [])))
+				if not math.isnan(Value):
+					return Value
+			except (ValueError, TypeError, IndexError):
+				return None
+		return self.Index["Constants"].get(VariableKey(Name))
+
+	# Folders are named as in the model file, such as "InputData/trans/AVLo".
+	def Folder(self, Folder):
+		Folder = Folder.replace("\\", "/").rstrip("/")
+		Arrays = {}
+		for Key, Variable in sorted(self.Index["Variables"].items()):
+			if any(os.path.dirname(Call["File"]) == Folder for Call in Variable["Calls"]):
+				Arrays[Variable["Name"]] = self.LoadArray(Key)
+		self.Save()
+		return Arrays
+
+	# The index is written to a temporary file first, so a crash never leaves a damaged index.
+	def Save(self):
+		if not self.Changed:
+			return
+		os.makedirs(self.CacheFolder, exist_ok=True)
+		IndexFile = os.path.join(self.CacheFolder, IndexFileName)
+		with open(IndexFile + ".tmp", 'w') as File:
+			json.dump(self.Index, File, separators=(",", ":"))
+		os.replace(IndexFile + ".tmp", IndexFile)
+		self.Changed = False
+
+def OpenInputData(ModelFile="EPS.mdl", CacheFolder=None):
+	if CacheFolder is None:
+		CacheFolder = os.path.join(os.path.dirname(ModelFile), "InputDataCache")
+	return InputData(ModelFile, CacheFolder)
+
+
+if __name__ == "__main__":
+
+	Start = time.time()
+	Data = OpenInputData("EPS.mdl")
+	Errors = []
+	if len(sys.argv) > 1:
+		for Argument in sys.argv[1:]:
+			try:
+				Arrays = Data.Folder(Argument) if NameKey(Argument) not in Data.Index["Variables"] else {Argument: Data.Variable(Argument)}
+			except ValueError as Error:
+				Errors.append(str(Error))
+				continue
+			if len(Arrays) == 0:
+				Errors.append(Argument + ": This is neither a folder nor a variable read from input data.")
+			for Name, Array in Arrays.items():
+				print(Array.Name + " (" + Array.Folder + ")")
+				for Dimension, Labels in zip(Array.Dimensions, Array.Labels):
+					print("  " + Dimension + ": " + ", ".join(format(Label, "g") if isinstance(Label, float) else Label for Label in Labels))
+				print("  " + str(int(numpy.isnan(Array.Values).sum())) + " of " + str(Array.Values.size) + " values are not read from input data")
+	else:
+		NumArrays = 0
+		for Key in sorted(Data.Index["Variables"]):
+			try:
+				Data.LoadArray(Key)
+				NumArrays += 1
+			except ValueError as Error:
+				Errors.append(str(Error))
+		Data.Save()
+		print("Opened " + str(NumArrays) + " arrays from " + str(len(Data.FolderNames())) + " input data folders in " + format(time.time() - Start, ".3f") + " seconds.")
+	for Error in Errors:
+		print(Error, file=sys.stderr)
+	sys.exit(1 if len(Errors) > 0 else 0)
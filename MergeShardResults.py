@@ -0,0 +1,78 @@
+# MergeShardResults.py
+#
+# This is a Python script that is used after running a batch of runs that was split into
+# several Vensim command scripts ("shards") by CreateCombinationsScript.py or
+# CreateContributionTestScript.py.  Each shard writes its own results file, with the shard
+# number added to the name of the results file (for example, "RunResults_Shard3.tsv").  This
+# script stitches the shard results files back together into a single results file, in shard
+# order, with a single "Time" row at the top.  Each run keeps the run number it was given by the
+# script that generated the shards, which counts across the whole batch, so the same run has the
+# same number whether or not the batch was sharded (and however many shards it was split into).
+#
+# CreateDataLoggingScript.py writes a separate results file for each run, even when it is
+# sharded, so its results do not need to be merged.
+
+
+# File Names
+# ----------
+# RunResultsFile should be the same as the RunResultsFile setting in the script that generated
+# the shards.  The shard results files are found by adding "_Shard" and a number to this name,
+# and the merged results are written to this name.
+RunResultsFile = "RunResults.tsv"
+
+
+import glob
+import os
+import re
+import sys
+
+
+# Finding the Shard Results Files
+# -------------------------------
+# We look for every file whose name matches the shard naming pattern, and we sort the files by
+# shard number (so that "_Shard10" comes after "_Shard9", rather than after "_Shard1").
+def FindShardResultsFiles(RunResultsFile):
+	Base, Extension = os.path.splitext(RunResultsFile)
+	ShardPattern = re.compile(re.escape(Base) + r"_Shard(\d+)" + re.escape(Extension) + "$")
+	ShardFiles = []
+	for FileName in glob.glob(glob.escape(Base) + "_Shard*" + glob.escape(Extension)):
+		Match = ShardPattern.search(FileName)
+		if Match:
+			ShardFiles.append((int(Match.group(1)), FileName))
+	ShardFiles.sort()
+
+	# Every shard from 1 to the highest shard number found must be present, or the merged
+	# results would silently be missing runs.
+	ShardNumbers = [ShardNumber for ShardNumber, FileName in ShardFiles]
+	if ShardNumbers != list(range(1, len(ShardNumbers) + 1)):
+		Missing = sorted(set(range(1, max(ShardNumbers, default=0) + 1)) - set(ShardNumbers))
+		raise FileNotFoundError("Results files are missing for shards: " + ", ".join(str(ShardNumber) for ShardNumber in Missing))
+	return [FileName for ShardNumber, FileName in ShardFiles]
+
+
+# Merging the Shard Results Files
+# -------------------------------
+# The files are read one line at a time, so merging uses very little memory, no matter how
+# large the shard results files are.  Only the first "Time" row is kept, and every other line is
+# copied unchanged.
+def MergeShardResults(ShardFiles, MergedFile):
+	TimeRowDone = False
+	with open(MergedFile, 'w', newline='') as Merged:
+		for ShardFile in ShardFiles:
+			with open(ShardFile, 'r', newline='') as Shard:
+				for Line in Shard:
+					if Line.startswith("Time\t") or Line.rstrip("\r\n") == "Time":
+						if TimeRowDone:
+							continue
+						TimeRowDone = True
+					Merged.write(Line)
+
+
+if __name__ == "__main__":
+	try:
+		ShardFiles = FindShardResultsFiles(RunResultsFile)
+	except FileNotFoundError as Error:
+		sys.exit("Error: " + str(Error))
+	if len(ShardFiles) < 1:
+		sys.exit("Error: No shard results files were found for " + RunResultsFile + ".")
+	MergeShardResults(ShardFiles, RunResultsFile)
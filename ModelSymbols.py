@@ -0,0 +1,383 @@
+# ModelSymbols.py
+#
+# This is a Python module that reads the Vensim model file (EPS.mdl) and builds an index of every
+# variable name, subscript range, and subscript element defined in it.  The scripts that generate
+# Vensim command scripts use the index to check the names of the variables they will set (with
+# SETVAL instructions or .cin files) and export (with .lst files) before writing anything.  Vensim
+# does not report a misspelled name until it reaches the instruction that uses it, which may be
+# hours into a batch of runs, and some mistakes (such as a misspelled variable in a .lst file) are
+# silently ignored.
+#
+# Reading the model file takes about a second, so the index is saved to a cache file next to the
+# model file (EPS.mdl.symbols.json), along with a hash of the model file's contents.  As long as
+# the model file has not changed, later checks load the cache instead, which takes milliseconds.
+#
+# This module may also be run on its own to check .lst or .cin files, for example:
+#   python ModelSymbols.py OutputVarsToExport.lst Scenario_NDC.cin
+# Add "--expand" to print the entries of the .lst files with wildcards expanded (see ExpandName()).
+
+import difflib
+import hashlib
+import itertools
+import json
+import os
+import re
+import sys
+
+
+# Normalizing Names
+# -----------------
+# Vensim does not distinguish between upper and lower case, spaces and underscores, or runs of
+# several spaces in names, so every name is looked up by a "key" in which these differences are
+# removed.  The index keeps the spelling used in the model file for messages.
+def NameKey(Name):
+	Name = Name.strip()
+	if len(Name) >= 2 and Name[0] == '"' and Name[-1] == '"':
+		Name = Name[1:-1]
+	return " ".join(Name.replace("_", " ").split()).lower()
+
+# A name may be followed by subscripts in square brackets, such as "Var[LDVs,VOC]".  This function
+# splits it into the variable name and a list of subscripts (None if there are no brackets).
+def SplitName(Name):
+	Name = Name.strip()
+	BracketPosition = Name.find("[")
+	if BracketPosition < 0:
+		return Name, None
+	Subscripts = Name[BracketPosition + 1:].rstrip()
+	if Subscripts.endswith("]"):
+		Subscripts = Subscripts[:-1]
+	return Name[:BracketPosition].strip(), [Subscript.strip() for Subscript in Subscripts.split(",")]
+
+# This returns the key of a name with its subscripts (if any), which does not depend on the spacing of
+# the subscripts either, so "Var[LDVs,VOC]" and "var[LDVs, VOC]" have the same key.
+def VariableKey(Name):
+	Name, Subscripts = SplitName(Name)
+	if Subscripts is None:
+		return NameKey(Name)
+	return NameKey(Name) + "[" + ",".join(NameKey(Subscript) for Subscript in Subscripts) + "]"
+
+
+# Reading the Model File
+# ----------------------
+# Each entry in a .mdl file ends with "|", and only the text before its first "~" (the equation)
+# is needed here; the rest is the units and comment.  Long lines are continued with a backslash at
+# the end of the line.  Everything after the "Sketch information" marker describes the diagrams.
+#
+# An entry is one of the following:
+#   a subscript range, such as "Pollutant: CO2, VOC, CO" (which may be followed by a mapping to
+#     another range, starting with "->", and may use a numbered sequence, such as "(Year2019-Year2050)",
+#     or the names of other ranges, as elements)
+#   an equivalent range, such as "Recipient Cash Flow Entity <-> Cash Flow Entity"
+#   a variable, such as "Var[Vehicle Type,Pollutant]=..." (or ":=" for data, or "(" for lookups).
+#     Data may be given a keyword that says how to fill in missing years, as in "Var:INTERPOLATE::=".
+#     A subscripted variable may have several entries that cover different elements, so we keep,
+#     for each subscript position, every range or element that appears in any of its entries.  An
+#     entry may leave out some elements of its ranges, as in "Var[Range] :EXCEPT: [element]=...",
+#     and these are covered by other entries, so such an entry still counts as using the whole range.
+#   a subscript range read from a file, such as "Policy Element: GET DIRECT SUBSCRIPT('file.csv', ...)"
+# Text in curly braces is a comment, even within an equation.
+SequencePattern = re.compile(r"^\((.*?)(\d+)\s*-\s*(.*?)(\d+)\)$")
+NamePattern = re.compile(r'^\s*("[^"]*"|[^\[\]=:(~<"]+?)\s*(\[[^\]]*\])?\s*(?::EXCEPT:\s*\[[^\]]*\](?:\s*,\s*\[[^\]]*\])*\s*)?(<->|:[A-Z ]+:\s*:=|:(?!=)|:=|==|=|\()')
+GetDirectSubscriptPattern = re.compile(r"^GET\s+DIRECT\s+SUBSCRIPT\s*\(\s*'([^']*)'\s*,\s*'([^']*)'\s*,\s*'([^']*)'\s*,\s*'([^']*)'", re.IGNORECASE)
+
+# Subscript ranges read with GET DIRECT SUBSCRIPT list their elements in a column (if the last cell
+# is only a column letter) or a row (if it is only a row number) of a text file, starting at the
+# first cell and continuing to the last non-empty cell.
+def ReadDirectSubscript(FileName, Delimiter, FirstCell, LastCell):
+	CellPattern = re.compile(r"^([A-Za-z]*)(\d*)$")
+	def ColumnNumber(Letters):
+		Number = 0
+		for Letter in Letters.upper():
+			Number = Number * 26 + ord(Letter) - ord("A") + 1
+		return Number - 1
+	FirstColumn, FirstRow = CellPattern.match(FirstCell).groups()
+	LastColumn, LastRow = CellPattern.match(LastCell).groups()
+	with open(FileName, 'r', encoding='utf-8-sig', errors='replace') as File:
+		Rows = [Line.rstrip("\r\n").split(Delimiter) for Line in File]
+	Row, Column = int(FirstRow) - 1, ColumnNumber(FirstColumn)
+	if LastRow == "":
+		Cells = [Fields[Column] if Column < len(Fields) else "" for Fields in Rows[Row:]]
+	else:
+		Cells = Rows[Row][Column:] if Row < len(Rows) else []
+	Elements = []
+	for Cell in Cells:
+		if Cell.strip() == "":
+			break
+		Elements.append(Cell.strip())
+	return Elements
+
+def ReadModelEquations(ModelFile):
+	with open(ModelFile, 'r', encoding='utf-8', errors='replace') as File:
+		Text = File.read()
+	Text = Text.split("\\\\\\---///", 1)[0]
+	if Text.startswith("{UTF-8}"):
+		Text = Text[len("{UTF-8}"):]
+	Text = re.sub(r"\\\r?\n[ \t]*", "", Text)
+	Text = re.sub(r"\{[^}]*\}", "", Text)
+	Equations = []
+	for Entry in Text.split("|"):
+		Equation = Entry.split("~", 1)[0].strip()
+		if Equation != "" and not Equation.startswith("*"):
+			Equations.append(Equation)
+	return Equations
+
+def ParseModelFile(ModelFile):
+	SourceFiles = [ModelFile]
+	RangeTokens = {}
+	Equivalents = {}
+	Variables = {}
+	for Equation in ReadModelEquations(ModelFile):
+		Match = NamePattern.match(Equation)
+		if not Match:
+			continue
+		Name, Brackets, Operator = Match.group(1).strip(), Match.group(2), Match.group(3)
+
+		if Operator == "<->" and Brackets is None:
+			Equivalents[NameKey(Name)] = (Name.strip('"'), NameKey(Equation[Match.end():]))
+		elif Operator == ":" and Brackets is None:
+			Definition = Equation[Match.end():].split("->", 1)[0].strip()
+			DirectSubscript = GetDirectSubscriptPattern.match(Definition)
+			if DirectSubscript:
+				SubscriptFile = os.path.join(os.path.dirname(ModelFile), DirectSubscript.group(1))
+				SourceFiles.append(SubscriptFile)
+				Tokens = ReadDirectSubscript(SubscriptFile, DirectSubscript.group(2), DirectSubscript.group(3), DirectSubscript.group(4))
+			else:
+				Tokens = [Token.strip() for Token in Definition.split(",") if Token.strip() != ""]
+			RangeTokens[NameKey(Name)] = (Name.strip('"'), Tokens)
+		elif Operator != ":":
+			Key = NameKey(Name)
+			if Key not in Variables:
+				Variables[Key] = {"Name": Name.strip('"'), "Subscripts": None}
+			if Brackets is not None:
+				Tokens = [Token.strip().rstrip("!") for Token in Brackets[1:-1].split(",")]
+				Positions = Variables[Key]["Subscripts"]
+				if Positions is None:
+					Positions = Variables[Key]["Subscripts"] = [[] for Token in Tokens]
+				if len(Positions) == len(Tokens):
+					for Position, Token in zip(Positions, Tokens):
+						if Token not in Position:
+							Position.append(Token)
+
+	# Ranges may list numbered sequences and other ranges, so we expand each range into a list of
+	# elements once every range has been read.
+	Ranges = {}
+	def ExpandRange(Key, Visiting):
+		if Key in Ranges:
+			return Ranges[Key]["Elements"]
+		RangeName, Tokens = RangeTokens[Key]
+		Elements = []
+		for Token in Tokens:
+			Sequence = SequencePattern.match(Token)
+			if Sequence:
+				for Number in range(int(Sequence.group(2)), int(Sequence.group(4)) + 1):
+					Elements.append(Sequence.group(1) + str(Number))
+			elif NameKey(Token) in RangeTokens and NameKey(Token) not in Visiting:
+				Elements.extend(ExpandRange(NameKey(Token), Visiting | {Key}))
+			else:
+				Elements.append(Token)
+		Ranges[Key] = {"Name": RangeName, "Elements": Elements}
+		return Elements
+	for Key in RangeTokens:
+		ExpandRange(Key, frozenset())
+	for Key, (RangeName, OtherKey) in Equivalents.items():
+		if OtherKey in Ranges:
+			Ranges[Key] = {"Name": RangeName, "Elements": Ranges[OtherKey]["Elements"]}
+
+	Elements = {}
+	for Range in Ranges.values():
+		for Element in Range["Elements"]:
+			Elements.setdefault(NameKey(Element), Element)
+
+	return {"Ranges": Ranges, "Elements": Elements, "Variables": Variables, "SourceFiles": SourceFiles}
+
+
+# The Cache
+# ---------
+# The cache file records the format of the index, the files that were read to build it (the model
+# file and any files read with GET DIRECT SUBSCRIPT), and a SHA-256 hash of their contents.  The
+# index is rebuilt whenever any of these do not match.
+IndexFormat = 3
+
+def HashFiles(FileNames):
+	Hash = hashlib.sha256()
+	for FileName in FileNames:
+		with open(FileName, 'rb') as File:
+			for Block in iter(lambda: File.read(1 << 20), b""):
+				Hash.update(Block)
+	return Hash.hexdigest()
+
+def LoadModelSymbols(ModelFile, CacheFile=None):
+	if CacheFile is None:
+		CacheFile = ModelFile + ".symbols.json"
+	try:
+		with open(CacheFile, 'r') as File:
+			Index = json.load(File)
+		if Index.get("Format") == IndexFormat and Index["SourceFiles"][0] == ModelFile and Index.get("SourcesHash") == HashFiles(Index["SourceFiles"]):
+			return ModelSymbols(Index)
+	except (OSError, ValueError, KeyError, IndexError):
+		pass
+
+	Index = ParseModelFile(ModelFile)
+	Index["Format"] = IndexFormat
+	Index["SourcesHash"] = HashFiles(Index["SourceFiles"])
+	try:
+		with open(CacheFile, 'w') as File:
+			json.dump(Index, File, separators=(",", ":"))
+	except OSError:
+		pass
+	return ModelSymbols(Index)
+
+
+# Looking Up Names
+# ----------------
+class ModelSymbols:
+
+	def __init__(self, Index):
+		self.Ranges = Index["Ranges"]
+		self.Elements = Index["Elements"]
+		self.Variables = Index["Variables"]
+		self.PositionElements = {}
+
+	# The elements allowed in each subscript position of a variable are found by expanding the
+	# ranges used in its entries.  We only do this for variables that are actually checked, and
+	# we remember the result.
+	def AllowedElements(self, VariableKey):
+		if VariableKey not in self.PositionElements:
+			Positions = []
+			for Tokens in self.Variables[VariableKey]["Subscripts"] or []:
+				Allowed = {}
+				for Token in Tokens:
+					for Element in self.Ranges[NameKey(Token)]["Elements"] if NameKey(Token) in self.Ranges else [Token]:
+						Allowed.setdefault(NameKey(Element), Element)
+				Positions.append(Allowed)
+			self.PositionElements[VariableKey] = Positions
+		return self.PositionElements[VariableKey]
+
+	# When a name is not found, we suggest the closest match, if there is one.  Candidates is a
+	# dictionary from each key to the name as spelled in the model file.
+	def Suggestion(self, Key, Candidates):
+		Matches = difflib.get_close_matches(Key, list(Candidates), n=1)
+		return "  Did you mean \"" + Candidates[Matches[0]] + "\"?" if len(Matches) > 0 else ""
+
+	# This function returns an error message describing the problem with a name, or None if the
+	# name is valid.  A subscript may be an element, a range whose elements are all allowed, or "*"
+	# (any element).  If RequireAllSubscripts is True (as for SETVAL instructions), a subscripted
+	# variable must be given one element for each subscript.
+	def CheckName(self, Name, RequireAllSubscripts=False):
+		VariableName, Subscripts = SplitName(Name)
+		Key = NameKey(VariableName)
+		if Key not in self.Variables:
+			return "\"" + VariableName + "\" is not a variable in the model." + self.Suggestion(Key, dict((VariableKey, Variable["Name"]) for VariableKey, Variable in self.Variables.items()))
+		Positions = self.AllowedElements(Key)
+		if Subscripts is None:
+			if RequireAllSubscripts and len(Positions) > 0:
+				return "\"" + Name + "\" needs " + str(len(Positions)) + " subscripts."
+			return None
+		if len(Subscripts) != len(Positions):
+			return "\"" + Name + "\" has " + str(len(Subscripts)) + " subscripts, but \"" + self.Variables[Key]["Name"] + "\" has " + str(len(Positions)) + "."
+		for Subscript, Allowed in zip(Subscripts, Positions):
+			SubscriptKey = NameKey(Subscript)
+			if Subscript == "*" and not RequireAllSubscripts:
+				continue
+			if SubscriptKey in Allowed:
+				continue
+			if SubscriptKey in self.Ranges and not RequireAllSubscripts:
+				if all(NameKey(Element) in Allowed for Element in self.Ranges[SubscriptKey]["Elements"]):
+					continue
+			return "\"" + Subscript + "\" is not a valid subscript of \"" + self.Variables[Key]["Name"] + "\" in \"" + Name + "\"." + self.Suggestion(SubscriptKey, Allowed)
+		return None
+
+	# This function expands a name whose subscripts include "*" or range names into a list of names
+	# with one element in each position, in the order in which the elements are defined in the model.
+	# For example, "Output Total CO2e Emissions by Sector[*]" becomes one name for each sector.
+	def ExpandName(self, Name):
+		VariableName, Subscripts = SplitName(Name)
+		Key = NameKey(VariableName)
+		if Subscripts is None or Key not in self.Variables:
+			return [Name]
+		Positions = self.AllowedElements(Key)
+		if len(Subscripts) != len(Positions):
+			return [Name]
+		Choices = []
+		for Subscript, Allowed in zip(Subscripts, Positions):
+			if Subscript == "*":
+				Choices.append(list(Allowed.values()))
+			elif NameKey(Subscript) in self.Ranges and NameKey(Subscript) not in Allowed:
+				Choices.append(self.Ranges[NameKey(Subscript)]["Elements"])
+			else:
+				Choices.append([Subscript])
+		return [VariableName + "[" + ",".join(Combination) + "]" for Combination in itertools.product(*Choices)]
+
+
+# Checking Files
+# --------------
+# Each line of a .lst file is a variable name, optionally with subscripts.  Each line of a .cin
+# file sets a variable, in the form "Name = value".  These functions return a list of error
+# messages, each beginning with the file name and line number.
+def ReadOutputVarsFile(FileName):
+	with open(FileName, 'r') as File:
+		return [(LineNumber, Line.strip()) for LineNumber, Line in enumerate(File, 1) if Line.strip() != ""]
+
+def CheckOutputVarsFile(Symbols, FileName):
+	Errors = []
+	for LineNumber, Entry in ReadOutputVarsFile(FileName):
+		Error = Symbols.CheckName(Entry)
+		if Error is not None:
+			Errors.append(FileName + ", line " + str(LineNumber) + ": " + Error)
+	return Errors
+
+def CheckSettingsFile(Symbols, FileName):
+	Errors = []
+	with open(FileName, 'r') as File:
+		for LineNumber, Line in enumerate(File, 1):
+			Line = Line.strip()
+			if Line == "" or Line.startswith(":"):
+				continue
+			Error = Symbols.CheckName(Line.split("=", 1)[0], RequireAllSubscripts=True)
+			if Error is not None:
+				Errors.append(FileName + ", line " + str(LineNumber) + ": " + Error)
+	return Errors
+
+# This is the check used by the scripts that generate Vensim command scripts.  It returns a list of
+# error messages for the names given in SETVAL instructions, the entries in .lst files, and the
+# settings in .cin files (including any of these files that do not exist).  Only text model files
+# (.mdl) can be read, so if the model is in another format (such as .vpmx), no checks are made.
+def CheckCommandScriptNames(ModelFile, SetvalNames=(), OutputVarsFiles=(), SettingsFiles=()):
+	if not ModelFile.lower().endswith(".mdl") or not os.path.isfile(ModelFile):
+		return []
+	Symbols = LoadModelSymbols(ModelFile)
+	Errors = []
+	for Name in SetvalNames:
+		Error = Symbols.CheckName(Name, RequireAllSubscripts=True)
+		if Error is not None:
+			Errors.append("SETVAL: " + Error)
+	for FileName in OutputVarsFiles:
+		if os.path.isfile(FileName):
+			Errors.extend(CheckOutputVarsFile(Symbols, FileName))
+		else:
+			Errors.append(FileName + ": The file does not exist.")
+	for FileName in SettingsFiles:
+		if os.path.isfile(FileName):
+			Errors.extend(CheckSettingsFile(Symbols, FileName))
+		else:
+			Errors.append(FileName + ": The file does not exist.")
+	return Errors
+
+
+if __name__ == "__main__":
+
+	ModelFile = "EPS.mdl"
+	Arguments = [Argument for Argument in sys.argv[1:] if Argument != "--expand"]
+	Symbols = LoadModelSymbols(ModelFile)
+	Errors = []
+	for FileName in Arguments:
+		if FileName.lower().endswith(".cin"):
+			Errors.extend(CheckSettingsFile(Symbols, FileName))
+		else:
+			Errors.extend(CheckOutputVarsFile(Symbols, FileName))
+			if "--expand" in sys.argv[1:]:
+				for LineNumber, Entry in ReadOutputVarsFile(FileName):
+					print("\n".join(Symbols.ExpandName(Entry)))
+	for Error in Errors:
+		print(Error, file=sys.stderr)
+	sys.exit(1 if len(Errors) > 0 else 0)
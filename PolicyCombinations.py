@@ -0,0 +1,121 @@
+# PolicyCombinations.py
+#
+# This is a Python module used by CreateCombinationsScript.py to step through every
+# combination of settings of the enabled policies without building a list of them in memory.
+#
+# Each combination is treated as a number written in a "mixed-radix" number system, in which
+# each digit is the index of the setting selected for one policy, and the base (or radix) of
+# each digit is the number of settings available for that policy.  For example, if three
+# policies are enabled, with 2, 3, and 2 settings respectively, the combinations are numbered
+# from 0 to 11 (2 * 3 * 2 = 12 combinations), and combination number 7 is (1, 0, 1), because
+# 7 = 1 * (3 * 2) + 0 * (2) + 1.  The last policy changes fastest, which is the same order in
+# which combinations were listed by earlier versions of CreateCombinationsScript.py.
+#
+# Because any combination can be computed directly from its run index, a batch of runs can be
+# split into pieces (or resumed part-way through) without enumerating the runs that come before.
+
+
+# Counting Combinations
+# ---------------------
+# The number of combinations is the product of the number of settings of each policy.
+def CountCombinations(Radices):
+	NumCombinations = 1
+	for Radix in Radices:
+		NumCombinations *= Radix
+	return NumCombinations
+
+
+# Finding a Single Combination
+# ----------------------------
+# We convert a run index (counting from zero) into a tuple of setting indices by repeatedly
+# dividing by the radix of each digit, starting with the last (fastest-changing) policy.
+def CombinationFromRunIndex(RunIndex, Radices):
+	if RunIndex < 0 or RunIndex >= CountCombinations(Radices):
+		raise IndexError("Run index " + str(RunIndex) + " is outside the range of policy setting combinations.")
+	Digits = [0] * len(Radices)
+	for Position in range(len(Radices) - 1, -1, -1):
+		RunIndex, Digits[Position] = divmod(RunIndex, Radices[Position])
+	return tuple(Digits)
+
+
+# Stepping Through Combinations
+# -----------------------------
+# This generator yields combinations one at a time, like an odometer: the last digit is
+# incremented, and whenever a digit rolls over to zero, the digit to its left is incremented.
+# Only the current combination is held in memory, so the cost of enumerating a million runs
+# is the same as enumerating ten.  The optional FirstRunIndex and LastRunIndex arguments
+# restrict the enumeration to a contiguous range of run indices (LastRunIndex is exclusive).
+def IterateCombinations(Radices, FirstRunIndex=0, LastRunIndex=None):
+	NumCombinations = CountCombinations(Radices)
+	if LastRunIndex is None or LastRunIndex > NumCombinations:
+		LastRunIndex = NumCombinations
+	if FirstRunIndex >= LastRunIndex:
+		return
+
+	Digits = list(CombinationFromRunIndex(FirstRunIndex, Radices))
+	for RunIndex in range(FirstRunIndex, LastRunIndex):
+		yield tuple(Digits)
+		Position = len(Digits) - 1
+		while Position >= 0:
+			Digits[Position] += 1
+			if Digits[Position] < Radices[Position]:
+				break
+			Digits[Position] = 0
+			Position -= 1
+
+
+# Gray Code Order
+# ---------------
+# Combinations may also be visited in "reflected Gray code" order, in which each combination
+# differs from the one before it in the setting of exactly one policy, and that setting moves
+# to an adjacent entry in the policy's list of settings.  For example, with two policies that
+# each have three settings, the order is (0,0), (0,1), (0,2), (1,2), (1,1), (1,0), (2,0), (2,1),
+# (2,2).  This means that the difference between consecutive runs in the results file shows the
+# effect of changing a single policy setting.
+#
+# To find the combination for a run index, we first find the ordinary (mixed-radix) combination.
+# Each digit's block of lower digits is traversed in reverse each time a higher digit changes,
+# so a digit is reflected (counted down instead of up) whenever the number formed by all of the
+# digits to its left is odd.
+def GrayCombinationFromRunIndex(RunIndex, Radices):
+	Digits = list(CombinationFromRunIndex(RunIndex, Radices))
+	Prefix = 0
+	for Position in range(len(Radices)):
+		Digit = Digits[Position]
+		if Prefix % 2 == 1:
+			Digits[Position] = Radices[Position] - 1 - Digit
+		Prefix = Prefix * Radices[Position] + Digit
+	return tuple(Digits)
+
+# This generator yields combinations in Gray code order, optionally restricted to a contiguous range
+# of run indices, in the same way as IterateCombinations().  Each digit has a direction (counting up
+# or down).  At each step, we move the last digit that can still move in its direction, and any
+# digits to its right that have reached the end of their range reverse direction instead of rolling
+# over.  On average, each step only needs to examine a couple of digits.
+def IterateGrayCombinations(Radices, FirstRunIndex=0, LastRunIndex=None):
+	NumCombinations = CountCombinations(Radices)
+	if LastRunIndex is None or LastRunIndex > NumCombinations:
+		LastRunIndex = NumCombinations
+	if FirstRunIndex >= LastRunIndex:
+		return
+
+	# The starting direction of each digit depends on whether the digits to its left form an odd
+	# number at the first run index, just as in GrayCombinationFromRunIndex().
+	Digits = list(GrayCombinationFromRunIndex(FirstRunIndex, Radices))
+	Directions = [1] * len(Radices)
+	Prefix = 0
+	for Position, Digit in enumerate(CombinationFromRunIndex(FirstRunIndex, Radices)):
+		if Prefix % 2 == 1:
+			Directions[Position] = -1
+		Prefix = Prefix * Radices[Position] + Digit
+
+	for RunIndex in range(FirstRunIndex, LastRunIndex):
+		yield tuple(Digits)
+		Position = len(Digits) - 1
+		while Position >= 0:
+			NextDigit = Digits[Position] + Directions[Position]
+			if 0 <= NextDigit < Radices[Position]:
+				Digits[Position] = NextDigit
+				break
+			Directions[Position] = -Directions[Position]
+			Position -= 1
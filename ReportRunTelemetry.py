@@ -0,0 +1,143 @@
+# ReportRunTelemetry.py
+#
+# This is a Python script that summarizes the telemetry log written by RunInParallel.py, which
+# records how long each run unit took, whether it succeeded, and how much it exported.  It may be
+# used while a batch is still running (to see how long it will take to finish), or afterward (to
+# see where the time went).  It reports:
+#
+# 1. The throughput of the batch so far, in runs per hour of elapsed (wall clock) time.
+# 2. The median and tail (90th percentile, 99th percentile, and longest) times taken per run.
+# 3. The number of attempts that timed out or failed to produce results, and of run units retried.
+# 4. The time spent on each type of instruction, if the simulator reported it.
+# 5. The slowest runs, with the policy settings (SETVAL instructions) that they were given.
+# 6. The projected time to finish the runs that remain, at the throughput seen so far.
+#
+# Usage: python ReportRunTelemetry.py [TelemetryFile.jsonl]
+
+
+# File Names
+# ----------
+TelemetryFile = "ParallelRunTelemetry.jsonl" # The telemetry log written by RunInParallel.py (may also be given on the command line)
+
+# Other Settings
+# --------------
+NumSlowest = 10 # The number of slowest runs to list
+
+
+import json
+import math
+import sys
+
+
+# Reading the Telemetry Log
+# -------------------------
+# The first line describes the batch, and each following line describes one attempt to carry out a
+# run unit.  A batch that is still running may have written only part of its last line, which is
+# skipped.
+def ReadTelemetry(TelemetryFile):
+	Attempts = []
+	with open(TelemetryFile, 'r') as Telemetry:
+		Batch = json.loads(Telemetry.readline())
+		for Line in Telemetry:
+			try:
+				Attempts.append(json.loads(Line))
+			except ValueError:
+				continue
+	return Batch, Attempts
+
+# Percentiles are found with the nearest-rank method, so each is a time that some run actually took.
+def Percentile(SortedValues, Fraction):
+	if len(SortedValues) == 0:
+		return 0.0
+	Rank = max(1, math.ceil(Fraction * len(SortedValues)))
+	return SortedValues[Rank - 1]
+
+def FormatDuration(Seconds):
+	if Seconds < 60:
+		return format(Seconds, ".1f") + " s"
+	if Seconds < 3600:
+		return format(Seconds / 60, ".1f") + " min"
+	return format(Seconds / 3600, ".1f") + " h"
+
+# Settings of zero are left out, as they are the same as not setting a policy at all.
+def DescribeSettings(Settings):
+	Described = []
+	for Name, Value in Settings.items():
+		try:
+			if float(Value) == 0:
+				continue
+		except ValueError:
+			pass
+		Described.append(Name + "=" + Value)
+	return ", ".join(Described) if len(Described) > 0 else "(no policies)"
+
+
+# Summarizing the Batch
+# ---------------------
+# Only attempts that succeeded count toward the throughput and the time per run.  A run unit with
+# several runs is assumed to have spent the same time on each of them.
+def ReportTelemetry(Batch, Attempts):
+	Succeeded = [Attempt for Attempt in Attempts if Attempt.get("Status") == "OK"]
+	Failed = [Attempt for Attempt in Attempts if Attempt.get("Status") != "OK"]
+	RunsDone = sum(len(Attempt["Runs"]) for Attempt in Succeeded)
+	Finished = [Attempt["Start"] + Attempt["Seconds"] for Attempt in Attempts if "Seconds" in Attempt]
+	Elapsed = max(Finished) - Batch["Start"] if len(Finished) > 0 else 0.0
+
+	print("Batch: " + Batch["Batch"] + " (" + str(Batch["NumRuns"]) + " runs in " + str(Batch["NumUnits"]) + " run units, with " + str(Batch["NumWorkers"]) + " workers)")
+	print("Runs done: " + str(RunsDone) + " of " + str(Batch["NumRuns"]) + " in " + FormatDuration(Elapsed))
+	if RunsDone == 0 or Elapsed <= 0:
+		print("No runs have finished yet, so no throughput can be reported.")
+		return
+	RunsPerHour = RunsDone / Elapsed * 3600
+	print("Throughput: " + format(RunsPerHour, ".1f") + " runs/hour")
+
+	RunTimes = []
+	for Attempt in Succeeded:
+		for Settings in Attempt["Runs"]:
+			RunTimes.append((Attempt["Seconds"] / len(Attempt["Runs"]), Attempt["Unit"], Settings))
+	Seconds = sorted(RunTime[0] for RunTime in RunTimes)
+	print("Time per run: median " + FormatDuration(Percentile(Seconds, 0.5)) + ", p90 " + FormatDuration(Percentile(Seconds, 0.9)) + ", p99 " + FormatDuration(Percentile(Seconds, 0.99)) + ", longest " + FormatDuration(Seconds[-1]))
+	OutputBytes = sum(Attempt.get("OutputBytes", 0) for Attempt in Succeeded)
+	print("Results exported: " + format(OutputBytes / 1000000, ".1f") + " MB (" + format(OutputBytes / RunsDone / 1000, ".1f") + " kB per run)")
+
+	if len(Failed) > 0:
+		Statuses = {}
+		for Attempt in Failed:
+			Statuses[Attempt.get("Status", "Unknown")] = Statuses.get(Attempt.get("Status", "Unknown"), 0) + 1
+		Retried = len(set(Attempt["Unit"] for Attempt in Failed))
+		print("Failed attempts: " + ", ".join(str(Count) + " " + Status for Status, Count in sorted(Statuses.items())) + " (in " + str(Retried) + " run units)")
+
+	CommandTimes = {}
+	for Attempt in Attempts:
+		for Command, Totals in Attempt.get("Commands", {}).items():
+			Sum = CommandTimes.setdefault(Command, {"Count": 0, "Seconds": 0.0})
+			Sum["Count"] += Totals["Count"]
+			Sum["Seconds"] += Totals["Seconds"]
+	if len(CommandTimes) > 0:
+		print("")
+		print("Time by instruction:")
+		for Command, Totals in sorted(CommandTimes.items(), key=lambda Item: -Item[1]["Seconds"]):
+			print("  " + Command + ": " + str(Totals["Count"]) + " times, " + FormatDuration(Totals["Seconds"]) + " in all, " + format(Totals["Seconds"] / Totals["Count"] * 1000, ".1f") + " ms each")
+
+	print("")
+	print("Slowest runs:")
+	for RunSeconds, UnitNumber, Settings in sorted(RunTimes, key=lambda RunTime: -RunTime[0])[:NumSlowest]:
+		print("  " + FormatDuration(RunSeconds) + " (run unit " + str(UnitNumber) + "): " + DescribeSettings(Settings))
+
+	print("")
+	RunsLeft = Batch["NumRuns"] - RunsDone
+	if RunsLeft <= 0:
+		print("All runs are done.")
+	else:
+		print("Projected time to finish the remaining " + str(RunsLeft) + " runs: " + FormatDuration(RunsLeft / RunsPerHour * 3600))
+
+
+if __name__ == "__main__":
+
+	if len(sys.argv) > 1:
+		TelemetryFile = sys.argv[1]
+	try:
+		Batch, Attempts = ReadTelemetry(TelemetryFile)
+	except (OSError, ValueError) as Error:
+		sys.exit("Error: The telemetry log " + TelemetryFile + " could not be read (" + str(Error) + ").")
+	ReportTelemetry(Batch, Attempts)
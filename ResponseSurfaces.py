@@ -0,0 +1,387 @@
+# ResponseSurfaces.py
+#
+# This is a Python module that fits "response surfaces" (also called emulators or surrogate models) to
+# the results of a batch of runs, such as a batch generated by CreateCombinationsScript.py in "Grid",
+# "Morris", or "Sobol" mode.  A response surface estimates the value of every output variable in every
+# year for any settings of the policies that varied in the batch (the "levers"), in a tiny fraction of
+# the time a model run takes, along with an estimate of the error of each value.  It can be used to
+# explore the effects of settings between those that were run, and to screen many candidate policy
+# packages before performing model runs of the most promising ones.  It requires the NumPy package.
+# Use FitResponseSurface.py to fit a response surface and save it to a file, and use LoadEmulator() in
+# your own Python code to query it.  For example:
+#
+#	from ResponseSurfaces import LoadEmulator
+#	Emulator = LoadEmulator("ResponseSurface.npz")
+#	Values, Errors = Emulator.Predict({"Carbon Tax - Electricity Sector": [20, 40, 60], "Feebate": 0.5}, Variables=["Output Total CO2e Emissions"])
+#
+# Each query gives every lever a value (a single value is used for every point, as for "Feebate" above),
+# or is an array with one row per point and one column per lever (in the order of Emulator.Levers).
+# Values and Errors have one row per point, one column per variable, and one layer per year.  Queries
+# are answered for many points at once, which is far faster than asking for one point at a time.
+#
+# Three methods are available:
+#
+# 1. "Grid": multilinear interpolation between the runs of a batch that tested every combination of a
+#    list of settings of each lever (a "Grid" batch).  The estimate is exact at the settings that were
+#    run.  The error estimate comes from the curvature of the results along each lever (the second
+#    difference between runs at neighboring settings), which can only be measured for levers with at
+#    least three settings, so the error is unknown (NaN) between the settings of a lever with only two.
+# 2. "Polynomial": a least-squares polynomial of the levers (of degree PolynomialDegree, including the
+#    interactions between levers) fitted to runs at any settings.  The error estimate is the standard
+#    error of prediction of the fit.
+# 3. "GaussianProcess": Gaussian process regression (kriging) with a squared exponential kernel, fitted
+#    to runs at any settings.  It passes through every run, and is usually the most accurate method for a
+#    sampled ("Morris" or "Sobol") batch of up to a few thousand runs.  The error estimate is the standard
+#    deviation of the Gaussian process at the point.  The kernel's length scale (how far apart two points
+#    must be before their results are unrelated) is chosen to minimize the leave-one-out error.
+#
+# Error estimates are approximate.  Points outside the range of settings that were run are extrapolated,
+# and their estimates (and error estimates) should not be relied upon.
+
+import itertools
+import json
+
+import numpy
+
+from ResultsStore import IsNumber
+from RunResultsTools import IterateRuns, MatchesSchedule, ParseMetadata, ParseValues, ReadYears
+
+
+Methods = ("Grid", "Polynomial", "GaussianProcess")
+
+# Metadata columns that identify a run without being a lever.  Runs under several policy implementation
+# schedules are emulated one schedule at a time (see ReadTrainingRuns() below).
+DefaultIgnoredColumns = ("RunName", "CurrentRunNumber", "RunCacheKey", "PolicySchedule", "SensitivitySample", "UncertaintyDraw")
+
+# The candidate length scales for the Gaussian process kernel, as fractions of the diagonal of the range
+# of settings (after every lever has been scaled to run from 0 to 1).
+GaussianProcessLengthScales = numpy.geomspace(0.05, 1.0, 12)
+GaussianProcessNugget = 1e-8
+
+
+# Reading the Training Runs
+# -------------------------
+# The levers are the metadata columns (other than IgnoredColumns) that hold a number in every run and
+# take more than one value.  This function returns the levers, an array of each run's lever settings
+# (one row per run), the variables, the years, and an array of results (one row per run, one column per
+# variable, and one layer per year).  If Variables is given, only those variables are read.
+def ReadTrainingRuns(RunResultsFile, Variables=None, IgnoredColumns=DefaultIgnoredColumns, Schedule=None, FirstYear=None, FinalYear=None):
+	Years = ReadYears(RunResultsFile, FirstYear, FinalYear)
+	RunSettings = []
+	RunOutputs = []
+	VariableNames = None
+	SchedulesFound = set()
+	for Metadata, Rows in IterateRuns(RunResultsFile, len(Years)):
+		Parsed = ParseMetadata(Metadata)
+		if not MatchesSchedule(Parsed, Schedule, SchedulesFound):
+			continue
+		RowValues = dict(Rows)
+		if VariableNames is None:
+			VariableNames = [Name for Name, Values in Rows] if Variables is None else list(Variables)
+			Missing = [Name for Name in VariableNames if Name not in RowValues]
+			if len(Missing) > 0:
+				raise ValueError("These variables are not in the results file: " + ", ".join(Missing))
+		RunOutputs.append(numpy.array([ParseValues(RowValues[Name]) if Name in RowValues else [numpy.nan] * len(Years) for Name in VariableNames]))
+		RunSettings.append({Key: Value for Key, Value in Parsed.items() if Key not in IgnoredColumns})
+	if len(RunSettings) == 0:
+		raise ValueError("The results file " + RunResultsFile + " holds no runs" + ("" if Schedule is None else " under policy implementation schedule " + str(Schedule)) + ".")
+
+	Levers = []
+	for Settings in RunSettings:
+		for Key in Settings:
+			if Key not in Levers and all(Key in Other and IsNumber(Other[Key]) for Other in RunSettings) and len(set(float(Other[Key]) for Other in RunSettings)) > 1:
+				Levers.append(Key)
+	if len(Levers) == 0:
+		raise ValueError("No lever settings vary between the runs in the results file.")
+	Points = numpy.array([[float(Settings[Lever]) for Lever in Levers] for Settings in RunSettings])
+	return Levers, Points, VariableNames, Years, numpy.stack(RunOutputs)
+
+
+# Emulators
+# ---------
+# Every emulator stores its results as an array with one row per run and one column per variable and
+# year (variable by variable, with the years of each variable together), so a query for a few variables
+# only needs to compute their columns.  The levers are scaled to run from 0 to 1 over the range of
+# settings that were run.
+class Emulator:
+
+	def __init__(self, Levers, Variables, Years, Points):
+		self.Levers = list(Levers)
+		self.Variables = list(Variables)
+		self.Years = list(Years)
+		self.Lower = Points.min(axis=0)
+		self.Upper = Points.max(axis=0)
+		self.VariableIndex = dict((Name, Position) for Position, Name in enumerate(self.Variables))
+
+	def Scale(self, Points):
+		return (Points - self.Lower) / (self.Upper - self.Lower)
+
+	def QueryPoints(self, Query):
+		if isinstance(Query, dict):
+			Unknown = [Name for Name in Query if Name not in self.Levers]
+			Missing = [Name for Name in self.Levers if Name not in Query]
+			if len(Unknown) > 0 or len(Missing) > 0:
+				raise KeyError("A query must give a value for each lever and no others.  " + ("Unknown levers: " + ", ".join(Unknown) + ".  " if len(Unknown) > 0 else "") + ("Missing levers: " + ", ".join(Missing) + "." if len(Missing) > 0 else ""))
+			Columns = numpy.broadcast_arrays(*[numpy.atleast_1d(numpy.asarray(Query[Name], dtype=float)) for Name in self.Levers])
+			return numpy.stack(Columns, axis=-1).reshape(-1, len(self.Levers))
+		Points = numpy.atleast_2d(numpy.asarray(Query, dtype=float))
+		if Points.shape[-1] != len(self.Levers):
+			raise ValueError("Each query point must have " + str(len(self.Levers)) + " lever values (not " + str(Points.shape[-1]) + ").")
+		return Points.reshape(-1, len(self.Levers))
+
+	def OutputColumns(self, Variables):
+		if Variables is None:
+			Variables = self.Variables
+		elif isinstance(Variables, str):
+			Variables = [Variables]
+		Columns = []
+		for Name in Variables:
+			if Name not in self.VariableIndex:
+				raise KeyError("The emulator has no variable named \"" + Name + "\".")
+			Columns.append(numpy.arange(len(self.Years)) + self.VariableIndex[Name] * len(self.Years))
+		return numpy.concatenate(Columns), len(Variables)
+
+	# Returns the estimated values and their error estimates, for each point, variable, and year.
+	def Predict(self, Query, Variables=None):
+		Points = self.QueryPoints(Query)
+		Columns, NumVariables = self.OutputColumns(Variables)
+		Values, Errors = self.PredictColumns(Points, Columns)
+		Shape = (len(Points), NumVariables, len(self.Years))
+		return Values.reshape(Shape), Errors.reshape(Shape)
+
+	# The arrays and settings needed to rebuild the emulator are saved in a single NumPy .npz file.
+	def Save(self, FileName):
+		Description = {"Method": self.Method, "Levers": self.Levers, "Variables": self.Variables, "Years": self.Years, "Settings": self.Settings()}
+		numpy.savez(FileName, Description=numpy.array(json.dumps(Description)), Lower=self.Lower, Upper=self.Upper, **self.Arrays())
+
+def FlattenOutputs(Outputs):
+	return Outputs.reshape(len(Outputs), -1).astype(numpy.float64)
+
+
+# Grid Emulators
+# --------------
+# The runs are arranged in an array with one axis per lever, and each query point is interpolated from
+# the 2^(number of levers) runs at the corners of the grid cell that contains it, all at once.  Points
+# outside the grid are extrapolated from the nearest cell.  For each lever with at least three settings,
+# we also keep the second derivative of every result along that lever, estimated at every run (using the
+# nearest run with neighbors on both sides, for runs at either end), for the error estimates.
+class GridEmulator(Emulator):
+	Method = "Grid"
+
+	def __init__(self, Levers, Variables, Years, Points, Outputs=None, Arrays=None):
+		Emulator.__init__(self, Levers, Variables, Years, Points)
+		if Arrays is not None:
+			self.Axes = numpy.split(Arrays["AxisValues"], numpy.cumsum(Arrays["AxisSizes"])[:-1])
+		else:
+			self.Axes = [numpy.unique(Points[:, LeverIndex]) for LeverIndex in range(len(self.Levers))]
+		Shape = tuple(len(Axis) for Axis in self.Axes)
+		self.Strides = numpy.array([int(numpy.prod(Shape[LeverIndex + 1:])) for LeverIndex in range(len(Shape))])
+		self.Corners = (numpy.arange(2 ** len(Shape))[:, numpy.newaxis] >> numpy.arange(len(Shape))[::-1]) & 1
+		if Arrays is not None:
+			self.Values = Arrays["Values"]
+			self.Curvatures = [Arrays["Curvature" + str(LeverIndex)] if "Curvature" + str(LeverIndex) in Arrays else None for LeverIndex in range(len(Shape))]
+			return
+
+		Positions = tuple(numpy.searchsorted(Axis, Points[:, LeverIndex]) for LeverIndex, Axis in enumerate(self.Axes))
+		Flat = numpy.ravel_multi_index(Positions, Shape)
+		if len(Points) != int(numpy.prod(Shape)) or len(numpy.unique(Flat)) != len(Points):
+			raise ValueError("The runs do not form a grid: a \"Grid\" emulator needs exactly one run for every combination of the settings of each lever (" + " x ".join(str(Size) for Size in Shape) + " = " + str(int(numpy.prod(Shape))) + " runs, but there are " + str(len(Points)) + ").")
+		self.Values = numpy.empty((len(Points), Outputs[0].size))
+		self.Values[Flat] = FlattenOutputs(Outputs)
+
+		self.Curvatures = []
+		GridValues = self.Values.reshape(Shape + (-1,))
+		for LeverIndex, Axis in enumerate(self.Axes):
+			if len(Axis) < 3:
+				self.Curvatures.append(None)
+				continue
+			Steps = numpy.diff(Axis)
+			Slopes = numpy.diff(GridValues, axis=LeverIndex) / Steps.reshape((-1,) + (1,) * (len(Shape) - LeverIndex))
+			SecondDerivatives = 2 * numpy.diff(Slopes, axis=LeverIndex) / (Steps[:-1] + Steps[1:]).reshape((-1,) + (1,) * (len(Shape) - LeverIndex))
+			Nearest = numpy.clip(numpy.arange(len(Axis)) - 1, 0, len(Axis) - 3)
+			self.Curvatures.append(numpy.abs(numpy.take(SecondDerivatives, Nearest, axis=LeverIndex)).reshape(len(Points), -1).astype(numpy.float32))
+
+	def PredictColumns(self, Points, Columns):
+		Cells = numpy.stack([numpy.clip(numpy.searchsorted(Axis, Points[:, LeverIndex], side="right") - 1, 0, len(Axis) - 2) for LeverIndex, Axis in enumerate(self.Axes)], axis=1)
+		Below = numpy.stack([Axis[Cells[:, LeverIndex]] for LeverIndex, Axis in enumerate(self.Axes)], axis=1)
+		Above = numpy.stack([Axis[Cells[:, LeverIndex] + 1] for LeverIndex, Axis in enumerate(self.Axes)], axis=1)
+		Fractions = (Points - Below) / (Above - Below)
+
+		CornerRuns = (Cells[:, numpy.newaxis, :] + self.Corners) @ self.Strides
+		Weights = numpy.where(self.Corners, Fractions[:, numpy.newaxis, :], 1 - Fractions[:, numpy.newaxis, :]).prod(axis=2)
+		Values = numpy.einsum("pc,pcv->pv", Weights, self.Values[CornerRuns[:, :, numpy.newaxis], Columns])
+
+		# The error of linear interpolation between two settings is half the second derivative, times the
+		# product of the distances to the two settings.
+		Errors = numpy.zeros_like(Values)
+		for LeverIndex, Curvature in enumerate(self.Curvatures):
+			Spans = numpy.abs((Points[:, LeverIndex] - Below[:, LeverIndex]) * (Above[:, LeverIndex] - Points[:, LeverIndex]))[:, numpy.newaxis]
+			if Curvature is None:
+				Errors += numpy.where(Spans == 0, 0.0, numpy.nan)
+			else:
+				Errors += 0.5 * Spans * numpy.einsum("pc,pcv->pv", Weights, Curvature[CornerRuns[:, :, numpy.newaxis], Columns])
+		return Values, Errors
+
+	def Settings(self):
+		return {}
+
+	def Arrays(self):
+		Arrays = {"Values": self.Values, "AxisValues": numpy.concatenate(self.Axes), "AxisSizes": numpy.array([len(Axis) for Axis in self.Axes])}
+		for LeverIndex, Curvature in enumerate(self.Curvatures):
+			if Curvature is not None:
+				Arrays["Curvature" + str(LeverIndex)] = Curvature
+		return Arrays
+
+
+# Polynomial Emulators
+# --------------------
+# The terms of the polynomial are every product of powers of the levers with a total degree of at most
+# Degree, except that no lever is raised to a power higher than its number of settings minus one (a lever
+# with two settings can only be fitted with a straight line).  Every variable and year is fitted at once.
+# The levers are scaled to run from -1 to 1, which keeps the fit accurate for higher degrees.  Results
+# that are missing (NaN) in any run are not fitted, and are estimated as NaN.
+class PolynomialEmulator(Emulator):
+	Method = "Polynomial"
+
+	def __init__(self, Levers, Variables, Years, Points, Outputs=None, Degree=2, Arrays=None):
+		Emulator.__init__(self, Levers, Variables, Years, Points)
+		self.Degree = Degree
+		if Arrays is not None:
+			self.Exponents, self.Coefficients, self.ResidualVariances, self.InverseGram = Arrays["Exponents"], Arrays["Coefficients"], Arrays["ResidualVariances"], Arrays["InverseGram"]
+			return
+
+		MaxPowers = [min(Degree, len(numpy.unique(Points[:, LeverIndex])) - 1) for LeverIndex in range(len(self.Levers))]
+		self.Exponents = numpy.array([Powers for Powers in itertools.product(*[range(MaxPower + 1) for MaxPower in MaxPowers]) if sum(Powers) <= Degree])
+		Features = self.Features(Points)
+		if len(self.Exponents) > len(Points):
+			raise ValueError("A polynomial of degree " + str(Degree) + " of " + str(len(self.Levers)) + " levers has " + str(len(self.Exponents)) + " terms, more than the number of runs (" + str(len(Points)) + ").  Use a lower PolynomialDegree.")
+
+		Targets = FlattenOutputs(Outputs)
+		Fitted = numpy.isfinite(Targets).all(axis=0)
+		self.Coefficients = numpy.full((len(self.Exponents), Targets.shape[1]), numpy.nan)
+		self.Coefficients[:, Fitted] = numpy.linalg.lstsq(Features, Targets[:, Fitted], rcond=None)[0]
+		self.InverseGram = numpy.linalg.pinv(Features.T @ Features)
+		Residuals = Targets - Features @ self.Coefficients
+		DegreesOfFreedom = len(Points) - len(self.Exponents)
+		self.ResidualVariances = (Residuals ** 2).sum(axis=0) / DegreesOfFreedom if DegreesOfFreedom > 0 else numpy.full(Targets.shape[1], numpy.nan)
+
+		# The leave-one-out residuals follow from the residuals and the leverage of each run.
+		Leverages = numpy.einsum("rf,fg,rg->r", Features, self.InverseGram, Features)
+		with numpy.errstate(divide="ignore", invalid="ignore"):
+			self.LeaveOneOutResiduals = Residuals / (1 - Leverages)[:, numpy.newaxis]
+
+	def Features(self, Points):
+		Scaled = 2 * self.Scale(Points) - 1
+		return numpy.prod(Scaled[:, numpy.newaxis, :] ** self.Exponents, axis=2)
+
+	def PredictColumns(self, Points, Columns):
+		Features = self.Features(Points)
+		Values = Features @ self.Coefficients[:, Columns]
+		Leverages = numpy.einsum("pf,fg,pg->p", Features, self.InverseGram, Features)
+		Errors = numpy.sqrt(self.ResidualVariances[Columns] * (1 + Leverages[:, numpy.newaxis]))
+		return Values, Errors
+
+	def Settings(self):
+		return {"Degree": self.Degree}
+
+	def Arrays(self):
+		return {"Exponents": self.Exponents, "Coefficients": self.Coefficients, "ResidualVariances": self.ResidualVariances, "InverseGram": self.InverseGram}
+
+
+# Gaussian Process Emulators
+# --------------------------
+# Each result is standardized (to a mean of zero and a standard deviation of one over the runs) and
+# modeled as a Gaussian process with the same kernel, so one factorization of the kernel matrix serves
+# every variable and year.  Each result's own variance is estimated by maximum likelihood.  For each
+# candidate length scale, the leave-one-out residuals of every run follow directly from the inverse of
+# the kernel matrix (Rasmussen and Williams, 2006, section 5.4.2), and the length scale with the smallest
+# mean squared leave-one-out residual is used.  A small "nugget" is added to the kernel matrix to keep it
+# well-conditioned.  Results that are missing (NaN) in any run are estimated as NaN.
+class GaussianProcessEmulator(Emulator):
+	Method = "GaussianProcess"
+
+	def __init__(self, Levers, Variables, Years, Points, Outputs=None, Arrays=None):
+		Emulator.__init__(self, Levers, Variables, Years, Points)
+		if Arrays is not None:
+			self.Inputs = Arrays["Inputs"]
+			self.LengthScale = float(Arrays["LengthScale"])
+			self.Means, self.Deviations, self.Weights, self.InverseKernel, self.SignalVariances = Arrays["Means"], Arrays["Deviations"], Arrays["Weights"], Arrays["InverseKernel"], Arrays["SignalVariances"]
+			return
+
+		self.Inputs = self.Scale(Points)
+		Targets = FlattenOutputs(Outputs)
+		Fitted = numpy.isfinite(Targets).all(axis=0)
+		self.Means = numpy.where(Fitted, numpy.nanmean(Targets, axis=0), numpy.nan)
+		self.Deviations = numpy.where(Fitted, numpy.nanstd(Targets, axis=0), numpy.nan)
+		self.Deviations[self.Deviations == 0] = 1
+		Standardized = numpy.where(Fitted, (Targets - self.Means) / self.Deviations, 0)
+
+		Best = None
+		Distances = ((self.Inputs[:, numpy.newaxis, :] - self.Inputs[numpy.newaxis, :, :]) ** 2).sum(axis=2)
+		for LengthScale in GaussianProcessLengthScales * numpy.sqrt(len(self.Levers)):
+			Kernel = numpy.exp(-Distances / (2 * LengthScale ** 2)) + GaussianProcessNugget * numpy.eye(len(Points))
+			try:
+				Factor = numpy.linalg.cholesky(Kernel)
+			except numpy.linalg.LinAlgError:
+				continue
+			FactorInverse = numpy.linalg.solve(Factor, numpy.eye(len(Points)))
+			InverseKernel = FactorInverse.T @ FactorInverse
+			Weights = InverseKernel @ Standardized
+			LeaveOneOutResiduals = Weights / numpy.diag(InverseKernel)[:, numpy.newaxis]
+			Score = numpy.mean(LeaveOneOutResiduals[:, Fitted] ** 2)
+			if Best is None or Score < Best[0]:
+				Best = (Score, LengthScale, InverseKernel, Weights, LeaveOneOutResiduals)
+		if Best is None:
+			raise ValueError("The Gaussian process could not be fitted, because the runs are too close together.")
+		Score, self.LengthScale, self.InverseKernel, Weights, LeaveOneOutResiduals = Best
+		self.Weights = numpy.where(Fitted, Weights, numpy.nan)
+		self.SignalVariances = numpy.where(Fitted, (Standardized * Weights).sum(axis=0) / len(Points), numpy.nan)
+		self.LeaveOneOutResiduals = numpy.where(Fitted, LeaveOneOutResiduals * self.Deviations, numpy.nan)
+
+	def PredictColumns(self, Points, Columns):
+		Distances = ((self.Scale(Points)[:, numpy.newaxis, :] - self.Inputs[numpy.newaxis, :, :]) ** 2).sum(axis=2)
+		Covariances = numpy.exp(-Distances / (2 * self.LengthScale ** 2))
+		Values = self.Means[Columns] + (Covariances @ self.Weights[:, Columns]) * self.Deviations[Columns]
+		Remaining = numpy.maximum(1 + GaussianProcessNugget - ((Covariances @ self.InverseKernel) * Covariances).sum(axis=1), 0)
+		Errors = numpy.sqrt(self.SignalVariances[Columns] * Remaining[:, numpy.newaxis]) * self.Deviations[Columns]
+		return Values, Errors
+
+	def Settings(self):
+		return {}
+
+	def Arrays(self):
+		return {"LengthScale": numpy.array(self.LengthScale), "Means": self.Means, "Deviations": self.Deviations, "Weights": self.Weights, "InverseKernel": self.InverseKernel, "SignalVariances": self.SignalVariances, "Inputs": self.Inputs}
+
+
+# Fitting and Loading Emulators
+# -----------------------------
+# With the "Auto" method, a "Grid" emulator is used if the runs form a grid, a "GaussianProcess" emulator
+# if there are no more than MaxGaussianProcessRuns runs (the time to fit one grows with the cube of the
+# number of runs), and a "Polynomial" emulator otherwise.
+def IsGrid(Points):
+	Sizes = [len(numpy.unique(Points[:, LeverIndex])) for LeverIndex in range(Points.shape[1])]
+	return len(Points) == int(numpy.prod(Sizes)) and len(numpy.unique(Points, axis=0)) == len(Points)
+
+def FitEmulator(Levers, Points, Variables, Years, Outputs, Method="Auto", PolynomialDegree=2, MaxGaussianProcessRuns=2000):
+	if Method == "Auto":
+		if IsGrid(Points):
+			Method = "Grid"
+		elif len(Points) <= MaxGaussianProcessRuns:
+			Method = "GaussianProcess"
+		else:
+			Method = "Polynomial"
+	if Method == "Grid":
+		return GridEmulator(Levers, Variables, Years, Points, Outputs)
+	if Method == "Polynomial":
+		return PolynomialEmulator(Levers, Variables, Years, Points, Outputs, PolynomialDegree)
+	if Method == "GaussianProcess":
+		return GaussianProcessEmulator(Levers, Variables, Years, Points, Outputs)
+	raise ValueError("The method must be \"Auto\" or one of " + ", ".join("\"" + Known + "\"" for Known in Methods) + " (not " + repr(Method) + ").")
+
+def LoadEmulator(FileName):
+	with numpy.load(FileName) as Saved:
+		Arrays = dict(Saved)
+	Description = json.loads(str(Arrays.pop("Description")))
+	Points = numpy.stack([Arrays.pop("Lower"), Arrays.pop("Upper")])
+	Classes = {"Grid": GridEmulator, "Polynomial": PolynomialEmulator, "GaussianProcess": GaussianProcessEmulator}
+	return Classes[Description["Method"]](Description["Levers"], Description["Variables"], Description["Years"], Points, Arrays=Arrays, **Description["Settings"])
@@ -0,0 +1,239 @@
+# ResultsStore.py
+#
+# This is a Python module that converts a results file written by Vensim (such as RunResults.tsv
+# or ContributionTestResults.tsv) into a "results store": a folder of binary files that can be
+# opened instantly and sliced by variable, year, and run settings without reading the whole
+# results file.  It requires the NumPy package.  Use IngestRunResults.py to create a results store,
+# and use OpenResultsStore() in your own Python code to query it.  For example:
+#
+#	from ResultsStore import OpenResultsStore
+#	Store = OpenResultsStore("RunResultsStore")
+#	Values, Years, Variables, Runs = Store.Query(Variables=["Output Total CO2e Emissions"], FirstYear=2030, FinalYear=2050, Where={"Carbon Tax - Electricity Sector": 40})
+#
+# Contents of a Results Store
+# ---------------------------
+# Index.json: the years, the variable names, and a description of each run dimension (see below)
+# Values.dat: the value of every variable in every year of every run, as 32-bit floating point
+#	numbers (the precision with which Vensim exports results), in an array with one row per year,
+#	one column per variable, and one layer per run.  Values that are missing are stored as NaN.
+# Dimension<N>.npy: the value of the Nth run dimension for every run
+#
+# Run dimensions are the metadata columns that identify each run, such as "CurrentRunNumber=12",
+# "Carbon Tax - Electricity Sector=40", or "EnabledPolicyGroup=Carbon Tax" (see RunResultsTools.py).
+# A dimension whose values are all numbers is stored as an array of numbers.  Any other dimension
+# is stored as an array of whole numbers, each of which is the position of the run's value in the
+# dimension's list of distinct values (kept in Index.json).
+
+import json
+import os
+
+import numpy
+
+from RunResultsTools import IterateRuns, ParseMetadata, ParseValues, ReadYears
+
+
+IndexFileName = "Index.json"
+ValuesFileName = "Values.dat"
+ValuesType = numpy.float32
+
+# Runs are collected into blocks of roughly this many values before being written to Values.dat,
+# so that each write covers a contiguous stretch of runs for every year and variable.
+ValuesPerBlock = 2 ** 22
+
+
+def IsNumber(Text):
+	try:
+		float(Text)
+		return True
+	except ValueError:
+		return False
+
+def DimensionFileName(DimensionIndex):
+	return "Dimension" + str(DimensionIndex) + ".npy"
+
+
+# Ingesting a Results File
+# ------------------------
+# The results file is read twice, one run at a time, so memory use does not depend on the size of
+# the file.  The first pass finds the variables, the number of runs, and the type of each run
+# dimension, and saves each run's metadata to a temporary file.  The second pass writes the values
+# and dimensions into the store.  The categories of a text dimension are numbered in the order in
+# which they first appear during the second pass, so no categories are kept for the dimensions
+# that turn out to be numeric (such as CurrentRunNumber, which has a different value in every run).
+def IngestResultsFile(ResultsFile, StoreDirectory, FirstYear=None, FinalYear=None):
+
+	Years = ReadYears(ResultsFile, FirstYear, FinalYear)
+	os.makedirs(StoreDirectory, exist_ok=True)
+	MetadataFile = os.path.join(StoreDirectory, "Metadata.tmp")
+
+	# First pass
+	VariableIndex = {}
+	Dimensions = {}
+	NumRuns = 0
+	with open(MetadataFile, 'w') as Metadata:
+		for RunMetadata, Rows in IterateRuns(ResultsFile, len(Years)):
+			for Name, Values in Rows:
+				if Name not in VariableIndex:
+					VariableIndex[Name] = len(VariableIndex)
+			Parsed = ParseMetadata(RunMetadata)
+			for Key, Value in Parsed.items():
+				if Key not in Dimensions:
+					Dimensions[Key] = {"Name": Key, "Numeric": True, "Categories": {}}
+				Dimension = Dimensions[Key]
+				if Dimension["Numeric"] and not IsNumber(Value):
+					Dimension["Numeric"] = False
+			Metadata.write(json.dumps(Parsed) + "\n")
+			NumRuns += 1
+
+	if NumRuns == 0:
+		os.remove(MetadataFile)
+		raise ValueError("The results file " + ResultsFile + " contains no runs.")
+
+	# Second pass
+	NumVariables = len(VariableIndex)
+	Values = numpy.memmap(os.path.join(StoreDirectory, ValuesFileName), dtype=ValuesType, mode='w+', shape=(len(Years), NumVariables, NumRuns))
+	DimensionList = list(Dimensions.values())
+	DimensionArrays = []
+	for DimensionIndex, Dimension in enumerate(DimensionList):
+		ArrayType = numpy.float64 if Dimension["Numeric"] else numpy.int32
+		Array = numpy.lib.format.open_memmap(os.path.join(StoreDirectory, DimensionFileName(DimensionIndex)), mode='w+', dtype=ArrayType, shape=(NumRuns,))
+		Array[:] = numpy.nan if Dimension["Numeric"] else -1
+		DimensionArrays.append(Array)
+
+	RunsPerBlock = max(1, ValuesPerBlock // max(1, len(Years) * NumVariables))
+	Block = numpy.full((len(Years), NumVariables, RunsPerBlock), numpy.nan, dtype=ValuesType)
+	BlockStart = 0
+	RunIndex = 0
+	with open(MetadataFile, 'r') as Metadata:
+		for (RunMetadata, Rows), MetadataLine in zip(IterateRuns(ResultsFile, len(Years)), Metadata):
+			Column = RunIndex - BlockStart
+			for Name, RowValues in Rows:
+				Block[:, VariableIndex[Name], Column] = ParseValues(RowValues)
+			Parsed = json.loads(MetadataLine)
+			for DimensionIndex, Dimension in enumerate(DimensionList):
+				if Dimension["Name"] in Parsed:
+					Value = Parsed[Dimension["Name"]]
+					if Dimension["Numeric"]:
+						DimensionArrays[DimensionIndex][RunIndex] = float(Value)
+					else:
+						Categories = Dimension["Categories"]
+						if Value not in Categories:
+							Categories[Value] = len(Categories)
+						DimensionArrays[DimensionIndex][RunIndex] = Categories[Value]
+			RunIndex += 1
+			if RunIndex - BlockStart == RunsPerBlock:
+				Values[:, :, BlockStart:RunIndex] = Block
+				Block[:] = numpy.nan
+				BlockStart = RunIndex
+	if RunIndex > BlockStart:
+		Values[:, :, BlockStart:RunIndex] = Block[:, :, :RunIndex - BlockStart]
+	Values.flush()
+	for Array in DimensionArrays:
+		Array.flush()
+	del Values, DimensionArrays
+	os.remove(MetadataFile)
+
+	Index = {
+		"SourceFile": os.path.basename(ResultsFile),
+		"Years": Years,
+		"Variables": sorted(VariableIndex, key=VariableIndex.get),
+		"NumRuns": NumRuns,
+		"Dimensions": [
+			{
+				"Name": Dimension["Name"],
+				"File": DimensionFileName(DimensionIndex),
+				"Type": "Number" if Dimension["Numeric"] else "Text",
+				"Categories": [] if Dimension["Numeric"] else sorted(Dimension["Categories"], key=Dimension["Categories"].get)
+			}
+			for DimensionIndex, Dimension in enumerate(DimensionList)
+		]
+	}
+	with open(os.path.join(StoreDirectory, IndexFileName), 'w') as IndexFile:
+		json.dump(Index, IndexFile, indent="\t")
+	return Index
+
+
+# Querying a Results Store
+# ------------------------
+# Opening a store only reads Index.json.  The values and dimensions are memory-mapped, so the
+# operating system reads only the parts of the files that a query actually touches.
+class ResultsStore:
+
+	def __init__(self, StoreDirectory):
+		with open(os.path.join(StoreDirectory, IndexFileName), 'r') as IndexFile:
+			self.Index = json.load(IndexFile)
+		self.Years = self.Index["Years"]
+		self.Variables = self.Index["Variables"]
+		self.NumRuns = self.Index["NumRuns"]
+		self.VariableIndex = dict((Name, Position) for Position, Name in enumerate(self.Variables))
+		self.Values = numpy.memmap(os.path.join(StoreDirectory, ValuesFileName), dtype=ValuesType, mode='r', shape=(len(self.Years), len(self.Variables), self.NumRuns))
+		self.Dimensions = {}
+		for Dimension in self.Index["Dimensions"]:
+			self.Dimensions[Dimension["Name"]] = (Dimension, numpy.load(os.path.join(StoreDirectory, Dimension["File"]), mmap_mode='r'))
+
+	# Returns the value of a run dimension for every run (as numbers or text).
+	def DimensionValues(self, Name):
+		Dimension, Array = self.Dimensions[Name]
+		if Dimension["Type"] == "Number":
+			return numpy.asarray(Array)
+		Categories = numpy.array(Dimension["Categories"] + [""], dtype=object)
+		return Categories[numpy.asarray(Array)]
+
+	# Returns a True/False array with one entry per run, which is True for runs that match every
+	# condition in Where.  Each condition is a dimension name paired with either a single value,
+	# a list of acceptable values, or a function that takes an array of values and returns an
+	# array of True/False.
+	def SelectRuns(self, Where=None):
+		Selected = numpy.ones(self.NumRuns, dtype=bool)
+		if Where is None:
+			return Selected
+		for Name, Condition in Where.items():
+			if Name not in self.Dimensions:
+				raise KeyError("The results store has no run dimension named \"" + Name + "\".")
+			Dimension, Array = self.Dimensions[Name]
+			if callable(Condition):
+				Selected &= numpy.asarray(Condition(self.DimensionValues(Name)), dtype=bool)
+				continue
+			Accepted = Condition if isinstance(Condition, (list, tuple, set)) else [Condition]
+			if Dimension["Type"] == "Number":
+				Selected &= numpy.isin(numpy.asarray(Array), [float(Value) for Value in Accepted])
+			else:
+				Codes = [Dimension["Categories"].index(str(Value)) for Value in Accepted if str(Value) in Dimension["Categories"]]
+				Selected &= numpy.isin(numpy.asarray(Array), Codes)
+		return Selected
+
+	# Returns an array of values with one row per year, one column per variable, and one layer per
+	# selected run, along with the years, variable names, and run indices (counting from zero, in
+	# the order in which the runs appear in the results file) that label the array.  Variables
+	# defaults to all variables, FirstYear and FinalYear default to the whole time range, and Where
+	# selects runs as described in SelectRuns().
+	def Query(self, Variables=None, FirstYear=None, FinalYear=None, Where=None):
+		if Variables is None:
+			Variables = self.Variables
+		elif isinstance(Variables, str):
+			Variables = [Variables]
+		VariablePositions = []
+		for Name in Variables:
+			if Name not in self.VariableIndex:
+				raise KeyError("The results store has no variable named \"" + Name + "\".")
+			VariablePositions.append(self.VariableIndex[Name])
+		FirstPosition = 0 if FirstYear is None else max(0, int(FirstYear) - self.Years[0])
+		FinalPosition = len(self.Years) if FinalYear is None else min(len(self.Years), int(FinalYear) - self.Years[0] + 1)
+		Runs = numpy.nonzero(self.SelectRuns(Where))[0]
+		Values = self.Values[numpy.ix_(numpy.arange(FirstPosition, FinalPosition), VariablePositions, Runs)]
+		return Values, self.Years[FirstPosition:FinalPosition], list(Variables), Runs
+
+	# Returns the metadata of a single run as a dictionary.
+	def RunMetadata(self, RunIndex):
+		Metadata = {}
+		for Name, (Dimension, Array) in self.Dimensions.items():
+			Value = Array[RunIndex]
+			if Dimension["Type"] == "Number":
+				if not numpy.isnan(Value):
+					Metadata[Name] = float(Value)
+			elif Value >= 0:
+				Metadata[Name] = Dimension["Categories"][Value]
+		return Metadata
+
+def OpenResultsStore(StoreDirectory):
+	return ResultsStore(StoreDirectory)
@@ -0,0 +1,264 @@
+# RunCache.py
+#
+# This is a Python module that keeps a cache of model run results, so that a run that has already
+# been performed (in any batch, by any of the scripts that generate Vensim command scripts) does not
+# need to be performed again.  Many batches repeat the same runs: contribution tests of the same
+# policies under different settings share their BAU case and full policy package, and a combinations
+# batch that adds a setting to one policy repeats every run of the batch without it.  Each of these
+# costs a full simulation in Vensim.
+#
+# How the Run Cache Is Used
+# -------------------------
+# When the UseRunCache setting is enabled in CreateCombinationsScript.py,
+# CreateContributionTestScript.py, or CreateDataLoggingScript.py, the script looks up each run in
+# the cache and only writes instructions for the runs that are not found.  These runs are exported
+# to a "new runs" results file rather than to the RunResultsFile.  The script also writes a "run
+# plan" file listing every run in the batch, in order, with the columns that identify it in the
+# results file.  After Vensim has carried out the command script, SpliceRunResults.py adds the new
+# runs to the cache and writes the complete RunResultsFile from the cache, in the same layout it
+# would have had if every run had been performed.
+#
+# Identifying Runs
+# ----------------
+# Each run is identified by a "run key": a SHA-256 hash of everything that determines its results.
+#   - The model file and every input data file it reads (found by looking for quoted file names in
+#     the model file, such as 'InputData/trans/AVL/AVL.csv')
+#   - The OutputVarsFile, and the first and final years exported
+#   - The contents of the settings (.cin) file read with READCIN, if any
+#   - The SETVAL instructions given before the run, sorted by variable name
+# If the model or any of its input data changes, every run key changes, so results from an older
+# version of the model are never reused.  (They are eventually removed from the cache, as described
+# below.)  Every SETVAL instruction is part of the run key, including those that set a policy to
+# zero, because zero is not the default value of every policy (the GRA revenue allocation settings,
+# for example, default to 5), and the policy implementation schedule can change the results even when
+# no policy is set.
+#
+# Contents of the Run Cache
+# -------------------------
+# The cache is a folder (RunCache by default) that may be shared by all scripts and batches.
+# Index.json: the size and time of last use of each run in the cache, and the hashes of the model and
+#	input data files (with their sizes and modification times, so files that have not changed are not
+#	read again)
+# Runs/<first two characters of run key>/<run key>.tsv: the results of one run, one line per variable,
+#	in the same layout as a results file, but without the columns that identify the run
+#
+# The cache has a maximum size (set with MaxRunCacheSizeMB in each script).  When SpliceRunResults.py
+# finds that the cache is larger than this, the runs that have gone unused for the longest time are
+# removed until the cache fits.  Looking up a run, or splicing it into a results file, counts as a use.
+
+import hashlib
+import json
+import os
+import re
+import time
+
+
+IndexFileName = "Index.json"
+RunsDirectoryName = "Runs"
+IndexFormat = 1
+PlanFormat = 1
+KeyFormat = 2
+
+
+# File Names
+# ----------
+# The run plan and the new runs results file are named after the command script, in the same way as
+# the savelist (see CommandScriptTools.py), so each script has its own.
+def RunPlanFileName(OutputScript):
+	DotPosition = OutputScript.rfind(".")
+	if DotPosition <= 0:
+		return OutputScript + "RunPlan.tsv"
+	return OutputScript[:DotPosition] + "RunPlan.tsv"
+
+def NewRunsFileName(OutputScript):
+	DotPosition = OutputScript.rfind(".")
+	if DotPosition <= 0:
+		return OutputScript + "NewRuns.tsv"
+	return OutputScript[:DotPosition] + "NewRuns.tsv"
+
+
+# Hashing Files
+# -------------
+def HashFile(FileName):
+	Hash = hashlib.sha256()
+	with open(FileName, 'rb') as File:
+		for Block in iter(lambda: File.read(1 << 20), b""):
+			Hash.update(Block)
+	return Hash.hexdigest()
+
+# The input data files read by the model are found by looking for quoted names of files that exist
+# (relative to the folder containing the model file).  This finds every file read with GET DIRECT
+# DATA, GET DIRECT CONSTANTS, GET DIRECT LOOKUPS, and GET DIRECT SUBSCRIPT.
+def ModelInputFiles(ModelFile):
+	ModelDirectory = os.path.dirname(ModelFile)
+	with open(ModelFile, 'r', encoding='utf-8', errors='replace') as File:
+		Text = File.read()
+	InputFiles = set()
+	for Match in re.finditer(r"'([^'\r\n]+)'", Text):
+		FileName = os.path.normpath(os.path.join(ModelDirectory, Match.group(1)))
+		if os.path.isfile(FileName):
+			InputFiles.add(FileName)
+	return sorted(InputFiles)
+
+
+# Run Keys
+# --------
+# SETVAL instructions are read from the text of the command script, so the run key always matches the
+# instructions that Vensim will be given.  Values are compared as numbers, so "1" and "1.0" are the same.
+# The format of the run key is part of the hash, so runs cached under an older format are never reused.
+def ParseSetvals(SetvalText):
+	from ModelSymbols import NameKey
+
+	Setvals = {}
+	for Line in SetvalText.splitlines():
+		if not Line.startswith("SIMULATE>SETVAL|"):
+			continue
+		Name, Value = Line[len("SIMULATE>SETVAL|"):].split("=", 1)
+		try:
+			Value = repr(float(Value))
+		except ValueError:
+			Value = Value.strip()
+		Setvals[NameKey(Name)] = Value
+	return Setvals
+
+def RunKey(BatchHash, SetvalText, SettingsHash=""):
+	Description = json.dumps([KeyFormat, BatchHash, SettingsHash, sorted(ParseSetvals(SetvalText).items())], separators=(",", ":"))
+	return hashlib.sha256(Description.encode("utf-8")).hexdigest()
+
+
+# The Run Cache
+# -------------
+class RunCache:
+
+	def __init__(self, Directory):
+		self.Directory = Directory
+		self.SettingsHashes = {}
+		try:
+			with open(os.path.join(Directory, IndexFileName), 'r') as File:
+				self.Index = json.load(File)
+			if self.Index.get("Format") != IndexFormat:
+				raise ValueError("The run cache index has an unknown format.")
+		except (OSError, ValueError):
+			self.Index = {"Format": IndexFormat, "FileHashes": {}, "Runs": {}}
+
+	def RunFileName(self, Key):
+		return os.path.join(self.Directory, RunsDirectoryName, Key[:2], Key + ".tsv")
+
+	# A file is only read again if its size or modification time has changed since it was last hashed.
+	def FileHash(self, FileName):
+		Status = os.stat(FileName)
+		Known = self.Index["FileHashes"].get(FileName)
+		if Known is not None and Known[0] == Status.st_size and Known[1] == Status.st_mtime_ns:
+			return Known[2]
+		Hash = HashFile(FileName)
+		self.Index["FileHashes"][FileName] = [Status.st_size, Status.st_mtime_ns, Hash]
+		return Hash
+
+	# The batch hash covers everything that is the same for every run in a batch.
+	def BatchHash(self, ModelFile, OutputVarsFile, FirstYear, FinalYear):
+		Hash = hashlib.sha256()
+		for FileName in [ModelFile] + ModelInputFiles(ModelFile) + [OutputVarsFile]:
+			Hash.update(self.FileHash(FileName).encode("utf-8"))
+		Hash.update(("|" + str(FirstYear) + "|" + str(FinalYear)).encode("utf-8"))
+		return Hash.hexdigest()
+
+	def SettingsHash(self, SettingsFile):
+		if SettingsFile.strip() == "":
+			return ""
+		if SettingsFile not in self.SettingsHashes:
+			self.SettingsHashes[SettingsFile] = HashFile(SettingsFile)
+		return self.SettingsHashes[SettingsFile]
+
+	# Looking up a run marks it as used, so it is not removed before it can be spliced into a results file.
+	def Contains(self, Key):
+		Entry = self.Index["Runs"].get(Key)
+		if Entry is None or not os.path.isfile(self.RunFileName(Key)):
+			return False
+		Entry[1] = time.time()
+		return True
+
+	# Rows are (variable name, values) pairs, as produced by IterateRuns() in RunResultsTools.py.
+	def Store(self, Key, Rows):
+		RunFile = self.RunFileName(Key)
+		os.makedirs(os.path.dirname(RunFile), exist_ok=True)
+		with open(RunFile, 'w', newline='') as File:
+			for Name, Values in Rows:
+				File.write(Name + "\t" + "\t".join(Values) + "\n")
+		self.Index["Runs"][Key] = [os.path.getsize(RunFile), time.time()]
+
+	def ReadRows(self, Key):
+		Rows = []
+		with open(self.RunFileName(Key), 'r', newline='') as File:
+			for Line in File:
+				Name, _, Values = Line.rstrip("\r\n").partition("\t")
+				Rows.append((Name, Values.split("\t")))
+		return Rows
+
+	def Size(self):
+		return sum(Entry[0] for Entry in self.Index["Runs"].values())
+
+	# The least recently used runs are removed until the cache is no larger than MaxBytes.  The number
+	# of runs removed is returned.
+	def Evict(self, MaxBytes):
+		Size = self.Size()
+		Removed = 0
+		for Key, Entry in sorted(self.Index["Runs"].items(), key=lambda Item: Item[1][1]):
+			if Size <= MaxBytes:
+				break
+			try:
+				os.remove(self.RunFileName(Key))
+			except FileNotFoundError:
+				pass
+			del self.Index["Runs"][Key]
+			Size -= Entry[0]
+			Removed += 1
+		return Removed
+
+	# The index is written to a temporary file first, so a crash never leaves a damaged index.
+	def Save(self):
+		os.makedirs(self.Directory, exist_ok=True)
+		IndexFile = os.path.join(self.Directory, IndexFileName)
+		with open(IndexFile + ".tmp", 'w') as File:
+			json.dump(self.Index, File, separators=(",", ":"))
+		os.replace(IndexFile + ".tmp", IndexFile)
+
+
+# Run Plans
+# ---------
+# The first line of a run plan is a JSON object describing the batch (the cache folder, the years, the
+# new runs results files, and the maximum cache size).  Each following line describes one run, in the
+# order in which the runs appear in the results files: the run key, the results file, and the text
+# written after the colon at the end of the VDF2TAB instruction (which may itself contain tabs).  Runs
+# are written one line at a time, so the plan for a very large batch does not need to fit in memory.
+class RunPlanWriter:
+
+	def __init__(self, PlanFile, CacheDirectory, FirstYear, FinalYear, NewRunsFiles, MaxCacheSizeMB):
+		self.File = open(PlanFile, 'w', newline='')
+		self.File.write(json.dumps({
+			"Format": PlanFormat,
+			"CacheDirectory": CacheDirectory,
+			"FirstYear": str(FirstYear),
+			"FinalYear": str(FinalYear),
+			"NewRunsFiles": NewRunsFiles,
+			"MaxCacheSizeMB": MaxCacheSizeMB
+		}) + "\n")
+
+	def Add(self, Key, ResultsFile, Metadata):
+		self.File.write(Key + "\t" + ResultsFile + "\t" + Metadata + "\n")
+
+	def Close(self):
+		self.File.close()
+
+def ReadRunPlanHeader(PlanFile):
+	with open(PlanFile, 'r', newline='') as File:
+		Header = json.loads(File.readline())
+	if Header.get("Format") != PlanFormat:
+		raise ValueError("The run plan " + PlanFile + " has an unknown format.")
+	return Header
+
+def IteratePlannedRuns(PlanFile):
+	with open(PlanFile, 'r', newline='') as File:
+		File.readline()
+		for Line in File:
+			Key, ResultsFile, Metadata = Line.rstrip("\r\n").split("\t", 2)
+			yield Key, ResultsFile, Metadata
@@ -0,0 +1,346 @@
+# RunInParallel.py
+#
+# This is a Python script that carries out a Vensim command script generated by one of the other
+# Python scripts distributed with the EPS (such as GeneratedCombinationsScript.cmd), using several
+# copies of Vensim at the same time.  Normally, a command script is opened in a single copy of
+# Vensim DSS, which performs its runs one after another.  This script instead:
+#
+# 1. Splits the command script into "run units," each containing the instructions for one run (the
+#    SETVAL and READCIN instructions before a MENU>RUN instruction, the MENU>RUN instruction, and the
+#    VDF2TAB and FILE>DELETE instructions that follow it).
+# 2. Gives each of NumWorkers workers its own "sandbox" folder, containing links to (or copies of) the
+#    model file, the InputData folder, and the other files the command script reads, so that the
+#    copies of Vensim never overwrite one another's .vdfx files.
+# 3. Has the workers carry out the run units, each in a small command script of its own, starting a
+#    new copy of Vensim for each.  A run that does not finish within SimulatorTimeout seconds, or that
+#    does not produce its results, is tried again, up to MaxAttempts times in all.
+# 4. Writes the results of the run units to the results files named in the command script, in the
+#    order in which the runs appear in the command script, so the results files are the same as if a
+#    single copy of Vensim had carried out the whole command script.
+#
+# The workers are threads of this script (a thread pool) rather than separate Python processes (a
+# process pool).  Each worker spends nearly all of its time waiting for its copy of Vensim, which is a
+# separate process already, so threads run the copies of Vensim just as much in parallel, without
+# starting extra copies of Python or passing the run units and results between processes.
+#
+# Usage: python RunInParallel.py [CommandScript.cmd]
+#
+# Each copy of Vensim needs its own license seat, so NumWorkers should not exceed the number of copies
+# of Vensim you may run at once.  To try this script without Vensim, use the stand-in simulator
+# distributed with the EPS (which produces made-up results) as the SimulatorCommand.
+
+
+# File Names
+# ----------
+CommandScript = "GeneratedCombinationsScript.cmd" # The command script to carry out (may also be given on the command line)
+WorkFolder = "ParallelRunWork" # The folder in which the workers' sandboxes and the results of each run unit are kept
+SharedFolders = ["InputData"] # Folders read by the model, which are linked into (or copied to) each sandbox
+TelemetryFile = "ParallelRunTelemetry.jsonl" # The file to which the time taken by each run unit is logged (see ReportRunTelemetry.py)
+
+# Other Settings
+# --------------
+NumWorkers = 4 # The number of copies of Vensim to run at the same time
+# The command used to start Vensim DSS and have it carry out a command script.  The text {CommandScript}
+# is replaced with the name of the command script for each run unit.  Each of these command scripts ends
+# with a MENU>EXIT instruction, so Vensim closes when its runs are done.  Files named in the command that
+# exist in the current folder (such as SimulatorStandIn.py) are given to the simulator with their full
+# paths, since each simulator is started in its sandbox.  For example:
+# SimulatorCommand = ["C:\\Program Files\\Vensim\\vendss64.exe", "{CommandScript}"]
+# SimulatorCommand = ["python", "SimulatorStandIn.py", "{CommandScript}"]
+SimulatorCommand = ["python", "SimulatorStandIn.py", "{CommandScript}"]
+SimulatorTimeout = 3600 # The longest time (in seconds) to wait for a single run before trying it again
+MaxAttempts = 3 # The number of times a run unit is tried before giving up
+RunsPerUnit = 1 # The number of consecutive runs given to a copy of Vensim at once.  Larger values mean the model is
+				# loaded less often, but more runs are repeated if a copy of Vensim crashes.
+
+
+import concurrent.futures
+import json
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+
+# Splitting a Command Script
+# --------------------------
+# Instructions that prepare a run (SETVAL, READCIN, and RUNNAME) begin a new run unit if the current run
+# unit already contains a MENU>RUN instruction.  VDF2TAB and FILE>DELETE instructions belong to the run
+# unit before them.  Any other instructions (such as LOADMODEL and SAVELIST) that come before the first
+# run are part of the "header," which is repeated at the start of the command script for every run
+# unit, and those that come after the last run (such as MENU>EXIT) are left out.
+SetupCommands = ("SIMULATE>SETVAL", "SIMULATE>READCIN", "SIMULATE>RUNNAME")
+FollowingCommands = ("MENU>VDF2TAB", "FILE>DELETE")
+
+def SplitCommandScript(ScriptFile):
+	Header = []
+	Units = []
+	Pending = []
+	with open(ScriptFile, 'r') as Script:
+		for Line in Script:
+			Line = Line.rstrip("\r\n")
+			if Line.strip() == "":
+				continue
+			Command = Line.partition("|")[0]
+			if Command in SetupCommands:
+				Pending.append(Line)
+			elif Command == "MENU>RUN":
+				Units.append(Pending + [Line])
+				Pending = []
+			elif Command in FollowingCommands and len(Units) > 0 and len(Pending) == 0:
+				Units[-1].append(Line)
+			elif len(Units) == 0:
+				Header.extend(Pending + [Line])
+				Pending = []
+	return Header, Units
+
+# The files named in a command script (the model file, .cin files, output variable lists, and savelists)
+# must be available in each sandbox.
+def ReadFileNames(Lines):
+	FileNames = set()
+	for Line in Lines:
+		Command, _, Arguments = Line.partition("|")
+		if Command == "SPECIAL>LOADMODEL":
+			FileNames.add(Arguments.strip().strip('"'))
+		elif Command in ("SIMULATE>READCIN", "SIMULATE>SAVELIST") and Arguments.strip() != "":
+			FileNames.add(Arguments.strip())
+		elif Command == "MENU>VDF2TAB":
+			FileNames.add(Arguments.split("|")[2])
+	return sorted(FileName for FileName in FileNames if os.path.isfile(FileName))
+
+
+# Exporting Results
+# -----------------
+# The arguments of VDF2TAB are the data file, results file, output variable list, options, delimiter,
+# first time, and last time, followed by a colon and the extra text to be written after each variable
+# name.  In a run unit's command script, each VDF2TAB instruction writes to its own file, with a "Time"
+# row, overwriting any older file (the "+" and "!" options are removed).  The original results file and
+# options are kept, so the results can later be written exactly as Vensim would have written them.
+def RedirectExport(Line, ExportFile):
+	Fields = Line.partition("|")[2].split("|", 7)
+	Target = (Fields[1], Fields[3])
+	Fields[1] = ExportFile
+	Fields[3] = Fields[3].replace("+", "").replace("!", "")
+	return "MENU>VDF2TAB|" + "|".join(Fields), Target
+
+
+# Sandboxes
+# ---------
+# Each worker has its own sandbox folder.  Files and folders are linked where the operating system
+# allows it (which avoids copying the InputData folder), and copied otherwise.
+def LinkOrCopy(Source, Destination):
+	if os.path.lexists(Destination):
+		return
+	try:
+		os.symlink(os.path.abspath(Source), Destination, target_is_directory=os.path.isdir(Source))
+	except (OSError, NotImplementedError):
+		if os.path.isdir(Source):
+			shutil.copytree(Source, Destination)
+		else:
+			shutil.copy2(Source, Destination)
+
+def PrepareSandbox(Sandbox, FileNames):
+	os.makedirs(Sandbox, exist_ok=True)
+	for Name in FileNames + [Folder for Folder in SharedFolders if os.path.isdir(Folder)]:
+		Destination = os.path.join(Sandbox, Name)
+		os.makedirs(os.path.dirname(Destination) or Sandbox, exist_ok=True)
+		LinkOrCopy(Name, Destination)
+
+
+# Telemetry
+# ---------
+# Every attempt to carry out a run unit is logged to the TelemetryFile as one line of JSON, so the time
+# taken by a batch can be analyzed with ReportRunTelemetry.py (even while the batch is still running).
+# Each line records when the attempt started, how long it took, its status ("OK", "Timeout", or
+# "NoResults"), the simulator's exit code, the size of the results it exported, and the SETVAL and
+# READCIN instructions of each of its runs, so slow runs can be traced to their policy settings.
+#
+# Vensim does not report how long each instruction takes, so for Vensim only the total time of each
+# attempt is known.  A simulator that can time each instruction (such as SimulatorStandIn.py) is told
+# the name of a file in which to do so in the SIMULATOR_TIMING_FILE environment variable, and the time
+# spent on each type of instruction (such as MENU>RUN or MENU>VDF2TAB) is then added to the log.
+TelemetryLock = threading.Lock()
+
+def LogTelemetry(Record):
+	with TelemetryLock:
+		with open(TelemetryFile, 'a') as Telemetry:
+			Telemetry.write(json.dumps(Record, separators=(",", ":")) + "\n")
+
+# The settings of each run in a run unit, as a list of {variable name: value} dictionaries (with the
+# .cin file read before the run, if any, under the name "READCIN").
+def RunSettings(Lines):
+	Runs = []
+	Settings = {}
+	for Line in Lines:
+		Command, _, Arguments = Line.partition("|")
+		if Command == "SIMULATE>SETVAL":
+			Name, _, Value = Arguments.partition("=")
+			Settings[Name] = Value
+		elif Command == "SIMULATE>READCIN" and Arguments.strip() != "":
+			Settings["READCIN"] = Arguments
+		elif Command == "MENU>RUN":
+			Runs.append(Settings)
+			Settings = {}
+	return Runs
+
+# The simulator's timing file is summarized as {instruction: {"Count": ..., "Seconds": ...}}.  None is
+# returned if the simulator did not write one.
+def ReadCommandTimes(TimingFile):
+	if not os.path.isfile(TimingFile):
+		return None
+	CommandTimes = {}
+	with open(TimingFile, 'r') as Timing:
+		for Line in Timing:
+			Entry = json.loads(Line)
+			Totals = CommandTimes.setdefault(Entry["Command"], {"Count": 0, "Seconds": 0.0})
+			Totals["Count"] += 1
+			Totals["Seconds"] += Entry["Seconds"]
+	os.remove(TimingFile)
+	return CommandTimes
+
+
+# Carrying Out a Run Unit
+# -----------------------
+# The run unit's command script is written to the sandbox, the simulator is started there, and the
+# exported results are moved to the work folder once every export has been written.  A unit that times
+# out, fails to produce its results, or causes the simulator to report an error is tried again.
+def SimulatorArguments(ScriptName):
+	Arguments = []
+	for Argument in SimulatorCommand:
+		if "{CommandScript}" in Argument:
+			Arguments.append(Argument.replace("{CommandScript}", ScriptName))
+		elif os.path.isfile(Argument):
+			Arguments.append(os.path.abspath(Argument))
+		else:
+			Arguments.append(Argument)
+	return Arguments
+
+def RunUnit(UnitNumber, Lines, Header, Sandboxes):
+	ScriptName = "Unit" + str(UnitNumber) + ".cmd"
+	ScriptLines = list(Header)
+	ExportFiles = []
+	for Line in Lines:
+		if Line.startswith("MENU>VDF2TAB|"):
+			ExportFile = "Unit" + str(UnitNumber) + "_Export" + str(len(ExportFiles) + 1) + ".tsv"
+			Line, Target = RedirectExport(Line, ExportFile)
+			ExportFiles.append(ExportFile)
+		ScriptLines.append(Line)
+	if any(Line.startswith("SIMULATE>SAVELIST|") and Line.strip() != "SIMULATE>SAVELIST|" for Line in Header):
+		ScriptLines.append("SIMULATE>SAVELIST|")
+	ScriptLines.append("MENU>EXIT")
+
+	Problem = None
+	Settings = RunSettings(Lines)
+	for Attempt in range(1, MaxAttempts + 1):
+		Sandbox = Sandboxes.get()
+		Record = {"Unit": UnitNumber, "Attempt": Attempt, "Worker": os.path.basename(Sandbox), "Runs": Settings}
+		Environment = dict(os.environ, SIMULATOR_TIMING_FILE="Unit" + str(UnitNumber) + "_Timing.jsonl")
+		try:
+			for ExportFile in ExportFiles:
+				if os.path.exists(os.path.join(Sandbox, ExportFile)):
+					os.remove(os.path.join(Sandbox, ExportFile))
+			with open(os.path.join(Sandbox, ScriptName), 'w') as Script:
+				Script.write("\n".join(ScriptLines) + "\n")
+			Record["Start"] = time.time()
+			try:
+				Completed = subprocess.run(SimulatorArguments(ScriptName), cwd=Sandbox, env=Environment, timeout=SimulatorTimeout * RunsPerUnit, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+				Record["Seconds"] = time.time() - Record["Start"]
+				Record["ExitCode"] = Completed.returncode
+				Missing = [ExportFile for ExportFile in ExportFiles if not os.path.isfile(os.path.join(Sandbox, ExportFile))]
+				if len(Missing) == 0:
+					Record["Status"] = "OK"
+					Record["OutputBytes"] = sum(os.path.getsize(os.path.join(Sandbox, ExportFile)) for ExportFile in ExportFiles)
+					for ExportFile in ExportFiles:
+						os.replace(os.path.join(Sandbox, ExportFile), os.path.join(WorkFolder, ExportFile))
+				else:
+					Record["Status"] = "NoResults"
+					Problem = "the simulator exited with code " + str(Completed.returncode) + " without writing its results"
+					if Completed.stderr:
+						Problem += " (" + Completed.stderr.decode("utf-8", "replace").strip().splitlines()[-1] + ")"
+			except subprocess.TimeoutExpired:
+				Record["Seconds"] = time.time() - Record["Start"]
+				Record["Status"] = "Timeout"
+				Problem = "the simulator did not finish within " + str(SimulatorTimeout * RunsPerUnit) + " seconds"
+			CommandTimes = ReadCommandTimes(os.path.join(Sandbox, Environment["SIMULATOR_TIMING_FILE"]))
+			if CommandTimes is not None:
+				Record["Commands"] = CommandTimes
+		finally:
+			Sandboxes.put(Sandbox)
+		LogTelemetry(Record)
+		if Record.get("Status") == "OK":
+			return UnitNumber, None
+		print("Run unit " + str(UnitNumber) + ", attempt " + str(Attempt) + " of " + str(MaxAttempts) + ": " + Problem + ".", file=sys.stderr)
+	return UnitNumber, Problem
+
+
+# Writing the Results Files
+# -------------------------
+# The results of each run unit are copied to the results files named in the command script, in order.
+# An export with the "+" option appends to its results file (otherwise, the file is started over), and
+# an export with the "!" option leaves out the "Time" row, just as in Vensim.
+def WriteResults(Units):
+	for UnitNumber, Lines in enumerate(Units, start=1):
+		ExportNumber = 0
+		for Line in Lines:
+			if not Line.startswith("MENU>VDF2TAB|"):
+				continue
+			ExportNumber += 1
+			ResultsFile, Options = RedirectExport(Line, "")[1]
+			ExportFile = os.path.join(WorkFolder, "Unit" + str(UnitNumber) + "_Export" + str(ExportNumber) + ".tsv")
+			with open(ExportFile, 'r', newline='') as Export, open(ResultsFile, 'a' if "+" in Options else 'w', newline='') as Results:
+				for ExportLine in Export:
+					if "!" in Options and (ExportLine.startswith("Time\t") or ExportLine.rstrip("\r\n") == "Time"):
+						continue
+					Results.write(ExportLine)
+			os.remove(ExportFile)
+
+
+if __name__ == "__main__":
+
+	if len(sys.argv) > 1:
+		CommandScript = sys.argv[1]
+	if len(SimulatorCommand) < 1:
+		sys.exit("Error: No SimulatorCommand was specified.")
+	try:
+		Header, Runs = SplitCommandScript(CommandScript)
+	except OSError as Error:
+		sys.exit("Error: The command script " + CommandScript + " could not be read (" + str(Error) + ").")
+	if len(Runs) < 1:
+		sys.exit("Error: The command script " + CommandScript + " contains no runs.")
+
+	# Consecutive runs are grouped into run units of RunsPerUnit runs each.
+	Units = [sum(Runs[First:First + RunsPerUnit], []) for First in range(0, len(Runs), RunsPerUnit)]
+	NumSandboxes = max(1, min(NumWorkers, len(Units)))
+
+	os.makedirs(WorkFolder, exist_ok=True)
+	# The first line of the telemetry log describes the batch, so the time to finish can be projected.
+	with open(TelemetryFile, 'w') as Telemetry:
+		Telemetry.write(json.dumps({"Batch": CommandScript, "Start": time.time(), "NumRuns": len(Runs), "NumUnits": len(Units), "NumWorkers": NumSandboxes}, separators=(",", ":")) + "\n")
+	FileNames = ReadFileNames(Header + sum(Units, []))
+	Sandboxes = queue.Queue()
+	for WorkerNumber in range(1, NumSandboxes + 1):
+		Sandbox = os.path.join(WorkFolder, "Worker" + str(WorkerNumber))
+		PrepareSandbox(Sandbox, FileNames)
+		Sandboxes.put(Sandbox)
+
+	# Each worker is a thread that starts a copy of the simulator and waits for it to finish, so the runs
+	# themselves are carried out in separate processes.
+	print("Carrying out " + str(len(Runs)) + " runs from " + CommandScript + " in " + str(len(Units)) + " run units with " + str(NumSandboxes) + " workers.")
+	Failures = []
+	with concurrent.futures.ThreadPoolExecutor(max_workers=NumSandboxes) as Pool:
+		Futures = [Pool.submit(RunUnit, UnitNumber, Lines, Header, Sandboxes) for UnitNumber, Lines in enumerate(Units, start=1)]
+		for NumDone, Future in enumerate(concurrent.futures.as_completed(Futures), start=1):
+			UnitNumber, Problem = Future.result()
+			if Problem is not None:
+				Failures.append(UnitNumber)
+			if NumDone % max(1, len(Units) // 20) == 0 or NumDone == len(Units):
+				print("  " + str(NumDone) + " of " + str(len(Units)) + " run units done.")
+
+	if len(Failures) > 0:
+		sys.exit("Error: The following run units failed after " + str(MaxAttempts) + " attempts, so no results were written: " + ", ".join(str(UnitNumber) for UnitNumber in sorted(Failures)) + ".  Their command scripts are in the sandboxes in " + WorkFolder + ".")
+	WriteResults(Units)
+	shutil.rmtree(WorkFolder, ignore_errors=True)
+	print("Done.  The results were written to the files named in " + CommandScript + ".")
@@ -0,0 +1,156 @@
+# RunResultsTools.py
+#
+# This is a Python module containing functions for reading the tab-separated results files
+# that Vensim writes when a command script uses the VDF2TAB instruction (such as RunResults.tsv
+# or ContributionTestResults.tsv).  It is used by the other Python scripts distributed with the
+# EPS, and it is not meant to be run on its own.
+#
+# Layout of a Results File
+# ------------------------
+# Each line of a results file is one output variable from one run.  The first column is the name
+# of the variable (with subscripts, if any).  It is followed by the text that the command script
+# added after the colon at the end of the VDF2TAB instruction, which identifies the run (such as
+# "MostRecentRun", "CurrentRunNumber=12", or "EnabledPolicyGroup=Carbon Tax").  We call these
+# the "metadata" columns.  The remaining columns hold the value of the variable in each year.
+# The first line of the file is usually a "Time" row, which has the same layout, but holds the
+# years instead of values.
+#
+# All of the runs in a results file have the same number of metadata columns, and each run's
+# lines are written together, so the lines for one run can be recognized by their identical
+# metadata columns.
+
+import math
+
+
+# Splitting a Line
+# ----------------
+# The values for each year are always the last columns, so if we know how many years are in the
+# file, we can split a line into its variable name, metadata columns, and values, even though
+# some metadata columns may look like numbers (for example, the carbon cap-to-tax script writes
+# "CurrentPrice=" and the price in two separate columns).
+def SplitResultsLine(Line, NumYears):
+	Fields = Line.rstrip("\r\n").split("\t")
+	Name = Fields[0]
+	Metadata = tuple(Fields[1:len(Fields) - NumYears])
+	Values = Fields[len(Fields) - NumYears:]
+	return Name, Metadata, Values
+
+# Vensim writes ":NA:" for values that are not available, and we treat any value that is not a
+# number the same way, as "not a number" (NaN).
+def ParseValue(Text):
+	try:
+		return float(Text)
+	except ValueError:
+		return math.nan
+
+def ParseValues(Values):
+	return [ParseValue(Value) for Value in Values]
+
+
+# Finding the Years
+# -----------------
+# The years in the "Time" row are the longest run of consecutive whole numbers at the end of the
+# row.  If the file has no "Time" row (for example, a file whose runs were all appended with the
+# "+!" VDF2TAB option), the caller must supply the first and final years instead.
+def YearsFromTimeRow(Line):
+	Fields = Line.rstrip("\r\n").split("\t")
+	Years = []
+	for Field in reversed(Fields[1:]):
+		try:
+			Year = float(Field)
+		except ValueError:
+			break
+		if Year != int(Year) or (len(Years) > 0 and int(Year) != Years[-1] - 1):
+			break
+		Years.append(int(Year))
+	Years.reverse()
+	return Years
+
+def IsTimeRow(Line):
+	return Line.startswith("Time\t") or Line.rstrip("\r\n") == "Time"
+
+# This function reads just enough of a results file to find its years.
+def ReadYears(FileName, FirstYear=None, FinalYear=None):
+	with open(FileName, 'r') as ResultsFile:
+		for Line in ResultsFile:
+			if IsTimeRow(Line):
+				return YearsFromTimeRow(Line)
+			break
+	if FirstYear is None or FinalYear is None:
+		raise ValueError("The results file " + FileName + " has no Time row, so its first and final years must be specified.")
+	return list(range(int(FirstYear), int(FinalYear) + 1))
+
+
+# Reading Metadata
+# ----------------
+# Metadata columns are usually written as "Key=value" in a single column.  Some scripts write the
+# key and value in separate columns ("Key=" followed by the value), and the run name is written on
+# its own, without a key.  This function turns the metadata columns of a line into a dictionary.
+# The first column without a key is stored under "RunName", and columns that only contain "-"
+# (used by CreateCombinationsScript.py to pad the policy columns) or nothing are skipped.
+def ParseMetadata(Metadata):
+	Parsed = {}
+	FieldIndex = 0
+	while FieldIndex < len(Metadata):
+		Field = Metadata[FieldIndex].strip()
+		FieldIndex += 1
+		if Field == "" or Field == "-":
+			continue
+		if "=" in Field:
+			Key, Value = Field.split("=", 1)
+			if Value == "" and FieldIndex < len(Metadata) and "=" not in Metadata[FieldIndex]:
+				Value = Metadata[FieldIndex].strip()
+				FieldIndex += 1
+			Parsed[Key.strip()] = Value.strip()
+		elif "RunName" not in Parsed:
+			Parsed["RunName"] = Field
+		else:
+			Parsed[Field] = ""
+	return Parsed
+
+
+# Policy Implementation Schedules
+# -------------------------------
+# Scripts that perform the same runs under several policy implementation schedules record each run's
+# schedule in a "PolicySchedule" column, and every run carries this column, including the BAU run (see
+# CommandScriptTools.py).  A run without it is accepted under any schedule, which is only needed when
+# reading results files written before every run was tagged (when the BAU run was performed once and
+# had "-" in place of the column).  Scripts that compare runs with one another must only compare runs
+# under the same schedule.  This function returns whether a run (with parsed metadata) should be
+# used when only the runs under the given Schedule are wanted.  If Schedule is None, the results file
+# must not hold runs under more than one schedule.  The schedules found so far are kept in the set
+# SchedulesFound, which the caller passes in empty before reading the first run.
+def MatchesSchedule(Parsed, Schedule, SchedulesFound):
+	RunSchedule = Parsed.get("PolicySchedule")
+	if RunSchedule is None:
+		return True
+	SchedulesFound.add(RunSchedule)
+	if Schedule is None:
+		if len(SchedulesFound) > 1:
+			raise ValueError("The results file holds runs under several policy implementation schedules (" + ", ".join(sorted(SchedulesFound, key=float)) + ").  Set PolicySchedule to the schedule whose runs should be used.")
+		return True
+	return float(RunSchedule) == float(Schedule)
+
+
+# Reading Runs
+# ------------
+# This generator reads a results file one line at a time and yields one run at a time, as a pair:
+# the run's metadata columns (a tuple of text strings, which can be passed to ParseMetadata()) and
+# a list of (variable name, values) pairs, where the values are the unparsed text of each year's
+# column.  Only one run is held in memory at a time.  The years must be known in advance (see
+# ReadYears() above).
+def IterateRuns(FileName, NumYears):
+	with open(FileName, 'r') as ResultsFile:
+		CurrentMetadata = None
+		CurrentRows = []
+		for Line in ResultsFile:
+			if IsTimeRow(Line) or Line.strip() == "":
+				continue
+			Name, Metadata, Values = SplitResultsLine(Line, NumYears)
+			if Metadata != CurrentMetadata and len(CurrentRows) > 0:
+				yield CurrentMetadata, CurrentRows
+				CurrentRows = []
+			CurrentMetadata = Metadata
+			CurrentRows.append((Name, Values))
+		if len(CurrentRows) > 0:
+			yield CurrentMetadata, CurrentRows
@@ -0,0 +1,175 @@
+# SelfChecks.py
+#
+# This is a Python script that checks a few behaviors of the Python modules and scripts distributed
+# with the EPS that are easy to break without noticing, because the mistake would only show up as
+# wrong results (or missing runs) hours into a batch of Vensim runs.  It does not run Vensim.  Each
+# check is a function that returns a list of problems (empty if the check passed), and the script
+# prints the problems found by every check and ends with an error status if there were any, so it
+# may be used in automated checks.
+#
+# Usage: python SelfChecks.py [names of checks]
+# With no names, every check is performed.  For example, "python SelfChecks.py RunKey" only checks
+# the run keys of the run cache.
+
+import os
+import subprocess
+import sys
+import tempfile
+
+
+# Run Cache Keys
+# --------------
+# Every SETVAL instruction determines the results of a run, so two runs that differ in any SETVAL
+# (even one that sets a policy to zero, or only the policy implementation schedule) must have
+# different run keys (see RunCache.py).  Differences in spelling and number formatting that Vensim
+# ignores must not change the run key.
+def CheckRunKey():
+	from RunCache import RunKey
+
+	Problems = []
+	Different = [
+		("", "SIMULATE>SETVAL|Policy Implementation Schedule Selector=1\n"),
+		("SIMULATE>SETVAL|Policy Implementation Schedule Selector=1\n", "SIMULATE>SETVAL|Policy Implementation Schedule Selector=2\n"),
+		("", "SIMULATE>SETVAL|GRA for Carbon Tax Revenue[household taxes]=0\n"),
+		("SIMULATE>SETVAL|Additional Carbon Tax Rate[electricity sector]=0\n", "SIMULATE>SETVAL|Additional Carbon Tax Rate[industry sector]=0\n"),
+	]
+	for First, Second in Different:
+		if RunKey("Batch", First) == RunKey("Batch", Second):
+			Problems.append("These runs have the same run key: " + repr(First) + " and " + repr(Second))
+	Same = [
+		("SIMULATE>SETVAL|A=1\nSIMULATE>SETVAL|B[x]=2\n", "SIMULATE>SETVAL|B[x]=2.0\nSIMULATE>SETVAL|a=1\n"),
+		("SIMULATE>SETVAL|Policy_Implementation  Schedule Selector=1\n", "SIMULATE>SETVAL|Policy Implementation Schedule Selector=1.0\n"),
+	]
+	for First, Second in Same:
+		if RunKey("Batch", First) != RunKey("Batch", Second):
+			Problems.append("These runs have different run keys: " + repr(First) + " and " + repr(Second))
+	if RunKey("Batch", "") == RunKey("Other Batch", ""):
+		Problems.append("Runs in different batches have the same run key.")
+	return Problems
+
+
+# Model Symbols
+# -------------
+# A variable may have an entry that covers all but a few elements of its ranges, such as
+# "Var[Sector] :EXCEPT: [electricity]=...", with the remaining elements given by other entries.  The
+# ":" of ":EXCEPT:" must not be mistaken for the start of a subscript range definition, or the
+# elements covered only by that entry would be rejected by the name checks (see ModelSymbols.py).
+def CheckModelSymbols():
+	from ModelSymbols import CheckCommandScriptNames
+
+	Problems = []
+	with tempfile.TemporaryDirectory() as Folder:
+		ModelFile = os.path.join(Folder, "Check.mdl")
+		with open(ModelFile, 'w') as File:
+			File.write("{UTF-8}\n"
+				"Sector: electricity, industry, buildings\n\t~\t~\t|\n\n"
+				"Emissions[Sector] :EXCEPT: [electricity]=\n\t1\n\t~\t~\t|\n\n"
+				"Emissions[electricity]=\n\t2\n\t~\t~\t|\n\n"
+				"Revenue[Sector] :EXCEPT:  [electricity],[industry]=\n\t3\n\t~\t~\t|\n\n"
+				"Revenue[electricity]=\n\t4\n\t~\t~\t|\n\n"
+				"Allocation[Sector] :EXCEPT: [buildings]=\n\t5\n\t~\t~\t|\n\n"
+				"\\\\\\---/// Sketch information\n")
+		for Name in ["Emissions[industry]", "Emissions[electricity]", "Revenue[buildings]", "Allocation[electricity]", "Allocation[buildings]"]:
+			Problems.extend(CheckCommandScriptNames(ModelFile, [Name]))
+		if len(CheckCommandScriptNames(ModelFile, ["Emissions[transportation]"])) == 0:
+			Problems.append("\"Emissions[transportation]\" was accepted, but it is not an element of the range.")
+
+	# The names that were rejected in EPS.mdl before ":EXCEPT:" entries were read are checked too.
+	if os.path.isfile("EPS.mdl"):
+		Problems.extend(CheckCommandScriptNames("EPS.mdl", [
+			"Output Energy Related CO2 Emissions by Sector[electricity sector]",
+			"Output Government Revenue Change Allocated by Mechanism[household taxes]"
+		]))
+	return Problems
+
+
+# Merging Shard Results
+# ---------------------
+# Each run of a sharded combinations batch is numbered across the whole batch when the command scripts
+# are generated, and MergeShardResults.py must keep these numbers, so the same run has the same number
+# however the batch was split (and even if a shard's runs are not in order, as after a resumed batch).
+def CheckMergeShardResults():
+	from MergeShardResults import FindShardResultsFiles, MergeShardResults
+
+	Problems = []
+	Shards = [[1, 2, 3], [5, 4], [6]]
+	with tempfile.TemporaryDirectory() as Folder:
+		RunResultsFile = os.path.join(Folder, "RunResults.tsv")
+		for ShardNumber, RunNumbers in enumerate(Shards, 1):
+			with open(os.path.join(Folder, "RunResults_Shard" + str(ShardNumber) + ".tsv"), 'w') as File:
+				File.write("Time\t2019\t2020\n")
+				for RunNumber in RunNumbers:
+					for Variable in ("Emissions", "Costs"):
+						File.write(Variable + "\t1\t2\tMostRecentRun\tCurrentRunNumber=" + str(RunNumber) + "\tPolicySchedule=1\n")
+		MergeShardResults(FindShardResultsFiles(RunResultsFile), RunResultsFile)
+		with open(RunResultsFile, 'r') as File:
+			Lines = File.read().splitlines()
+	Expected = ["Time\t2019\t2020"] + [Variable + "\t1\t2\tMostRecentRun\tCurrentRunNumber=" + str(RunNumber) + "\tPolicySchedule=1" for RunNumbers in Shards for RunNumber in RunNumbers for Variable in ("Emissions", "Costs")]
+	if Lines != Expected:
+		Problems.append("The merged results file differs from the shard results files (run numbers " + ", ".join(Line.split("CurrentRunNumber=")[1].split("\t")[0] for Line in Lines if "CurrentRunNumber=" in Line) + ").")
+	return Problems
+
+
+# The Shapley Run Budget
+# ----------------------
+# In "Shapley" mode, CreateContributionTestScript.py must never write more runs than the
+# ShapleyRunBudget (counting the runs under every policy implementation schedule), and if even one
+# pair of permutations needs more runs than that, it must produce an error rather than exceed the
+# budget.  The script is run on the synthetic model and policy catalog of BenchmarkGenerators.py.
+def CheckShapleyBudget():
+	from BenchmarkGenerators import ChangeSettings, GroupName, PoliciesPerGroup, WriteSyntheticCatalog, WriteSyntheticModel
+
+	Problems = []
+	Cases = [(10, 200, [1]), (10, 100, [1, 2]), (50, 200, [1]), (50, 60, [1]), (500, 200, [1])]
+	with tempfile.TemporaryDirectory() as Folder:
+		NumPolicies = max(NumGroups for NumGroups, Budget, Schedules in Cases) * PoliciesPerGroup
+		WriteSyntheticModel(Folder, NumPolicies)
+		WriteSyntheticCatalog(Folder, NumPolicies)
+		for NumGroups, Budget, Schedules in Cases:
+			with open("CreateContributionTestScript.py", 'r') as GeneratorFile:
+				Source = ChangeSettings(GeneratorFile.read(), {
+					"ModelFile": "Benchmark.mdl", "OutputVarsFile": "Benchmark.lst", "NumShards": 1, "UseRunCache": False, "Resume": False,
+					"EnableOrDisableGroups": "Shapley", "ShapleyRunBudget": Budget, "PolicySchedules": Schedules,
+					"PolicySelections": [("Group", GroupName(GroupNumber)) for GroupNumber in range(1, NumGroups + 1)]
+				})
+			ScriptFile = os.path.join(Folder, "CheckContributionTestScript.py")
+			with open(ScriptFile, 'w') as GeneratorFile:
+				GeneratorFile.write(Source)
+			Environment = dict(os.environ, PYTHONPATH=os.path.abspath("."))
+			Process = subprocess.run([sys.executable, ScriptFile], cwd=Folder, env=Environment, capture_output=True, text=True)
+			with open(os.path.join(Folder, "GeneratedContributionTestScript.cmd"), 'r') as Script:
+				Text = Script.read()
+			NumRuns = Text.count("MENU>RUN|")
+			Case = str(NumGroups) + " groups, " + str(len(Schedules)) + " schedules, and a budget of " + str(Budget)
+			if 2 * NumGroups * len(Schedules) > Budget:
+				if Process.returncode == 0 or not Text.startswith("Error:"):
+					Problems.append("With " + Case + ", the script did not produce an error (it wrote " + str(NumRuns) + " runs).")
+			elif Process.returncode != 0:
+				Problems.append("With " + Case + ", the script failed: " + (Process.stderr.strip() or Text.strip()))
+			elif NumRuns > Budget or NumRuns < 2 * NumGroups * len(Schedules):
+				Problems.append("With " + Case + ", the script wrote " + str(NumRuns) + " runs.")
+	return Problems
+
+
+Checks = {
+	"RunKey": CheckRunKey,
+	"ModelSymbols": CheckModelSymbols,
+	"MergeShardResults": CheckMergeShardResults,
+	"ShapleyBudget": CheckShapleyBudget,
+}
+
+
+if __name__ == "__main__":
+
+	Names = sys.argv[1:] or list(Checks)
+	UnknownNames = [Name for Name in Names if Name not in Checks]
+	if len(UnknownNames) > 0:
+		sys.exit("Error: There is no check named " + ", ".join(UnknownNames) + ".  The checks are " + ", ".join(Checks) + ".")
+	NumProblems = 0
+	for Name in Names:
+		Problems = Checks[Name]()
+		print(Name + ": " + ("passed" if len(Problems) == 0 else str(len(Problems)) + (" problem" if len(Problems) == 1 else " problems")))
+		for Problem in Problems:
+			print("  " + Problem)
+		NumProblems += len(Problems)
+	sys.exit(1 if NumProblems > 0 else 0)
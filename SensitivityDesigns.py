@@ -0,0 +1,136 @@
+# SensitivityDesigns.py
+#
+# This is a Python module used by CreateCombinationsScript.py to choose the runs for a global
+# sensitivity analysis, which finds out which of many enabled policies have the largest effects on
+# the results, and whether their effects depend on one another.  Testing every combination of even
+# two settings of fifty policies would require 2^50 runs, so instead, each policy is given a range
+# (from its lowest to its highest setting), and a few thousand points within the ranges are chosen
+# so that the effect of each policy can be estimated statistically.  EstimateSensitivityIndices.py
+# computes the estimates from the results.
+#
+# The designs are built in "unit" terms: each policy's value is a number from 0 (the low end of its
+# range) to 1 (the high end), and each sample (run) is a list with one such number per policy.  Two
+# designs are available:
+#
+# 1. "Morris" (elementary effects).  Each "trajectory" starts from a random point on a grid of
+#    NumLevels evenly spaced values per policy, and then changes one policy at a time, in a random
+#    order, by a fixed step (Delta), until every policy has been changed once.  The change in the
+#    results caused by each step is an "elementary effect" of the policy that changed.  A trajectory
+#    needs one run more than the number of policies, and the samples are listed one trajectory after
+#    another.  Delta is NumLevels / (2 * (NumLevels - 1)), which is a whole number of grid steps when
+#    NumLevels is even, so every level is equally likely to be visited.
+#
+# 2. "Sobol" (variance-based, with the sampling scheme of Saltelli).  Two independent random samples,
+#    A and B, are drawn with NumBaseSamples points each.  For each policy, a third sample, AB, is made
+#    by copying A and replacing that policy's column with the one from B.  The samples are listed in
+#    the order A, B, then the AB sample for each policy in turn, so the design needs
+#    NumBaseSamples * (number of policies + 2) runs.
+#
+# Random numbers are drawn with Python's "random" module from the given seed, so the same settings
+# always give the same design, and no extra packages are needed to build one.  This module also holds
+# the samplers used to draw the values of uncertain inputs (see "Samplers" below).
+
+import random
+
+
+# Morris Designs
+# --------------
+def BuildMorrisDesign(NumPolicies, NumTrajectories, NumLevels, Seed):
+	if NumLevels < 2 or NumLevels % 2 != 0:
+		raise ValueError("The number of levels in a Morris design must be an even number of at least 2 (not " + str(NumLevels) + ").")
+	if NumTrajectories < 1:
+		raise ValueError("A Morris design needs at least one trajectory.")
+
+	Generator = random.Random(Seed)
+	Step = NumLevels // 2
+	Samples = []
+	for Trajectory in range(NumTrajectories):
+
+		# Each policy starts at a random level, and moves up by Delta if it can, or down otherwise.
+		Levels = [Generator.randrange(NumLevels) for Policy in range(NumPolicies)]
+		Directions = [1 if Level + Step < NumLevels else -1 for Level in Levels]
+		Order = list(range(NumPolicies))
+		Generator.shuffle(Order)
+
+		Samples.append([Level / (NumLevels - 1) for Level in Levels])
+		for Policy in Order:
+			Levels[Policy] += Directions[Policy] * Step
+			Samples.append([Level / (NumLevels - 1) for Level in Levels])
+	return Samples
+
+
+# Sobol Designs
+# -------------
+def BuildSobolDesign(NumPolicies, NumBaseSamples, Seed):
+	if NumBaseSamples < 2:
+		raise ValueError("A Sobol design needs at least two base samples.")
+
+	Generator = random.Random(Seed)
+	SampleA = [[Generator.random() for Policy in range(NumPolicies)] for Point in range(NumBaseSamples)]
+	SampleB = [[Generator.random() for Policy in range(NumPolicies)] for Point in range(NumBaseSamples)]
+	Samples = SampleA + SampleB
+	for Policy in range(NumPolicies):
+		for PointA, PointB in zip(SampleA, SampleB):
+			Point = PointA[:]
+			Point[Policy] = PointB[Policy]
+			Samples.append(Point)
+	return Samples
+
+
+
+# Samplers
+# --------
+# Monte Carlo uncertainty analysis (see UncertainInputs.py) needs a sample of NumPoints points, each
+# with one unit value per uncertain input.  Three samplers are available:
+#
+# 1. "Random": every value is drawn independently.
+# 2. "LatinHypercube": the range of each input is divided into NumPoints equal strata, and each
+#    stratum is used by exactly one point (in a random order for each input), so every part of each
+#    input's distribution is represented, even with few points.
+# 3. "Halton": the points follow a Halton sequence (a quasi-random sequence, which uses a different
+#    prime number as the base for each input), so they are spread evenly across every combination of
+#    inputs, not just across each input.  The whole sequence is shifted by a random amount for each
+#    input (wrapping around at 1), so that different seeds give different samples.  Halton sequences
+#    work best with a modest number of inputs (up to about 20).
+Samplers = ("Random", "LatinHypercube", "Halton")
+
+def FirstPrimes(Count):
+	Primes = []
+	Candidate = 2
+	while len(Primes) < Count:
+		if all(Candidate % Prime != 0 for Prime in Primes):
+			Primes.append(Candidate)
+		Candidate += 1
+	return Primes
+
+def RadicalInverse(Index, Base):
+	Inverse = 0.0
+	Fraction = 1.0 / Base
+	while Index > 0:
+		Index, Digit = divmod(Index, Base)
+		Inverse += Digit * Fraction
+		Fraction /= Base
+	return Inverse
+
+def BuildUnitSample(Sampler, NumPoints, NumDimensions, Seed):
+	if Sampler not in Samplers:
+		raise ValueError("The sampler must be one of " + ", ".join("\"" + Known + "\"" for Known in Samplers) + " (not " + repr(Sampler) + ").")
+	if NumPoints < 1:
+		raise ValueError("At least one point must be drawn.")
+
+	Generator = random.Random(Seed)
+	if Sampler == "Random":
+		return [[Generator.random() for Dimension in range(NumDimensions)] for Point in range(NumPoints)]
+
+	if Sampler == "LatinHypercube":
+		Columns = []
+		for Dimension in range(NumDimensions):
+			Strata = list(range(NumPoints))
+			Generator.shuffle(Strata)
+			Columns.append([(Stratum + Generator.random()) / NumPoints for Stratum in Strata])
+		return [list(Point) for Point in zip(*Columns)]
+
+	# The sequence starts from its second point, because its first point is zero in every dimension.
+	Primes = FirstPrimes(NumDimensions)
+	Shifts = [Generator.random() for Dimension in range(NumDimensions)]
+	return [[(RadicalInverse(Point + 1, Prime) + Shift) % 1.0 for Prime, Shift in zip(Primes, Shifts)] for Point in range(NumPoints)]
@@ -0,0 +1,145 @@
+# SimulatorStandIn.py
+#
+# This is a Python script that imitates Vensim DSS closely enough to carry out the Vensim
+# command scripts generated by the other Python scripts distributed with the EPS.  It does
+# NOT simulate the EPS.  The "results" it writes are made-up numbers that respond to policy
+# settings in a simple, repeatable way (for example, emissions always fall as a carbon tax
+# rises).  It is useful for trying out the Python scripts that run Vensim automatically, such
+# as the "Solve" mode of CreateCarbonCapToTaxScript.py, on a computer that does not have
+# Vensim DSS (such as a Linux computer), and for checking that a generated command script
+# produces a results file with the expected layout.
+#
+# Usage: python SimulatorStandIn.py CommandScript.cmd
+#
+# The command script is carried out in the current working directory.  The following
+# instructions are supported: SPECIAL>LOADMODEL, SIMULATE>RUNNAME, SIMULATE>SETVAL,
+# SIMULATE>READCIN, SIMULATE>SAVELIST, MENU>RUN, MENU>VDF2TAB, FILE>DELETE, and MENU>EXIT.
+# Other instructions are ignored.  As in Vensim, changes made with SETVAL or READCIN only
+# apply to the next run.
+#
+# If the SIMULATOR_TIMING_FILE environment variable names a file, the time taken by each
+# instruction is appended to it, one line of JSON per instruction (see RunInParallel.py).
+
+import json
+import math
+import os
+import sys
+import time
+import zlib
+
+
+# Made-Up Results
+# ---------------
+# Each variable has a base value that depends only on its name and grows slowly over time.
+# Every policy setting in effect for the run changes the value by an amount that depends on
+# the names of the variable and the policy, phased in between 2020 and 2030 (or two years later
+# for each higher policy implementation schedule number).  The effect of
+# each setting levels off as the setting grows (more slowly for carbon taxes, which are
+# expressed in currency units rather than fractions).  Variables with "Emissions" in their
+# names fall as policy settings rise.
+def StableFraction(Text):
+	return (zlib.crc32(Text.encode("utf-8")) % 100000) / 100000.0
+
+def PhaseIn(Year, Schedule=1):
+	return min(1.0, max(0.0, (Year - 2020) / (10.0 + 2.0 * (Schedule - 1))))
+
+def MadeUpValue(Variable, Year, Settings):
+	Schedule = Settings.get("Policy Implementation Schedule Selector", 1)
+	if Variable.startswith("Selected Policy Implementation Schedule"):
+		return PhaseIn(Year, Schedule)
+	Base = 100.0 + 900.0 * StableFraction(Variable)
+	Trend = 1.0 + 0.01 * (Year - 2019)
+	Effect = 0.0
+	for Name, Setting in Settings.items():
+		if Name == "Policy Implementation Schedule Selector":
+			continue
+		if "Carbon Tax" in Name:
+			Weight, Scale = 0.5 * StableFraction(Variable + "|" + Name), 100.0
+		else:
+			Weight, Scale = 0.02 * StableFraction(Variable + "|" + Name), 1.0
+		Effect += Weight * (1.0 - math.exp(-Setting / Scale))
+	if "Emissions" in Variable:
+		return Base * Trend * math.exp(-PhaseIn(Year, Schedule) * Effect)
+	return Base * Trend * (1.0 + 0.1 * PhaseIn(Year, Schedule) * Effect)
+
+
+# Reading Settings Files
+# ----------------------
+# A .cin file contains one "Name = value" line per setting.
+def ReadCinFile(FileName):
+	Settings = {}
+	if FileName.strip() == "":
+		return Settings
+	with open(FileName, 'r') as CinFile:
+		for Line in CinFile:
+			if "=" in Line:
+				Name, Value = Line.split("=", 1)
+				Settings[Name.strip()] = float(Value)
+	return Settings
+
+
+# Carrying Out a Command Script
+# -----------------------------
+def RunCommandScript(ScriptFile, TimingFile=None):
+	RunName = "Current"
+	PendingSettings = {}
+	Timing = open(TimingFile, 'a') if TimingFile else None
+	with open(ScriptFile, 'r') as Script:
+		for Line in Script:
+			Line = Line.rstrip("\r\n")
+			if Line.strip() == "":
+				continue
+			Command, _, Arguments = Line.partition("|")
+			Start = time.perf_counter()
+			if Command == "SIMULATE>RUNNAME":
+				RunName = Arguments
+			elif Command == "SIMULATE>SETVAL":
+				Name, Value = Arguments.split("=", 1)
+				PendingSettings[Name.strip()] = float(Value)
+			elif Command == "SIMULATE>READCIN":
+				PendingSettings.update(ReadCinFile(Arguments))
+			elif Command == "MENU>RUN":
+				# We save the settings in effect for the run as the .vdfx file, and the values are
+				# worked out when they are exported.  Settings are then cleared, as in Vensim.
+				with open(RunName + ".vdfx", 'w') as DataFile:
+					json.dump(PendingSettings, DataFile)
+				PendingSettings = {}
+			elif Command == "MENU>VDF2TAB":
+				ExportResults(Arguments)
+			elif Command == "FILE>DELETE":
+				if os.path.exists(Arguments):
+					os.remove(Arguments)
+			elif Command == "MENU>EXIT":
+				break
+			if Timing is not None:
+				Timing.write(json.dumps({"Command": Command, "Seconds": time.perf_counter() - Start}) + "\n")
+	if Timing is not None:
+		Timing.close()
+
+# The arguments of VDF2TAB are the data file, results file, output variable list, options, delimiter,
+# first time, and last time, followed by a colon and the extra text to be written after each variable
+# name.  The "+" option appends to the results file, and the "!" option leaves out the "Time" row.
+def ExportResults(Arguments):
+	Fields = Arguments.split("|", 7)
+	DataFileName, ResultsFileName, OutputVarsFile, Options = Fields[0], Fields[1], Fields[2], Fields[3]
+	FirstTime, LastTime = int(float(Fields[5])), int(float(Fields[6]))
+	ExtraText = Fields[7][1:] if len(Fields) > 7 and Fields[7].startswith(":") else ""
+
+	with open(DataFileName, 'r') as DataFile:
+		Settings = json.load(DataFile)
+	with open(OutputVarsFile, 'r') as VarsFile:
+		Variables = [Line.strip() for Line in VarsFile if Line.strip() != ""]
+	Years = list(range(FirstTime, LastTime + 1))
+
+	with open(ResultsFileName, 'a' if "+" in Options else 'w') as ResultsFile:
+		if "!" not in Options:
+			ResultsFile.write("\t".join(["Time", ExtraText] + [str(Year) for Year in Years]) + "\n")
+		for Variable in Variables:
+			Values = [format(MadeUpValue(Variable, Year, Settings), ".7g") for Year in Years]
+			ResultsFile.write("\t".join([Variable, ExtraText] + Values) + "\n")
+
+
+if __name__ == "__main__":
+	if len(sys.argv) < 2:
+		sys.exit("Usage: python SimulatorStandIn.py CommandScript.cmd")
+	RunCommandScript(sys.argv[1], os.environ.get("SIMULATOR_TIMING_FILE"))
@@ -0,0 +1,105 @@
+# SpliceRunResults.py
+#
+# This is a Python script that is used after Vensim has carried out a command script generated with
+# the UseRunCache setting enabled (in CreateCombinationsScript.py, CreateContributionTestScript.py,
+# or CreateDataLoggingScript.py).  Such a command script only performs the runs that were not found
+# in the run cache, and exports them to a "new runs" results file.  This script:
+#
+# 1. Adds the new runs to the run cache (and deletes the new runs results files).
+# 2. Writes the complete results file (or files) for the batch, taking every run from the cache, in
+#    the order and with the columns listed in the run plan written by the generating script.
+# 3. Removes the least recently used runs from the cache, if it has grown larger than its maximum size.
+#
+# If the command script was split into shards, the new runs from all shards are added, and a single
+# results file is written, so MergeShardResults.py is not needed.  See RunCache.py for details.
+
+
+# File Names
+# ----------
+# The run plan is named after the command script, so that "GeneratedCombinationsScript.cmd" has the
+# run plan "GeneratedCombinationsScriptRunPlan.tsv".  The name of the run plan may also be given on
+# the command line (for example, "python SpliceRunResults.py GeneratedDataLoggingScriptRunPlan.tsv").
+RunPlanFile = "GeneratedCombinationsScriptRunPlan.tsv"
+
+
+import os
+import sys
+
+from RunCache import IteratePlannedRuns, ReadRunPlanHeader, RunCache
+from RunResultsTools import IterateRuns, ParseMetadata
+
+
+# Adding the New Runs
+# -------------------
+# Each new run is identified in the new runs results file by a "RunCacheKey=" column.  Shards that
+# had no runs to perform did not write a new runs results file, so missing files are skipped.
+def AddNewRuns(Cache, NewRunsFiles, NumYears):
+	NumAdded = 0
+	for NewRunsFile in NewRunsFiles:
+		if not os.path.isfile(NewRunsFile):
+			continue
+		for Metadata, Rows in IterateRuns(NewRunsFile, NumYears):
+			Key = ParseMetadata(Metadata).get("RunCacheKey")
+			if Key is not None:
+				Cache.Store(Key, Rows)
+				NumAdded += 1
+	return NumAdded
+
+
+# Writing the Results Files
+# -------------------------
+# We first check that every run in the plan is in the cache, so that a batch that was not finished
+# does not overwrite a complete results file with an incomplete one.  Each results file begins with
+# a "Time" row, which (as when Vensim writes it) carries the columns of the first run in the file.
+def FindMissingRuns(Cache, PlanFile):
+	Missing = 0
+	for Key, ResultsFile, Metadata in IteratePlannedRuns(PlanFile):
+		if not Cache.Contains(Key):
+			Missing += 1
+	return Missing
+
+def WriteResultsFiles(Cache, PlanFile, Years):
+	ResultsFiles = []
+	Output = None
+	for Key, ResultsFile, Metadata in IteratePlannedRuns(PlanFile):
+		if Output is None or ResultsFile != ResultsFiles[-1]:
+			if Output is not None:
+				Output.close()
+			Output = open(ResultsFile, 'a' if ResultsFile in ResultsFiles else 'w', newline='')
+			if ResultsFile not in ResultsFiles:
+				Output.write("Time\t" + Metadata + "\t" + "\t".join(str(Year) for Year in Years) + "\n")
+			ResultsFiles.append(ResultsFile)
+		for Name, Values in Cache.ReadRows(Key):
+			Output.write(Name + "\t" + Metadata + "\t" + "\t".join(Values) + "\n")
+	if Output is not None:
+		Output.close()
+	return sorted(set(ResultsFiles))
+
+
+if __name__ == "__main__":
+
+	if len(sys.argv) > 1:
+		RunPlanFile = sys.argv[1]
+	try:
+		Header = ReadRunPlanHeader(RunPlanFile)
+	except (OSError, ValueError) as Error:
+		sys.exit("Error: The run plan " + RunPlanFile + " could not be read (" + str(Error) + ").")
+	Years = list(range(int(Header["FirstYear"]), int(Header["FinalYear"]) + 1))
+
+	Cache = RunCache(Header["CacheDirectory"])
+	NumAdded = AddNewRuns(Cache, Header["NewRunsFiles"], len(Years))
+	Cache.Save()
+	for NewRunsFile in Header["NewRunsFiles"]:
+		if os.path.isfile(NewRunsFile):
+			os.remove(NewRunsFile)
+
+	Missing = FindMissingRuns(Cache, RunPlanFile)
+	if Missing > 0:
+		sys.exit("Error: " + str(Missing) + " runs in " + RunPlanFile + " are not in the run cache.  Make sure Vensim finished the whole command script (or generate it again).")
+	ResultsFiles = WriteResultsFiles(Cache, RunPlanFile, Years)
+
+	Removed = Cache.Evict(Header["MaxCacheSizeMB"] * 1000000)
+	Cache.Save()
+	print("Added " + str(NumAdded) + " new runs to the run cache and wrote " + ", ".join(ResultsFiles) + ".")
+	if Removed > 0:
+		print("Removed " + str(Removed) + " least recently used runs from the run cache to keep it within " + str(Header["MaxCacheSizeMB"]) + " MB.")
@@ -0,0 +1,110 @@
+# UncertainInputs.py
+#
+# This is a Python module used by CreateCombinationsScript.py to perform Monte Carlo uncertainty
+# analysis: runs in which some of the model's input assumptions (such as fuel prices or technology
+# costs) are set to values drawn from probability distributions, so that the spread of the results
+# shows how uncertain they are.  Each uncertain input is a constant in the model, changed with a
+# SETVAL instruction.  SETVAL cannot change a time series (such as the fuel prices read from
+# InputData/fuels with GET DIRECT DATA), so time series are varied through a constant multiplier,
+# such as "Fuel Price Multiplier for Sensitivity Analysis Runs[natural gas]".
+#
+# Draws are chosen in "unit" terms (a number from 0 to 1 for each input, see the samplers in
+# SensitivityDesigns.py), and each unit value is turned into a value of the input with the inverse
+# of the input's cumulative distribution function.  For example, a unit value of 0.5 gives the
+# median of the distribution, and 0.05 gives its 5th percentile.
+
+import collections
+import math
+import statistics
+
+
+# Reading the Uncertain Inputs
+# ----------------------------
+# Each uncertain input is given as a tuple of three or four entries:
+#   1. the name of the constant in the model, with subscripts if it has any
+#   2. the name of its distribution (see Distributions below)
+#   3. a list of the distribution's parameters
+#   4. (optional) "Relative", if the drawn value multiplies the constant's value in the InputData
+#      folder, rather than replacing it.  For example, a "Normal" distribution with parameters
+#      [1, 0.1] gives values within about 10% of the input data value two-thirds of the time.
+# The value of a relative input is read with InputDataArrays.py, which requires the NumPy package.
+# It must be read from InputData with GET DIRECT CONSTANTS (not GET DIRECT DATA or LOOKUPS).
+UncertainInput = collections.namedtuple("UncertainInput", ("Name", "Distribution", "Parameters", "BaseValue"))
+
+# The number of parameters of each distribution, and their meanings:
+#   "Uniform": lowest value, highest value
+#   "Triangular": lowest value, most likely value, highest value
+#   "Normal": mean, standard deviation
+#   "LogNormal": median, standard deviation of the natural logarithm of the value
+Distributions = {"Uniform": 2, "Triangular": 3, "Normal": 2, "LogNormal": 2}
+
+def ReadUncertainInputs(Selections, ModelFile):
+	Inputs = []
+	RelativeInputs = []
+	for Selection in Selections:
+		if len(Selection) < 3 or len(Selection) > 4 or (len(Selection) == 4 and Selection[3] != "Relative"):
+			raise ValueError("Each uncertain input must have a name, a distribution, a list of parameters, and optionally \"Relative\": " + repr(Selection))
+		Name, Distribution, Parameters = Selection[0], Selection[1], Selection[2]
+		if Distribution not in Distributions:
+			raise ValueError("The distribution of " + Name + " must be one of " + ", ".join("\"" + Known + "\"" for Known in Distributions) + " (not " + repr(Distribution) + ").")
+		if len(Parameters) != Distributions[Distribution]:
+			raise ValueError("A \"" + Distribution + "\" distribution has " + str(Distributions[Distribution]) + " parameters, but " + Name + " has " + str(len(Parameters)) + ".")
+		if Distribution == "Uniform" and not Parameters[0] <= Parameters[1]:
+			raise ValueError("The lowest value of " + Name + " must not be greater than its highest value.")
+		if Distribution == "Triangular" and not Parameters[0] <= Parameters[1] <= Parameters[2]:
+			raise ValueError("The most likely value of " + Name + " must be between its lowest and highest values.")
+		if Distribution in ("Normal", "LogNormal") and Parameters[1] < 0:
+			raise ValueError("The standard deviation of " + Name + " must not be negative.")
+		if Distribution == "LogNormal" and Parameters[0] <= 0:
+			raise ValueError("The median of " + Name + " must be greater than zero.")
+		Inputs.append(UncertainInput(Name, Distribution, tuple(float(Parameter) for Parameter in Parameters), None))
+		if len(Selection) == 4:
+			RelativeInputs.append(len(Inputs) - 1)
+
+	# The input data are only opened if a relative input needs them.
+	if len(RelativeInputs) > 0:
+		from InputDataArrays import OpenInputData
+		from ModelSymbols import NameKey, SplitName
+		Data = OpenInputData(ModelFile)
+		for InputIndex in RelativeInputs:
+			Name, Subscripts = SplitName(Inputs[InputIndex].Name)
+			Variable = Data.Index["Variables"].get(NameKey(Name))
+			if Variable is None or any(Call["Function"] != "CONSTANTS" for Call in Variable["Calls"]):
+				raise ValueError(Inputs[InputIndex].Name + " is marked \"Relative\", but it is not read from InputData with GET DIRECT CONSTANTS.")
+			Array = Data.Variable(Name)
+			try:
+				BaseValue = float(Array.Select(*(Subscripts or [])))
+			except (ValueError, TypeError, IndexError):
+				raise ValueError(Inputs[InputIndex].Name + " must name a single element of " + Array.Name + ", with one subscript element for each of its dimensions (" + ", ".join(Array.Dimensions) + ").")
+			if math.isnan(BaseValue):
+				raise ValueError(Inputs[InputIndex].Name + " has no value in InputData.")
+			Inputs[InputIndex] = Inputs[InputIndex]._replace(BaseValue=BaseValue)
+	return Inputs
+
+
+# Drawing Values
+# --------------
+# Unit values of exactly 0 or 1 would give infinite values for the normal and log-normal
+# distributions, so they are moved slightly inside the range.
+def InputValue(Input, UnitValue):
+	Parameters = Input.Parameters
+	if Input.Distribution == "Uniform":
+		Value = Parameters[0] + UnitValue * (Parameters[1] - Parameters[0])
+	elif Input.Distribution == "Triangular":
+		Low, Mode, High = Parameters
+		if High == Low:
+			Value = Low
+		elif UnitValue < (Mode - Low) / (High - Low):
+			Value = Low + math.sqrt(UnitValue * (High - Low) * (Mode - Low))
+		else:
+			Value = High - math.sqrt((1 - UnitValue) * (High - Low) * (High - Mode))
+	else:
+		UnitValue = min(max(UnitValue, 1e-12), 1 - 1e-12)
+		Deviation = statistics.NormalDist().inv_cdf(UnitValue) * Parameters[1]
+		if Input.Distribution == "Normal":
+			Value = Parameters[0] + Deviation
+		else:
+			Value = Parameters[0] * math.exp(Deviation)
+	if Input.BaseValue is not None:
+		Value *= Input.BaseValue
+	return Value